@@ -0,0 +1,160 @@
+"""
+Benchmark plugin and shared fixtures.
+
+Run with:
+    pytest benchmarks                          # store .benchmarks/<commit>.json
+    pytest benchmarks --bench-compare latest   # also fail on >50% median slow-downs
+    pytest benchmarks --bench-compare a1b2c3d --bench-tolerance 1.0
+"""
+
+from pathlib import Path
+
+import httpx
+import pytest
+
+from benchmarks.harness import (
+    STATS,
+    Benchmark,
+    check_thresholds,
+    load_run,
+    load_thresholds,
+    save_run,
+)
+from config import (
+    BingXConfig,
+    BotStateConfig,
+    Config,
+    DynamicTPConfig,
+    GridConfig,
+    MACDConfig,
+    ReactivationMode,
+    SpacingType,
+    TradingConfig,
+    TradingMode,
+)
+from src.client.bingx_client import BingXClient
+from src.client.time_sync import ServerClock
+from src.filters.registry import FilterRegistry
+from src.grid.grid_manager import GridManager
+from src.simulator import BingXSimulator, FakeExchange, SimulatorConfig
+
+SYMBOL = "BTC-USDT"
+API_KEY = "bench_api_key"  # pragma: allowlist secret
+SECRET_KEY = "bench_secret_key"  # pragma: allowlist secret
+PRICE = 100_000.0
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("bench", "latency benchmarks")
+    group.addoption(
+        "--bench-storage",
+        default=".benchmarks",
+        help="Directory for per-commit results (default: .benchmarks)",
+    )
+    group.addoption(
+        "--bench-compare",
+        metavar="REF",
+        help="Fail on median regressions against a stored run (file, commit or 'latest')",
+    )
+    group.addoption(
+        "--bench-tolerance",
+        type=float,
+        default=0.5,
+        help="Allowed median slow-down for --bench-compare (default: 0.5 = 50%%)",
+    )
+    group.addoption("--bench-no-save", action="store_true", help="Do not store this run")
+
+
+def pytest_configure(config):
+    config._bench_results = []
+    config._bench_thresholds = load_thresholds()
+    ref = config.getoption("--bench-compare")
+    config._bench_baseline = load_run(Path(config.getoption("--bench-storage")), ref) if ref else {}
+
+
+@pytest.fixture
+def bench(request):
+    """Timer for one benchmark; fails the test if a regression threshold is exceeded."""
+    config = request.config
+    name = request.node.name
+
+    def complete(result):
+        config._bench_results.append(result)
+        failures = check_thresholds(
+            result,
+            config._bench_thresholds.get(name),
+            config._bench_baseline.get(name),
+            config.getoption("--bench-tolerance"),
+        )
+        if failures:
+            pytest.fail(f"{name} regressed: " + "; ".join(failures), pytrace=False)
+
+    return Benchmark(name, request.node.module.__name__.rsplit(".", 1)[-1], complete)
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    results = getattr(config, "_bench_results", [])
+    if not results:
+        return
+    terminalreporter.section("benchmarks (ms)")
+    width = max(len(r.name) for r in results)
+    terminalreporter.write_line(
+        f"{'name':<{width}}  {'rounds':>6}" + "".join(f"{stat:>10}" for stat in STATS)
+    )
+    for result in results:
+        stats = result.stats()
+        terminalreporter.write_line(
+            f"{result.name:<{width}}  {stats['rounds']:>6}"
+            + "".join(f"{stats[stat]:>10.3f}" for stat in STATS)
+        )
+    if not config.getoption("--bench-no-save"):
+        path = save_run(Path(config.getoption("--bench-storage")), results)
+        terminalreporter.write_line(f"Saved to {path}")
+
+
+# ----------------------------------------------------------------------
+# Bot under test (against the local exchange simulator)
+# ----------------------------------------------------------------------
+
+
+def make_config(simulator: BingXSimulator, max_total_orders: int = 10) -> Config:
+    return Config(
+        bingx=BingXConfig(
+            API_KEY, SECRET_KEY, rest_url=simulator.rest_url, stream_url=simulator.ws_url
+        ),
+        trading=TradingConfig(SYMBOL, 10, 100.0, TradingMode.DEMO),
+        grid=GridConfig(SpacingType.FIXED, 100.0, 5.0, 0.5, max_total_orders=max_total_orders),
+        macd=MACDConfig(12, 26, 9, "1h"),
+        dynamic_tp=DynamicTPConfig(),
+        reactivation_mode=ReactivationMode.IMMEDIATE,
+        bot_state=BotStateConfig(),
+    )
+
+
+@pytest.fixture
+async def simulator():
+    config = SimulatorConfig(api_key=API_KEY, secret_key=SECRET_KEY, ping_interval=0)
+    async with BingXSimulator(config, FakeExchange(price=PRICE, balance=1_000_000.0)) as sim:
+        yield sim
+
+
+@pytest.fixture
+async def client(simulator):
+    client = BingXClient(make_config(simulator).bingx, http_client=httpx.AsyncClient())
+    client.clock = ServerClock()
+    yield client
+    await client.close()
+
+
+@pytest.fixture
+def grid_manager_factory(simulator, client):
+    """Build GridManagers wired to the simulator (filters registry reset afterwards)."""
+
+    def build(max_total_orders: int = 10) -> GridManager:
+        FilterRegistry().clear()
+        manager = GridManager(make_config(simulator, max_total_orders), client)
+        manager._current_price = PRICE
+        return manager
+
+    yield build
+    FilterRegistry().clear()
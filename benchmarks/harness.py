@@ -0,0 +1,222 @@
+"""
+Latency benchmark harness.
+
+A small pytest-benchmark style timer that also handles coroutines (the bot's
+hot paths are async). Each benchmark runs warm-up rounds, then times every
+round with perf_counter_ns; optional per-round setup is not timed.
+
+Results of a run are stored as JSON per commit (``.benchmarks/<commit>.json``)
+and checked against two kinds of regression thresholds:
+- absolute budgets from ``benchmarks/thresholds.json``
+- relative slow-down against a stored run (``--bench-compare``)
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any
+
+THRESHOLDS_FILE = Path(__file__).with_name("thresholds.json")
+STATS = ("min", "median", "mean", "p95", "max")
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings of one benchmark (milliseconds per round)."""
+
+    name: str
+    group: str
+    samples_ms: list[float] = field(default_factory=list)
+
+    def stats(self) -> dict[str, float]:
+        samples = sorted(self.samples_ms)
+        return {
+            "rounds": len(samples),
+            "min": samples[0],
+            "median": statistics.median(samples),
+            "mean": statistics.fmean(samples),
+            "p95": samples[min(len(samples) - 1, int(len(samples) * 0.95))],
+            "max": samples[-1],
+        }
+
+
+class Benchmark:
+    """
+    Timer handed to benchmarks by the ``bench`` fixture.
+
+    Usage:
+        def test_thing(bench):
+            bench(compute, arg, rounds=200)
+
+        async def test_async_thing(bench):
+            await bench.run_async(handle_event, setup=place_order, rounds=50)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        group: str,
+        on_complete: Callable[[BenchmarkResult], None] | None = None,
+    ):
+        """
+        Args:
+            name: Benchmark name (key in thresholds.json and stored runs)
+            group: Module the benchmark belongs to
+            on_complete: Called with the result once timing has finished
+        """
+        self.result = BenchmarkResult(name, group)
+        self._on_complete = on_complete
+
+    def _complete(self) -> None:
+        if self._on_complete is not None:
+            self._on_complete(self.result)
+
+    def __call__(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        setup: Callable[[], Any] | None = None,
+        rounds: int = 100,
+        warmup: int = 5,
+    ) -> Any:
+        """Time a synchronous call; returns the last result."""
+        result = None
+        for i in range(warmup + rounds):
+            if setup is not None:
+                setup()
+            started = time.perf_counter_ns()
+            result = fn(*args)
+            elapsed = time.perf_counter_ns() - started
+            if i >= warmup:
+                self.result.samples_ms.append(elapsed / 1e6)
+        self._complete()
+        return result
+
+    async def run_async(
+        self,
+        fn: Callable[..., Awaitable[Any]],
+        *args: Any,
+        setup: Callable[[], Awaitable[Any]] | None = None,
+        rounds: int = 100,
+        warmup: int = 5,
+    ) -> Any:
+        """Time a coroutine function; returns the last result."""
+        result = None
+        for i in range(warmup + rounds):
+            if setup is not None:
+                await setup()
+            started = time.perf_counter_ns()
+            result = await fn(*args)
+            elapsed = time.perf_counter_ns() - started
+            if i >= warmup:
+                self.result.samples_ms.append(elapsed / 1e6)
+        self._complete()
+        return result
+
+
+def check_thresholds(
+    result: BenchmarkResult,
+    budgets: dict[str, float] | None,
+    baseline: dict[str, float] | None,
+    tolerance: float,
+) -> list[str]:
+    """
+    Regressions of one result.
+
+    Args:
+        result: Measured timings
+        budgets: Absolute limits, e.g. {"median_ms": 2.0, "p95_ms": 5.0}
+        baseline: Stats of the same benchmark from a stored run
+        tolerance: Allowed median slow-down against the baseline (0.3 = +30%)
+
+    Returns:
+        One message per exceeded threshold (empty if none)
+    """
+    stats = result.stats()
+    failures = []
+    for key, limit in (budgets or {}).items():
+        stat = key.removesuffix("_ms")
+        if stat in stats and stats[stat] > limit:
+            failures.append(f"{stat} {stats[stat]:.3f}ms > budget {limit:.3f}ms")
+    if baseline and "median" in baseline:
+        limit = baseline["median"] * (1 + tolerance)
+        if stats["median"] > limit:
+            failures.append(
+                f"median {stats['median']:.3f}ms > baseline {baseline['median']:.3f}ms "
+                f"+{tolerance:.0%}"
+            )
+    return failures
+
+
+def load_thresholds(path: Path = THRESHOLDS_FILE) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        return {}
+    thresholds: dict[str, dict[str, float]] = json.loads(path.read_text())
+    return thresholds
+
+
+def current_commit() -> str:
+    """Short HEAD hash, suffixed with -dirty for uncommitted changes ("unknown" outside git)."""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{commit}-dirty" if dirty else commit
+
+
+def save_run(storage: Path, results: list[BenchmarkResult]) -> Path:
+    """Store a run as <storage>/<commit>.json (one file per commit, last run wins)."""
+    storage.mkdir(parents=True, exist_ok=True)
+    commit = current_commit()
+    path = storage / f"{commit}.json"
+    payload = {
+        "commit": commit,
+        "datetime": datetime.now(UTC).isoformat(),
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+        },
+        "benchmarks": {r.name: {"group": r.group, **r.stats()} for r in results if r.samples_ms},
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True))
+    return path
+
+
+def load_run(storage: Path, ref: str) -> dict[str, dict[str, float]]:
+    """
+    Benchmarks of a stored run.
+
+    Args:
+        storage: Results directory
+        ref: Path to a results file, a commit (prefix), or "latest"
+
+    Raises:
+        FileNotFoundError: If no stored run matches
+    """
+    path = Path(ref)
+    if not path.is_file():
+        runs = sorted(storage.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        if ref != "latest":
+            runs = [p for p in runs if p.stem.startswith(ref)]
+        if not runs:
+            raise FileNotFoundError(f"No stored benchmark run matches {ref!r} in {storage}")
+        path = runs[-1]
+    benchmarks: dict[str, dict[str, float]] = json.loads(path.read_text())["benchmarks"]
+    return benchmarks
@@ -0,0 +1,153 @@
+"""
+Dashboard analytics endpoints at 1k, 10k and 100k trades.
+
+Requests go through the FastAPI app (ASGI, no network) backed by a SQLite
+database seeded once per size, with the analytics response cache bypassed
+so every round runs the queries.
+"""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import httpx
+import numpy as np
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.api.dependencies import get_account_id, get_db_session
+from src.api.main import app
+from src.database.base import Base
+from src.database.models import Account, Trade, User
+from src.database.repositories.daily_pnl_repository import DailyPnlRepository
+
+SIZES = [1_000, 10_000, 100_000]
+START = datetime(2025, 1, 1, tzinfo=UTC)
+DAYS = 365
+BYPASS = {"X-Cache-Bypass": "1"}
+
+
+def trade_rows(account_id: uuid.UUID, n: int) -> list[dict]:
+    """A year of grid trades: mostly closed, some open and cancelled."""
+    rng = np.random.default_rng(n)
+    opened = rng.uniform(0, DAYS * 86_400, n)
+    held = rng.exponential(3 * 3_600, n)
+    entry = rng.uniform(60_000, 110_000, n).round(1)
+    pnl = rng.normal(0.3, 0.4, n).round(8)
+    status = rng.choice(["CLOSED", "OPEN", "CANCELLED"], n, p=[0.9, 0.07, 0.03])
+    rows = []
+    for i in range(n):
+        opened_at = START + timedelta(seconds=float(opened[i]))
+        closed = status[i] == "CLOSED"
+        rows.append(
+            {
+                "id": uuid.uuid4(),
+                "account_id": account_id,
+                "exchange_order_id": f"{1_900_000_000_000_000_000 + i}",
+                "exchange_tp_order_id": f"{1_950_000_000_000_000_000 + i}",
+                "symbol": "BTC-USDT",
+                "side": "LONG",
+                "leverage": 10,
+                "entry_price": Decimal(str(entry[i])),
+                "exit_price": Decimal(str(entry[i] * 1.005)) if closed else None,
+                "quantity": Decimal("0.001"),
+                "tp_price": Decimal(str(entry[i] * 1.005)),
+                "tp_percent": Decimal("0.5"),
+                "pnl": Decimal(str(pnl[i])) if closed else None,
+                "pnl_percent": Decimal(str(round(pnl[i] / entry[i] * 1e5, 4))) if closed else None,
+                "trading_fee": Decimal("0.05"),
+                "funding_fee": Decimal("0"),
+                "status": str(status[i]),
+                "opened_at": opened_at,
+                "filled_at": opened_at,
+                "closed_at": opened_at + timedelta(seconds=float(held[i])) if closed else None,
+            }
+        )
+    return rows
+
+
+async def seed(url: str, n: int) -> uuid.UUID:
+    engine = create_async_engine(url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine, expire_on_commit=False) as session:
+        user = User(email="bench@example.com", password_hash="x", name="Bench")
+        session.add(user)
+        await session.flush()
+        account = Account(user_id=user.id, exchange="bingx", name="Bench", is_demo=True)
+        session.add(account)
+        await session.flush()
+        rows = trade_rows(account.id, n)
+        for i in range(0, n, 10_000):
+            await session.execute(insert(Trade), rows[i : i + 10_000])
+        await session.commit()
+        await DailyPnlRepository(session).rebuild(account.id)
+    await engine.dispose()
+    return account.id
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=str)
+def trade_db(request, tmp_path_factory):
+    """SQLite database file with `param` trades (seeded once per module and size)."""
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('trades')}/trades.db"
+    account_id = asyncio.run(seed(url, request.param))
+    return url, account_id
+
+
+@pytest.fixture
+async def api(trade_db):
+    url, account_id = trade_db
+    engine = create_async_engine(url)
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def session_override():
+        async with sessions() as session:
+            yield session
+
+    app.dependency_overrides[get_db_session] = session_override
+    app.dependency_overrides[get_account_id] = lambda: account_id
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        yield client
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+async def get_ok(api: httpx.AsyncClient, path: str, params: dict | None = None) -> dict:
+    response = await api.get(path, params=params, headers=BYPASS)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+async def test_trades_endpoint(bench, api):
+    body = await bench.run_async(get_ok, api, "/api/v1/trading/trades", {"limit": 100}, rounds=30)
+
+    assert len(body["trades"]) == 100
+
+
+async def test_trades_endpoint_filtered(bench, api):
+    params = {"profit_filter": "profitable", "sort_by": "pnl", "min_duration": 3_600, "limit": 100}
+
+    body = await bench.run_async(get_ok, api, "/api/v1/trading/trades", params, rounds=30)
+
+    assert body["trades"]
+
+
+async def test_stats_endpoint(bench, api):
+    body = await bench.run_async(get_ok, api, "/api/v1/trading/stats", rounds=30)
+
+    assert body["total_trades"] > 0
+
+
+async def test_cumulative_pnl_endpoint(bench, api):
+    params = {
+        "period": "custom",
+        "start_date": START.isoformat(),
+        "end_date": (START + timedelta(days=DAYS)).isoformat(),
+    }
+
+    body = await bench.run_async(get_ok, api, "/api/v1/trading/cumulative-pnl", params, rounds=30)
+
+    assert body["data"]
@@ -0,0 +1,80 @@
+"""
+MACD/EMA computation on hourly candles.
+
+- Full: MACDStrategy.calculate_macd over 1000 candles (REST fallback path)
+- Incremental: update_macd / EMAFilter.update when one more candle closes
+  (KlineStore path); the state is seeded during warm-up
+"""
+
+import numpy as np
+import pytest
+
+from config import MACDConfig
+from src.client.klines import Klines
+from src.filters.ema_filter import EMAFilter
+from src.strategy.macd_strategy import MACDStrategy
+
+HISTORY = 1000
+ROUNDS = 500
+
+
+@pytest.fixture(scope="module")
+def klines():
+    n = HISTORY + ROUNDS + 50
+    rng = np.random.default_rng(11)
+    close = 100_000.0 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = close * np.abs(rng.normal(0, 0.002, n))
+    return Klines(
+        timestamp=1_704_067_200_000 + np.arange(n, dtype=np.int64) * 3_600_000,
+        open=open_,
+        high=np.maximum(open_, close) + spread,
+        low=np.minimum(open_, close) - spread,
+        close=close,
+        volume=rng.uniform(10, 100, n),
+    )
+
+
+def windows(klines):
+    """Sliding HISTORY-candle windows, one more closed candle each time."""
+    end = HISTORY
+    while True:
+        yield klines[end - HISTORY : end]
+        end += 1
+
+
+def test_macd_full(bench, klines):
+    strategy = MACDStrategy(MACDConfig(12, 26, 9, "1h"))
+
+    values = bench(strategy.calculate_macd, klines[:HISTORY], rounds=200)
+
+    assert values is not None
+
+
+def test_macd_incremental(bench, klines):
+    strategy = MACDStrategy(MACDConfig(12, 26, 9, "1h"))
+    window = windows(klines)
+    current = {}
+
+    def next_candle():
+        current["klines"] = next(window)
+
+    values = bench(
+        lambda: strategy.update_macd(current["klines"]), setup=next_candle, rounds=ROUNDS
+    )
+
+    expected = strategy.calculate_macd(current["klines"])
+    assert values.histogram == pytest.approx(expected.histogram, rel=1e-6)
+
+
+def test_ema_incremental(bench, klines):
+    ema = EMAFilter(period=13)
+    window = windows(klines)
+    current = {}
+
+    def next_candle():
+        current["klines"] = next(window)
+
+    bench(lambda: ema.update(current["klines"]), setup=next_candle, rounds=ROUNDS)
+
+    assert ema.current_ema is not None
@@ -0,0 +1,88 @@
+"""
+Order paths against the local exchange simulator.
+
+- Fill: from the simulator emitting ORDER_TRADE_UPDATE, over the account
+  WebSocket (loopback), until GridManager._handle_order_filled_ws has
+  finished, TP order lookup included.
+- Grid: GridManager._create_grid_orders placing N levels (batch requests of
+  5 orders; the bot places at most 10 orders per cycle). Every round starts
+  with a full rate-limit bucket, as a cycle after an idle period does, so the
+  client's request pacing is not part of the measurement.
+"""
+
+import asyncio
+
+import pytest
+
+from benchmarks.conftest import PRICE, SYMBOL
+from src.client.rate_limiter import RateLimiter
+
+ENTRY_PRICE = 99_000.0
+TP_PRICE = 99_495.0
+
+
+async def wait_for(condition, timeout=5.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.001)
+
+
+async def test_order_filled_event(bench, simulator, client, grid_manager_factory):
+    manager = grid_manager_factory()
+    manager._running = True
+    await manager._start_websocket()
+    await wait_for(lambda: manager.order_book.is_live)
+
+    done = asyncio.Event()
+    handle_order_filled = manager._handle_order_filled_ws
+
+    async def probe(order_id, order):
+        await handle_order_filled(order_id, order)
+        done.set()
+
+    manager._handle_order_filled_ws = probe
+    tracked = {}
+
+    async def place_order():
+        # Previous round's TP closes the position at the reset price
+        simulator.set_price(PRICE)
+        await wait_for(lambda: simulator.exchange.position_amt == 0 and not manager.order_book)
+        done.clear()
+        result = await client.create_limit_order_with_tp(
+            SYMBOL, "BUY", "BOTH", ENTRY_PRICE, 0.001, TP_PRICE
+        )
+        await wait_for(lambda: len(manager.order_book) == 1)
+        order_id = str(result["entry_order_id"])
+        tracked["order"] = manager.tracker.add_order(
+            order_id=order_id, entry_price=ENTRY_PRICE, tp_price=TP_PRICE, quantity=0.001
+        )
+
+    async def fill():
+        simulator.set_price(ENTRY_PRICE - 10)
+        await done.wait()
+
+    try:
+        await bench.run_async(fill, setup=place_order, rounds=50, warmup=3)
+    finally:
+        manager._running = False
+        await manager._stop_websocket()
+
+    assert tracked["order"].exchange_tp_order_id in simulator.exchange.orders
+
+
+@pytest.mark.parametrize("levels", [1, 5, 10])
+async def test_create_grid_orders(bench, simulator, client, grid_manager_factory, levels):
+    manager = grid_manager_factory(max_total_orders=levels)
+
+    async def reset():
+        await client.cancel_all_orders(SYMBOL)
+        manager.tracker.clear_all()
+        manager.order_book.clear()
+        client.rate_limiter = RateLimiter()
+
+    await bench.run_async(manager._create_grid_orders, setup=reset, rounds=30, warmup=3)
+
+    assert len(simulator.exchange.orders) == levels
+    assert len(manager.tracker.pending_orders) == levels
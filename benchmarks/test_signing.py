@@ -0,0 +1,36 @@
+"""
+Request signing: one signed order URL (HMAC-SHA256 + query string).
+
+Runs on every REST call, so it is budgeted per order.
+"""
+
+import httpx
+
+from benchmarks.conftest import API_KEY, SECRET_KEY
+from config import BingXConfig
+from src.client.bingx_client import BingXClient
+
+ENDPOINT = "/openApi/swap/v2/trade/order"
+ORDER_PARAMS = {
+    "symbol": "BTC-USDT",
+    "side": "BUY",
+    "positionSide": "LONG",
+    "type": "LIMIT",
+    "quantity": 0.001,
+    "price": 97250.5,
+    "clientOrderId": "grid-3f2a9c1e",
+}
+
+
+async def test_signed_order_url(bench):
+    client = BingXClient(BingXConfig(API_KEY, SECRET_KEY), http_client=httpx.AsyncClient())
+    params = dict(ORDER_PARAMS)
+    timestamps = iter(range(1_760_000_000_000, 1_760_000_100_000))
+
+    def next_timestamp():
+        params["timestamp"] = next(timestamps)
+
+    url = bench(client._signed_url, ENDPOINT, params, setup=next_timestamp, rounds=5000)
+
+    assert "&signature=" in url
+    await client.close()
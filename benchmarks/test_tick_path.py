@@ -0,0 +1,76 @@
+"""
+Price tick path: trade stream frame -> GridManager.update_price_from_websocket.
+
+Frames are gzip-compressed JSON, as BingX sends them, fed straight into the
+market WebSocket's message loop. The chain under test is the production
+wiring from main.py: BingXWebSocket -> PriceStreamer -> GridManager, with
+the update scheduler attached so the repositioning check runs too.
+"""
+
+import gzip
+import json
+from collections import deque
+
+import numpy as np
+
+from benchmarks.conftest import PRICE, SYMBOL
+from src.api.services.price_streamer import PriceStreamer
+from src.grid.update_scheduler import UpdateScheduler
+
+
+class FrameSocket:
+    """Stands in for the websockets connection: yields the queued frames."""
+
+    def __init__(self):
+        self.frames: deque[bytes] = deque()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> bytes:
+        if not self.frames:
+            raise StopAsyncIteration
+        return self.frames.popleft()
+
+
+def trade_frame(price: float, trade_id: int) -> bytes:
+    message = {
+        "code": 0,
+        "dataType": f"{SYMBOL}@trade",
+        "data": {
+            "e": "trade",
+            "E": 1_704_067_200_000 + trade_id,
+            "s": SYMBOL,
+            "t": str(trade_id),
+            "p": f"{price:.1f}",
+            "q": "0.0012",
+            "T": 1_704_067_200_000 + trade_id,
+            "m": bool(trade_id % 2),
+        },
+    }
+    return gzip.compress(json.dumps(message).encode())
+
+
+async def test_price_tick_to_grid_manager(bench, grid_manager_factory):
+    manager = grid_manager_factory()
+    manager._scheduler = UpdateScheduler(manager.run_triggers)  # Not started: notify only
+    streamer = PriceStreamer(manager.config.bingx, symbol=SYMBOL)
+    streamer.set_price_callback(manager.update_price_from_websocket)
+    ws = streamer.ws_client
+    await ws.subscribe_price(SYMBOL, streamer._handle_price_update)
+    ws._ws = socket = FrameSocket()
+
+    rng = np.random.default_rng(7)
+    prices = iter(PRICE * np.exp(np.cumsum(rng.normal(0, 0.0002, 3000))))
+    frames = (trade_frame(price, i) for i, price in enumerate(prices))
+    last = {"frame": b""}
+
+    async def next_frame():
+        last["frame"] = next(frames)
+        socket.frames.append(last["frame"])
+
+    await bench.run_async(ws._message_loop, setup=next_frame, rounds=2000, warmup=100)
+
+    sent = json.loads(gzip.decompress(last["frame"]))["data"]["p"]
+    assert manager._current_price == float(sent)
+    assert manager._scheduler.stats["triggers"]["price"] > 0
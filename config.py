@@ -32,9 +32,13 @@ class BingXConfig:
     api_key: str
     secret_key: str
     is_demo: bool = True
+    rest_url: str = ""  # Overrides base_url (e.g. a local exchange simulator)
+    stream_url: str = ""  # Overrides ws_url
 
     @property
     def base_url(self) -> str:
+        if self.rest_url:
+            return self.rest_url
         if self.is_demo:
             return "https://open-api-vst.bingx.com"
         return "https://open-api.bingx.com"
@@ -42,7 +46,7 @@ class BingXConfig:
     @property
     def ws_url(self) -> str:
         # WebSocket URL (same for both modes)
-        return "wss://open-api-ws.bingx.com/market"
+        return self.stream_url or "wss://open-api-ws.bingx.com/market"
 
 
 @dataclass
@@ -116,6 +120,8 @@ def load_config() -> Config:
             api_key=os.getenv("BINGX_API_KEY", ""),
             secret_key=os.getenv("BINGX_SECRET_KEY", ""),
             is_demo=os.getenv("TRADING_MODE", "demo").lower() == "demo",
+            rest_url=os.getenv("BINGX_REST_URL", ""),
+            stream_url=os.getenv("BINGX_WS_URL", ""),
         ),
         trading=TradingConfig(
             symbol=os.getenv("SYMBOL", "BTC-USDT"),
@@ -15,15 +15,18 @@ from config import load_config
 from src.api.dependencies import set_global_account_id, set_grid_manager, set_order_tracker
 from src.api.services.price_streamer import PriceStreamer
 from src.client.bingx_client import BingXClient
-from src.database.engine import get_session
+from src.client.http_pool import close_http_client, init_http_client
+from src.client.kline_store import KlineStore
+from src.client.time_sync import server_clock
+from src.database.engine import dispose_engine, get_session, init_engine
 from src.database.helpers import get_or_create_account
-from src.database.repositories.activity_event_repository import ActivityEventRepository
 from src.database.repositories.bot_state_repository import BotStateRepository
 from src.database.repositories.macd_filter_config_repository import MACDFilterConfigRepository
 from src.database.repositories.strategy_repository import StrategyRepository
 from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
 from src.grid.grid_manager import GridManager
 from src.health.health_server import HealthServer
+from src.services.activity_event_sink import ActivityEventSink
 from src.strategy.macd_strategy import GridState
 from src.ui.alerts import AudioAlerts
 from src.utils.logger import main_logger
@@ -55,7 +58,10 @@ async def run_bot() -> None:
         sys.exit(1)
 
     # Initialize components
+    init_engine()  # Shared DB engine/pool for the whole process
+    init_http_client()  # Shared BingX HTTP pool (bot + API)
     client = BingXClient(config.bingx)
+    server_clock.start(client.get_server_time)  # Signed timestamps follow BingX's clock
     alerts = AudioAlerts(enabled=True)
     price_streamer = PriceStreamer(config.bingx, symbol=config.trading.symbol)
 
@@ -182,12 +188,16 @@ async def run_bot() -> None:
             "TPAdjustmentRepositoryWrapper",
             (),
             {
-                "save_adjustment": lambda self, *args, **kwargs: (
-                    _save_tp_adjustment_with_session(*args, **kwargs)
+                "save_adjustment": lambda self, *args, **kwargs: _save_tp_adjustment_with_session(
+                    *args, **kwargs
                 ),
             },
         )()
 
+    # Batched write-behind sink for activity events (flushed on shutdown)
+    activity_event_sink = ActivityEventSink()
+    await activity_event_sink.start()
+
     # Create GridManager with repository wrapper injected
     grid_manager = GridManager(
         config=config,
@@ -199,6 +209,7 @@ async def run_bot() -> None:
         bot_state_repository=None,  # Will be set after
         strategy_repository=None,  # Will be set after
         tp_adjustment_repository=tp_adjustment_repository_wrapper,
+        activity_event_sink=activity_event_sink,
     )
 
     # Set up bot state repository with a session factory
@@ -291,32 +302,6 @@ async def run_bot() -> None:
         # Configure wrapper in HealthServer for legacy API endpoints
         health_server.set_trading_config_repo(trading_config_wrapper)
 
-        # Create a wrapper activity event repository that creates sessions on demand
-        async def _log_activity_event_with_session(
-            account_id, event_type, description, event_data=None, timestamp=None
-        ):
-            """Helper to log activity event with a new session."""
-            async for session in get_session():
-                repo = ActivityEventRepository(session)
-                return await repo.create_event(
-                    account_id=account_id,
-                    event_type=event_type,
-                    description=description,
-                    event_data=event_data,
-                    timestamp=timestamp,
-                )
-
-        # Configure wrapper in GridManager
-        grid_manager._activity_event_repository = type(
-            "ActivityEventRepositoryWrapper",
-            (),
-            {
-                "create_event": lambda self, *args, **kwargs: _log_activity_event_with_session(
-                    *args, **kwargs
-                ),
-            },
-        )()
-
     # Restore state if available
     if restored_state:
         grid_manager.strategy.restore_state(
@@ -434,44 +419,55 @@ async def run_bot() -> None:
     # This enables GridManager to receive prices via WebSocket instead of REST API polling
     price_streamer.set_price_callback(grid_manager.update_price_from_websocket)
 
+    # Stream klines over the same market WebSocket (REST is only used for backfills)
+    kline_store = KlineStore(
+        client,
+        price_streamer.ws_client,
+        config.trading.symbol,
+        interval=grid_manager.strategy.timeframe,
+    )
+    await kline_store.start()
+    grid_manager.set_kline_store(kline_store)
+
     # Start price streamer for real-time dashboard updates
     await price_streamer.start()
 
     main_logger.info("Bot iniciado. Pressione Ctrl+C para encerrar.")
 
+    # Event-driven updates: price ticks, account events and candle closes trigger
+    # only the work they affect; a slow poll runs the full cycle as safety net
+    grid_manager.start_scheduler(poll_interval=30.0)
+
     try:
-        # Main loop with heartbeat monitoring
-        iteration_count = 0
+        # Heartbeat monitoring (the scheduler runs the updates)
+        uptime = 0
         while True:
             try:
-                iteration_count += 1
-
-                # Heartbeat log every 60s (12 iterations * 5s)
-                if iteration_count % 12 == 0:
-                    main_logger.info(
-                        f"Loop heartbeat: iteration {iteration_count}, uptime: {iteration_count * 5}s"
-                    )
-
-                # Update grid manager
-                await grid_manager.update()
-
-                # Wait before next update (5s with caching)
-                await asyncio.sleep(5)
+                await asyncio.sleep(60)
+                uptime += 60
+                stats = grid_manager.scheduler_stats or {}
+                main_logger.info(
+                    f"Loop heartbeat: uptime: {uptime}s, updates: {stats.get('runs', 0)}, "
+                    f"last latency: {stats.get('last_latency_ms', 0.0)}ms"
+                )
 
             except asyncio.CancelledError:
                 break
-            except Exception as e:
-                main_logger.error(f"Erro no loop principal: {e}")
-                await asyncio.sleep(5)
 
     except KeyboardInterrupt:
         pass
     finally:
         main_logger.info("Encerrando bot...")
+        if grid_manager.kline_store is not None:
+            await grid_manager.kline_store.stop()  # May have moved to a new timeframe
         await price_streamer.stop()
         await grid_manager.stop()
+        await activity_event_sink.stop()
         await health_server.stop()
+        await server_clock.stop()
         await client.close()
+        await close_http_client()
+        await dispose_engine()
         main_logger.info("Bot encerrado com sucesso.")
 
 
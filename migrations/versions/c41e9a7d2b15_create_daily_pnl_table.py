@@ -0,0 +1,61 @@
+"""create_daily_pnl_table
+
+Revision ID: c41e9a7d2b15
+Revises: d3aed5818b8f
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c41e9a7d2b15"  # pragma: allowlist secret
+down_revision: str | Sequence[str] | None = "d3aed5818b8f"  # pragma: allowlist secret
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "daily_pnl",
+        sa.Column("account_id", sa.Uuid(), nullable=False),
+        sa.Column("symbol", sa.String(length=20), nullable=False),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("realized_pnl", sa.Numeric(precision=20, scale=8), nullable=False),
+        sa.Column("fees", sa.Numeric(precision=20, scale=8), nullable=False),
+        sa.Column("trade_count", sa.Integer(), nullable=False),
+        sa.Column("wins", sa.Integer(), nullable=False),
+        sa.Column("losses", sa.Integer(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("account_id", "symbol", "date"),
+    )
+
+    # Backfill from existing closed trades (same grouping as DailyPnlRepository.rebuild)
+    op.execute(
+        """
+        INSERT INTO daily_pnl
+            (account_id, symbol, date, realized_pnl, fees, trade_count, wins, losses, updated_at)
+        SELECT
+            account_id,
+            symbol,
+            (closed_at AT TIME ZONE 'UTC')::date,
+            SUM(pnl),
+            SUM(trading_fee + funding_fee),
+            COUNT(*),
+            COUNT(*) FILTER (WHERE pnl > 0),
+            COUNT(*) FILTER (WHERE pnl < 0),
+            now()
+        FROM trades
+        WHERE status = 'CLOSED' AND pnl IS NOT NULL AND closed_at IS NOT NULL
+        GROUP BY account_id, symbol, (closed_at AT TIME ZONE 'UTC')::date
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("daily_pnl")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Backtest the grid strategy on stored OHLCV candles.
+
+Grid, MACD and order size default to the bot's configuration (.env); any of
+them can be overridden on the command line.
+
+Usage:
+    python scripts/backtest.py data/BTC-USDT_1m.csv
+    python scripts/backtest.py data/BTC-USDT_1m.parquet --spacing 0.3 --spacing-type percent
+    python scripts/backtest.py data/BTC-USDT_1m.csv --no-macd --ema --tp 0.5
+
+The data file needs timestamp (or time), open, high, low, close and volume
+columns; see src/backtest/data.py.
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from dataclasses import replace
+
+from dotenv import load_dotenv
+
+from config import MACDConfig, SpacingType, load_config
+from src.backtest import BacktestConfig, BacktestEngine, load_klines
+
+
+def build_config(args: argparse.Namespace) -> BacktestConfig:
+    """Bot configuration with command-line overrides applied."""
+    bot = load_config()
+    grid = replace(
+        bot.grid,
+        **{
+            name: value
+            for name, value in (
+                ("spacing_type", args.spacing_type and SpacingType(args.spacing_type)),
+                ("spacing_value", args.spacing),
+                ("range_percent", args.range),
+                ("take_profit_percent", args.tp),
+                ("max_total_orders", args.max_orders),
+            )
+            if value is not None
+        },
+    )
+    macd = MACDConfig(
+        fast=args.macd_fast or bot.macd.fast,
+        slow=args.macd_slow or bot.macd.slow,
+        signal=args.macd_signal or bot.macd.signal,
+        timeframe=args.timeframe or bot.macd.timeframe,
+    )
+    return BacktestConfig(
+        grid=grid,
+        macd=macd,
+        macd_enabled=not args.no_macd,
+        ema_enabled=args.ema,
+        ema_period=args.ema_period,
+        order_size_usdt=args.order_size or bot.trading.order_size_usdt,
+        fee_rate=args.fee_rate,
+        initial_balance=args.balance,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("data", help="CSV or Parquet file with OHLCV candles")
+    parser.add_argument("--env-file", default=".env")
+    parser.add_argument("--spacing-type", choices=[t.value for t in SpacingType])
+    parser.add_argument("--spacing", type=float, help="Grid spacing (USDT or %%)")
+    parser.add_argument("--range", type=float, help="Grid range below price (%%)")
+    parser.add_argument("--tp", type=float, help="Take profit (%%)")
+    parser.add_argument("--max-orders", type=int, help="Max pending orders + open positions")
+    parser.add_argument("--macd-fast", type=int)
+    parser.add_argument("--macd-slow", type=int)
+    parser.add_argument("--macd-signal", type=int)
+    parser.add_argument("--timeframe", help="MACD/EMA timeframe (e.g. 1h)")
+    parser.add_argument("--no-macd", action="store_true", help="Disable the MACD filter")
+    parser.add_argument("--ema", action="store_true", help="Enable the EMA filter")
+    parser.add_argument("--ema-period", type=int, default=13)
+    parser.add_argument("--order-size", type=float, help="Order size in USDT")
+    parser.add_argument("--fee-rate", type=float, default=0.0002, help="Fee per side")
+    parser.add_argument("--balance", type=float, default=1000.0, help="Initial balance")
+    args = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    config = build_config(args)
+    klines = load_klines(args.data)
+
+    started = time.perf_counter()
+    result = asyncio.run(BacktestEngine(config).run(klines))
+    elapsed = time.perf_counter() - started
+
+    print(json.dumps(result.summary(), indent=2))
+    print(f"Replayed {len(klines)} candles in {elapsed:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Benchmark: TP adjustment loading for a /trades page, per trade vs bulk.
+
+Seeds trades with TP adjustments and, for each page size, times loading the
+adjustments of one page with one query per trade (get_by_trade, the old N+1
+path) and with a single query (get_by_trades).
+
+Usage:
+    python scripts/bench_trade_adjustments.py
+    python scripts/bench_trade_adjustments.py --database-url postgresql+asyncpg://...
+
+Uses an in-memory SQLite database by default. SQLite has no network round
+trip, so the gap is much larger against a real PostgreSQL server.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from decimal import Decimal
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.database.base import Base
+from src.database.models.account import Account
+from src.database.models.tp_adjustment import TPAdjustment
+from src.database.models.trade import Trade
+from src.database.models.user import User
+from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
+
+PAGE_SIZES = (10, 50, 100, 500, 1000)
+
+
+async def seed(session: AsyncSession, trades: int, adjustments_per_trade: int) -> list[Trade]:
+    """Create one account with trades, each with a few TP adjustments."""
+    user = User(
+        email="bench@example.com",
+        name="Bench",
+        password_hash="x",  # pragma: allowlist secret
+    )
+    session.add(user)
+    await session.flush()
+    account = Account(user_id=user.id, exchange="bingx", name="Bench", is_demo=True)
+    session.add(account)
+    await session.flush()
+
+    rows = [
+        Trade(
+            account_id=account.id,
+            exchange_order_id=str(i),
+            symbol="BTC-USDT",
+            side="LONG",
+            leverage=10,
+            entry_price=Decimal("50000"),
+            quantity=Decimal("0.001"),
+            tp_price=Decimal("50250"),
+            tp_percent=Decimal("0.5"),
+            status="CLOSED",
+        )
+        for i in range(trades)
+    ]
+    session.add_all(rows)
+    await session.flush()
+    session.add_all(
+        TPAdjustment(
+            trade_id=trade.id,
+            old_tp_price=Decimal("50250"),
+            new_tp_price=Decimal("50300"),
+            old_tp_percent=Decimal("0.5"),
+            new_tp_percent=Decimal("0.6"),
+        )
+        for trade in rows
+        for _ in range(adjustments_per_trade)
+    )
+    await session.commit()
+    return rows
+
+
+async def time_call(func, repeat: int) -> float:
+    """Median wall time of func() in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+async def run(database_url: str, adjustments_per_trade: int, repeat: int) -> None:
+    engine = create_async_engine(database_url)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    session_maker = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with session_maker() as session:
+            trades = await seed(session, max(PAGE_SIZES), adjustments_per_trade)
+            repo = TPAdjustmentRepository(session)
+
+            print(f"{'page size':>10} {'per trade (ms)':>15} {'bulk (ms)':>10} {'speedup':>8}")
+            for size in PAGE_SIZES:
+                trade_ids = [t.id for t in trades[:size]]
+
+                async def per_trade(ids=trade_ids):
+                    return [await repo.get_by_trade(trade_id) for trade_id in ids]
+
+                async def bulk(ids=trade_ids):
+                    return await repo.get_by_trades(ids)
+
+                per_trade_ms = await time_call(per_trade, repeat)
+                bulk_ms = await time_call(bulk, repeat)
+                print(
+                    f"{size:>10} {per_trade_ms:>15.1f} {bulk_ms:>10.1f} "
+                    f"{per_trade_ms / bulk_ms:>7.1f}x"
+                )
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default="sqlite+aiosqlite:///:memory:")
+    parser.add_argument("--adjustments-per-trade", type=int, default=2)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.adjustments_per_trade, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,7 @@ import asyncio
 from dotenv import load_dotenv
 from sqlalchemy import delete, func, select
 
-from src.database.engine import get_engine, get_session_maker
+from src.database.engine import create_engine, get_session_maker
 from src.database.models.activity_event import ActivityEvent
 from src.database.models.trade import Trade
 
@@ -17,7 +17,7 @@ async def clear_tables():
     load_dotenv(".env.stage")
 
     print("Conectando ao banco de dados stage...")
-    engine = get_engine(echo=True)
+    engine = create_engine(echo=True)
     session_maker = get_session_maker(engine)
 
     async with session_maker() as session:
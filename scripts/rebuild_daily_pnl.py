@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""Rebuild the daily_pnl rollup table from the trades table.
+
+The rollup is maintained incrementally whenever a trade closes. Run this to
+backfill it, or to recompute it after trades were edited outside the bot.
+
+Usage:
+    python scripts/rebuild_daily_pnl.py
+    python scripts/rebuild_daily_pnl.py --account-id <uuid>
+    python scripts/rebuild_daily_pnl.py --env-file .env.stage
+"""
+
+import argparse
+import asyncio
+from uuid import UUID
+
+from dotenv import load_dotenv
+
+from src.database.engine import create_engine, get_session_maker
+from src.database.repositories.daily_pnl_repository import DailyPnlRepository
+
+
+async def rebuild(account_id: UUID | None) -> int:
+    """Rebuild the rollup for one account (or all) and return the row count."""
+    engine = create_engine()
+    session_maker = get_session_maker(engine)
+    try:
+        async with session_maker() as session:
+            return await DailyPnlRepository(session).rebuild(account_id)
+    finally:
+        await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--account-id", type=UUID, default=None)
+    parser.add_argument("--env-file", default=".env")
+    args = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    rows = asyncio.run(rebuild(args.account_id))
+    scope = f"account {args.account_id}" if args.account_id else "all accounts"
+    print(f"daily_pnl rebuilt for {scope}: {rows} rows")
+
+
+if __name__ == "__main__":
+    main()
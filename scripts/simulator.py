@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Run a local BingX simulator for offline bot runs and load tests.
+
+Serves the BingX REST and WebSocket APIs from an in-process exchange. The
+price follows a scripted path: stored candles (the first --warmup become the
+kline history, the rest are replayed tick by tick) or a random walk.
+
+Usage:
+    python scripts/simulator.py --data data/BTC-USDT_1m.csv --tick-interval 0.05
+    python scripts/simulator.py --latency 40 --jitter 20 --error-rate 0.01 \\
+        --rate-limit order=10 --rate-limit account=20
+
+Then start the bot against it:
+    BINGX_REST_URL=http://127.0.0.1:8090 BINGX_WS_URL=ws://127.0.0.1:8090/market \\
+        python main.py
+"""
+
+import argparse
+import asyncio
+import os
+from collections.abc import Iterator
+
+import numpy as np
+from dotenv import load_dotenv
+
+from src.backtest import load_klines
+from src.simulator import BingXSimulator, FakeExchange, SimulatorConfig, candle_ticks
+
+
+def parse_rate_limit(text: str) -> tuple[str, int]:
+    """Parse "group=requests_per_second" (group: market, account or order)."""
+    group, sep, value = text.partition("=")
+    if not sep or group not in ("market", "account", "order"):
+        raise argparse.ArgumentTypeError("expected market|account|order=N")
+    return group, int(value)
+
+
+def random_walk(price: float, volatility: float, seed: int | None) -> Iterator[float]:
+    """Endless geometric random walk starting at price."""
+    rng = np.random.default_rng(seed)
+    while True:
+        for step in rng.normal(0, volatility, 1000):
+            price *= float(np.exp(step))
+            yield price
+
+
+async def run(args: argparse.Namespace) -> None:
+    exchange = FakeExchange(symbol=args.symbol, price=args.price, balance=args.balance)
+    prices: Iterator[float]
+    if args.data:
+        klines = load_klines(args.data)
+        exchange.seed_klines(klines[: args.warmup])
+        prices = candle_ticks(klines[args.warmup :])
+    else:
+        prices = random_walk(args.price, args.volatility, args.seed)
+
+    simulator = BingXSimulator(
+        SimulatorConfig(
+            host=args.host,
+            port=args.port,
+            api_key=os.getenv("BINGX_API_KEY", ""),
+            secret_key=os.getenv("BINGX_SECRET_KEY", ""),
+            latency_ms=args.latency,
+            jitter_ms=args.jitter,
+            rate_limits=dict(args.rate_limit or []),
+            error_rate=args.error_rate,
+            clock_offset_ms=args.clock_offset,
+            seed=args.seed,
+        ),
+        exchange,
+    )
+    async with simulator:
+        print(f"BINGX_REST_URL={simulator.rest_url}")
+        print(f"BINGX_WS_URL={simulator.ws_url}")
+        await simulator.play(prices, args.tick_interval)
+        print(f"Price path finished: {exchange.stats}")
+        await asyncio.Event().wait()  # Keep serving until interrupted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--env-file", default=".env", help="Credentials to accept")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument("--symbol", default="BTC-USDT")
+    parser.add_argument("--balance", type=float, default=10_000.0, help="USDT balance")
+    parser.add_argument("--data", help="CSV or Parquet candles for the price path")
+    parser.add_argument("--warmup", type=int, default=6000, help="Candles used as history")
+    parser.add_argument("--price", type=float, default=100_000.0, help="Random walk start")
+    parser.add_argument("--volatility", type=float, default=0.0005, help="Random walk step")
+    parser.add_argument("--tick-interval", type=float, default=0.1, help="Seconds per tick")
+    parser.add_argument("--latency", type=float, default=0.0, help="Latency (ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Extra random latency (ms)")
+    parser.add_argument("--rate-limit", type=parse_rate_limit, action="append")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Failed request fraction")
+    parser.add_argument("--clock-offset", type=int, default=0, help="Server clock skew (ms)")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    try:
+        asyncio.run(run(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Sweep grid/MACD/EMA parameters over stored candles on all CPU cores.
+
+Each --param takes a parameter name and comma-separated values; every
+combination is backtested. Parameters not swept come from the bot's
+configuration (.env). Re-running with the same output directory resumes
+an interrupted sweep.
+
+Usage:
+    python scripts/sweep.py data/BTC-USDT_1m.csv sweeps/btc \\
+        --param spacing_value=0.2,0.3,0.5 --param take_profit_percent=0.3,0.5,1.0
+    python scripts/sweep.py data/BTC-USDT_1m.parquet sweeps/macd --workers 8 \\
+        --param macd_fast=8,12 --param macd_slow=21,26 --param macd_signal=7,9
+
+Parameters: spacing_type, spacing_value, range_percent, take_profit_percent,
+max_total_orders, macd_fast, macd_slow, macd_signal, ema_period.
+"""
+
+import argparse
+from typing import Any
+
+from dotenv import load_dotenv
+
+from config import load_config
+from src.backtest import BacktestConfig, load_klines, run_sweep
+from src.backtest.sweep import SWEEP_PARAMETERS
+
+INT_PARAMETERS = {"max_total_orders", "macd_fast", "macd_slow", "macd_signal", "ema_period"}
+
+
+def parse_param(text: str) -> tuple[str, list[Any]]:
+    """Parse "name=v1,v2,..." into the parameter name and typed values."""
+    name, sep, values = text.partition("=")
+    if not sep or name not in SWEEP_PARAMETERS:
+        raise argparse.ArgumentTypeError(
+            f"expected name=v1,v2,... with name in {', '.join(SWEEP_PARAMETERS)}"
+        )
+    if name == "spacing_type":
+        cast: type = str
+    else:
+        cast = int if name in INT_PARAMETERS else float
+    return name, [cast(v) for v in values.split(",") if v]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("data", help="CSV or Parquet file with OHLCV candles")
+    parser.add_argument("output", help="Sweep directory (dataset + results)")
+    parser.add_argument("--param", type=parse_param, action="append", required=True)
+    parser.add_argument("--env-file", default=".env")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--batch-size", type=int, default=8)
+    parser.add_argument("--format", choices=["parquet", "csv"])
+    parser.add_argument("--no-macd", action="store_true", help="Disable the MACD filter")
+    parser.add_argument("--ema", action="store_true", help="Enable the EMA filter")
+    parser.add_argument("--fee-rate", type=float, default=0.0002, help="Fee per side")
+    parser.add_argument("--balance", type=float, default=1000.0, help="Initial balance")
+    parser.add_argument("--top", type=int, default=10, help="Best results to print")
+    args = parser.parse_args()
+
+    load_dotenv(args.env_file)
+    bot = load_config()
+    base = BacktestConfig(
+        grid=bot.grid,
+        macd=bot.macd,
+        macd_enabled=not args.no_macd,
+        ema_enabled=args.ema,
+        order_size_usdt=bot.trading.order_size_usdt,
+        fee_rate=args.fee_rate,
+        initial_balance=args.balance,
+    )
+
+    results = run_sweep(
+        load_klines(args.data),
+        dict(args.param),
+        base,
+        args.output,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        format=args.format,
+    )
+
+    columns = [name for name, _ in args.param]
+    columns += ["total_pnl", "max_drawdown_percent", "trades", "win_rate"]
+    print(results.sort_values("total_pnl", ascending=False)[columns].head(args.top).to_string())
+    print(f"{len(results)} results in {args.output}/results")
+
+
+if __name__ == "__main__":
+    main()
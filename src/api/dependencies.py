@@ -3,6 +3,7 @@
 This module provides dependency injection functions for:
 - Database sessions
 - Repositories
+- Analytics cache bypass header
 - BingX client
 - GridManager instance
 - Filter registry
@@ -18,7 +19,7 @@ from typing import TYPE_CHECKING
 from uuid import UUID
 
 import jwt
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Header, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from passlib.context import CryptContext
 from sqlalchemy import select
@@ -28,7 +29,9 @@ from src.api.schemas.auth import TokenData
 from src.database import get_session
 from src.database.models.user import User
 from src.database.repositories.activity_event_repository import ActivityEventRepository
+from src.database.repositories.daily_pnl_repository import DailyPnlRepository
 from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
+from src.database.repositories.trade_analytics_repository import TradeAnalyticsRepository
 from src.database.repositories.trade_repository import TradeRepository
 from src.filters.registry import FilterRegistry
 from src.grid.order_tracker import OrderTracker
@@ -242,6 +245,34 @@ async def get_trade_repository(
     return TradeRepository(session)
 
 
+async def get_trade_analytics_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> TradeAnalyticsRepository:
+    """Get TradeAnalyticsRepository instance for dependency injection.
+
+    Args:
+        session: Database session from get_db_session
+
+    Returns:
+        TradeAnalyticsRepository: Trade analytics repository instance
+    """
+    return TradeAnalyticsRepository(session)
+
+
+async def get_daily_pnl_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> DailyPnlRepository:
+    """Get DailyPnlRepository instance for dependency injection.
+
+    Args:
+        session: Database session from get_db_session
+
+    Returns:
+        DailyPnlRepository: Daily P&L rollup repository instance
+    """
+    return DailyPnlRepository(session)
+
+
 async def get_activity_event_repository(
     session: AsyncSession = Depends(get_db_session),
 ) -> ActivityEventRepository:
@@ -270,6 +301,27 @@ async def get_tp_adjustment_repository(
     return TPAdjustmentRepository(session)
 
 
+def get_cache_bypass(
+    x_cache_bypass: str | None = Header(default=None),
+    cache_control: str | None = Header(default=None),
+) -> bool:
+    """Whether the request asks to skip the analytics response cache.
+
+    Set ``X-Cache-Bypass: 1`` or ``Cache-Control: no-cache`` to force a fresh
+    computation when debugging.
+
+    Args:
+        x_cache_bypass: X-Cache-Bypass header value
+        cache_control: Cache-Control header value
+
+    Returns:
+        bool: True if the cache should be bypassed
+    """
+    if x_cache_bypass and x_cache_bypass.lower() not in ("0", "false"):
+        return True
+    return bool(cache_control and "no-cache" in cache_control.lower())
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
     session: AsyncSession = Depends(get_db),
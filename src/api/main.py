@@ -70,6 +70,13 @@ async def startup_event():
     """Initialize services on API startup."""
     global _price_streamer
 
+    try:
+        from src.database.engine import init_engine
+
+        init_engine()
+    except Exception as e:
+        logger.error(f"Failed to initialize database engine: {e}")
+
     try:
         from config import load_config
         from src.api.services.price_streamer import PriceStreamer
@@ -96,6 +103,13 @@ async def shutdown_event():
         except Exception as e:
             logger.error(f"Error stopping PriceStreamer: {e}")
 
+    try:
+        from src.database.engine import dispose_engine
+
+        await dispose_engine()
+    except Exception as e:
+        logger.error(f"Error disposing database engine: {e}")
+
 
 @app.get("/")
 async def root():
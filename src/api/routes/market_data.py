@@ -18,6 +18,7 @@ from src.api.schemas.market_data import (
 from src.api.websocket.connection_manager import get_connection_manager
 from src.api.websocket.events import PriceUpdateEvent, WebSocketEvent
 from src.client.bingx_client import BingXClient
+from src.client.kline_store import get_kline_store
 from src.grid.grid_calculator import GridCalculator
 from src.strategy.macd_strategy import MACDStrategy
 
@@ -215,7 +216,8 @@ async def get_macd(
     - Overall signal (bullish/bearish/neutral)
     - Whether histogram is rising or falling
 
-    Data is based on klines cached for 60 seconds.
+    Uses the streaming kline store when the bot is running (updated on every
+    kline message); otherwise falls back to REST klines cached for 60 seconds.
 
     Args:
         client: BingX API client
@@ -229,11 +231,16 @@ async def get_macd(
         HTTPException: If API request or calculation fails
     """
     try:
-        # Fetch klines for MACD calculation
-        klines = await client.get_klines(symbol, interval=strategy.timeframe, limit=100)
+        store = get_kline_store(symbol, strategy.timeframe)
+        if store is not None and store.is_ready:
+            # Zero-copy views over the streaming candles
+            macd_values = strategy.update_macd(store.klines())
+        else:
+            # Fetch klines for MACD calculation
+            klines = await client.get_klines(symbol, interval=strategy.timeframe, limit=100)
 
-        # Calculate MACD values
-        macd_values = strategy.calculate_macd(klines)
+            # Calculate MACD values
+            macd_values = strategy.calculate_macd(klines)
 
         if macd_values is None:
             raise HTTPException(
@@ -5,17 +5,24 @@ from decimal import Decimal
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 
-from src.api.dependencies import get_account_id, get_trade_repository
+from src.api.dependencies import (
+    get_account_id,
+    get_cache_bypass,
+    get_trade_analytics_repository,
+)
 from src.api.schemas.metrics import (
     PerformanceMetricsResponse,
     PeriodMetrics,
     TimePeriod,
     TotalMetrics,
 )
-from src.database.models.trade import Trade
-from src.database.repositories.trade_repository import TradeRepository
+from src.database.repositories.trade_analytics_repository import (
+    TradeAnalyticsRepository,
+    TradeSummary,
+)
+from src.utils.response_cache import analytics_cache
 
 router = APIRouter(prefix="/api/v1/metrics", tags=["Metrics"])
 
@@ -56,16 +63,16 @@ def _calculate_period_dates(
         return start_date, end_date
 
 
-def _calculate_metrics_from_trades(
-    trades: list[Trade],
+def _calculate_period_metrics(
+    summary: TradeSummary,
     period_label: str,
     start_date: datetime,
     end_date: datetime,
 ) -> PeriodMetrics:
-    """Calculate period metrics from a list of trades.
+    """Calculate period metrics from the period's trade aggregates.
 
     Args:
-        trades: List of Trade objects.
+        summary: Aggregates of the trades in the period.
         period_label: Label for the period (e.g., 'today', '7days').
         start_date: Period start datetime.
         end_date: Period end datetime.
@@ -73,81 +80,90 @@ def _calculate_metrics_from_trades(
     Returns:
         PeriodMetrics with calculated values.
     """
-    closed_trades = [t for t in trades if t.status == "CLOSED" and t.pnl is not None]
-
-    trades_closed = len(closed_trades)
-    winning_trades = sum(1 for t in closed_trades if t.pnl is not None and t.pnl > 0)
-    losing_trades = sum(1 for t in closed_trades if t.pnl is not None and t.pnl < 0)
-
-    realized_pnl = sum(t.pnl for t in closed_trades if t.pnl is not None)
-    realized_pnl_decimal = Decimal(str(realized_pnl)) if realized_pnl else Decimal("0")
+    trades_closed = summary.realized_trades
+    realized_pnl = summary.realized_pnl
 
     # Calculate P&L percentage relative to trade volume
-    total_volume = sum(t.entry_price * t.quantity for t in closed_trades)
     pnl_percent = Decimal("0")
-    if total_volume > 0:
-        pnl_percent = (realized_pnl_decimal / Decimal(str(total_volume))) * Decimal("100")
+    if summary.capital_employed > 0:
+        pnl_percent = (realized_pnl / summary.capital_employed) * Decimal("100")
 
     win_rate = Decimal("0")
     if trades_closed > 0:
-        win_rate = (Decimal(winning_trades) / Decimal(trades_closed)) * Decimal("100")
+        win_rate = (Decimal(summary.winning_trades) / Decimal(trades_closed)) * Decimal("100")
 
     return PeriodMetrics(
         period=period_label,
         start_date=start_date,
         end_date=end_date,
-        realized_pnl=realized_pnl_decimal.quantize(Decimal("0.01")),
+        realized_pnl=realized_pnl.quantize(Decimal("0.01")),
         pnl_percent=pnl_percent.quantize(Decimal("0.01")),
         trades_closed=trades_closed,
-        winning_trades=winning_trades,
-        losing_trades=losing_trades,
+        winning_trades=summary.winning_trades,
+        losing_trades=summary.losing_trades,
         win_rate=win_rate.quantize(Decimal("0.01")),
     )
 
 
-def _calculate_total_metrics(trades: list[Trade]) -> TotalMetrics:
-    """Calculate total metrics from all trades.
+def _calculate_total_metrics(summary: TradeSummary) -> TotalMetrics:
+    """Calculate total metrics from all-time trade aggregates.
 
     Args:
-        trades: List of all Trade objects.
+        summary: Aggregates of all the account's trades.
 
     Returns:
         TotalMetrics with calculated values.
     """
-    closed_trades = [t for t in trades if t.status == "CLOSED" and t.pnl is not None]
-    total_trades = len(closed_trades)
-
-    pnls = [t.pnl for t in closed_trades if t.pnl is not None]
-    total_pnl = sum(pnls) if pnls else Decimal("0")
-    total_pnl_decimal = Decimal(str(total_pnl))
+    total_trades = summary.realized_trades
+    total_pnl = summary.realized_pnl
 
     avg_profit = Decimal("0")
     if total_trades > 0:
-        avg_profit = total_pnl_decimal / Decimal(total_trades)
+        avg_profit = total_pnl / Decimal(total_trades)
 
-    total_fees = sum(t.trading_fee + t.funding_fee for t in closed_trades)
-    total_fees_decimal = Decimal(str(total_fees)) if total_fees else Decimal("0")
-
-    net_pnl = total_pnl_decimal - total_fees_decimal
-
-    best_trade = max(pnls) if pnls else Decimal("0")
-    worst_trade = min(pnls) if pnls else Decimal("0")
+    net_pnl = total_pnl - summary.realized_fees
 
     return TotalMetrics(
-        total_pnl=total_pnl_decimal.quantize(Decimal("0.01")),
+        total_pnl=total_pnl.quantize(Decimal("0.01")),
         total_trades=total_trades,
         avg_profit_per_trade=avg_profit.quantize(Decimal("0.01")),
-        total_fees=total_fees_decimal.quantize(Decimal("0.01")),
+        total_fees=summary.realized_fees.quantize(Decimal("0.01")),
         net_pnl=net_pnl.quantize(Decimal("0.01")),
-        best_trade=Decimal(str(best_trade)).quantize(Decimal("0.01")),
-        worst_trade=Decimal(str(worst_trade)).quantize(Decimal("0.01")),
+        best_trade=summary.best_pnl.quantize(Decimal("0.01")),
+        worst_trade=summary.worst_pnl.quantize(Decimal("0.01")),
+    )
+
+
+async def _get_performance(
+    analytics_repo: TradeAnalyticsRepository,
+    account_id: UUID,
+    period: TimePeriod,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> PerformanceMetricsResponse:
+    """Build period and all-time metrics from two aggregate queries."""
+    period_start, period_end = _calculate_period_dates(period, start_date, end_date)
+
+    period_summary = await analytics_repo.summarize(account_id, period_start, period_end)
+    total_summary = await analytics_repo.summarize(account_id)
+
+    return PerformanceMetricsResponse(
+        period_metrics=_calculate_period_metrics(
+            period_summary,
+            period.value,
+            period_start,
+            period_end,
+        ),
+        total_metrics=_calculate_total_metrics(total_summary),
     )
 
 
 @router.get("/performance", response_model=PerformanceMetricsResponse)
 async def get_performance_metrics_current(
+    response: Response,
     account_id: Annotated[UUID, Depends(get_account_id)],
-    trade_repo: Annotated[TradeRepository, Depends(get_trade_repository)],
+    analytics_repo: Annotated[TradeAnalyticsRepository, Depends(get_trade_analytics_repository)],
+    bypass_cache: Annotated[bool, Depends(get_cache_bypass)],
     period: Annotated[
         TimePeriod,
         Query(description="Time period for filtering (today, 7days, 30days, custom)"),
@@ -167,10 +183,14 @@ async def get_performance_metrics_current(
     This is a convenience endpoint for single-account mode.
 
     Returns both period-specific metrics and all-time total metrics.
+    Responses are cached until the account's trades change (see
+    src.utils.response_cache); the X-Cache header reports HIT, MISS or BYPASS.
 
     Args:
+        response: Outgoing response (carries the X-Cache header).
         account_id: Account UUID (injected via get_account_id dependency).
-        trade_repo: Injected trade repository.
+        analytics_repo: Injected trade analytics repository.
+        bypass_cache: Skip the analytics response cache (X-Cache-Bypass header).
         period: Time period filter (today, 7days, 30days, custom).
         start_date: Start date for custom period.
         end_date: End date for custom period.
@@ -183,26 +203,12 @@ async def get_performance_metrics_current(
     """
 
     try:
-        # Calculate period boundaries
-        period_start, period_end = _calculate_period_dates(period, start_date, end_date)
-
-        # Fetch period trades and all trades in parallel
-        period_trades = await trade_repo.get_trades_by_period(account_id, period_start, period_end)
-        all_trades = await trade_repo.get_trades_by_account(account_id, limit=100000, offset=0)
-
-        # Calculate metrics
-        period_metrics = _calculate_metrics_from_trades(
-            period_trades,
-            period.value,
-            period_start,
-            period_end,
-        )
-        total_metrics = _calculate_total_metrics(all_trades)
-
-        return PerformanceMetricsResponse(
-            period_metrics=period_metrics,
-            total_metrics=total_metrics,
+        metrics, response.headers["X-Cache"] = await analytics_cache.get_or_compute(
+            ("metrics/performance", account_id, period, start_date, end_date),
+            lambda: _get_performance(analytics_repo, account_id, period, start_date, end_date),
+            bypass=bypass_cache,
         )
+        return metrics
     except HTTPException:
         raise
     except Exception as e:
@@ -213,8 +219,10 @@ async def get_performance_metrics_current(
 
 @router.get("/performance/{account_id}", response_model=PerformanceMetricsResponse)
 async def get_performance_metrics(
+    response: Response,
     account_id: UUID,
-    trade_repo: Annotated[TradeRepository, Depends(get_trade_repository)],
+    analytics_repo: Annotated[TradeAnalyticsRepository, Depends(get_trade_analytics_repository)],
+    bypass_cache: Annotated[bool, Depends(get_cache_bypass)],
     period: Annotated[
         TimePeriod,
         Query(description="Time period for filtering (today, 7days, 30days, custom)"),
@@ -231,10 +239,14 @@ async def get_performance_metrics(
     """Get performance metrics for a specific account.
 
     Returns both period-specific metrics and all-time total metrics.
+    Responses are cached until the account's trades change (see
+    src.utils.response_cache); the X-Cache header reports HIT, MISS or BYPASS.
 
     Args:
+        response: Outgoing response (carries the X-Cache header).
         account_id: Account UUID to get metrics for.
-        trade_repo: Injected trade repository.
+        analytics_repo: Injected trade analytics repository.
+        bypass_cache: Skip the analytics response cache (X-Cache-Bypass header).
         period: Time period filter (today, 7days, 30days, custom).
         start_date: Start date for custom period.
         end_date: End date for custom period.
@@ -246,26 +258,12 @@ async def get_performance_metrics(
         HTTPException: If database operation fails or invalid parameters.
     """
     try:
-        # Calculate period boundaries
-        period_start, period_end = _calculate_period_dates(period, start_date, end_date)
-
-        # Fetch period trades and all trades in parallel
-        period_trades = await trade_repo.get_trades_by_period(account_id, period_start, period_end)
-        all_trades = await trade_repo.get_trades_by_account(account_id, limit=100000, offset=0)
-
-        # Calculate metrics
-        period_metrics = _calculate_metrics_from_trades(
-            period_trades,
-            period.value,
-            period_start,
-            period_end,
-        )
-        total_metrics = _calculate_total_metrics(all_trades)
-
-        return PerformanceMetricsResponse(
-            period_metrics=period_metrics,
-            total_metrics=total_metrics,
+        metrics, response.headers["X-Cache"] = await analytics_cache.get_or_compute(
+            ("metrics/performance", account_id, period, start_date, end_date),
+            lambda: _get_performance(analytics_repo, account_id, period, start_date, end_date),
+            bypass=bypass_cache,
         )
+        return metrics
     except HTTPException:
         raise
     except Exception as e:
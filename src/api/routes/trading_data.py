@@ -6,9 +6,16 @@ from enum import Enum
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-
-from src.api.dependencies import get_account_id, get_tp_adjustment_repository, get_trade_repository
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+
+from src.api.dependencies import (
+    get_account_id,
+    get_cache_bypass,
+    get_daily_pnl_repository,
+    get_tp_adjustment_repository,
+    get_trade_analytics_repository,
+    get_trade_repository,
+)
 from src.api.schemas.trading_data import (
     BestWorstTradeSchema,
     CumulativePnlDataPointSchema,
@@ -22,10 +29,14 @@ from src.api.schemas.trading_data import (
     TradesListResponse,
     TradeStatsSchema,
 )
+from src.database.models.daily_pnl import DailyPnl
 from src.database.models.tp_adjustment import TPAdjustment
 from src.database.models.trade import Trade
+from src.database.repositories.daily_pnl_repository import DailyPnlRepository, utc_date
 from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
-from src.database.repositories.trade_repository import TradeRepository
+from src.database.repositories.trade_analytics_repository import TradeAnalyticsRepository
+from src.database.repositories.trade_repository import InvalidCursorError, TradeRepository
+from src.utils.response_cache import analytics_cache
 
 
 class ProfitFilter(str, Enum):
@@ -123,21 +134,19 @@ def _calculate_fees(trade: Trade) -> TradeFeesSchema:
     )
 
 
-async def _enrich_trade(
+def _enrich_trade(
     trade: Trade,
-    tp_adjustment_repo: TPAdjustmentRepository,
+    adjustments: list[TPAdjustment],
 ) -> TradeSchema:
     """Enrich a trade with TP adjustments, duration, and fees.
 
     Args:
         trade: Trade model instance
-        tp_adjustment_repo: Repository to fetch TP adjustments
+        adjustments: TP adjustments of the trade (from TPAdjustmentRepository.get_by_trades)
 
     Returns:
         TradeSchema with all fields populated including new BE-TRADE-003 fields
     """
-    # Fetch TP adjustments for this trade
-    adjustments = await tp_adjustment_repo.get_by_trade(trade.id)
     tp_adjustment_schemas = [_convert_tp_adjustment(adj) for adj in adjustments]
 
     # Calculate duration and fees
@@ -234,119 +243,6 @@ def _calculate_duration_seconds(trade: Trade) -> int | None:
     return None
 
 
-def _get_sort_key(
-    trade: Trade, sort_by: SortByField
-) -> tuple[bool, Decimal | int | datetime | None]:
-    """Get the sort key for a trade based on the sort field.
-
-    Returns a tuple of (is_none, value) where is_none is True if the value is None.
-    This ensures None values are sorted consistently (at the end for ASC, start for DESC).
-
-    Args:
-        trade: Trade instance.
-        sort_by: Field to sort by.
-
-    Returns:
-        Tuple of (is_none, value) for stable sorting with None handling.
-    """
-    value: Decimal | int | datetime | None = None
-
-    if sort_by == SortByField.CLOSED_AT:
-        value = trade.closed_at
-    elif sort_by == SortByField.ENTRY_PRICE:
-        value = trade.entry_price
-    elif sort_by == SortByField.EXIT_PRICE:
-        value = trade.exit_price
-    elif sort_by == SortByField.QUANTITY:
-        value = trade.quantity
-    elif sort_by == SortByField.PNL:
-        value = trade.pnl
-    elif sort_by == SortByField.PNL_PERCENT:
-        value = trade.pnl_percent
-    elif sort_by == SortByField.DURATION:
-        value = _calculate_duration_seconds(trade)
-
-    # Return tuple for stable sorting: (is_none, value)
-    # This ensures None values are always sorted to the end regardless of direction
-    return (value is None, value if value is not None else Decimal(0))
-
-
-def _apply_in_memory_sorting(
-    trades: list[Trade],
-    sort_by: SortByField,
-    sort_direction: SortDirection,
-) -> list[Trade]:
-    """Sort trades in memory.
-
-    Used when sorting by computed fields (duration) or when in-memory filters
-    are applied and we need to re-sort the results.
-
-    Args:
-        trades: List of trades to sort.
-        sort_by: Field to sort by.
-        sort_direction: Sort direction (asc or desc).
-
-    Returns:
-        Sorted list of trades.
-    """
-    reverse = sort_direction == SortDirection.DESC
-    return sorted(trades, key=lambda t: _get_sort_key(t, sort_by), reverse=reverse)
-
-
-def _apply_in_memory_filters(
-    trades: list[Trade],
-    *,
-    profit_filter: ProfitFilter = ProfitFilter.ALL,
-    min_duration: int | None = None,
-    max_duration: int | None = None,
-    search_query: str | None = None,
-) -> list[Trade]:
-    """Apply filters that require in-memory processing.
-
-    Args:
-        trades: List of trades to filter.
-        profit_filter: Filter by profit/loss status.
-        min_duration: Minimum duration in seconds.
-        max_duration: Maximum duration in seconds.
-        search_query: Search by exchange_order_id or exchange_tp_order_id.
-
-    Returns:
-        Filtered list of trades.
-    """
-    result = trades
-
-    # Profit filter
-    if profit_filter == ProfitFilter.PROFITABLE:
-        result = [t for t in result if t.pnl is not None and t.pnl > 0]
-    elif profit_filter == ProfitFilter.LOSSES:
-        result = [t for t in result if t.pnl is not None and t.pnl < 0]
-
-    # Duration filter
-    if min_duration is not None or max_duration is not None:
-        filtered_by_duration = []
-        for trade in result:
-            duration = _calculate_duration_seconds(trade)
-            if duration is None:
-                continue  # Skip open trades for duration filter
-            if min_duration is not None and duration < min_duration:
-                continue
-            if max_duration is not None and duration > max_duration:
-                continue
-            filtered_by_duration.append(trade)
-        result = filtered_by_duration
-
-    # Search filter (exact match on exchange order IDs)
-    if search_query:
-        result = [
-            t
-            for t in result
-            if (t.exchange_order_id and search_query in t.exchange_order_id)
-            or (t.exchange_tp_order_id and search_query in t.exchange_tp_order_id)
-        ]
-
-    return result
-
-
 @router.get("/trades", response_model=TradesListResponse)
 async def get_trades(
     account_id: Annotated[UUID, Depends(get_account_id)],
@@ -399,6 +295,10 @@ async def get_trades(
         int, Query(ge=1, le=1000, description="Maximum number of trades to return")
     ] = 100,
     offset: Annotated[int, Query(ge=0, description="Number of trades to skip")] = 0,
+    cursor: Annotated[
+        str | None,
+        Query(description="next_cursor of the previous page (keyset pagination, ignores offset)"),
+    ] = None,
 ):
     """Get trades for the current account with advanced filtering, sorting, and pagination.
 
@@ -416,9 +316,11 @@ async def get_trades(
     - quantity: Sort by trade quantity
     - pnl: Sort by profit/loss amount
     - pnlPercent: Sort by profit/loss percentage
-    - duration: Sort by trade duration (computed field)
+    - duration: Sort by trade duration (closed_at - opened_at)
 
-    All filters combine with AND logic.
+    All filters combine with AND logic. Filtering, sorting and pagination all
+    run in SQL. Pages can be requested by offset, or by passing the response's
+    next_cursor as cursor (keyset pagination, constant cost for deep pages).
 
     Args:
         account_id: Account UUID (injected via dependency)
@@ -439,6 +341,7 @@ async def get_trades(
         sort_direction: Sort direction (default: desc)
         limit: Maximum number of trades to return (1-1000)
         offset: Number of trades to skip for pagination
+        cursor: Keyset cursor from a previous response (takes precedence over offset)
 
     Returns:
         TradesListResponse: List of trades with pagination info
@@ -479,160 +382,91 @@ async def get_trades(
                     status_code=400, detail="min_duration cannot be greater than max_duration"
                 )
 
-        # Check if any in-memory filters are applied
-        has_in_memory_filters = (
-            profit_filter != ProfitFilter.ALL
-            or min_duration is not None
-            or max_duration is not None
-            or search_query is not None
-        )
-
-        # Check if sorting needs to be done in-memory
-        # Duration is a computed field that cannot be sorted in SQL
-        needs_in_memory_sorting = sort_by == SortByField.DURATION or has_in_memory_filters
-
-        # When in-memory processing is needed, fetch more records
-        # This is a trade-off: we fetch more from DB to process in memory
-        fetch_limit = limit * 10 if needs_in_memory_sorting else limit
-        fetch_offset = 0 if needs_in_memory_sorting else offset
-
-        # Fetch trades with SQL filters and optional SQL sorting
-        trades, sql_total = await trade_repo.get_trades_with_filters(
+        # Fetch one page with all filters, sorting and pagination in SQL
+        page = await trade_repo.get_trades_page(
             account_id,
             start_date=start_date,
             end_date=end_date,
             status=status,
+            profit_filter=profit_filter,
             min_entry_price=min_entry_price,
             max_entry_price=max_entry_price,
+            min_duration=min_duration,
+            max_duration=max_duration,
             min_quantity=min_quantity,
             max_quantity=max_quantity,
-            limit=fetch_limit,
-            offset=fetch_offset,
-            sort_by=None if needs_in_memory_sorting else sort_by,
+            search_query=search_query,
+            limit=limit,
+            offset=offset,
+            cursor=cursor,
+            sort_by=sort_by,
             sort_direction=sort_direction,
         )
+        trades = page.trades
 
-        # Apply in-memory filters
-        if has_in_memory_filters:
-            trades = _apply_in_memory_filters(
-                trades,
-                profit_filter=profit_filter,
-                min_duration=min_duration,
-                max_duration=max_duration,
-                search_query=search_query,
-            )
-
-        # Apply in-memory sorting when needed
-        if needs_in_memory_sorting:
-            trades = _apply_in_memory_sorting(trades, sort_by, sort_direction)
-            total = len(trades)
-            trades = trades[offset : offset + limit]
-        else:
-            total = sql_total
-
-        # Enrich trades with TP adjustments, duration, and fees
-        trade_schemas = [await _enrich_trade(trade, tp_adjustment_repo) for trade in trades]
+        # Enrich trades with TP adjustments (one query for the whole page), duration, and fees
+        adjustments_by_trade = await tp_adjustment_repo.get_by_trades([t.id for t in trades])
+        trade_schemas = [
+            _enrich_trade(trade, adjustments_by_trade.get(trade.id, [])) for trade in trades
+        ]
 
         return TradesListResponse(
             trades=trade_schemas,
-            total=total,
+            total=page.total,
             limit=limit,
             offset=offset,
+            next_cursor=page.next_cursor,
         )
     except HTTPException:
         raise
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to fetch trades: {str(e)}") from e
 
 
-@router.get("/stats", response_model=TradeStatsSchema)
-async def get_trade_stats(
-    account_id: Annotated[UUID, Depends(get_account_id)],
-    trade_repo: Annotated[TradeRepository, Depends(get_trade_repository)],
-    start_date: Annotated[
-        datetime | None, Query(description="Calculate stats from this date")
-    ] = None,
-    end_date: Annotated[
-        datetime | None, Query(description="Calculate stats until this date")
-    ] = None,
-):
-    """Get trading statistics for the current account.
-
-    Calculates comprehensive statistics including win rate, total P&L,
-    fees, and average trade performance.
-
-    Args:
-        account_id: Account UUID (injected via dependency)
-        trade_repo: Injected trade repository
-        start_date: Optional start date for stats calculation
-        end_date: Optional end date for stats calculation
-
-    Returns:
-        TradeStatsSchema: Trading statistics
-
-    Raises:
-        HTTPException: If database operation fails
-    """
+async def _trade_stats(
+    analytics_repo: TradeAnalyticsRepository,
+    account_id: UUID,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> TradeStatsSchema:
+    """Compute trading statistics from one aggregate query."""
     try:
-        # Normalize dates to UTC timezone to ensure correct comparison with DB timestamps
-        start_date = _ensure_utc_timezone(start_date)
-        end_date = _ensure_utc_timezone(end_date)
-
-        # Fetch trades based on date filters
-        if start_date and end_date:
-            trades = await trade_repo.get_trades_by_period(account_id, start_date, end_date)
-        else:
-            trades = await trade_repo.get_trades_by_account(account_id, limit=10000, offset=0)
-
-        # Calculate statistics
-        total_trades = len(trades)
-        open_trades = sum(1 for t in trades if t.status == "OPEN")
-        closed_trades = sum(1 for t in trades if t.status == "CLOSED")
-
-        # Only consider closed trades for P&L stats
-        closed_trades_list = [t for t in trades if t.status == "CLOSED" and t.pnl is not None]
+        # Aggregate in the database (period applies only when both dates are given)
+        summary = await analytics_repo.summarize(account_id, start_date, end_date)
 
-        # Calculate winning/losing trades (mypy safe - filtered by pnl is not None)
-        winning_trades = sum(1 for t in closed_trades_list if t.pnl is not None and t.pnl > 0)
-        losing_trades = sum(1 for t in closed_trades_list if t.pnl is not None and t.pnl < 0)
+        closed_trades = summary.closed_trades
+        winning_trades = summary.winning_trades
+        losing_trades = summary.losing_trades
 
         win_rate = Decimal("0")
         if closed_trades > 0:
             win_rate = (Decimal(winning_trades) / Decimal(closed_trades)) * Decimal("100")
 
-        # Total P&L (mypy safe - all trades have non-null pnl after filter)
-        total_pnl_sum = sum(t.pnl for t in closed_trades_list if t.pnl is not None)
-        total_pnl = Decimal(str(total_pnl_sum)) if total_pnl_sum else Decimal("0")
-        total_fees_sum = sum(t.trading_fee + t.funding_fee for t in trades)
-        total_fees = Decimal(str(total_fees_sum)) if total_fees_sum else Decimal("0")
+        # P&L stats only consider closed trades; fees cover all trades
+        total_pnl = summary.realized_pnl
+        total_fees = summary.total_fees
         net_pnl = total_pnl - total_fees
 
         avg_pnl_per_trade = Decimal("0")
         if closed_trades > 0:
             avg_pnl_per_trade = total_pnl / Decimal(closed_trades)
 
-        # Calculate average win/loss (mypy safe - filtered)
-        winning_pnls: list[Decimal] = [
-            t.pnl for t in closed_trades_list if t.pnl is not None and t.pnl > 0
-        ]
-        losing_pnls: list[Decimal] = [
-            t.pnl for t in closed_trades_list if t.pnl is not None and t.pnl < 0
-        ]
-
         avg_win = Decimal("0")
-        if winning_pnls:
-            avg_win = sum(winning_pnls) / Decimal(len(winning_pnls))
+        if winning_trades:
+            avg_win = summary.gross_profit / Decimal(winning_trades)
 
         avg_loss = Decimal("0")
-        if losing_pnls:
-            avg_loss = sum(losing_pnls) / Decimal(len(losing_pnls))
+        if losing_trades:
+            avg_loss = summary.gross_loss / Decimal(losing_trades)
 
-        largest_win = max(winning_pnls) if winning_pnls else Decimal("0")
-        largest_loss = min(losing_pnls) if losing_pnls else Decimal("0")
+        largest_win = summary.largest_win
+        largest_loss = summary.largest_loss
 
         return TradeStatsSchema(
-            total_trades=total_trades,
-            open_trades=open_trades,
+            total_trades=summary.total_trades,
+            open_trades=summary.open_trades,
             closed_trades=closed_trades,
             winning_trades=winning_trades,
             losing_trades=losing_trades,
@@ -650,6 +484,53 @@ async def get_trade_stats(
         raise HTTPException(status_code=500, detail=f"Failed to calculate stats: {str(e)}") from e
 
 
+@router.get("/stats", response_model=TradeStatsSchema)
+async def get_trade_stats(
+    response: Response,
+    account_id: Annotated[UUID, Depends(get_account_id)],
+    analytics_repo: Annotated[TradeAnalyticsRepository, Depends(get_trade_analytics_repository)],
+    bypass_cache: Annotated[bool, Depends(get_cache_bypass)],
+    start_date: Annotated[
+        datetime | None, Query(description="Calculate stats from this date")
+    ] = None,
+    end_date: Annotated[
+        datetime | None, Query(description="Calculate stats until this date")
+    ] = None,
+):
+    """Get trading statistics for the current account.
+
+    Calculates comprehensive statistics including win rate, total P&L,
+    fees, and average trade performance with a single aggregate query.
+
+    Responses are cached until the account's trades change; the X-Cache
+    header reports HIT, MISS or BYPASS.
+
+    Args:
+        response: Outgoing response (carries the X-Cache header)
+        account_id: Account UUID (injected via dependency)
+        analytics_repo: Injected trade analytics repository
+        bypass_cache: Skip the analytics response cache (X-Cache-Bypass header)
+        start_date: Optional start date for stats calculation
+        end_date: Optional end date for stats calculation
+
+    Returns:
+        TradeStatsSchema: Trading statistics
+
+    Raises:
+        HTTPException: If database operation fails
+    """
+    # Normalize dates to UTC timezone to ensure correct comparison with DB timestamps
+    start_date = _ensure_utc_timezone(start_date)
+    end_date = _ensure_utc_timezone(end_date)
+
+    stats, response.headers["X-Cache"] = await analytics_cache.get_or_compute(
+        ("trading/stats", account_id, start_date, end_date),
+        lambda: _trade_stats(analytics_repo, account_id, start_date, end_date),
+        bypass=bypass_cache,
+    )
+    return stats
+
+
 def _ensure_utc_timezone(dt: datetime | None) -> datetime | None:
     """Ensure datetime has UTC timezone.
 
@@ -707,134 +588,79 @@ def _calculate_period_dates(
         return start_date, end_date
 
 
-def _find_best_worst_trades(
-    trades: list[Trade],
+def _best_worst_trade_schemas(
+    best: Trade | None,
+    worst: Trade | None,
+    total_trades: int,
 ) -> tuple[BestWorstTradeSchema, BestWorstTradeSchema]:
-    """Find the best and worst trades from a list.
+    """Build the best and worst trade schemas.
 
     Args:
-        trades: List of closed Trade objects with non-null pnl.
+        best: Closed trade with the highest pnl, or None.
+        worst: Closed trade with the lowest pnl, or None.
+        total_trades: Number of closed trades with P&L in the period.
 
     Returns:
         Tuple of (best_trade, worst_trade) schemas.
 
     Notes:
-        - Empty list: both null
+        - No trades: both null
         - Single trade: appears only in best (if positive) or worst (if negative),
           not both. Break-even trades (pnl=0) result in both being null.
         - Multiple trades: standard max/min logic
     """
     null_trade = BestWorstTradeSchema(id=None, pnl=Decimal("0"), date=None)
 
-    if not trades:
-        return (null_trade, null_trade)
-
-    # Special case: single trade should only appear in one field
-    if len(trades) == 1:
-        trade = trades[0]
-        pnl = trade.pnl if trade.pnl is not None else Decimal("0")
-        trade_schema = BestWorstTradeSchema(
+    def to_schema(trade: Trade) -> BestWorstTradeSchema:
+        return BestWorstTradeSchema(
             id=trade.id,
-            pnl=Decimal(str(pnl)).quantize(Decimal("0.01")),
+            pnl=Decimal(str(trade.pnl)).quantize(Decimal("0.01")) if trade.pnl else Decimal("0"),
             date=trade.closed_at,
         )
 
+    if total_trades == 0 or best is None or worst is None:
+        return (null_trade, null_trade)
+
+    # Special case: single trade should only appear in one field
+    if total_trades == 1:
+        pnl = best.pnl if best.pnl is not None else Decimal("0")
         if pnl > 0:
             # Positive trade: it's the best, no worst
-            return (trade_schema, null_trade)
+            return (to_schema(best), null_trade)
         elif pnl < 0:
             # Negative trade: it's the worst, no best
-            return (null_trade, trade_schema)
+            return (null_trade, to_schema(best))
         else:
             # Break-even trade: neither best nor worst
             return (null_trade, null_trade)
 
-    # Multiple trades: find best (max pnl) and worst (min pnl)
-    best = max(trades, key=lambda t: t.pnl if t.pnl is not None else Decimal("-999999"))
-    worst = min(trades, key=lambda t: t.pnl if t.pnl is not None else Decimal("999999"))
-
-    return (
-        BestWorstTradeSchema(
-            id=best.id,
-            pnl=Decimal(str(best.pnl)).quantize(Decimal("0.01")) if best.pnl else Decimal("0"),
-            date=best.closed_at,
-        ),
-        BestWorstTradeSchema(
-            id=worst.id,
-            pnl=Decimal(str(worst.pnl)).quantize(Decimal("0.01")) if worst.pnl else Decimal("0"),
-            date=worst.closed_at,
-        ),
-    )
+    return (to_schema(best), to_schema(worst))
 
 
-@router.get("/performance-metrics", response_model=PerformanceMetricsSchema)
-async def get_performance_metrics(
-    account_id: Annotated[UUID, Depends(get_account_id)],
-    trade_repo: Annotated[TradeRepository, Depends(get_trade_repository)],
-    period: Annotated[
-        PeriodFilter,
-        Query(description="Time period for filtering (today, 7days, 30days, custom)"),
-    ] = PeriodFilter.TODAY,
-    start_date: Annotated[
-        datetime | None,
-        Query(description="Start date for custom period (required if period=custom)"),
-    ] = None,
-    end_date: Annotated[
-        datetime | None,
-        Query(description="End date for custom period (required if period=custom)"),
-    ] = None,
-):
-    """Get performance metrics for the current account.
-
-    Calculates comprehensive trading analytics including:
-    - Total P&L and ROI based on capital employed
-    - Win rate and trade counts
-    - Best and worst trades with full details (id, pnl, date)
-
-    The ROI is calculated as: (totalPnl / sum(entryPrice * quantity)) * 100
-
-    Args:
-        account_id: Account UUID (injected via get_account_id dependency).
-        trade_repo: Injected trade repository.
-        period: Time period filter (today, 7days, 30days, custom).
-        start_date: Start date for custom period.
-        end_date: End date for custom period.
-
-    Returns:
-        PerformanceMetricsSchema with all calculated metrics.
-
-    Raises:
-        HTTPException: If database operation fails or invalid parameters.
-    """
+async def _performance_metrics(
+    analytics_repo: TradeAnalyticsRepository,
+    account_id: UUID,
+    period: PeriodFilter,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> PerformanceMetricsSchema:
+    """Compute performance metrics for a period."""
     try:
         # Calculate period boundaries
         period_start, period_end = _calculate_period_dates(period, start_date, end_date)
 
-        # Fetch trades for the period
-        trades = await trade_repo.get_trades_by_period(account_id, period_start, period_end)
+        # Aggregate closed trades with P&L in the period
+        summary = await analytics_repo.summarize(account_id, period_start, period_end)
 
-        # Filter to closed trades with P&L
-        closed_trades = [t for t in trades if t.status == "CLOSED" and t.pnl is not None]
-
-        # Calculate basic counts
-        total_trades = len(closed_trades)
-        winning_trades = sum(1 for t in closed_trades if t.pnl is not None and t.pnl > 0)
-        losing_trades = sum(1 for t in closed_trades if t.pnl is not None and t.pnl < 0)
-
-        # Calculate total P&L
-        total_pnl_sum = sum(t.pnl for t in closed_trades if t.pnl is not None)
-        total_pnl = Decimal(str(total_pnl_sum)) if total_pnl_sum else Decimal("0")
-
-        # Calculate capital employed (sum of entry_price * quantity)
-        capital_employed = sum(t.entry_price * t.quantity for t in closed_trades)
-        capital_employed_decimal = (
-            Decimal(str(capital_employed)) if capital_employed else Decimal("0")
-        )
+        total_trades = summary.realized_trades
+        winning_trades = summary.winning_trades
+        losing_trades = summary.losing_trades
+        total_pnl = summary.realized_pnl
 
         # Calculate ROI: (totalPnl / capital_employed) * 100
         roi = Decimal("0")
-        if capital_employed_decimal > 0:
-            roi = (total_pnl / capital_employed_decimal) * Decimal("100")
+        if summary.capital_employed > 0:
+            roi = (total_pnl / summary.capital_employed) * Decimal("100")
 
         # Calculate win rate
         win_rate = Decimal("0")
@@ -847,7 +673,12 @@ async def get_performance_metrics(
             avg_profit = total_pnl / Decimal(total_trades)
 
         # Find best and worst trades
-        best_trade, worst_trade = _find_best_worst_trades(closed_trades)
+        best, worst = (None, None)
+        if total_trades > 0:
+            best, worst = await analytics_repo.get_best_worst_trades(
+                account_id, period_start, period_end
+            )
+        best_trade, worst_trade = _best_worst_trade_schemas(best, worst, total_trades)
 
         return PerformanceMetricsSchema(
             total_pnl=total_pnl.quantize(Decimal("0.01")),
@@ -870,24 +701,79 @@ async def get_performance_metrics(
         ) from e
 
 
-def _group_trades_by_date(trades: list[Trade]) -> dict[str, Decimal]:
-    """Group trades by closed_at date and sum daily P&L.
+@router.get("/performance-metrics", response_model=PerformanceMetricsSchema)
+async def get_performance_metrics(
+    response: Response,
+    account_id: Annotated[UUID, Depends(get_account_id)],
+    analytics_repo: Annotated[TradeAnalyticsRepository, Depends(get_trade_analytics_repository)],
+    bypass_cache: Annotated[bool, Depends(get_cache_bypass)],
+    period: Annotated[
+        PeriodFilter,
+        Query(description="Time period for filtering (today, 7days, 30days, custom)"),
+    ] = PeriodFilter.TODAY,
+    start_date: Annotated[
+        datetime | None,
+        Query(description="Start date for custom period (required if period=custom)"),
+    ] = None,
+    end_date: Annotated[
+        datetime | None,
+        Query(description="End date for custom period (required if period=custom)"),
+    ] = None,
+):
+    """Get performance metrics for the current account.
+
+    Calculates comprehensive trading analytics including:
+    - Total P&L and ROI based on capital employed
+    - Win rate and trade counts
+    - Best and worst trades with full details (id, pnl, date)
+
+    The ROI is calculated as: (totalPnl / sum(entryPrice * quantity)) * 100
+
+    Counts and sums come from one aggregate query; best and worst trades are
+    single-row lookups. Responses are cached until the account's trades
+    change; the X-Cache header reports HIT, MISS or BYPASS.
+
+    Args:
+        response: Outgoing response (carries the X-Cache header).
+        account_id: Account UUID (injected via get_account_id dependency).
+        analytics_repo: Injected trade analytics repository.
+        bypass_cache: Skip the analytics response cache (X-Cache-Bypass header).
+        period: Time period filter (today, 7days, 30days, custom).
+        start_date: Start date for custom period.
+        end_date: End date for custom period.
+
+    Returns:
+        PerformanceMetricsSchema with all calculated metrics.
+
+    Raises:
+        HTTPException: If database operation fails or invalid parameters.
+    """
+    metrics, response.headers["X-Cache"] = await analytics_cache.get_or_compute(
+        ("trading/performance-metrics", account_id, period, start_date, end_date),
+        lambda: _performance_metrics(analytics_repo, account_id, period, start_date, end_date),
+        bypass=bypass_cache,
+    )
+    return metrics
+
+
+def _group_daily_pnl_by_date(rows: list[DailyPnl]) -> dict[str, Decimal]:
+    """Sum daily rollup rows (one per symbol) into P&L per date.
 
     Args:
-        trades: List of closed Trade objects with non-null pnl and closed_at.
+        rows: DailyPnl rows for the period.
 
     Returns:
         Dictionary mapping date strings (YYYY-MM-DD) to daily P&L sum.
     """
     daily_pnl: dict[str, Decimal] = {}
 
-    for trade in trades:
-        if trade.closed_at is None or trade.pnl is None:
+    for row in rows:
+        if row.trade_count == 0:
             continue
 
-        date_str = trade.closed_at.strftime("%Y-%m-%d")
+        date_str = row.date.isoformat()
         current_pnl = daily_pnl.get(date_str, Decimal("0"))
-        daily_pnl[date_str] = current_pnl + trade.pnl
+        daily_pnl[date_str] = current_pnl + row.realized_pnl
 
     return daily_pnl
 
@@ -925,10 +811,49 @@ def _calculate_cumulative_pnl(
     return data_points
 
 
+async def _cumulative_pnl(
+    daily_pnl_repo: DailyPnlRepository,
+    account_id: UUID,
+    period: PeriodFilter,
+    start_date: datetime | None,
+    end_date: datetime | None,
+) -> CumulativePnlResponse:
+    """Build the equity curve for a period from the daily rollup."""
+    try:
+        # Calculate period boundaries
+        period_start, period_end = _calculate_period_dates(period, start_date, end_date)
+
+        # Fetch the daily rollup rows for the period
+        rows = await daily_pnl_repo.get_by_period(
+            account_id, utc_date(period_start), utc_date(period_end)
+        )
+
+        # Sum symbols into one P&L value per date
+        daily_pnl = _group_daily_pnl_by_date(rows)
+
+        # Calculate cumulative P&L
+        data_points = _calculate_cumulative_pnl(daily_pnl)
+
+        return CumulativePnlResponse(
+            data=data_points,
+            period=period.value,
+            period_start=period_start,
+            period_end=period_end,
+        )
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500, detail=f"Failed to calculate cumulative P&L: {str(e)}"
+        ) from e
+
+
 @router.get("/cumulative-pnl", response_model=CumulativePnlResponse)
 async def get_cumulative_pnl(
+    response: Response,
     account_id: Annotated[UUID, Depends(get_account_id)],
-    trade_repo: Annotated[TradeRepository, Depends(get_trade_repository)],
+    daily_pnl_repo: Annotated[DailyPnlRepository, Depends(get_daily_pnl_repository)],
+    bypass_cache: Annotated[bool, Depends(get_cache_bypass)],
     period: Annotated[
         PeriodFilter,
         Query(description="Time period for filtering (today, 7days, 30days, custom)"),
@@ -951,9 +876,17 @@ async def get_cumulative_pnl(
     The data is ideal for plotting an equity curve chart showing
     the account's performance over time.
 
+    Reads the daily_pnl rollup (one row per day and symbol) instead of the
+    trades themselves. Trades are bucketed by their UTC close date, and every
+    day from the start date through the end date is included. Responses are
+    cached until the account's trades change; the X-Cache header reports HIT,
+    MISS or BYPASS.
+
     Args:
+        response: Outgoing response (carries the X-Cache header).
         account_id: Account UUID (injected via get_account_id dependency).
-        trade_repo: Injected trade repository.
+        daily_pnl_repo: Injected daily P&L rollup repository.
+        bypass_cache: Skip the analytics response cache (X-Cache-Bypass header).
         period: Time period filter (today, 7days, 30days, custom).
         start_date: Start date for custom period.
         end_date: End date for custom period.
@@ -964,35 +897,9 @@ async def get_cumulative_pnl(
     Raises:
         HTTPException: If database operation fails or invalid parameters.
     """
-    try:
-        # Calculate period boundaries
-        period_start, period_end = _calculate_period_dates(period, start_date, end_date)
-
-        # Fetch trades for the period
-        trades = await trade_repo.get_trades_by_period(account_id, period_start, period_end)
-
-        # Filter to closed trades with P&L and closed_at date
-        closed_trades = [
-            t
-            for t in trades
-            if t.status == "CLOSED" and t.pnl is not None and t.closed_at is not None
-        ]
-
-        # Group trades by date and sum daily P&L
-        daily_pnl = _group_trades_by_date(closed_trades)
-
-        # Calculate cumulative P&L
-        data_points = _calculate_cumulative_pnl(daily_pnl)
-
-        return CumulativePnlResponse(
-            data=data_points,
-            period=period.value,
-            period_start=period_start,
-            period_end=period_end,
-        )
-    except HTTPException:
-        raise
-    except Exception as e:
-        raise HTTPException(
-            status_code=500, detail=f"Failed to calculate cumulative P&L: {str(e)}"
-        ) from e
+    curve, response.headers["X-Cache"] = await analytics_cache.get_or_compute(
+        ("trading/cumulative-pnl", account_id, period, start_date, end_date),
+        lambda: _cumulative_pnl(daily_pnl_repo, account_id, period, start_date, end_date),
+        bypass=bypass_cache,
+    )
+    return curve
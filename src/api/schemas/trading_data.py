@@ -226,6 +226,9 @@ class TradesListResponse(BaseModel):
     total: int = Field(..., description="Total number of trades")
     limit: int = Field(..., description="Pagination limit")
     offset: int = Field(..., description="Pagination offset")
+    next_cursor: str | None = Field(
+        None, description="Cursor for the next page (null on the last page)"
+    )
 
 
 class BestWorstTradeSchema(BaseModel):
@@ -51,6 +51,11 @@ class PriceStreamer:
         self._running = False
         self._price_callback: Callable[[float], None] | None = None
 
+    @property
+    def ws_client(self) -> BingXWebSocket:
+        """Underlying market WebSocket (shared with other market data consumers)."""
+        return self._ws_client
+
     def set_price_callback(self, callback: Callable[[float], None]) -> None:
         """Set callback to receive real-time price updates.
 
@@ -8,6 +8,7 @@ This module provides a singleton ConnectionManager that:
 """
 
 import asyncio
+import time
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +17,19 @@ from pydantic import BaseModel
 
 from src.api.websocket.events import WebSocketEvent
 from src.utils.logger import websocket_logger as logger
+from src.utils.metrics import metrics
+
+# Time to send one event to every connected dashboard client
+BROADCAST_SECONDS = metrics.histogram(
+    "dashboard_broadcast_duration_seconds",
+    "Fan-out time of a dashboard WebSocket broadcast",
+    ("type",),
+)
+BROADCAST_CLIENTS = metrics.histogram(
+    "dashboard_broadcast_clients",
+    "Clients reached per dashboard WebSocket broadcast",
+    buckets=(1, 2, 5, 10, 25, 50, 100),
+)
 
 
 class ConnectionInfo(BaseModel):
@@ -114,16 +128,19 @@ class ConnectionManager:
         if not self._active_connections:
             return
 
+        started = time.perf_counter()
         message = event.model_dump_json()
         disconnected: list[WebSocket] = []
 
         async with self._lock:
+            BROADCAST_CLIENTS.observe(len(self._active_connections))
             for websocket in self._active_connections:
                 try:
                     await websocket.send_text(message)
                 except Exception as e:
                     logger.warning(f"Failed to send to client: {e}")
                     disconnected.append(websocket)
+        BROADCAST_SECONDS.labels(str(event.type)).observe(time.perf_counter() - started)
 
         # Clean up disconnected clients
         for websocket in disconnected:
@@ -151,15 +168,20 @@ class ConnectionManager:
         if not self._active_connections:
             return
 
+        started = time.perf_counter()
         disconnected: list[WebSocket] = []
 
         async with self._lock:
+            BROADCAST_CLIENTS.observe(len(self._active_connections))
             for websocket in self._active_connections:
                 try:
                     await websocket.send_json(data)
                 except Exception as e:
                     logger.warning(f"Failed to send JSON to client: {e}")
                     disconnected.append(websocket)
+        BROADCAST_SECONDS.labels(str(data.get("type", "json"))).observe(
+            time.perf_counter() - started
+        )
 
         # Clean up disconnected clients
         for websocket in disconnected:
@@ -0,0 +1,25 @@
+"""
+Backtesting for the grid strategy.
+
+Replays stored OHLCV candles through the live grid logic (GridCalculator,
+MACDStrategy, EMAFilter, OrderTracker) against a simulated exchange, and
+sweeps parameter combinations over it in parallel.
+"""
+
+from src.backtest.data import load_klines, resample
+from src.backtest.engine import BacktestConfig, BacktestEngine, BacktestResult
+from src.backtest.exchange import SimTrade, SimulatedExchange
+from src.backtest.sweep import ResultStore, expand_grid, run_sweep
+
+__all__ = [
+    "BacktestConfig",
+    "BacktestEngine",
+    "BacktestResult",
+    "ResultStore",
+    "SimTrade",
+    "SimulatedExchange",
+    "expand_grid",
+    "load_klines",
+    "resample",
+    "run_sweep",
+]
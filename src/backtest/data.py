@@ -0,0 +1,92 @@
+"""Historical kline loading and resampling for backtests."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.client.kline_store import INTERVAL_MS
+from src.client.klines import OHLCV_COLUMNS, Klines
+
+
+def load_klines(path: str | Path) -> Klines:
+    """
+    Load stored OHLCV candles from a CSV or Parquet file.
+
+    The file needs open, high, low, close and volume columns plus the candle
+    open time in a ``timestamp`` (or BingX-style ``time``) column, either as
+    milliseconds or as datetimes. Rows are sorted by time and duplicates
+    dropped.
+
+    Args:
+        path: .csv or .parquet file
+
+    Returns:
+        Klines, oldest first
+    """
+    path = Path(path)
+    if path.suffix == ".parquet":
+        frame = pd.read_parquet(path)
+    else:
+        frame = pd.read_csv(path)
+
+    if "timestamp" not in frame.columns and "time" in frame.columns:
+        frame = frame.rename(columns={"time": "timestamp"})
+    missing = [c for c in ("timestamp", *OHLCV_COLUMNS) if c not in frame.columns]
+    if missing:
+        raise ValueError(f"Missing kline columns in {path}: {', '.join(missing)}")
+
+    if frame["timestamp"].dtype == object:
+        frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+    frame = frame.sort_values("timestamp").drop_duplicates("timestamp")
+    return Klines.from_frame(frame)
+
+
+def interval_ms(interval: str) -> int:
+    """Duration of a kline interval (e.g. "1h") in milliseconds."""
+    try:
+        return INTERVAL_MS[interval]
+    except KeyError:
+        raise ValueError(f"Unsupported kline interval: {interval}") from None
+
+
+def resample(klines: Klines, interval: str) -> tuple[Klines, np.ndarray]:
+    """
+    Aggregate candles into a longer interval (vectorized).
+
+    Only complete buckets are returned: a trailing bucket whose candles do
+    not reach the end of the interval is still in formation and is dropped.
+
+    Args:
+        klines: Source candles, oldest first (e.g. 1m)
+        interval: Target interval (e.g. "1h")
+
+    Returns:
+        Tuple of (resampled Klines, index in ``klines`` of the last source
+        candle of each bucket, i.e. the candle at whose close it closes)
+    """
+    if not len(klines):
+        return klines, np.empty(0, dtype=np.int64)
+
+    target_ms = interval_ms(interval)
+    buckets = klines.timestamp // target_ms
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(klines)] - 1
+
+    count = len(starts)
+    source_ms = int(np.median(np.diff(klines.timestamp))) if len(klines) > 1 else target_ms
+    if klines.timestamp[-1] + source_ms < (buckets[-1] + 1) * target_ms:
+        count -= 1  # Last bucket still in formation
+
+    resampled = Klines(
+        buckets[starts[:count]] * target_ms,
+        klines.open[starts[:count]],
+        np.maximum.reduceat(klines.high, starts)[:count],
+        np.minimum.reduceat(klines.low, starts)[:count],
+        klines.close[ends[:count]],
+        np.add.reduceat(klines.volume, starts)[:count],
+    )
+    ends = ends[:count]
+    return resampled, ends
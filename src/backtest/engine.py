@@ -0,0 +1,373 @@
+"""Backtest engine: replays historical klines through the grid trading logic.
+
+The engine drives the same components the live bot uses - ``GridCalculator``
+for levels, range and drift, ``MACDStrategy``/``MACDFilter`` and ``EMAFilter``
+for the create/cancel decisions, ``OrderTracker`` for duplicate and slot
+checks - and replaces BingX with a ``SimulatedExchange``. The per-cycle
+decisions mirror ``GridManager._create_grid_orders`` and
+``GridManager._execute_state_actions``.
+
+The event loop is vectorized: instead of visiting every candle, NumPy finds
+the next candle in which something can happen (an order fills, a take profit
+triggers, the price moves far enough to reposition the grid - the same
+``REPOSITION_SPACING_FRACTION`` the live price stream uses - or an indicator
+candle closes), and the grid logic only runs there. The equity curve is then
+rebuilt for every candle in one pass.
+
+Funding fees are not simulated.
+
+Example:
+    klines = load_klines("data/BTC-USDT_1m.csv")
+    result = await BacktestEngine(BacktestConfig(grid=grid, macd=macd)).run(klines)
+    print(result.summary())
+"""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from config import GridConfig, MACDConfig
+from src.backtest.data import interval_ms, resample
+from src.backtest.exchange import SimTrade, SimulatedExchange
+from src.client.klines import Klines
+from src.filters.ema_filter import EMAFilter
+from src.filters.macd_filter import MACDFilter
+from src.grid.grid_calculator import GridCalculator
+from src.grid.grid_manager import GridManager
+from src.grid.order_tracker import OrderTracker
+from src.strategy.macd_strategy import GridState, MACDStrategy
+
+# Indicator candles passed per evaluation (the live bot fetches 100 klines)
+INDICATOR_WINDOW = 100
+# Max orders created per cycle (same cap as GridManager)
+MAX_ORDERS_PER_CYCLE = 10
+# BingX minimum order quantity (BTC)
+MIN_QUANTITY = 0.0001
+
+# Loggers silenced while replaying (per-order logs would dominate the run time)
+_QUIET_LOGGERS = ("orders", "trades", "macd", "main")
+
+
+@dataclass
+class BacktestConfig:
+    """Strategy and simulation settings for one backtest run."""
+
+    grid: GridConfig
+    macd: MACDConfig
+    macd_enabled: bool = True
+    ema_enabled: bool = False
+    ema_period: int = 13
+    ema_allow_on_rising: bool = True
+    ema_allow_on_falling: bool = False
+    order_size_usdt: float = 100.0
+    fee_rate: float = 0.0002  # Per side (BingX maker fee)
+    initial_balance: float = 1000.0
+    quiet: bool = True  # Silence per-order logging during the run
+
+
+@dataclass
+class BacktestResult:
+    """Outcome of a backtest run."""
+
+    trades: list[SimTrade]
+    timestamps: np.ndarray  # Candle open times (ms)
+    equity: np.ndarray  # Balance + realized + unrealized P&L at each candle close
+    initial_balance: float
+    fills: int
+    cancels: int
+    orders_created: int
+    fees: float
+    open_positions: int
+    unrealized_pnl: float
+    events: int  # Candles at which the grid logic ran
+    stats: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def realized_pnl(self) -> float:
+        """P&L of closed trades, net of fees."""
+        return sum(t.pnl for t in self.trades)
+
+    @property
+    def total_pnl(self) -> float:
+        """Final equity minus initial balance (includes open positions)."""
+        return float(self.equity[-1] - self.initial_balance) if len(self.equity) else 0.0
+
+    @property
+    def max_drawdown(self) -> float:
+        """Largest peak-to-trough equity drop, in USDT."""
+        if not len(self.equity):
+            return 0.0
+        return float((np.maximum.accumulate(self.equity) - self.equity).max())
+
+    @property
+    def max_drawdown_percent(self) -> float:
+        """Largest peak-to-trough equity drop, as a percentage of the peak."""
+        if not len(self.equity):
+            return 0.0
+        peak = np.maximum.accumulate(self.equity)
+        return float(((peak - self.equity) / peak).max() * 100)
+
+    @property
+    def win_rate(self) -> float:
+        """Percentage of closed trades with positive net P&L."""
+        if not self.trades:
+            return 0.0
+        return sum(1 for t in self.trades if t.pnl > 0) / len(self.trades) * 100
+
+    def summary(self) -> dict[str, Any]:
+        """Headline metrics as a flat dict."""
+        return {
+            "total_pnl": round(self.total_pnl, 2),
+            "realized_pnl": round(self.realized_pnl, 2),
+            "unrealized_pnl": round(self.unrealized_pnl, 2),
+            "fees": round(self.fees, 2),
+            "max_drawdown": round(self.max_drawdown, 2),
+            "max_drawdown_percent": round(self.max_drawdown_percent, 2),
+            "trades": len(self.trades),
+            "win_rate": round(self.win_rate, 1),
+            "fills": self.fills,
+            "orders_created": self.orders_created,
+            "cancels": self.cancels,
+            "open_positions": self.open_positions,
+            "candles": len(self.equity),
+            "events": self.events,
+        }
+
+
+@contextmanager
+def _quiet_logs(enabled: bool) -> Iterator[None]:
+    loggers = [logging.getLogger(name) for name in _QUIET_LOGGERS] if enabled else []
+    previous = [logger.disabled for logger in loggers]
+    for logger in loggers:
+        logger.disabled = True
+    try:
+        yield
+    finally:
+        for logger, disabled in zip(loggers, previous, strict=True):
+            logger.disabled = disabled
+
+
+class BacktestEngine:
+    """
+    Replays candles through the grid logic against a SimulatedExchange.
+
+    Args:
+        config: Strategy and simulation settings.
+    """
+
+    def __init__(self, config: BacktestConfig):
+        self.config = config
+        self.calculator = GridCalculator(config.grid)
+        self.tracker = OrderTracker(spacing=config.grid.spacing_value)
+        self.strategy = MACDStrategy(config.macd)
+        self.macd_filter = MACDFilter(self.strategy, enabled=config.macd_enabled)
+        self.ema_filter = EMAFilter(
+            period=config.ema_period,
+            timeframe=config.macd.timeframe,  # GridManager feeds the EMA the MACD klines
+            allow_on_rising=config.ema_allow_on_rising,
+            allow_on_falling=config.ema_allow_on_falling,
+            enabled=config.ema_enabled,
+        )
+        self.state = GridState.WAIT
+        self.orders_created = 0
+        self.exchange: SimulatedExchange | None = None
+
+    async def run(self, klines: Klines) -> BacktestResult:
+        """
+        Replay candles (any interval up to the MACD timeframe, e.g. 1m).
+
+        Orders are placed at a candle's close and can fill from the next one.
+
+        Args:
+            klines: Historical candles, oldest first.
+
+        Returns:
+            BacktestResult with trades, equity curve and counters
+        """
+        with _quiet_logs(self.config.quiet):
+            return await self._run(klines)
+
+    async def _run(self, klines: Klines) -> BacktestResult:
+        n = len(klines)
+        exchange = self.exchange = SimulatedExchange(klines, self.config.fee_rate)
+        signal, signal_ends = resample(klines, self.config.macd.timeframe)
+
+        # Indicator arrays with one extra slot for the candle in formation
+        signal_ts = np.append(
+            signal.timestamp, signal.timestamp[-1:] + interval_ms(self.config.macd.timeframe)
+        )
+        signal_close = np.append(signal.close, 0.0)
+
+        events: list[int] = []
+        realized: list[float] = []
+        quantity: list[float] = []
+        cost: list[float] = []
+
+        index, next_signal = 0, 0
+        ref_price = float(klines.close[0]) if n else 0.0
+        while index < n:
+            # Search up to the next indicator close (or the end of the data)
+            has_signal = next_signal < len(signal_ends)
+            stop = int(signal_ends[next_signal]) + 1 if has_signal else n
+            step = (
+                self.calculator.calculate_spacing(ref_price)
+                * GridManager.REPOSITION_SPACING_FRACTION
+            )
+            event = exchange.next_event(index, stop, ref_price, step)
+            if event is None:
+                if not has_signal:
+                    break
+                event = stop - 1
+
+            opened, closed = exchange.match(event)
+            for trade in closed:
+                await self.tracker.order_tp_hit(trade.order_id, trade.exit_price)
+            for position in opened:
+                await self.tracker.order_filled(position.order_id)
+
+            price = float(klines.close[event])
+            if has_signal and event == signal_ends[next_signal]:
+                self._refresh_indicators(signal_ts, signal_close, next_signal, price)
+                next_signal += 1
+            self._execute_state_actions(price)
+            ref_price = price
+
+            events.append(event)
+            realized.append(exchange.realized_pnl - exchange.open_fees)
+            quantity.append(exchange.open_quantity)
+            cost.append(exchange.open_cost)
+            index = event + 1
+
+        return self._result(klines, exchange, events, realized, quantity, cost)
+
+    def _refresh_indicators(
+        self, signal_ts: np.ndarray, signal_close: np.ndarray, closed: int, price: float
+    ) -> None:
+        """Update MACD/EMA after indicator candle ``closed`` closed (GridManager._refresh_indicators)."""
+        # The candle in formation has just opened at the current price
+        forming = closed + 1
+        saved = signal_close[forming]
+        signal_close[forming] = price
+        start = max(0, forming + 1 - INDICATOR_WINDOW)
+        timestamps = signal_ts[start : forming + 1]
+        closes = signal_close[start : forming + 1]
+
+        macd_values = self.strategy.update_macd_from_arrays(timestamps, closes)
+        new_state = self.strategy.evaluate_state(macd_values)
+        self.ema_filter.update_from_arrays(timestamps, closes)
+        signal_close[forming] = saved
+
+        self.macd_filter.set_current_state(new_state)
+        if new_state != self.state:
+            # Entering INACTIVE cancels pending orders unless the EMA protects them
+            if new_state == GridState.INACTIVE and not self._ema_protects():
+                self._cancel_all_pending()
+            self.state = new_state
+
+    def _ema_protects(self) -> bool:
+        return self.ema_filter.enabled and self.ema_filter.should_protect_orders()
+
+    def _execute_state_actions(self, price: float) -> None:
+        """Create or cancel orders for the current state (GridManager._execute_state_actions)."""
+        if self.macd_filter.should_allow_trade() and self.ema_filter.should_allow_trade():
+            self._create_grid_orders(price)
+        elif self.state == GridState.INACTIVE and not self._ema_protects():
+            self._cancel_all_pending()
+
+    def _create_grid_orders(self, price: float) -> None:
+        """Drift and range cancellations, then new levels (GridManager._create_grid_orders)."""
+        assert self.exchange is not None
+        exchange = self.exchange
+        filled = len(exchange.positions)
+
+        limit_orders = [o for o in exchange.open_orders() if o["type"] == "LIMIT"]
+        drift = self.calculator.get_orders_to_cancel_for_drift(price, limit_orders, filled)
+        self._cancel_orders(drift)
+        if drift:
+            limit_orders = [o for o in exchange.open_orders() if o["type"] == "LIMIT"]
+
+        out_of_range = self.calculator.get_orders_to_cancel(price, limit_orders, filled)
+        self._cancel_orders(out_of_range)
+        if out_of_range:
+            limit_orders = [o for o in exchange.open_orders() if o["type"] == "LIMIT"]
+
+        # No free slot: get_levels_to_create() would return nothing, skip computing levels
+        min_price = self.calculator.calculate_min_price(price)
+        in_range = sum(1 for o in limit_orders if o["price"] >= min_price)
+        if in_range + filled >= self.calculator.max_total_orders:
+            return
+
+        occupied = {round(p.entry_price, 2) for p in self.tracker.filled_orders}
+        levels = [
+            level
+            for level in self.calculator.get_levels_to_create(price, limit_orders, filled)
+            if not self.tracker.has_order_at_price(level.entry_price)
+            and round(level.entry_price, 2) not in occupied
+            and not self.tracker.is_slot_occupied(level.entry_price)
+        ]
+
+        quantity = round(self.config.order_size_usdt / price, 6)
+        if quantity < MIN_QUANTITY:
+            return
+        for level in levels[:MAX_ORDERS_PER_CYCLE]:
+            order_id = exchange.place_order(level.entry_price, quantity, level.tp_price)
+            self.tracker.add_order(order_id, level.entry_price, level.tp_price, quantity)
+            self.orders_created += 1
+
+    def _cancel_orders(self, orders: list[dict]) -> None:
+        assert self.exchange is not None
+        for order in orders:
+            if self.exchange.cancel_order(order["orderId"]):
+                self.tracker.cancel_order(order["orderId"])
+
+    def _cancel_all_pending(self) -> None:
+        assert self.exchange is not None
+        self._cancel_orders([o for o in self.exchange.open_orders() if o["type"] == "LIMIT"])
+
+    def _result(
+        self,
+        klines: Klines,
+        exchange: SimulatedExchange,
+        events: list[int],
+        realized: list[float],
+        quantity: list[float],
+        cost: list[float],
+    ) -> BacktestResult:
+        """Build the result; the equity curve is rebuilt for every candle in one pass."""
+        n = len(klines)
+        equity = np.full(n, self.config.initial_balance)
+        if events:
+            # State after the last event at or before each candle (constant in between)
+            segment = np.searchsorted(np.asarray(events), np.arange(n), side="right") - 1
+            seen = segment >= 0
+            segment = segment[seen]
+            equity[seen] += (
+                np.asarray(realized)[segment]
+                + np.asarray(quantity)[segment] * klines.close[seen]
+                - np.asarray(cost)[segment]
+            )
+
+        last_close = float(klines.close[-1]) if n else 0.0
+        return BacktestResult(
+            trades=exchange.trades,
+            timestamps=klines.timestamp,
+            equity=equity,
+            initial_balance=self.config.initial_balance,
+            fills=exchange.fills,
+            cancels=exchange.cancels,
+            orders_created=self.orders_created,
+            fees=exchange.fees,
+            open_positions=len(exchange.positions),
+            # Net of the entry fees already paid, like realized P&L
+            unrealized_pnl=(
+                exchange.open_quantity * last_close - exchange.open_cost - exchange.open_fees
+            ),
+            events=len(events),
+            stats=self.tracker.get_stats(),
+        )
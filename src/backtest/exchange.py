@@ -0,0 +1,196 @@
+"""Simulated exchange that matches grid orders against historical candles."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.client.klines import Klines
+
+
+@dataclass
+class SimOrder:
+    """A resting LIMIT buy with its attached take profit."""
+
+    order_id: str
+    price: float
+    tp_price: float
+    quantity: float
+
+
+@dataclass
+class SimPosition:
+    """A filled grid order waiting for its take profit."""
+
+    order_id: str
+    entry_price: float
+    tp_price: float
+    quantity: float
+    filled_index: int  # Candle in which the entry filled
+    entry_fee: float
+
+
+@dataclass
+class SimTrade:
+    """A closed round trip (entry fill to take profit)."""
+
+    order_id: str
+    entry_time: int  # Candle open times in ms
+    exit_time: int
+    entry_price: float
+    exit_price: float
+    quantity: float
+    fees: float
+    pnl: float  # Net of fees
+
+
+class SimulatedExchange:
+    """
+    LIMIT buy + TAKE_PROFIT grid orders matched against candle high/low.
+
+    A buy fills in the first candle whose low reaches its price, at the limit
+    price (or at the open if the candle gapped below it). A take profit
+    triggers in the first later candle whose high reaches it, at the TP price
+    (or the open on a gap up). A position never exits in the candle that
+    opened it: the order of the high and low within one candle is unknown,
+    so the round trip is not assumed.
+
+    Args:
+        klines: Candles to match against, oldest first.
+        fee_rate: Fee per side as a fraction of notional (BingX maker: 0.0002).
+    """
+
+    def __init__(self, klines: Klines, fee_rate: float = 0.0002):
+        self.klines = klines
+        self.fee_rate = fee_rate
+        self.pending: dict[str, SimOrder] = {}
+        self.positions: dict[str, SimPosition] = {}
+        self.trades: list[SimTrade] = []
+        self.realized_pnl = 0.0
+        self.fees = 0.0
+        self.fills = 0
+        self.cancels = 0
+        self._next_id = 0
+
+    @property
+    def open_quantity(self) -> float:
+        """Total quantity of open positions."""
+        return sum(p.quantity for p in self.positions.values())
+
+    @property
+    def open_cost(self) -> float:
+        """Total entry notional of open positions."""
+        return sum(p.quantity * p.entry_price for p in self.positions.values())
+
+    @property
+    def open_fees(self) -> float:
+        """Entry fees paid for open positions (charged to P&L when they close)."""
+        return sum(p.entry_fee for p in self.positions.values())
+
+    def open_orders(self) -> list[dict]:
+        """Open orders shaped like BingX's openOrders (LIMIT entries and their TPs)."""
+        orders = [
+            {"orderId": o.order_id, "type": "LIMIT", "price": o.price, "origQty": o.quantity}
+            for o in self.pending.values()
+        ]
+        orders.extend(
+            {"orderId": p.order_id, "type": "TAKE_PROFIT_MARKET", "stopPrice": p.tp_price}
+            for p in self.positions.values()
+        )
+        return orders
+
+    def place_order(self, price: float, quantity: float, tp_price: float) -> str:
+        """Place a LIMIT buy with a take profit; returns the order ID."""
+        self._next_id += 1
+        order_id = str(self._next_id)
+        self.pending[order_id] = SimOrder(order_id, price, tp_price, quantity)
+        return order_id
+
+    def cancel_order(self, order_id: str) -> bool:
+        """Cancel a pending order."""
+        if self.pending.pop(order_id, None) is None:
+            return False
+        self.cancels += 1
+        return True
+
+    def next_event(
+        self, start: int, stop: int, ref_price: float, reprice_step: float | None = None
+    ) -> int | None:
+        """
+        First candle in [start, stop) where an order fills, a TP triggers or
+        the close moves reprice_step away from ref_price.
+
+        Vectorized over the candle range, so quiet stretches cost one NumPy
+        pass instead of a Python iteration per candle.
+
+        Returns:
+            Candle index, or None if nothing happens in the range
+        """
+        if start >= stop:
+            return None
+
+        mask = np.zeros(stop - start, dtype=bool)
+        if self.pending:
+            mask |= self.klines.low[start:stop] <= max(o.price for o in self.pending.values())
+        if self.positions:
+            mask |= self.klines.high[start:stop] >= min(p.tp_price for p in self.positions.values())
+        if reprice_step:
+            mask |= np.abs(self.klines.close[start:stop] - ref_price) >= reprice_step
+
+        first = int(mask.argmax())
+        return start + first if mask[first] else None
+
+    def match(self, index: int) -> tuple[list[SimPosition], list[SimTrade]]:
+        """
+        Match orders against one candle: take profits first, then entries.
+
+        Returns:
+            Tuple of (positions opened, trades closed) in this candle
+        """
+        open_ = float(self.klines.open[index])
+        high = float(self.klines.high[index])
+        low = float(self.klines.low[index])
+        time_ms = int(self.klines.timestamp[index])
+
+        closed: list[SimTrade] = []
+        for position in [p for p in self.positions.values() if p.tp_price <= high]:
+            exit_price = max(position.tp_price, open_)
+            exit_fee = exit_price * position.quantity * self.fee_rate
+            fees = position.entry_fee + exit_fee
+            pnl = (exit_price - position.entry_price) * position.quantity - fees
+            trade = SimTrade(
+                order_id=position.order_id,
+                entry_time=int(self.klines.timestamp[position.filled_index]),
+                exit_time=time_ms,
+                entry_price=position.entry_price,
+                exit_price=exit_price,
+                quantity=position.quantity,
+                fees=fees,
+                pnl=pnl,
+            )
+            del self.positions[position.order_id]
+            self.trades.append(trade)
+            self.realized_pnl += pnl
+            self.fees += exit_fee
+            closed.append(trade)
+
+        opened: list[SimPosition] = []
+        for order in [o for o in self.pending.values() if o.price >= low]:
+            entry_price = min(order.price, open_)
+            entry_fee = entry_price * order.quantity * self.fee_rate
+            position = SimPosition(
+                order_id=order.order_id,
+                entry_price=entry_price,
+                tp_price=order.tp_price,
+                quantity=order.quantity,
+                filled_index=index,
+                entry_fee=entry_fee,
+            )
+            del self.pending[order.order_id]
+            self.positions[order.order_id] = position
+            self.fees += entry_fee
+            self.fills += 1
+            opened.append(position)
+
+        return opened, closed
@@ -0,0 +1,309 @@
+"""
+Parallel parameter sweeps over the backtest engine.
+
+Combinations of grid/MACD/EMA parameters (the fields a ``Strategy`` row can
+hold) are spread over a ``ProcessPoolExecutor``. The candles are written
+once as one ``.npy`` file per column and every worker memory-maps them, so
+the OS page cache shares a single copy instead of each task pickling the
+dataset.
+
+Results are written incrementally, one part file per finished batch, to a
+results directory. Parts are Parquet when pyarrow is installed (CSV
+otherwise) and are written atomically, so an interrupted sweep keeps every
+completed batch; running it again on the same candles skips the combinations
+already stored. Run IDs include a fingerprint of the candles, so a sweep over
+a different dataset in the same directory never reuses those results.
+
+Usage:
+    space = {"spacing_value": [0.2, 0.3, 0.5], "take_profit_percent": [0.3, 0.5]}
+    results = run_sweep(klines, space, base_config, "sweeps/btc-2024")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import importlib.util
+import itertools
+import json
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, replace
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from config import SpacingType
+from src.backtest.engine import BacktestConfig, BacktestEngine
+from src.client.klines import OHLCV_COLUMNS, Klines
+from src.utils.logger import main_logger
+
+# Sweepable parameters (Strategy model fields) and the config they map to
+GRID_PARAMETERS = (
+    "spacing_type",
+    "spacing_value",
+    "range_percent",
+    "take_profit_percent",
+    "max_total_orders",
+)
+MACD_PARAMETERS = {"macd_fast": "fast", "macd_slow": "slow", "macd_signal": "signal"}
+SWEEP_PARAMETERS = (*GRID_PARAMETERS, *MACD_PARAMETERS, "ema_period")
+
+_KLINE_COLUMNS = ("timestamp", *OHLCV_COLUMNS)
+
+# Candles opened by each worker process (see _init_worker)
+_worker_klines: Klines | None = None
+
+
+def expand_grid(space: Mapping[str, Iterable[Any]]) -> list[dict[str, Any]]:
+    """
+    Cartesian product of parameter values.
+
+    Combinations where the fast MACD period is not below the slow one are
+    skipped.
+
+    Args:
+        space: Parameter name (one of SWEEP_PARAMETERS) -> values to try
+
+    Returns:
+        One dict of parameter values per combination
+    """
+    unknown = sorted(set(space) - set(SWEEP_PARAMETERS))
+    if unknown:
+        raise ValueError(f"Unknown sweep parameters: {', '.join(unknown)}")
+
+    names = list(space)
+    combinations = []
+    for values in itertools.product(*(list(space[name]) for name in names)):
+        params = dict(zip(names, values, strict=True))
+        if params.get("macd_fast", 0) >= params.get("macd_slow", float("inf")):
+            continue
+        combinations.append(params)
+    return combinations
+
+
+def apply_parameters(base: BacktestConfig, params: Mapping[str, Any]) -> BacktestConfig:
+    """Copy of ``base`` with sweep parameters applied."""
+    grid = {name: params[name] for name in GRID_PARAMETERS if name in params}
+    if "spacing_type" in grid:
+        grid["spacing_type"] = SpacingType(grid["spacing_type"])
+    macd = {field: params[name] for name, field in MACD_PARAMETERS.items() if name in params}
+
+    config = replace(base, grid=replace(base.grid, **grid), macd=replace(base.macd, **macd))
+    if "ema_period" in params:
+        config = replace(config, ema_period=int(params["ema_period"]))
+    return config
+
+
+def dataset_fingerprint(klines: Klines) -> str:
+    """Short hash identifying a candle dataset (length, time span and closes)."""
+    digest = hashlib.sha1()
+    if len(klines):
+        digest.update(f"{len(klines)}:{klines.timestamp[0]}:{klines.timestamp[-1]}".encode())
+    digest.update(np.ascontiguousarray(klines.close).tobytes())
+    return digest.hexdigest()[:16]
+
+
+def run_id(base: BacktestConfig, params: Mapping[str, Any], dataset: str) -> str:
+    """
+    Stable ID of one run.
+
+    Args:
+        base: Config the parameters are applied to
+        params: Sweep parameters of the run
+        dataset: Fingerprint of the candles (see dataset_fingerprint)
+    """
+    payload = json.dumps(
+        {"base": asdict(base), "params": dict(params), "dataset": dataset},
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha1(payload.encode()).hexdigest()[:16]
+
+
+def share_klines(klines: Klines, directory: str | Path) -> Path:
+    """
+    Write candles as one .npy file per column for workers to memory-map.
+
+    Args:
+        klines: Candles to share
+        directory: Dataset directory (created if missing)
+
+    Returns:
+        The dataset directory
+    """
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for column in _KLINE_COLUMNS:
+        tmp = directory / f"{column}.tmp.npy"
+        np.save(tmp, getattr(klines, column))
+        os.replace(tmp, directory / f"{column}.npy")
+    return directory
+
+
+def open_shared_klines(directory: str | Path) -> Klines:
+    """Memory-map a dataset written by share_klines (read-only, no copy)."""
+    directory = Path(directory)
+    return Klines(
+        *(np.load(directory / f"{column}.npy", mmap_mode="r") for column in _KLINE_COLUMNS)
+    )
+
+
+class ResultStore:
+    """
+    Sweep results as a directory of columnar part files.
+
+    Each write creates one new part; a part is written to a temporary name
+    and renamed into place, so a killed process never leaves a partial one.
+
+    Args:
+        directory: Results directory (created if missing)
+        format: "parquet" or "csv"; defaults to Parquet when pyarrow is installed
+    """
+
+    def __init__(self, directory: str | Path, format: str | None = None):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if format is None:
+            format = "parquet" if importlib.util.find_spec("pyarrow") else "csv"
+        if format not in ("parquet", "csv"):
+            raise ValueError(f"Unsupported result format: {format}")
+        self.format = format
+
+    def parts(self) -> list[Path]:
+        """Existing part files, oldest first (any format)."""
+        return sorted(p for p in self.directory.glob("part-*") if p.suffix in (".parquet", ".csv"))
+
+    @staticmethod
+    def _read(path: Path, columns: list[str] | None = None) -> pd.DataFrame:
+        if path.suffix == ".parquet":
+            return pd.read_parquet(path, columns=columns)
+        # Hex IDs made only of digits must not be parsed as numbers
+        return pd.read_csv(path, usecols=columns, dtype={"run_id": str, "dataset": str})
+
+    def completed(self) -> set[str]:
+        """IDs of the runs already stored."""
+        ids: set[str] = set()
+        for path in self.parts():
+            ids.update(self._read(path, ["run_id"])["run_id"].astype(str))
+        return ids
+
+    def write(self, rows: list[dict[str, Any]]) -> Path | None:
+        """Store rows as a new part file."""
+        if not rows:
+            return None
+        parts = self.parts()
+        number = int(parts[-1].name.split("-")[1].split(".")[0]) + 1 if parts else 0
+        path = self.directory / f"part-{number:05d}.{self.format}"
+        tmp = path.with_name(f".{path.name}.tmp")
+
+        frame = pd.DataFrame(rows)
+        if self.format == "parquet":
+            frame.to_parquet(tmp, index=False)
+        else:
+            frame.to_csv(tmp, index=False)
+        os.replace(tmp, path)
+        return path
+
+    def load(self) -> pd.DataFrame:
+        """All stored results as one DataFrame."""
+        parts = self.parts()
+        if not parts:
+            return pd.DataFrame()
+        return pd.concat([self._read(path) for path in parts], ignore_index=True)
+
+
+def _init_worker(dataset: str) -> None:
+    global _worker_klines
+    _worker_klines = open_shared_klines(dataset)
+
+
+async def _run_batch_async(
+    base: BacktestConfig, dataset: str, batch: list[tuple[str, dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    assert _worker_klines is not None
+    rows = []
+    for key, params in batch:
+        row: dict[str, Any] = {"run_id": key, "dataset": dataset, **params}
+        try:
+            result = await BacktestEngine(apply_parameters(base, params)).run(_worker_klines)
+        except Exception as e:
+            row["error"] = f"{type(e).__name__}: {e}"
+        else:
+            row.update(result.summary())
+        rows.append(row)
+    return rows
+
+
+def _run_batch(
+    base: BacktestConfig, dataset: str, batch: list[tuple[str, dict[str, Any]]]
+) -> list[dict[str, Any]]:
+    return asyncio.run(_run_batch_async(base, dataset, batch))
+
+
+def _dataset_results(store: ResultStore, dataset: str) -> pd.DataFrame:
+    results = store.load()
+    if results.empty:
+        return results
+    if "dataset" not in results.columns:
+        return results.iloc[0:0]
+    return results[results["dataset"] == dataset].reset_index(drop=True)
+
+
+def run_sweep(
+    klines: Klines,
+    space: Mapping[str, Iterable[Any]],
+    base: BacktestConfig,
+    output: str | Path,
+    workers: int | None = None,
+    batch_size: int = 8,
+    format: str | None = None,
+) -> pd.DataFrame:
+    """
+    Backtest every parameter combination in parallel.
+
+    Resumable: combinations whose results for the same candles are already
+    in ``output`` are not run again.
+
+    Args:
+        klines: Candles to replay
+        space: Parameter name -> values (see expand_grid)
+        base: Config the parameters are applied to
+        output: Sweep directory (holds the shared dataset and the results)
+        workers: Worker processes (default: CPU count)
+        batch_size: Combinations per task (one results part per batch)
+        format: Result part format (see ResultStore)
+
+    Returns:
+        All results stored in ``output`` for these candles, one row per combination
+    """
+    output = Path(output)
+    store = ResultStore(output / "results", format)
+    done = store.completed()
+
+    dataset = dataset_fingerprint(klines)
+    runs = [(run_id(base, params, dataset), params) for params in expand_grid(space)]
+    pending = [(key, params) for key, params in runs if key not in done]
+    if not pending:
+        return _dataset_results(store, dataset)
+
+    main_logger.info(
+        f"Sweep: {len(pending)} combinações a executar ({len(runs) - len(pending)} já concluídas)"
+    )
+    # One directory per dataset: never overwrite candles another sweep is reading
+    shared = share_klines(klines, output / "klines" / dataset)
+    batches = [pending[i : i + batch_size] for i in range(0, len(pending), batch_size)]
+
+    finished = 0
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(str(shared),)) as pool:
+        futures = [pool.submit(_run_batch, base, dataset, batch) for batch in batches]
+        for future in as_completed(futures):
+            rows = future.result()
+            store.write(rows)
+            finished += len(rows)
+            main_logger.info(f"Sweep: {finished}/{len(pending)} combinações concluídas")
+
+    return _dataset_results(store, dataset)
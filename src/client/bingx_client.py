@@ -2,65 +2,202 @@ import asyncio
 import hashlib
 import hmac
 import json
+import re
 import time
 import uuid
 from typing import Any
-from urllib.parse import urlencode
+from urllib.parse import quote_plus, urlencode
 
 import httpx
-import pandas as pd
 
 from config import BingXConfig
+from src.client.http_pool import get_http_client, get_http_pool_config
+from src.client.klines import Klines
+from src.client.rate_limiter import (
+    RateLimiter,
+    RateLimitError,
+    endpoint_group,
+    is_rate_limit_error,
+)
+from src.client.request_cache import RequestCache
+from src.client.time_sync import server_clock
 from src.utils.logger import error_logger, orders_logger
+from src.utils.metrics import metrics
+
+# Characters urlencode() leaves as-is: values made only of these need no quoting
+_URL_SAFE = re.compile(r"[A-Za-z0-9_.~-]*")
+
+# Per attempt, excluding the rate limiter wait; status is the HTTP status code
+# or "error" when no response arrived (timeout, connection failure)
+REQUEST_SECONDS = metrics.histogram(
+    "bingx_request_duration_seconds",
+    "BingX REST request latency",
+    ("endpoint", "status"),
+)
+API_ERRORS = metrics.counter(
+    "bingx_api_errors_total",
+    "BingX responses with a non-zero error code",
+    ("endpoint", "code"),
+)
+
+
+def _canonical_query(params: dict) -> tuple[str, str]:
+    """
+    Build the sorted query string once for both signing and the URL.
+
+    BingX verifies the signature against the raw (unencoded) parameters, while
+    the URL carries them encoded. Most values (symbols, prices, ids) contain
+    no characters that need quoting, so both strings are usually the same
+    and encoding is skipped.
+
+    Returns:
+        Tuple of (raw query string to sign, URL-encoded query string)
+    """
+    items = [(k, str(v)) for k, v in sorted(params.items())]
+    raw = "&".join(f"{k}={v}" for k, v in items)
+    if all(_URL_SAFE.fullmatch(v) for _, v in items):
+        return raw, raw
+    encoded = "&".join(f"{quote_plus(k)}={quote_plus(v)}" for k, v in items)
+    return raw, encoded
 
 
 class BingXClient:
     """Client for BingX Perpetual Swap API v2."""
 
-    def __init__(self, config: BingXConfig):
+    # Max orders per request on the batch endpoints
+    BATCH_CREATE_LIMIT = 5
+    BATCH_CANCEL_LIMIT = 10
+
+    def __init__(self, config: BingXConfig, http_client: httpx.AsyncClient | None = None):
+        """
+        Initialize the client.
+
+        Args:
+            config: BingX credentials and environment
+            http_client: HTTP client to use (default: the process-wide pool
+                from get_http_client(), shared by all BingXClient instances)
+        """
         self.config = config
         self.base_url = config.base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
-
-        # Cache com TTL (time to live) em segundos
-        self._cache: dict[str, tuple[float, Any]] = {}
-        self._cache_ttl = {
-            "klines": 60,  # Klines: 60s (muda só no candle novo)
-            "balance": 30,  # Balance: 30s
-            "positions": 15,  # Positions: 15s
-            "open_orders": 15,  # Open orders: 15s
-            "funding_rate": 300,  # Funding rate: 5min (não muda frequentemente)
-        }
+        self._shared_http_client = http_client is None
+        self.client = http_client or get_http_client()
+        # Short read budget for order create/cancel (the hot path)
+        self._order_timeout = get_http_pool_config().order_timeouts()
+
+        # Cache de leituras com TTL por tipo (ver request_cache.DEFAULT_POLICIES);
+        # chamadas concorrentes para a mesma chave compartilham uma requisição
+        self._cache = RequestCache()
 
-    def _get_cached(self, key: str) -> Any | None:
-        """Get cached value if not expired."""
-        if key in self._cache:
-            cached_time, value = self._cache[key]
-            ttl = self._cache_ttl.get(key, 10)
-            if time.time() - cached_time < ttl:
-                return value
-        return None
+        # Token buckets per endpoint group (market / account / order)
+        self.rate_limiter = RateLimiter()
 
-    def _set_cache(self, key: str, value: Any) -> None:
-        """Set cache value."""
-        self._cache[key] = (time.time(), value)
+        # Server clock estimate for signed timestamps (shared; see time_sync)
+        self.clock = server_clock
+
+        # HMAC keyed once with the secret; each signature works on a copy
+        self._hmac = hmac.new(config.secret_key.encode("utf-8"), digestmod=hashlib.sha256)
 
     def _invalidate_cache(self, *prefixes: str) -> None:
-        """Invalidate cache entries matching prefixes."""
-        keys_to_delete = [
-            k for k in self._cache if any(k.startswith(p) or k == p for p in prefixes)
-        ]
-        for k in keys_to_delete:
-            del self._cache[k]
+        """Invalidate cache entries (and pending loads) matching prefixes."""
+        self._cache.invalidate(*prefixes)
+
+    def cache_stats(self) -> dict[str, dict[str, int]]:
+        """Cache hit/stale/miss/coalesced counters per key kind (e.g. "klines")."""
+        return self._cache.snapshot()
+
+    @staticmethod
+    def _open_order(params: dict[str, Any], order_id: Any) -> dict[str, Any]:
+        """Open order (get_open_orders shape) for an order that was just created."""
+        return {
+            "orderId": order_id,
+            "symbol": params["symbol"],
+            "side": params["side"],
+            "positionSide": params["positionSide"],
+            "type": params["type"],
+            "price": params.get("price", 0),
+            "stopPrice": params.get("stopPrice", 0),
+            "origQty": params["quantity"],
+            "status": "NEW",
+            "clientOrderId": params["clientOrderID"],
+        }
+
+    def _apply_created(
+        self, symbol: str, created: list[tuple[dict[str, Any], dict[str, Any]]], uncertain: bool
+    ) -> None:
+        """
+        Update the symbol's caches after orders were created.
+
+        Resting orders (LIMIT and trigger orders) are added to the cached open
+        orders. A TP attached to a LIMIT order only becomes an open order when
+        the entry fills, so it is not added. MARKET orders (or responses
+        without an order ID) change positions, so those caches are dropped.
+
+        Args:
+            symbol: Trading pair
+            created: (params sent, order response) of each created order
+            uncertain: A request failed without a response (orders may exist)
+        """
+        resting = []
+        for params, response in created:
+            entry_order_id, _ = self._extract_order_ids(response)
+            if params["type"] == "MARKET" or not entry_order_id:
+                uncertain = True
+            else:
+                resting.append(self._open_order(params, entry_order_id))
+
+        if uncertain:
+            self._invalidate_cache(f"open_orders:{symbol}", f"positions:{symbol}", "positions:all")
+        elif resting:
+            self._cache.update(f"open_orders:{symbol}", lambda orders: [*orders, *resting])
+        self._invalidate_cache("balance")
+
+    def _apply_cancelled(self, symbol: str, order_ids: list[str], uncertain: bool) -> None:
+        """
+        Update the symbol's caches after orders were cancelled.
+
+        Cancelled IDs are removed from the cached open orders. A failed cancel
+        usually means the order was filled or is already gone, so the cache is
+        dropped instead.
+
+        Args:
+            symbol: Trading pair
+            order_ids: IDs of the cancelled orders
+            uncertain: Some cancel failed
+        """
+        if uncertain:
+            self._invalidate_cache(f"open_orders:{symbol}")
+        elif order_ids:
+            cancelled = {str(order_id) for order_id in order_ids}
+            self._cache.update(
+                f"open_orders:{symbol}",
+                lambda orders: [o for o in orders if str(o.get("orderId")) not in cancelled],
+            )
+        self._invalidate_cache("balance")
 
     def _generate_signature(self, query_string: str) -> str:
         """Generate HMAC SHA256 signature for request."""
-        signature = hmac.new(
-            self.config.secret_key.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
-        return signature
+        mac = self._hmac.copy()
+        mac.update(query_string.encode("utf-8"))
+        return mac.hexdigest()
+
+    def _timestamp(self) -> int:
+        """Timestamp for signed requests, corrected by the server clock offset."""
+        return self.clock.now_ms()
+
+    async def _resync_clock(self, attempt: int) -> None:
+        """Resync the server clock after a rejected timestamp (back off if that fails).
+
+        The measured offset is adopted without smoothing, so the retry is signed
+        with the corrected time even after a large clock step.
+        """
+        if not await self.clock.sync(self.get_server_time, smooth=False):
+            await asyncio.sleep(0.5 * (attempt + 1))
+
+    def _signed_url(self, endpoint: str, params: dict) -> str:
+        """Build the signed request URL for params (which must include the timestamp)."""
+        query_string, encoded_query = _canonical_query(params)
+        signature = self._generate_signature(query_string)
+        return f"{self.base_url}{endpoint}?{encoded_query}&signature={signature}"
 
     def _get_headers(self) -> dict:
         """Get request headers with API key."""
@@ -68,6 +205,28 @@ class BingXClient:
             "X-BX-APIKEY": self.config.api_key,
         }
 
+    def _rate_limited(
+        self, group: str, error_msg: str, retry_after: float | None = None
+    ) -> RateLimitError:
+        """Slow down the endpoint group and build the error for a rate-limited response."""
+        retry_after = self.rate_limiter.record_rate_limited(group, retry_after)
+        return RateLimitError(f"BingX API Error: {error_msg}", group, retry_after)
+
+    async def _send(
+        self, method: str, url: str, headers: dict[str, str], timeout: Any
+    ) -> httpx.Response:
+        """Send one HTTP request (params are already in the URL query string)."""
+        if method.upper() == "GET":
+            return await self.client.get(url, headers=headers, timeout=timeout)
+        if method.upper() == "POST":
+            # POST with params in query string, empty body
+            return await self.client.post(url, headers=headers, timeout=timeout)
+        if method.upper() == "PUT":
+            return await self.client.put(url, headers=headers, timeout=timeout)
+        if method.upper() == "DELETE":
+            return await self.client.delete(url, headers=headers, timeout=timeout)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+
     async def _request(
         self,
         method: str,
@@ -84,64 +243,86 @@ class BingXClient:
             endpoint: API endpoint
             params: Query parameters
             signed: Whether to sign the request
-            max_retries: Maximum number of retries for timestamp errors
+            max_retries: Maximum number of retries for timestamp and rate-limit errors
 
         Returns:
             API response data
+
+        Raises:
+            RateLimitError: If still rate limited after max_retries attempts
         """
         params = params or {}
         headers = self._get_headers()
+        group = endpoint_group(method, endpoint)
+        timeout = self._order_timeout if group == "order" else httpx.USE_CLIENT_DEFAULT
 
         # Retry loop for timestamp errors
         for attempt in range(max_retries):
             if signed:
                 # Generate fresh timestamp for each attempt
-                params["timestamp"] = int(time.time() * 1000)
-                # Create sorted query string for signature (no URL encoding for signature)
-                sorted_params = sorted(params.items())
-                query_string = "&".join([f"{k}={v}" for k, v in sorted_params])
-                signature = self._generate_signature(query_string)
-                # URL-encode the query string for the actual request
-                encoded_query = urlencode(sorted_params)
-                url = f"{self.base_url}{endpoint}?{encoded_query}&signature={signature}"
+                params["timestamp"] = self._timestamp()
+                url = self._signed_url(endpoint, params)
             else:
                 url = f"{self.base_url}{endpoint}"
                 if params:
                     url += "?" + urlencode(params)
 
             try:
-                if method.upper() == "GET":
-                    response = await self.client.get(url, headers=headers)
-                elif method.upper() == "POST":
-                    # POST with params in query string, empty body
-                    response = await self.client.post(url, headers=headers)
-                elif method.upper() == "PUT":
-                    response = await self.client.put(url, headers=headers)
-                elif method.upper() == "DELETE":
-                    response = await self.client.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
+                async with self.rate_limiter.slot(group):
+                    started = time.perf_counter()
+                    status = "error"
+                    try:
+                        response = await self._send(method, url, headers, timeout)
+                        status = str(response.status_code)
+                    finally:
+                        REQUEST_SECONDS.labels(endpoint, status).observe(
+                            time.perf_counter() - started
+                        )
+
+                if response.status_code == 429:
+                    retry_after = response.headers.get("Retry-After")
+                    raise self._rate_limited(
+                        group,
+                        "429 Too Many Requests",
+                        float(retry_after) if retry_after and retry_after.isdigit() else None,
+                    )
 
                 response.raise_for_status()
                 data = response.json()
 
                 if data.get("code") != 0:
                     error_msg = data.get("msg", "Unknown error")
+                    API_ERRORS.labels(endpoint, str(data.get("code"))).inc()
+
+                    if is_rate_limit_error(data.get("code"), error_msg):
+                        raise self._rate_limited(group, error_msg)
 
-                    # Retry on timestamp errors
+                    # Retry on timestamp errors (after resyncing the server clock)
                     if "timestamp is invalid" in error_msg.lower() and attempt < max_retries - 1:
                         error_logger.warning(
                             f"Timestamp error (attempt {attempt + 1}/{max_retries}), retrying..."
                         )
-                        await asyncio.sleep(0.5 * (attempt + 1))  # Exponential backoff
+                        await self._resync_clock(attempt)
                         continue
 
                     error_logger.error(f"API Error: {error_msg}")
                     raise Exception(f"BingX API Error: {error_msg}")
 
+                self.rate_limiter.record_success(group)
                 result: dict[str, Any] = data.get("data", data)
                 return result
 
+            except RateLimitError as e:
+                # Rejected requests were not executed, so retrying is safe; the
+                # bucket already holds further requests for the cool-down
+                if attempt < max_retries - 1:
+                    error_logger.warning(
+                        f"Rate limited on {group} (attempt {attempt + 1}/{max_retries}), "
+                        f"retrying in {e.retry_after:.1f}s..."
+                    )
+                    continue
+                error_logger.error(f"Rate limit Error: {e}")
+                raise
             except httpx.HTTPStatusError as e:
                 error_logger.error(f"HTTP Error: {e}")
                 raise
@@ -151,7 +332,7 @@ class BingXClient:
                     error_logger.warning(
                         f"Timestamp error (attempt {attempt + 1}/{max_retries}), retrying..."
                     )
-                    await asyncio.sleep(0.5 * (attempt + 1))
+                    await self._resync_clock(attempt)
                     continue
 
                 error_logger.error(f"Request Error: {e}")
@@ -160,6 +341,11 @@ class BingXClient:
         # Should not reach here, but just in case
         raise Exception("Max retries exceeded")
 
+    async def get_server_time(self) -> int:
+        """Get BingX server time in milliseconds (unsigned, not cached)."""
+        data = await self._request("GET", "/openApi/swap/v2/server/time", signed=False)
+        return int(data["serverTime"])
+
     async def get_price(self, symbol: str) -> float:
         """Get current price for a symbol."""
         endpoint = "/openApi/swap/v2/quote/price"
@@ -183,11 +369,12 @@ class BingXClient:
                 - quoteVolume: 24h quote volume (in USDT)
                 - openPrice: Price 24h ago
         """
-        cache_key = f"ticker_24h:{symbol}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
+        result: dict[str, Any] = await self._cache.fetch(
+            f"ticker_24h:{symbol}", lambda: self._fetch_ticker_24h(symbol)
+        )
+        return result
 
+    async def _fetch_ticker_24h(self, symbol: str) -> dict[str, Any]:
         endpoint = "/openApi/swap/v2/quote/ticker"
         params = {"symbol": symbol}
         data = await self._request("GET", endpoint, params, signed=False)
@@ -204,10 +391,6 @@ class BingXClient:
             "quoteVolume": float(data.get("quoteVolume") or 0),
             "openPrice": float(data.get("openPrice") or 0),
         }
-
-        # Add custom cache TTL for ticker (30s)
-        self._cache_ttl["ticker_24h"] = 30
-        self._set_cache(cache_key, result)
         return result
 
     async def get_klines(
@@ -215,7 +398,8 @@ class BingXClient:
         symbol: str,
         interval: str = "1h",
         limit: int = 100,
-    ) -> pd.DataFrame:
+        use_cache: bool = True,
+    ) -> Klines:
         """
         Get kline/candlestick data (cached for 60s).
 
@@ -223,15 +407,20 @@ class BingXClient:
             symbol: Trading pair (e.g., "BTC-USDT")
             interval: Kline interval (1m, 5m, 15m, 30m, 1h, 4h, 1d, 1w)
             limit: Number of klines to fetch (max 1000)
+            use_cache: If False, always fetch fresh data (result is still cached)
 
         Returns:
-            DataFrame with columns: open, high, low, close, volume, timestamp
+            Klines with OHLCV arrays and open times in ms, oldest first
+            (use .to_frame() for a DataFrame)
         """
-        cache_key = f"klines:{symbol}:{interval}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached  # type: ignore[no-any-return,unused-ignore]
+        klines: Klines = await self._cache.fetch(
+            f"klines:{symbol}:{interval}",
+            lambda: self._fetch_klines(symbol, interval, limit),
+            use_cache=use_cache,
+        )
+        return klines
 
+    async def _fetch_klines(self, symbol: str, interval: str, limit: int) -> Klines:
         endpoint = "/openApi/swap/v2/quote/klines"
         params = {
             "symbol": symbol,
@@ -239,85 +428,135 @@ class BingXClient:
             "limit": limit,
         }
         data = await self._request("GET", endpoint, params, signed=False)
+        if not isinstance(data, list):
+            raise ValueError(f"API returned non-list klines response: {type(data).__name__}")
 
         # BingX API v2 returns list of dicts with keys: open, close, high, low, volume, time
-        # Create DataFrame from list of dicts
-        df = pd.DataFrame(data)
-
-        # Rename 'time' column to 'timestamp' for consistency with rest of code
-        if "time" in df.columns:
-            df = df.rename(columns={"time": "timestamp"})
-
-        # Convert numeric columns to float
-        df = df.astype(
-            {
-                "open": float,
-                "high": float,
-                "low": float,
-                "close": float,
-                "volume": float,
-            }
-        )
-
-        # Convert timestamp from milliseconds to datetime
-        # Use errors='coerce' to handle invalid timestamps from BingX API
-        # This prevents FloatingPointError on extreme/invalid timestamp values
-        df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms", errors="coerce")
-
-        # Filter out rows with invalid timestamps (NaT)
-        if df["timestamp"].isna().any():
+        # Rows with invalid timestamps (seen occasionally from BingX) are dropped
+        klines = Klines.from_records(data)
+        if len(klines) < len(data):
             error_logger.warning(
-                f"Filtered {df['timestamp'].isna().sum()} invalid timestamps from klines data"
+                f"Filtered {len(data) - len(klines)} invalid timestamps from klines data"
             )
-            df = df.dropna(subset=["timestamp"])
-
-        self._set_cache(cache_key, df)
-        return df
+        return klines
 
     async def get_balance(self) -> dict[str, Any]:
         """Get account balance (cached for 30s)."""
-        cached = self._get_cached("balance")
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
-
         endpoint = "/openApi/swap/v2/user/balance"
-        data = await self._request("GET", endpoint)
-
-        self._set_cache("balance", data)
+        data: dict[str, Any] = await self._cache.fetch(
+            "balance", lambda: self._request("GET", endpoint)
+        )
         return data
 
     async def get_positions(self, symbol: str | None = None) -> list[dict[str, Any]]:
         """Get open positions (cached for 15s)."""
-        cache_key = f"positions:{symbol or 'all'}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
+        result: list[dict[str, Any]] = await self._cache.fetch(
+            f"positions:{symbol or 'all'}", lambda: self._fetch_positions(symbol)
+        )
+        return result
 
+    async def _fetch_positions(self, symbol: str | None) -> list[dict[str, Any]]:
         endpoint = "/openApi/swap/v2/user/positions"
         params: dict[str, str] = {}
         if symbol:
             params["symbol"] = symbol
         data = await self._request("GET", endpoint, params)
-        result: list[dict[str, Any]] = data if isinstance(data, list) else []
+        return data if isinstance(data, list) else []
 
-        self._set_cache(cache_key, result)
-        return result
+    async def get_open_orders(self, symbol: str, use_cache: bool = True) -> list[dict[str, Any]]:
+        """Get open orders for a symbol (cached for 15s).
 
-    async def get_open_orders(self, symbol: str) -> list[dict[str, Any]]:
-        """Get open orders for a symbol (cached for 15s)."""
-        cache_key = f"open_orders:{symbol}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
+        Args:
+            symbol: Trading pair (e.g., "BTC-USDT")
+            use_cache: If False, always fetch fresh data (result is still cached)
+        """
+        result: list[dict[str, Any]] = await self._cache.fetch(
+            f"open_orders:{symbol}",
+            lambda: self._fetch_open_orders(symbol),
+            use_cache=use_cache,
+        )
+        return result
 
+    async def _fetch_open_orders(self, symbol: str) -> list[dict[str, Any]]:
         endpoint = "/openApi/swap/v2/trade/openOrders"
         params = {"symbol": symbol}
         data = await self._request("GET", endpoint, params)
         result: list[dict[str, Any]] = data.get("orders", []) if isinstance(data, dict) else data
-
-        self._set_cache(cache_key, result)
         return result
 
+    @staticmethod
+    def _order_params(
+        symbol: str,
+        side: str,
+        position_side: str,
+        order_type: str,
+        quantity: float,
+        price: float | None = None,
+        stop_price: float | None = None,
+        take_profit: dict | None = None,
+        stop_loss: dict | None = None,
+    ) -> dict[str, Any]:
+        """Build the parameters of one order (shared by single and batch create)."""
+        params: dict[str, Any] = {
+            "symbol": symbol,
+            "side": side,
+            "positionSide": position_side,
+            "type": order_type,
+            "quantity": quantity,
+            "clientOrderID": str(uuid.uuid4()),  # Required for VST demo
+        }
+
+        if price is not None:
+            params["price"] = price
+
+        if stop_price is not None:
+            params["stopPrice"] = stop_price
+
+        if take_profit:
+            params["takeProfit"] = json.dumps(take_profit, separators=(",", ":"))
+
+        if stop_loss:
+            params["stopLoss"] = json.dumps(stop_loss, separators=(",", ":"))
+
+        return params
+
+    @staticmethod
+    def _extract_order_ids(result: dict) -> tuple[Any, Any]:
+        """Extract (entry order ID, TP order ID) from an order response."""
+        entry_order_id = result.get("orderId")
+        if not entry_order_id:
+            order_obj = result.get("order")
+            if isinstance(order_obj, dict):
+                entry_order_id = order_obj.get("orderId")
+        if not entry_order_id:
+            data_obj = result.get("data")
+            if isinstance(data_obj, dict):
+                entry_order_id = data_obj.get("orderId")
+
+        tp_order_id = result.get("takeProfitOrderId") or result.get("tpOrderId")
+        if not tp_order_id:
+            tp_obj = result.get("takeProfit")
+            if isinstance(tp_obj, dict):
+                tp_order_id = tp_obj.get("orderId")
+        if not tp_order_id:
+            tp_order_obj = result.get("takeProfitOrder")
+            if isinstance(tp_order_obj, dict):
+                tp_order_id = tp_order_obj.get("orderId")
+        if not tp_order_id:
+            order_obj = result.get("order")
+            if isinstance(order_obj, dict):
+                tp_sub = order_obj.get("takeProfit")
+                if isinstance(tp_sub, dict):
+                    tp_order_id = tp_sub.get("orderId")
+        if not tp_order_id:
+            data_obj = result.get("data")
+            if isinstance(data_obj, dict):
+                tp_sub = data_obj.get("takeProfit")
+                if isinstance(tp_sub, dict):
+                    tp_order_id = tp_sub.get("orderId")
+
+        return entry_order_id, tp_order_id
+
     async def create_order(
         self,
         symbol: str,
@@ -348,32 +587,23 @@ class BingXClient:
             Order response with orderId
         """
         endpoint = "/openApi/swap/v2/trade/order"
-        params = {
-            "symbol": symbol,
-            "side": side,
-            "positionSide": position_side,
-            "type": order_type,
-            "quantity": quantity,
-            "clientOrderID": str(uuid.uuid4()),  # Required for VST demo
-        }
-
-        if price is not None:
-            params["price"] = price
-
-        if stop_price is not None:
-            params["stopPrice"] = stop_price
-
-        if take_profit:
-            params["takeProfit"] = json.dumps(take_profit, separators=(",", ":"))
-
-        if stop_loss:
-            params["stopLoss"] = json.dumps(stop_loss, separators=(",", ":"))
+        params = self._order_params(
+            symbol,
+            side,
+            position_side,
+            order_type,
+            quantity,
+            price=price,
+            stop_price=stop_price,
+            take_profit=take_profit,
+            stop_loss=stop_loss,
+        )
 
         try:
             data = await self._request("POST", endpoint, params)
 
-            # Invalidate cache after order creation
-            self._invalidate_cache("open_orders", "positions", "balance")
+            # Write the new order through to the cached open orders
+            self._apply_created(symbol, [(params, data)], uncertain=not isinstance(data, dict))
 
             # Only log success if we get a valid response with orderId
             order_id = data.get("orderId") or data.get("order", {}).get("orderId")
@@ -391,6 +621,34 @@ class BingXClient:
             )
             raise
 
+    @staticmethod
+    def limit_order_with_tp_spec(
+        side: str,
+        position_side: str,
+        price: float,
+        quantity: float,
+        tp_price: float,
+    ) -> dict[str, Any]:
+        """
+        Build create_order arguments for a LIMIT order with embedded take profit.
+
+        Used by create_limit_order_with_tp and as an order spec for
+        create_orders_batch.
+        """
+        return {
+            "side": side,
+            "position_side": position_side,
+            "order_type": "LIMIT",
+            "quantity": quantity,
+            "price": price,
+            "take_profit": {
+                "type": "TAKE_PROFIT_MARKET",
+                "stopPrice": tp_price,
+                "price": tp_price,
+                "workingType": "MARK_PRICE",
+            },
+        }
+
     async def create_limit_order_with_tp(
         self,
         symbol: str,
@@ -414,21 +672,9 @@ class BingXClient:
         Returns:
             Order response with entry and TP order IDs
         """
-        take_profit = {
-            "type": "TAKE_PROFIT_MARKET",
-            "stopPrice": tp_price,
-            "price": tp_price,
-            "workingType": "MARK_PRICE",
-        }
-
         result = await self.create_order(
             symbol=symbol,
-            side=side,
-            position_side=position_side,
-            order_type="LIMIT",
-            quantity=quantity,
-            price=price,
-            take_profit=take_profit,
+            **self.limit_order_with_tp_spec(side, position_side, price, quantity, tp_price),
         )
 
         # Validate result is a dict before accessing .get()
@@ -442,39 +688,7 @@ class BingXClient:
         # Log full response for debugging
         orders_logger.debug(f"create_limit_order_with_tp raw result: {result}")
 
-        # Safely extract entry_order_id
-        entry_order_id = result.get("orderId")
-        if not entry_order_id:
-            order_obj = result.get("order")
-            if isinstance(order_obj, dict):
-                entry_order_id = order_obj.get("orderId")
-        if not entry_order_id:
-            data_obj = result.get("data")
-            if isinstance(data_obj, dict):
-                entry_order_id = data_obj.get("orderId")
-
-        # Safely extract tp_order_id
-        tp_order_id = result.get("takeProfitOrderId") or result.get("tpOrderId")
-        if not tp_order_id:
-            tp_obj = result.get("takeProfit")
-            if isinstance(tp_obj, dict):
-                tp_order_id = tp_obj.get("orderId")
-        if not tp_order_id:
-            tp_order_obj = result.get("takeProfitOrder")
-            if isinstance(tp_order_obj, dict):
-                tp_order_id = tp_order_obj.get("orderId")
-        if not tp_order_id:
-            order_obj = result.get("order")
-            if isinstance(order_obj, dict):
-                tp_sub = order_obj.get("takeProfit")
-                if isinstance(tp_sub, dict):
-                    tp_order_id = tp_sub.get("orderId")
-        if not tp_order_id:
-            data_obj = result.get("data")
-            if isinstance(data_obj, dict):
-                tp_sub = data_obj.get("takeProfit")
-                if isinstance(tp_sub, dict):
-                    tp_order_id = tp_sub.get("orderId")
+        entry_order_id, tp_order_id = self._extract_order_ids(result)
 
         result["entry_order_id"] = entry_order_id
         result["tp_order_id"] = tp_order_id
@@ -497,12 +711,13 @@ class BingXClient:
             orders_logger.debug(f"Attempting to cancel order: {order_id[:8]} on {symbol}")
             data = await self._request("DELETE", endpoint, params)
 
-            # Invalidate cache after cancellation
-            self._invalidate_cache("open_orders", "positions", "balance")
+            # Drop the order from the cached open orders
+            self._apply_cancelled(symbol, [order_id], uncertain=False)
 
             orders_logger.info(f"Order cancelled: {order_id[:8]}")
             return data
         except Exception as e:
+            self._apply_cancelled(symbol, [], uncertain=True)
             error_logger.error(
                 f"Failed to cancel order {order_id[:8]} on {symbol}: {e} | "
                 f"This may indicate the order was already filled, canceled, or doesn't exist"
@@ -515,12 +730,167 @@ class BingXClient:
         params = {"symbol": symbol}
         data = await self._request("DELETE", endpoint, params)
 
-        # Invalidate cache after cancellation
-        self._invalidate_cache("open_orders", "positions", "balance")
+        # No open orders remain for the symbol
+        self._cache.update(f"open_orders:{symbol}", lambda orders: [])
+        self._invalidate_cache("balance")
 
         orders_logger.info(f"All orders cancelled for {symbol}")
         return data
 
+    async def create_orders_batch(
+        self, symbol: str, orders: list[dict[str, Any]]
+    ) -> list[dict[str, Any]]:
+        """
+        Create several orders with the batch endpoint.
+
+        Orders are sent in chunks of BATCH_CREATE_LIMIT (chunks run
+        concurrently, paced by the rate limiter). A failed order or chunk does
+        not fail the others.
+
+        Args:
+            symbol: Trading pair
+            orders: Order specs with create_order keyword arguments
+                (side, position_side, order_type, quantity, and optionally
+                price, stop_price, take_profit, stop_loss)
+
+        Returns:
+            One result per input order, in the same order:
+                - success: Whether the order was created
+                - entry_order_id / tp_order_id: Created order IDs (on success)
+                - order: Raw order response (on success)
+                - error: Error message (on failure)
+                - exception: Exception that failed the chunk, if any
+        """
+        endpoint = "/openApi/swap/v2/trade/batchOrders"
+        batch = [self._order_params(symbol, **order) for order in orders]
+        chunks = [
+            batch[i : i + self.BATCH_CREATE_LIMIT]
+            for i in range(0, len(batch), self.BATCH_CREATE_LIMIT)
+        ]
+
+        async def send(chunk: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            params = {"batchOrders": json.dumps(chunk, separators=(",", ":"))}
+            try:
+                data = await self._request("POST", endpoint, params)
+            except Exception as e:
+                return [{"success": False, "error": str(e), "exception": e} for _ in chunk]
+
+            created = data.get("orders", []) if isinstance(data, dict) else data
+            created = [o for o in created or [] if isinstance(o, dict)]
+            by_client_id = {
+                str(o.get("clientOrderID") or o.get("clientOrderId")): o
+                for o in created
+                if o.get("clientOrderID") or o.get("clientOrderId")
+            }
+
+            results = []
+            for i, params_sent in enumerate(chunk):
+                order = by_client_id.get(params_sent["clientOrderID"])
+                if order is None and not by_client_id and i < len(created):
+                    order = created[i]  # Response without client IDs: match by position
+                entry_order_id, tp_order_id = self._extract_order_ids(order or {})
+                if order is None or order.get("code") not in (None, 0) or not entry_order_id:
+                    error = (order or {}).get("msg") or "Order missing from batch response"
+                    results.append({"success": False, "error": error, "exception": None})
+                else:
+                    results.append(
+                        {
+                            "success": True,
+                            "entry_order_id": entry_order_id,
+                            "tp_order_id": tp_order_id,
+                            "order": order,
+                        }
+                    )
+            return results
+
+        chunk_results = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        results = [result for chunk in chunk_results for result in chunk]
+
+        # Write created orders through to the cached open orders (results follow batch order)
+        self._apply_created(
+            symbol,
+            [
+                (params, r["order"])
+                for params, r in zip(batch, results, strict=True)
+                if r["success"]
+            ],
+            uncertain=any(r.get("exception") for r in results),
+        )
+
+        created_count = sum(1 for r in results if r["success"])
+        orders_logger.info(f"Batch create: {created_count}/{len(results)} orders on {symbol}")
+        for result in results:
+            if not result["success"]:
+                orders_logger.error(
+                    f"FAILED to create order (batch) on {symbol}: {result['error']}"
+                )
+        return results
+
+    async def cancel_orders_batch(self, symbol: str, order_ids: list[str]) -> list[dict[str, Any]]:
+        """
+        Cancel several orders with the batch endpoint.
+
+        IDs are sent in chunks of BATCH_CANCEL_LIMIT (chunks run concurrently).
+        A failed order or chunk does not fail the others.
+
+        Args:
+            symbol: Trading pair
+            order_ids: Exchange order IDs
+
+        Returns:
+            One result per input ID, in the same order:
+                - orderId: Order ID
+                - success: Whether the order was cancelled
+                - error: Error message (on failure)
+        """
+        endpoint = "/openApi/swap/v2/trade/batchOrders"
+        order_ids = [str(order_id) for order_id in order_ids]
+        chunks = [
+            order_ids[i : i + self.BATCH_CANCEL_LIMIT]
+            for i in range(0, len(order_ids), self.BATCH_CANCEL_LIMIT)
+        ]
+
+        async def send(chunk: list[str]) -> list[dict[str, Any]]:
+            params = {
+                "symbol": symbol,
+                "orderIdList": "[" + ",".join(chunk) + "]",
+            }
+            try:
+                data = await self._request("DELETE", endpoint, params)
+            except Exception as e:
+                return [{"orderId": oid, "success": False, "error": str(e)} for oid in chunk]
+
+            data = data if isinstance(data, dict) else {}
+            cancelled = {str(o.get("orderId")) for o in data.get("success") or []}
+            failed = {
+                str(o.get("orderId")): o.get("errorMessage") or o.get("msg") or "Cancel failed"
+                for o in data.get("failed") or []
+            }
+            return [
+                {
+                    "orderId": oid,
+                    "success": oid in cancelled,
+                    "error": None
+                    if oid in cancelled
+                    else failed.get(oid, "Order missing from batch response"),
+                }
+                for oid in chunk
+            ]
+
+        chunk_results = await asyncio.gather(*(send(chunk) for chunk in chunks))
+        results = [result for chunk in chunk_results for result in chunk]
+
+        # Drop cancelled orders from the cached open orders
+        self._apply_cancelled(
+            symbol,
+            [r["orderId"] for r in results if r["success"]],
+            uncertain=not all(r["success"] for r in results),
+        )
+
+        cancelled_count = sum(1 for r in results if r["success"])
+        orders_logger.info(f"Batch cancel: {cancelled_count}/{len(results)} orders on {symbol}")
+        return results
+
     async def modify_tp_order(
         self,
         symbol: str,
@@ -615,9 +985,6 @@ class BingXClient:
 
             orders_logger.info(f"New TP order created: {new_order_id[:8]} at ${new_tp_price:,.2f}")
 
-            # Invalidate cache after modification
-            self._invalidate_cache("open_orders", "positions")
-
             return {
                 "order": new_tp_order,
                 "oldOrderId": old_tp_order_id,
@@ -703,11 +1070,12 @@ class BingXClient:
             Result is cached for 1 hour since position mode rarely changes.
             Cache is invalidated when creating orders to detect mode changes.
         """
-        cache_key = f"position_mode:{symbol}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return str(cached)
+        mode: str = await self._cache.fetch(
+            f"position_mode:{symbol}", lambda: self._fetch_position_mode(symbol)
+        )
+        return mode
 
+    async def _fetch_position_mode(self, symbol: str) -> str:
         # Get position info which includes position mode indicator
         positions = await self.get_positions(symbol)
 
@@ -727,10 +1095,6 @@ class BingXClient:
             else:
                 # Hedge mode: use the actual position side
                 position_mode = str(first_position.get("positionSide", "BOTH"))
-
-        # Cache for 1 hour (position mode changes are rare)
-        self._cache_ttl[cache_key] = 3600
-        self._set_cache(cache_key, position_mode)
         return position_mode
 
     async def get_funding_rate(self, symbol: str) -> dict[str, Any]:
@@ -743,11 +1107,12 @@ class BingXClient:
                 - nextFundingTime: Timestamp of next funding settlement
                 - markPrice: Current mark price
         """
-        cache_key = f"funding_rate:{symbol}"
-        cached = self._get_cached(cache_key)
-        if cached is not None:
-            return cached  # type: ignore[no-any-return]
+        result: dict[str, Any] = await self._cache.fetch(
+            f"funding_rate:{symbol}", lambda: self._fetch_funding_rate(symbol)
+        )
+        return result
 
+    async def _fetch_funding_rate(self, symbol: str) -> dict[str, Any]:
         endpoint = "/openApi/swap/v2/quote/premiumIndex"
         params = {"symbol": symbol}
         data = await self._request("GET", endpoint, params, signed=False)
@@ -758,8 +1123,6 @@ class BingXClient:
             "nextFundingTime": int(data.get("nextFundingTime", 0)),
             "markPrice": float(data.get("markPrice", 0)),
         }
-
-        self._set_cache(cache_key, result)
         return result
 
     async def get_income_history(
@@ -886,11 +1249,7 @@ class BingXClient:
         """Generate a listenKey for WebSocket account updates."""
         endpoint = "/openApi/user/auth/userDataStream"
         # This endpoint returns listenKey directly, not wrapped in "data"
-        params = {"timestamp": int(time.time() * 1000)}
-        query_string = f"timestamp={params['timestamp']}"
-        signature = self._generate_signature(query_string)
-
-        url = f"{self.base_url}{endpoint}?{query_string}&signature={signature}"
+        url = self._signed_url(endpoint, {"timestamp": self._timestamp()})
         headers = self._get_headers()
 
         try:
@@ -912,12 +1271,8 @@ class BingXClient:
     async def keep_alive_listen_key(self, listen_key: str) -> bool:
         """Keep listenKey alive (call every 30 minutes)."""
         endpoint = "/openApi/user/auth/userDataStream"
-        params = {"listenKey": listen_key, "timestamp": int(time.time() * 1000)}
-        sorted_params = sorted(params.items())
-        query_string = "&".join([f"{k}={v}" for k, v in sorted_params])
-        signature = self._generate_signature(query_string)
-
-        url = f"{self.base_url}{endpoint}?{query_string}&signature={signature}"
+        params = {"listenKey": listen_key, "timestamp": self._timestamp()}
+        url = self._signed_url(endpoint, params)
         headers = self._get_headers()
 
         response = await self.client.put(url, headers=headers)
@@ -926,17 +1281,14 @@ class BingXClient:
     async def close_listen_key(self, listen_key: str) -> bool:
         """Close/invalidate a listenKey."""
         endpoint = "/openApi/user/auth/userDataStream"
-        params = {"listenKey": listen_key, "timestamp": int(time.time() * 1000)}
-        sorted_params = sorted(params.items())
-        query_string = "&".join([f"{k}={v}" for k, v in sorted_params])
-        signature = self._generate_signature(query_string)
-
-        url = f"{self.base_url}{endpoint}?{query_string}&signature={signature}"
+        params = {"listenKey": listen_key, "timestamp": self._timestamp()}
+        url = self._signed_url(endpoint, params)
         headers = self._get_headers()
 
         response = await self.client.delete(url, headers=headers)
         return bool(response.status_code == 200)
 
     async def close(self):
-        """Close the HTTP client."""
-        await self.client.aclose()
+        """Close the HTTP client, unless it is the shared pool (see close_http_client)."""
+        if not self._shared_http_client:
+            await self.client.aclose()
@@ -0,0 +1,207 @@
+"""Shared HTTP connection pool for the BingX REST API.
+
+A single ``httpx.AsyncClient`` (and connection pool) is shared by every
+``BingXClient`` in the process, so the bot, the API and short-lived clients
+(e.g. credential checks) reuse warm keep-alive connections instead of each
+opening their own. It is created lazily on first use or explicitly via
+``init_http_client()`` at startup, and closed with ``close_http_client()`` on
+shutdown.
+
+HTTP/2 multiplexes concurrent requests over one connection. It needs the
+optional ``h2`` package (``pip install httpx[http2]``); without it the pool
+falls back to HTTP/1.1 keep-alive.
+"""
+
+import importlib.util
+import os
+from dataclasses import dataclass
+from typing import Any
+
+import httpx
+
+from src.utils.logger import main_logger
+
+# Process-wide client (see init_http_client/close_http_client)
+_client: httpx.AsyncClient | None = None
+
+
+@dataclass
+class HttpPoolConfig:
+    """Transport settings for the shared BingX HTTP client."""
+
+    http2: bool = True  # Multiplex requests over one connection (needs h2)
+    max_connections: int = 20  # Open connections, in use or idle
+    max_keepalive_connections: int = 10  # Idle connections kept for reuse
+    keepalive_expiry: float = 30.0  # Seconds an idle connection is kept
+    connect_timeout: float = 5.0  # Seconds to establish a connection
+    read_timeout: float = 15.0  # Seconds to wait for a response
+    write_timeout: float = 5.0  # Seconds to send a request
+    pool_timeout: float = 5.0  # Seconds to wait for a free connection
+    order_timeout: float = 5.0  # Read timeout for order create/cancel calls
+
+    def timeout(self) -> httpx.Timeout:
+        """Default timeout for reads and account queries."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.read_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+    def order_timeouts(self) -> httpx.Timeout:
+        """Short timeout budget for hot-path order calls."""
+        return httpx.Timeout(
+            connect=self.connect_timeout,
+            read=self.order_timeout,
+            write=self.write_timeout,
+            pool=self.pool_timeout,
+        )
+
+
+@dataclass
+class HttpPoolMetrics:
+    """Counters for requests and the connections opened to serve them."""
+
+    requests: int = 0
+    connections_opened: int = 0
+    http2_responses: int = 0
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.requests = 0
+        self.connections_opened = 0
+        self.http2_responses = 0
+
+
+_metrics = HttpPoolMetrics()
+
+
+class _CountingTransport(httpx.AsyncHTTPTransport):
+    """Transport that counts requests and new connections (via httpcore trace events)."""
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        request.extensions["trace"] = self._trace
+        _metrics.requests += 1
+        response = await super().handle_async_request(request)
+        if response.extensions.get("http_version") == b"HTTP/2":
+            _metrics.http2_responses += 1
+        return response
+
+    @staticmethod
+    async def _trace(event_name: str, info: dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            _metrics.connections_opened += 1
+
+
+def http2_available() -> bool:
+    """Check whether the optional h2 package (needed for HTTP/2) is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def get_http_pool_config() -> HttpPoolConfig:
+    """Get HTTP pool settings from environment.
+
+    Reads BINGX_HTTP2, BINGX_MAX_CONNECTIONS, BINGX_MAX_KEEPALIVE,
+    BINGX_KEEPALIVE_EXPIRY, BINGX_CONNECT_TIMEOUT, BINGX_READ_TIMEOUT,
+    BINGX_POOL_TIMEOUT and BINGX_ORDER_TIMEOUT, falling back to
+    HttpPoolConfig defaults.
+    """
+    return HttpPoolConfig(
+        http2=os.getenv("BINGX_HTTP2", "true").lower() == "true",
+        max_connections=int(os.getenv("BINGX_MAX_CONNECTIONS", "20")),
+        max_keepalive_connections=int(os.getenv("BINGX_MAX_KEEPALIVE", "10")),
+        keepalive_expiry=float(os.getenv("BINGX_KEEPALIVE_EXPIRY", "30")),
+        connect_timeout=float(os.getenv("BINGX_CONNECT_TIMEOUT", "5")),
+        read_timeout=float(os.getenv("BINGX_READ_TIMEOUT", "15")),
+        pool_timeout=float(os.getenv("BINGX_POOL_TIMEOUT", "5")),
+        order_timeout=float(os.getenv("BINGX_ORDER_TIMEOUT", "5")),
+    )
+
+
+def create_http_client(pool_config: HttpPoolConfig | None = None) -> httpx.AsyncClient:
+    """Create a new HTTP client with a tuned connection pool.
+
+    Most code should use get_http_client() instead, which returns the shared
+    process-wide client. This is exposed for tools and tests that need an
+    isolated client of their own.
+
+    Args:
+        pool_config: Pool settings. Defaults to get_http_pool_config().
+
+    Returns:
+        httpx.AsyncClient instance.
+    """
+    pool_config = pool_config or get_http_pool_config()
+    http2 = pool_config.http2
+    if http2 and not http2_available():
+        main_logger.warning("HTTP/2 requested but h2 is not installed; using HTTP/1.1")
+        http2 = False
+
+    limits = httpx.Limits(
+        max_connections=pool_config.max_connections,
+        max_keepalive_connections=pool_config.max_keepalive_connections,
+        keepalive_expiry=pool_config.keepalive_expiry,
+    )
+    return httpx.AsyncClient(
+        transport=_CountingTransport(http2=http2, limits=limits),
+        timeout=pool_config.timeout(),
+    )
+
+
+def init_http_client() -> httpx.AsyncClient:
+    """Create the shared HTTP client (startup hook).
+
+    Safe to call more than once; subsequent calls return the existing client.
+
+    Returns:
+        The shared httpx.AsyncClient instance.
+    """
+    global _client
+
+    if _client is None or _client.is_closed:
+        _client = create_http_client()
+        main_logger.info("BingX HTTP client initialized")
+
+    return _client
+
+
+async def close_http_client() -> None:
+    """Close all pooled connections and drop the shared client (shutdown hook)."""
+    global _client
+
+    if _client is None:
+        return
+
+    client = _client
+    _client = None
+    _metrics.reset()
+    await client.aclose()
+    main_logger.info("BingX HTTP client closed")
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it if needed."""
+    return init_http_client()
+
+
+def get_http_pool_stats() -> dict[str, Any]:
+    """Get request and connection reuse metrics for the shared client.
+
+    Returns:
+        Dict with request and new-connection counts, how many requests reused
+        a pooled connection, and HTTP/2 responses. Only ``initialized`` is
+        set when the client has not been created yet.
+    """
+    if _client is None:
+        return {"initialized": False}
+
+    requests = _metrics.requests
+    reused = max(0, requests - _metrics.connections_opened)
+    return {
+        "initialized": True,
+        "requests": requests,
+        "connections_opened": _metrics.connections_opened,
+        "reused_requests": reused,
+        "reuse_ratio": round(reused / requests, 3) if requests else 0.0,
+        "http2_responses": _metrics.http2_responses,
+    }
@@ -0,0 +1,389 @@
+"""Streaming kline store fed by the BingX market WebSocket.
+
+Keeps a fixed-size ring buffer of closed candles plus the candle still in
+formation for one (symbol, interval), updated from the ``@kline_<interval>``
+stream. Gaps (reconnects, skipped candles) are backfilled via REST.
+
+The buffer is written twice (at ``slot`` and ``slot + size``), so the most
+recent candles are always one contiguous slice and can be handed out as
+read-only NumPy views without copying.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from src.client.klines import OHLCV_COLUMNS, Klines
+from src.utils.logger import main_logger
+
+if TYPE_CHECKING:
+    from src.client.bingx_client import BingXClient
+    from src.client.websocket_client import BingXWebSocket
+
+# Kline interval durations in milliseconds (used for gap detection)
+INTERVAL_MS: dict[str, int] = {
+    "1m": 60_000,
+    "3m": 3 * 60_000,
+    "5m": 5 * 60_000,
+    "15m": 15 * 60_000,
+    "30m": 30 * 60_000,
+    "1h": 3_600_000,
+    "2h": 2 * 3_600_000,
+    "4h": 4 * 3_600_000,
+    "6h": 6 * 3_600_000,
+    "8h": 8 * 3_600_000,
+    "12h": 12 * 3_600_000,
+    "1d": 86_400_000,
+    "3d": 3 * 86_400_000,
+    "1w": 7 * 86_400_000,
+}
+
+# Stores registered by start(), keyed by (symbol, interval)
+_stores: dict[tuple[str, str], KlineStore] = {}
+
+
+def get_kline_store(symbol: str, interval: str) -> KlineStore | None:
+    """Get the running KlineStore for a symbol/interval, if any."""
+    return _stores.get((symbol, interval))
+
+
+class KlineStore:
+    """
+    Ring buffer of candles for one (symbol, interval) fed by the kline stream.
+
+    Example:
+        store = KlineStore(client, ws, "BTC-USDT", "1h")
+        await store.start()
+        closes = store.closes()  # read-only view, forming candle last
+    """
+
+    def __init__(
+        self,
+        client: BingXClient,
+        ws: BingXWebSocket,
+        symbol: str,
+        interval: str = "1h",
+        capacity: int = 300,
+        max_age_seconds: float = 60.0,
+    ):
+        """
+        Initialize an empty store.
+
+        Args:
+            client: REST client used for backfills
+            ws: Market WebSocket providing the kline stream
+            symbol: Trading pair (e.g., "BTC-USDT")
+            interval: Kline interval (1m, 5m, 15m, 1h, etc.)
+            capacity: Maximum number of closed candles kept
+            max_age_seconds: Data is considered stale if no update arrives
+                within this many seconds
+        """
+        self._client = client
+        self._ws = ws
+        self.symbol = symbol
+        self.interval = interval
+        self.capacity = capacity
+        self._max_age = max_age_seconds
+        self._interval_ms = INTERVAL_MS.get(interval)
+
+        # Closed candles + forming candle, mirrored (see module docstring)
+        self._size = capacity + 1
+        self._ts = np.zeros(2 * self._size, dtype=np.int64)
+        self._ohlcv = np.zeros((len(OHLCV_COLUMNS), 2 * self._size), dtype=np.float64)
+        self._head = 0  # Slot of the forming candle
+        self._closed = 0  # Number of closed candles held
+        self._has_forming = False
+
+        self._backfilled = False
+        self._backfill_lock = asyncio.Lock()
+        self._backfill_task: asyncio.Task | None = None
+        self._last_update = 0.0
+        self._close_callbacks: list[Callable[[int], None]] = []
+        self._last_notified_close: int | None = None
+        self._stats = {"messages": 0, "candles_closed": 0, "backfills": 0, "gaps": 0}
+
+    @property
+    def data_type(self) -> str:
+        """WebSocket channel name for this store."""
+        return f"{self.symbol}@kline_{self.interval}"
+
+    @property
+    def is_stale(self) -> bool:
+        """True if no stream update or backfill arrived within max_age_seconds."""
+        return time.monotonic() - self._last_update > self._max_age
+
+    @property
+    def is_ready(self) -> bool:
+        """True once backfilled, receiving fresh data, and holding closed candles."""
+        return self._backfilled and self._closed > 0 and not self.is_stale
+
+    @property
+    def last_closed_time(self) -> int | None:
+        """Open time (ms) of the most recent closed candle."""
+        if self._closed == 0:
+            return None
+        return int(self._ts[(self._head - 1) % self._size])
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Stream/backfill counters and buffer fill level."""
+        return {
+            **self._stats,
+            "closed_candles": self._closed,
+            "stale": self.is_stale,
+        }
+
+    def __len__(self) -> int:
+        return self._closed + (1 if self._has_forming else 0)
+
+    def add_close_callback(self, callback: Callable[[int], None]) -> None:
+        """
+        Register a callback for newly closed candles.
+
+        Called with the open time (ms) of the latest closed candle, both for
+        stream updates and for backfills that load newer candles.
+        """
+        if callback not in self._close_callbacks:
+            self._close_callbacks.append(callback)
+
+    def remove_close_callback(self, callback: Callable[[int], None]) -> None:
+        """Unregister a close callback (no-op if not registered)."""
+        if callback in self._close_callbacks:
+            self._close_callbacks.remove(callback)
+
+    def _notify_close(self) -> None:
+        open_time = self.last_closed_time
+        if open_time is None or open_time == self._last_notified_close:
+            return
+        self._last_notified_close = open_time
+        for callback in self._close_callbacks:
+            try:
+                callback(open_time)
+            except Exception as e:
+                main_logger.warning(f"KlineStore close callback error: {e}")
+
+    # ------------------------------------------------------------------
+    # Views
+    # ------------------------------------------------------------------
+
+    def _window(self, include_forming: bool) -> slice:
+        count = self._closed + (1 if include_forming and self._has_forming else 0)
+        start = (self._head - self._closed) % self._size
+        return slice(start, start + count)
+
+    @staticmethod
+    def _readonly(view: np.ndarray) -> np.ndarray:
+        view.flags.writeable = False
+        return view
+
+    def timestamps(self, include_forming: bool = True) -> np.ndarray:
+        """Candle open times in ms (int64 view, oldest first)."""
+        return self._readonly(self._ts[self._window(include_forming)])
+
+    def column(self, name: str, include_forming: bool = True) -> np.ndarray:
+        """
+        Get an OHLCV column as a read-only float64 view (oldest first).
+
+        Views share memory with the store and reflect later updates, so use
+        them right away rather than holding on to them across awaits.
+
+        Args:
+            name: One of open, high, low, close, volume
+            include_forming: Include the candle still in formation as last element
+        """
+        return self._readonly(self._ohlcv[OHLCV_COLUMNS.index(name), self._window(include_forming)])
+
+    def closes(self, include_forming: bool = True) -> np.ndarray:
+        """Close prices (float64 view, oldest first)."""
+        return self.column("close", include_forming)
+
+    def klines(self, include_forming: bool = True) -> Klines:
+        """
+        Klines over the buffer (zero-copy views, same shape as BingXClient.get_klines()).
+
+        Like column(), the views reflect later updates: use right away.
+        """
+        window = self._window(include_forming)
+        return Klines(self._ts[window], *self._ohlcv[:, window])
+
+    def to_frame(self, include_forming: bool = True) -> pd.DataFrame:
+        """Copy the buffer into a DataFrame (same columns as Klines.to_frame())."""
+        window = self._window(include_forming)
+        frame = pd.DataFrame(
+            {name: self._ohlcv[i, window].copy() for i, name in enumerate(OHLCV_COLUMNS)}
+        )
+        frame["timestamp"] = pd.to_datetime(self._ts[window], unit="ms")
+        return frame
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Subscribe to the kline stream, backfill history and register the store."""
+        self._ws.add_connect_callback(self._on_reconnect)
+        await self._ws.subscribe_kline(self.symbol, self.interval, self._on_kline)
+        await self.backfill()
+        _stores[(self.symbol, self.interval)] = self
+        main_logger.info(f"KlineStore started for {self.data_type} ({self._closed} candles)")
+
+    async def stop(self) -> None:
+        """Unsubscribe and unregister the store."""
+        if _stores.get((self.symbol, self.interval)) is self:
+            del _stores[(self.symbol, self.interval)]
+        self._ws.remove_connect_callback(self._on_reconnect)
+
+        if self._backfill_task and not self._backfill_task.done():
+            self._backfill_task.cancel()
+            try:
+                await self._backfill_task
+            except asyncio.CancelledError:
+                pass
+
+        try:
+            await self._ws.unsubscribe(self.data_type)
+        except Exception as e:
+            main_logger.warning(f"KlineStore unsubscribe failed: {e}")
+
+    def for_interval(self, interval: str) -> KlineStore:
+        """
+        New store for another interval on the same client and stream.
+
+        The new store is not started; the caller starts it and stops this one.
+
+        Args:
+            interval: Kline interval of the new store
+        """
+        return KlineStore(
+            self._client,
+            self._ws,
+            self.symbol,
+            interval,
+            capacity=self.capacity,
+            max_age_seconds=self._max_age,
+        )
+
+    async def backfill(self) -> None:
+        """Reload the buffer from REST (used at start, on reconnect and on gaps)."""
+        async with self._backfill_lock:
+            try:
+                klines = await self._client.get_klines(
+                    self.symbol, interval=self.interval, limit=self._size, use_cache=False
+                )
+            except Exception as e:
+                main_logger.warning(f"KlineStore backfill failed for {self.data_type}: {e}")
+                return
+
+            if klines is None or len(klines) == 0:
+                return
+
+            if not isinstance(klines, Klines):
+                klines = Klines.from_frame(klines)
+            self._load(klines.timestamp, [getattr(klines, name) for name in OHLCV_COLUMNS])
+            self._stats["backfills"] += 1
+
+    def _load(self, timestamps: np.ndarray, columns: list[np.ndarray]) -> None:
+        """Replace the buffer contents; the last row is the forming candle."""
+        count = min(len(timestamps), self._size)
+        timestamps = timestamps[-count:]
+
+        # Keep a forming candle received from the stream if it is newer than REST's
+        stream_forming: tuple[int, float, float, float, float, float] | None = None
+        if self._has_forming and self._ts[self._head] > timestamps[-1]:
+            open_, high, low, close, volume = (float(v) for v in self._ohlcv[:, self._head])
+            stream_forming = (int(self._ts[self._head]), open_, high, low, close, volume)
+
+        for target in (self._ts[:count], self._ts[self._size : self._size + count]):
+            target[:] = timestamps
+        for row, values in enumerate(columns):
+            self._ohlcv[row, :count] = values[-count:]
+            self._ohlcv[row, self._size : self._size + count] = values[-count:]
+
+        self._closed = count - 1
+        self._head = count - 1
+        self._has_forming = True
+        self._backfilled = True
+        self._last_update = time.monotonic()
+
+        if stream_forming is not None:
+            self._apply(*stream_forming)
+
+        self._notify_close()
+
+    # ------------------------------------------------------------------
+    # Stream handling
+    # ------------------------------------------------------------------
+
+    def _on_reconnect(self) -> None:
+        """Backfill candles missed while the WebSocket was disconnected."""
+        if self._backfilled:
+            self._schedule_backfill()
+
+    def _schedule_backfill(self) -> None:
+        if self._backfill_task and not self._backfill_task.done():
+            return
+        try:
+            self._backfill_task = asyncio.create_task(self.backfill())
+        except RuntimeError:
+            main_logger.debug("No event loop running, skipping kline backfill")
+
+    def _on_kline(self, data: Any) -> None:
+        """Handle a kline stream message (single dict or list of dicts)."""
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            try:
+                self._apply(
+                    int(item["T"]),
+                    float(item["o"]),
+                    float(item["h"]),
+                    float(item["l"]),
+                    float(item["c"]),
+                    float(item["v"]),
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                main_logger.warning(f"KlineStore: invalid kline message {item!r}: {e}")
+
+    def _write(self, slot: int, values: tuple[int, float, float, float, float, float]) -> None:
+        for position in (slot, slot + self._size):
+            self._ts[position] = values[0]
+            self._ohlcv[:, position] = values[1:]
+
+    def _apply(
+        self, open_time: int, open_: float, high: float, low: float, close: float, volume: float
+    ) -> None:
+        """Update the forming candle or close it when a newer candle starts."""
+        values = (open_time, open_, high, low, close, volume)
+        self._stats["messages"] += 1
+        self._last_update = time.monotonic()
+
+        if not self._has_forming:
+            self._write(self._head, values)
+            self._has_forming = True
+            return
+
+        forming_time = int(self._ts[self._head])
+        if open_time < forming_time:
+            return  # Out-of-order update for an already closed candle
+
+        if open_time > forming_time:
+            # Previous forming candle is now closed
+            self._closed = min(self._closed + 1, self.capacity)
+            self._head = (self._head + 1) % self._size
+            self._stats["candles_closed"] += 1
+
+            if self._interval_ms and open_time - forming_time > self._interval_ms:
+                self._stats["gaps"] += 1
+                main_logger.warning(f"KlineStore: gap detected on {self.data_type}, backfilling")
+                self._schedule_backfill()
+
+            self._write(self._head, values)
+            self._notify_close()
+            return
+
+        self._write(self._head, values)
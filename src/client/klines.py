@@ -0,0 +1,148 @@
+"""Columnar kline container.
+
+``Klines`` holds candles as contiguous NumPy arrays (float64 OHLCV, int64
+open times in milliseconds) so indicators can work on them directly, with a
+lazily built DataFrame for code that still needs pandas.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+# Float columns, in storage order
+OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+
+# Open times outside this range (ms) are treated as invalid
+_MIN_VALID_MS = 0
+_MAX_VALID_MS = 4_102_444_800_000  # 2100-01-01
+
+
+def _readonly(values: np.ndarray) -> np.ndarray:
+    values.flags.writeable = False
+    return values
+
+
+class Klines:
+    """
+    Candles stored column-wise, oldest first.
+
+    Arrays are read-only: instances are cached and shared (e.g. by
+    BingXClient.get_klines and KlineStore views), so consumers must not
+    modify them. The last candle is usually the one still in formation.
+
+    Attributes:
+        timestamp: Candle open times in milliseconds (int64)
+        open, high, low, close, volume: Candle values (float64)
+    """
+
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume", "_frame")
+
+    def __init__(
+        self,
+        timestamp: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ):
+        """
+        Wrap existing arrays (no copy when dtypes already match).
+
+        Args:
+            timestamp: Open times in ms
+            open: Open prices
+            high: High prices
+            low: Low prices
+            close: Close prices
+            volume: Volumes
+        """
+        self.timestamp = _readonly(np.asarray(timestamp, dtype=np.int64))
+        self.open = _readonly(np.asarray(open, dtype=np.float64))
+        self.high = _readonly(np.asarray(high, dtype=np.float64))
+        self.low = _readonly(np.asarray(low, dtype=np.float64))
+        self.close = _readonly(np.asarray(close, dtype=np.float64))
+        self.volume = _readonly(np.asarray(volume, dtype=np.float64))
+        self._frame: pd.DataFrame | None = None
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> Klines:
+        """
+        Build from BingX REST kline dicts (open, high, low, close, volume, time).
+
+        Rows with missing or out-of-range times are dropped.
+
+        Args:
+            records: Kline dicts; values may be strings or numbers
+
+        Returns:
+            Klines instance
+        """
+        rows = list(records)
+        times = np.array([row.get("time", row.get("timestamp")) for row in rows], dtype=np.float64)
+        columns = {
+            name: np.array([row[name] for row in rows], dtype=np.float64) for name in OHLCV_COLUMNS
+        }
+
+        valid = np.isfinite(times) & (times > _MIN_VALID_MS) & (times < _MAX_VALID_MS)
+        if not valid.all():
+            times = times[valid]
+            columns = {name: values[valid] for name, values in columns.items()}
+
+        return cls(times.astype(np.int64), **columns)
+
+    @classmethod
+    def from_frame(cls, frame: pd.DataFrame) -> Klines:
+        """
+        Build from a DataFrame with timestamp and OHLCV columns.
+
+        Args:
+            frame: DataFrame shaped like the legacy get_klines() output;
+                timestamp may be datetime64 or integer milliseconds
+
+        Returns:
+            Klines instance
+        """
+        timestamps = frame["timestamp"].to_numpy()
+        if timestamps.dtype.kind == "M":
+            timestamps = timestamps.astype("datetime64[ms]").astype(np.int64)
+        return cls(
+            timestamps,
+            **{name: frame[name].to_numpy(dtype=np.float64) for name in OHLCV_COLUMNS},
+        )
+
+    def __len__(self) -> int:
+        return len(self.close)
+
+    def __getitem__(self, index: slice) -> Klines:
+        """Slice candles (returns views, not copies)."""
+        if not isinstance(index, slice):
+            raise TypeError("Klines only supports slicing")
+        return Klines(
+            self.timestamp[index],
+            self.open[index],
+            self.high[index],
+            self.low[index],
+            self.close[index],
+            self.volume[index],
+        )
+
+    def __repr__(self) -> str:
+        last = f", last_close={self.close[-1]}" if len(self) else ""
+        return f"<Klines(n={len(self)}{last})>"
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        DataFrame with open, high, low, close, volume and timestamp (datetime) columns.
+
+        Built on first use and cached.
+        """
+        if self._frame is None:
+            frame = pd.DataFrame({name: getattr(self, name) for name in OHLCV_COLUMNS})
+            frame["timestamp"] = pd.to_datetime(self.timestamp, unit="ms")
+            self._frame = frame
+        return self._frame
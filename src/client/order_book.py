@@ -0,0 +1,336 @@
+"""Local mirror of open exchange orders fed by the account WebSocket.
+
+``ExchangeOrderBook`` keeps the open orders of one symbol in memory, updated
+from ``ORDER_TRADE_UPDATE`` events (and from local create/cancel results),
+indexed by order id, type and price. Orders are stored in the same shape as
+``BingXClient.get_open_orders()`` so callers can switch without changes.
+
+REST is only used as a fallback and for reconciliation:
+- while the account WebSocket is not connected, reads go to REST;
+- after a (re)connect, events may have been missed, so the next read takes a
+  REST snapshot (and falls back to a plain REST read if the snapshot fails);
+- a background task re-snapshots every ``reconcile_interval`` seconds, and the
+  book is considered stale if no snapshot succeeded within ``max_age_seconds``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Any
+
+from src.utils.logger import orders_logger
+
+if TYPE_CHECKING:
+    from src.client.bingx_client import BingXClient
+    from src.client.websocket_client import BingXAccountWebSocket
+
+# Order statuses after which an order is no longer open
+CLOSED_STATUSES = frozenset({"FILLED", "CANCELED", "CANCELLED", "EXPIRED", "REJECTED"})
+
+# Order types whose trigger price is stopPrice (price is 0 for market triggers)
+_STOP_TYPES = frozenset({"TAKE_PROFIT_MARKET", "TAKE_PROFIT", "STOP_MARKET", "STOP"})
+
+# ORDER_TRADE_UPDATE field -> REST open order field
+_EVENT_FIELDS = {
+    "s": "symbol",
+    "S": "side",
+    "ps": "positionSide",
+    "o": "type",
+    "p": "price",
+    "sp": "stopPrice",
+    "q": "origQty",
+    "z": "executedQty",
+    "X": "status",
+    "c": "clientOrderId",
+    "T": "updateTime",
+}
+
+
+def _price_key(order: dict[str, Any]) -> float:
+    """Index price: stopPrice for TP/SL orders, price otherwise (rounded to cents)."""
+    try:
+        if order.get("type") in _STOP_TYPES and float(order.get("stopPrice") or 0) > 0:
+            return round(float(order["stopPrice"]), 2)
+        return round(float(order.get("price") or 0), 2)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _remove_id(index: dict[Any, set[str]], key: Any, order_id: str) -> None:
+    ids = index.get(key)
+    if ids is not None:
+        ids.discard(order_id)
+        if not ids:
+            del index[key]
+
+
+class ExchangeOrderBook:
+    """
+    Open orders of one symbol, mirrored from the account WebSocket.
+
+    Example:
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(account_ws)          # resync on every reconnect
+        account_ws.set_order_callback(book.apply_event)
+        book.start()                     # periodic REST reconciliation
+        orders = await book.get_open_orders()
+        tps = book.by_type("TAKE_PROFIT_MARKET")
+    """
+
+    def __init__(
+        self,
+        client: BingXClient,
+        symbol: str,
+        reconcile_interval: float = 60.0,
+        max_age_seconds: float = 180.0,
+    ):
+        """
+        Initialize an empty book.
+
+        Args:
+            client: REST client used for snapshots and fallback reads
+            symbol: Trading pair (e.g., "BTC-USDT")
+            reconcile_interval: Seconds between background REST snapshots
+            max_age_seconds: Book is stale if the last snapshot is older than this
+        """
+        self._client = client
+        self.symbol = symbol
+        self.reconcile_interval = reconcile_interval
+        self._max_age = max_age_seconds
+        self._ws: BingXAccountWebSocket | None = None
+
+        self._orders: dict[str, dict[str, Any]] = {}
+        self._by_type: dict[str, set[str]] = {}
+        self._by_price: dict[float, set[str]] = {}
+
+        self._needs_snapshot = True  # Never synced, or events may have been missed
+        self._last_snapshot = 0.0
+        self._snapshot_lock = asyncio.Lock()
+        self._inflight_events: list[dict[str, Any]] | None = None
+        self._task: asyncio.Task | None = None
+        self._stats = {
+            "events": 0,
+            "snapshots": 0,
+            "snapshot_errors": 0,
+            "book_reads": 0,
+            "rest_reads": 0,
+            "drift": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    @property
+    def is_live(self) -> bool:
+        """True while the account WebSocket is connected (events are flowing)."""
+        return self._ws is not None and self._ws.is_connected
+
+    @property
+    def is_stale(self) -> bool:
+        """True if the book cannot be trusted without a REST snapshot."""
+        if not self.is_live or self._needs_snapshot:
+            return True
+        return time.monotonic() - self._last_snapshot > self._max_age
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Event/snapshot/read counters."""
+        return {
+            **self._stats,
+            "orders": len(self._orders),
+            "live": self.is_live,
+            "stale": self.is_stale,
+            "snapshot_age_seconds": (
+                round(time.monotonic() - self._last_snapshot, 1) if self._last_snapshot else None
+            ),
+        }
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    # ------------------------------------------------------------------
+    # Queries (in-memory, no REST)
+    # ------------------------------------------------------------------
+
+    def orders(self) -> list[dict[str, Any]]:
+        """All open orders (REST get_open_orders shape). Do not modify the dicts."""
+        return list(self._orders.values())
+
+    def get(self, order_id: str | int) -> dict[str, Any] | None:
+        """Open order by id."""
+        return self._orders.get(str(order_id))
+
+    def by_type(self, *order_types: str) -> list[dict[str, Any]]:
+        """Open orders of the given type(s), e.g. "LIMIT" or "TAKE_PROFIT_MARKET"."""
+        return [
+            self._orders[order_id]
+            for order_type in order_types
+            for order_id in self._by_type.get(order_type, ())
+        ]
+
+    def at_price(self, price: float) -> list[dict[str, Any]]:
+        """Open orders at a price (stopPrice for TP/SL orders), matched to the cent."""
+        return [self._orders[order_id] for order_id in self._by_price.get(round(price, 2), ())]
+
+    async def get_open_orders(self) -> list[dict[str, Any]]:
+        """
+        Open orders, from memory when live, otherwise from REST.
+
+        Without a connected account WebSocket this is a plain (cached)
+        client.get_open_orders() call. When connected, a REST snapshot is only
+        taken if the book is stale; if that snapshot fails, the result of a
+        plain REST read is returned instead of the stale book.
+
+        Raises:
+            Exception: If the book cannot be used and the REST read fails
+        """
+        if not self.is_live:
+            self._stats["rest_reads"] += 1
+            self._needs_snapshot = True
+            orders = await self._client.get_open_orders(self.symbol)
+            if isinstance(orders, list):
+                self._replace(orders)
+            return orders
+
+        if self.is_stale:
+            await self.refresh()
+            if self.is_stale:
+                # Snapshot failed: the book may be empty or missed events, so
+                # read REST like the non-live path (errors propagate to callers)
+                self._stats["rest_reads"] += 1
+                return await self._client.get_open_orders(self.symbol)
+        self._stats["book_reads"] += 1
+        return self.orders()
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def apply_event(self, order_data: dict[str, Any]) -> None:
+        """
+        Apply an ORDER_TRADE_UPDATE payload (the "o" object).
+
+        Open statuses (NEW, PARTIALLY_FILLED, ...) upsert the order; closed
+        statuses (FILLED, CANCELED, ...) remove it.
+        """
+        symbol = order_data.get("s")
+        order_id = order_data.get("i")
+        if order_id is None or (symbol and symbol != self.symbol):
+            return
+
+        self._stats["events"] += 1
+        if self._inflight_events is not None:
+            self._inflight_events.append(order_data)
+
+        order_id = str(order_id)
+        if order_data.get("X") in CLOSED_STATUSES:
+            self.discard(order_id)
+            return
+
+        fields = {
+            rest_key: order_data[event_key]
+            for event_key, rest_key in _EVENT_FIELDS.items()
+            if order_data.get(event_key) is not None
+        }
+        existing = self._orders.get(order_id)
+        self.add_order({**(existing or {"orderId": order_id}), **fields})
+
+    def add_order(self, order: dict[str, Any]) -> None:
+        """Insert or replace an open order (e.g. right after a successful create)."""
+        order_id = str(order.get("orderId", ""))
+        if not order_id:
+            return
+        self._unindex(order_id)
+        self._orders[order_id] = order
+        self._by_type.setdefault(str(order.get("type", "")), set()).add(order_id)
+        self._by_price.setdefault(_price_key(order), set()).add(order_id)
+
+    def discard(self, order_id: str | int) -> dict[str, Any] | None:
+        """Remove an order (e.g. right after a successful cancel). Returns it if present."""
+        order_id = str(order_id)
+        self._unindex(order_id)
+        return self._orders.pop(order_id, None)
+
+    def _unindex(self, order_id: str) -> None:
+        order = self._orders.get(order_id)
+        if order is None:
+            return
+        _remove_id(self._by_type, str(order.get("type", "")), order_id)
+        _remove_id(self._by_price, _price_key(order), order_id)
+
+    def _replace(self, orders: list[dict[str, Any]]) -> None:
+        self._orders.clear()
+        self._by_type.clear()
+        self._by_price.clear()
+        for order in orders:
+            self.add_order(order)
+
+    def clear(self, symbol: str | None = None) -> None:
+        """Drop all orders (optionally switching symbol); the next read resyncs."""
+        if symbol is not None:
+            self.symbol = symbol
+        self._replace([])
+        self._needs_snapshot = True
+
+    async def refresh(self) -> None:
+        """Replace the book with a fresh REST snapshot (events received meanwhile are kept)."""
+        async with self._snapshot_lock:
+            self._inflight_events = []
+            try:
+                orders = await self._client.get_open_orders(self.symbol, use_cache=False)
+            except Exception as e:
+                self._stats["snapshot_errors"] += 1
+                orders_logger.warning(f"Order book snapshot failed: {e}")
+                return
+            finally:
+                inflight, self._inflight_events = self._inflight_events, None
+
+            before = set(self._orders)
+            self._replace(orders)
+            for event in inflight:
+                self.apply_event(event)
+
+            drift = len(before.symmetric_difference(self._orders))
+            if drift and not self._needs_snapshot:
+                self._stats["drift"] += drift
+                orders_logger.warning(f"Order book drift corrected: {drift} order(s)")
+
+            self._needs_snapshot = False
+            self._last_snapshot = time.monotonic()
+            self._stats["snapshots"] += 1
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def attach(self, ws: BingXAccountWebSocket) -> None:
+        """Use an account WebSocket as event source; every (re)connect forces a resync."""
+        self._ws = ws
+        self._needs_snapshot = True
+        ws.add_connect_callback(self._on_reconnect)
+
+    def _on_reconnect(self) -> None:
+        self._needs_snapshot = True
+
+    def start(self) -> None:
+        """Start periodic REST reconciliation (requires a running event loop)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._reconcile_loop())
+
+    async def stop(self) -> None:
+        """Stop periodic reconciliation."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _reconcile_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.reconcile_interval)
+            if self.is_live:
+                await self.refresh()
@@ -0,0 +1,247 @@
+"""Rate-limit-aware request scheduling for the BingX REST API.
+
+BingX limits requests per endpoint group (market data per IP, account and
+order endpoints per UID). ``RateLimiter`` keeps one ``TokenBucket`` per group
+so bursts (e.g. a grid rebuild) are paced just under the limit instead of
+hitting it, and bounds how many order create/cancel requests are in flight.
+
+When a request is rate limited anyway (HTTP 429 or a frequency-limit error
+code), the group's rate is halved and it pauses for the server-provided (or
+default) cool-down; the rate then recovers gradually while requests succeed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any
+
+# BingX error codes returned for request frequency limits
+RATE_LIMIT_CODES = frozenset({100410, 109400})
+
+# Error message fragments returned with rate-limited responses
+RATE_LIMIT_MESSAGES = ("over 20 error", "rate limit", "frequency limit", "too many requests")
+
+
+class RateLimitError(Exception):
+    """Request rejected by BingX for exceeding a rate limit."""
+
+    def __init__(self, message: str, group: str, retry_after: float):
+        super().__init__(message)
+        self.group = group
+        self.retry_after = retry_after
+
+
+def is_rate_limit_error(code: Any, message: str) -> bool:
+    """Check whether an API error code/message means the request was rate limited."""
+    if code in RATE_LIMIT_CODES:
+        return True
+    message = message.lower()
+    return any(fragment in message for fragment in RATE_LIMIT_MESSAGES)
+
+
+@dataclass(frozen=True)
+class BucketLimit:
+    """Rate limit of one endpoint group."""
+
+    rate: float  # Requests per second
+    burst: int  # Bucket capacity
+    max_concurrency: int | None = None  # Max requests in flight (None = unbounded)
+
+
+# Endpoint group limits, kept slightly under the published BingX limits
+DEFAULT_LIMITS: dict[str, BucketLimit] = {
+    "market": BucketLimit(rate=9.0, burst=10),  # 100 req / 10s per IP
+    "account": BucketLimit(rate=9.0, burst=10),  # queries: positions, balance, open orders
+    "order": BucketLimit(rate=9.0, burst=10, max_concurrency=5),  # create/cancel/modify
+}
+
+
+def endpoint_group(method: str, endpoint: str) -> str:
+    """
+    Map a request to its rate-limit group.
+
+    Args:
+        method: HTTP method
+        endpoint: API endpoint path
+
+    Returns:
+        "market" for public quote endpoints, "order" for order mutations,
+        "account" for everything else
+    """
+    if "/quote/" in endpoint:
+        return "market"
+    if "/trade/" in endpoint and method.upper() != "GET":
+        return "order"
+    return "account"
+
+
+class TokenBucket:
+    """
+    Async token bucket with adaptive rate.
+
+    Example:
+        bucket = TokenBucket(rate=10, burst=10)
+        await bucket.acquire()       # waits if the bucket is empty
+        bucket.penalize(1.0)         # got a 429: halve rate, pause 1s
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        min_rate_fraction: float = 0.1,
+        recovery_seconds: float = 10.0,
+    ):
+        """
+        Initialize a full bucket.
+
+        Args:
+            rate: Nominal refill rate (tokens per second)
+            burst: Bucket capacity
+            min_rate_fraction: Lowest rate after penalties, as a fraction of rate
+            recovery_seconds: Quiet time after a penalty before the rate recovers
+        """
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self._min_rate = rate * min_rate_fraction
+        self._recovery_seconds = recovery_seconds
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._last_penalty = 0.0
+        self._lock = asyncio.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """
+        Take one token, waiting until one is available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:  # FIFO: waiters are served in arrival order
+            while True:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self._refill(now)
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return waited
+                    delay = (1 - self._tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def penalize(self, retry_after: float) -> None:
+        """Halve the rate, drain the bucket and pause for retry_after seconds."""
+        now = time.monotonic()
+        self.rate = max(self._min_rate, self.rate / 2)
+        self._tokens = 0.0
+        self._updated = now
+        self._blocked_until = max(self._blocked_until, now + retry_after)
+        self._last_penalty = now
+
+    def record_success(self) -> None:
+        """Step the rate back towards nominal once penalties have stopped."""
+        if self.rate < self.base_rate:
+            now = time.monotonic()
+            if now - self._last_penalty >= self._recovery_seconds:
+                self.rate = min(self.base_rate, self.rate * 1.25)
+                self._last_penalty = now  # Next step after another quiet period
+
+
+class RateLimiter:
+    """
+    Token buckets and concurrency limits per endpoint group.
+
+    Example:
+        limiter = RateLimiter()
+        async with limiter.slot("order"):
+            response = await http.post(...)
+    """
+
+    def __init__(self, limits: dict[str, BucketLimit] | None = None, retry_after: float = 1.0):
+        """
+        Initialize buckets for each group.
+
+        Args:
+            limits: Limits per group (defaults to DEFAULT_LIMITS)
+            retry_after: Cool-down when a rate-limited response has no Retry-After
+        """
+        self.limits = limits or DEFAULT_LIMITS
+        self.default_retry_after = retry_after
+        self._buckets = {
+            group: TokenBucket(limit.rate, limit.burst) for group, limit in self.limits.items()
+        }
+        self._semaphores = {
+            group: asyncio.Semaphore(limit.max_concurrency)
+            for group, limit in self.limits.items()
+            if limit.max_concurrency
+        }
+        self._stats: dict[str, dict[str, float]] = {
+            group: {"requests": 0, "waited_seconds": 0.0, "rate_limited": 0}
+            for group in self.limits
+        }
+
+    @asynccontextmanager
+    async def slot(self, group: str) -> AsyncIterator[None]:
+        """Hold a concurrency slot and one token of the group for the request."""
+        semaphore = self._semaphores.get(group)
+        if semaphore is not None:
+            async with semaphore:
+                await self._take(group)
+                yield
+        else:
+            await self._take(group)
+            yield
+
+    async def _take(self, group: str) -> None:
+        bucket = self._buckets.get(group)
+        if bucket is None:
+            return
+        waited = await bucket.acquire()
+        stats = self._stats[group]
+        stats["requests"] += 1
+        stats["waited_seconds"] += waited
+
+    def record_success(self, group: str) -> None:
+        """Report a successful response (lets a penalized rate recover)."""
+        bucket = self._buckets.get(group)
+        if bucket is not None:
+            bucket.record_success()
+
+    def record_rate_limited(self, group: str, retry_after: float | None = None) -> float:
+        """
+        Report a rate-limited response and slow the group down.
+
+        Returns:
+            Cool-down applied, in seconds
+        """
+        retry_after = retry_after if retry_after is not None else self.default_retry_after
+        bucket = self._buckets.get(group)
+        if bucket is not None:
+            bucket.penalize(retry_after)
+            self._stats[group]["rate_limited"] += 1
+        return retry_after
+
+    @property
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-group request/wait/rate-limit counters and current rate."""
+        return {
+            group: {
+                **self._stats[group],
+                "waited_seconds": round(self._stats[group]["waited_seconds"], 3),
+                "rate": round(self._buckets[group].rate, 2),
+            }
+            for group in self.limits
+        }
@@ -0,0 +1,199 @@
+"""Response cache for BingX REST reads.
+
+Several components read the same exchange state at nearly the same time
+(GridManager sync, DynamicTPManager, reconciliation, the /market routes).
+``RequestCache`` lets concurrent misses for one key share a single in-flight
+request (single-flight), can serve a slightly stale value while one background
+refresh runs (stale-while-revalidate), and bounds its size with LRU eviction.
+
+Keys look like ``"<kind>:<params>"`` (e.g. ``"open_orders:BTC-USDT"``); the
+cache policy is looked up by the full key first, then by its kind. Hit/miss
+counters are kept per kind, so they stay bounded however many symbols,
+intervals or limits are requested.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import partial
+from typing import Any
+
+from src.utils.logger import error_logger
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long values of one kind stay usable."""
+
+    ttl: float  # Seconds a value is fresh
+    stale: float = 0.0  # Extra seconds it may be served while a refresh runs
+
+
+# Order and position state is never served stale: grid decisions depend on it
+DEFAULT_POLICIES: dict[str, CachePolicy] = {
+    "klines": CachePolicy(ttl=60),  # Changes only on a new candle
+    "balance": CachePolicy(ttl=30, stale=15),
+    "positions": CachePolicy(ttl=15),
+    "open_orders": CachePolicy(ttl=15),
+    "funding_rate": CachePolicy(ttl=300, stale=300),  # Changes rarely
+    "ticker_24h": CachePolicy(ttl=30, stale=30),
+    "position_mode": CachePolicy(ttl=3600),  # Position mode changes are rare
+}
+
+
+@dataclass
+class CacheStats:
+    """Counters for one key kind."""
+
+    hits: int = 0  # Served fresh from the cache
+    stale: int = 0  # Served stale while a refresh ran
+    misses: int = 0  # Started a request
+    coalesced: int = 0  # Waited on another caller's in-flight request
+
+
+class RequestCache:
+    """TTL cache with single-flight loading, stale-while-revalidate and LRU bound.
+
+    Args:
+        policies: Cache policy per key kind (defaults to DEFAULT_POLICIES).
+        max_entries: Maximum number of cached values.
+        default_ttl: TTL for keys without a policy.
+    """
+
+    def __init__(
+        self,
+        policies: dict[str, CachePolicy] | None = None,
+        max_entries: int = 256,
+        default_ttl: float = 10.0,
+    ):
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self.stats: defaultdict[str, CacheStats] = defaultdict(CacheStats)  # Per kind
+
+    def policy(self, key: str) -> CachePolicy:
+        """Cache policy for a key (exact key, then its kind)."""
+        policy = self.policies.get(key) or self.policies.get(key.split(":", 1)[0])
+        return policy or CachePolicy(ttl=self.default_ttl)
+
+    def get(self, key: str) -> Any | None:
+        """Fresh cached value, or None."""
+        entry = self._entries.get(key)
+        if entry is None or time.monotonic() - entry[0] >= self.policy(key).ttl:
+            return None
+        return entry[1]
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def update(self, key: str, change: Callable[[Any], Any]) -> bool:
+        """Apply a local change to a cached value (write-through after a mutation).
+
+        The entry keeps its timestamp, so the TTL still bounds drift from
+        changes made elsewhere. A load already in flight predates the change
+        and is no longer cached or shared.
+
+        Args:
+            key: Cache key.
+            change: Returns the new value from the current one (must not mutate it:
+                callers may still hold the old value).
+
+        Returns:
+            True if a cached value was updated.
+        """
+        self._inflight.pop(key, None)
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        self._entries[key] = (entry[0], change(entry[1]))
+        return True
+
+    def invalidate(self, *prefixes: str) -> None:
+        """Drop entries (and pending loads) whose key starts with any prefix.
+
+        A request already in flight for a dropped key still completes for its
+        callers, but its result is not cached and later callers start anew.
+        """
+        for store in (self._entries, self._inflight):
+            for key in [k for k in store if k.startswith(prefixes)]:
+                del store[key]
+
+    async def fetch(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        use_cache: bool = True,
+    ) -> Any:
+        """Return the value for key, loading it at most once concurrently.
+
+        Args:
+            key: Cache key.
+            loader: Coroutine factory that requests the value.
+            use_cache: If False, always start a fresh request (result is still cached).
+
+        Returns:
+            Cached or freshly loaded value.
+        """
+        stats = self.stats[key.split(":", 1)[0]]
+        if use_cache:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry[0]
+                policy = self.policy(key)
+                if age < policy.ttl + policy.stale:
+                    self._entries.move_to_end(key)
+                    if age < policy.ttl:
+                        stats.hits += 1
+                    else:
+                        stats.stale += 1
+                        if key not in self._inflight:
+                            self._start(key, loader, background=True)
+                    return entry[1]
+
+            task = self._inflight.get(key)
+            if task is not None:
+                stats.coalesced += 1
+                # Shield so one caller's cancellation doesn't cancel the shared request
+                return await asyncio.shield(task)
+
+        stats.misses += 1
+        return await asyncio.shield(self._start(key, loader))
+
+    def _start(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        background: bool = False,
+    ) -> asyncio.Task[Any]:
+        async def load() -> Any:
+            value = await loader()
+            # Skip caching if the key was invalidated (or reloaded) meanwhile
+            if self._inflight.get(key) is task:
+                self.set(key, value)
+            return value
+
+        task = asyncio.create_task(load())
+        self._inflight[key] = task
+        task.add_done_callback(partial(self._finish, key, background))
+        return task
+
+    def _finish(self, key: str, background: bool, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # A background refresh has no awaiting caller: report its failure here
+        if background and not task.cancelled() and task.exception() is not None:
+            error_logger.warning(f"Background refresh of {key} failed: {task.exception()}")
+
+    def snapshot(self) -> dict[str, dict[str, int]]:
+        """Hit/stale/miss/coalesced counters per key kind (e.g. "klines")."""
+        return {key: vars(stats).copy() for key, stats in self.stats.items()}
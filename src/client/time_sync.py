@@ -0,0 +1,156 @@
+"""BingX server clock synchronization.
+
+BingX rejects signed requests whose timestamp is too far from its own clock
+("timestamp is invalid"). ``ServerClock`` samples the exchange's server time,
+estimates the local clock offset NTP-style (server time minus the midpoint of
+the request) and smooths it, so signed timestamps follow the server clock
+instead of the local one.
+
+One clock is shared by every ``BingXClient`` in the process (``server_clock``):
+the offset belongs to the host clock, not to a client. The bot keeps it fresh
+with a background resync loop.
+"""
+
+import asyncio
+import os
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from src.utils.logger import error_logger, main_logger
+
+# Returns the exchange's server time in milliseconds
+ServerTimeFetcher = Callable[[], Awaitable[int]]
+
+
+class ServerClock:
+    """Smoothed estimate of the offset between the local and server clocks.
+
+    Args:
+        alpha: EWMA weight of a new measurement (1.0 = no smoothing).
+        samples: Requests per sync; the one with the lowest round trip wins,
+            since its midpoint is the most precise.
+        max_rtt_ms: Samples with a slower round trip are discarded.
+    """
+
+    def __init__(self, alpha: float = 0.3, samples: int = 3, max_rtt_ms: float = 2000.0):
+        self.alpha = alpha
+        self.samples = samples
+        self.max_rtt_ms = max_rtt_ms
+        self.offset_ms = 0.0  # Server time minus local time
+        self.rtt_ms: float | None = None
+        self.synced_at: float | None = None  # Local epoch seconds of the last sync
+        self.syncs = 0
+        self.failures = 0
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether at least one sync succeeded."""
+        return self.synced_at is not None
+
+    def now_ms(self) -> int:
+        """Current server time estimate, for signed request timestamps."""
+        return int(time.time() * 1000 + self.offset_ms)
+
+    def add_sample(
+        self, sent_ms: float, server_ms: float, received_ms: float, smooth: bool = True
+    ) -> bool:
+        """Fold one measurement into the offset and RTT estimates.
+
+        Args:
+            sent_ms: Local time the request was sent.
+            server_ms: Server time in the response.
+            received_ms: Local time the response arrived.
+            smooth: Blend into the EWMA; False adopts the measurement as is.
+
+        Returns:
+            False if the sample was discarded (slow round trip).
+        """
+        rtt = received_ms - sent_ms
+        if rtt < 0 or rtt > self.max_rtt_ms:
+            return False
+
+        offset = server_ms - (sent_ms + received_ms) / 2
+        if self.rtt_ms is None or not smooth:
+            self.offset_ms, self.rtt_ms = offset, rtt
+        else:
+            self.offset_ms += self.alpha * (offset - self.offset_ms)
+            self.rtt_ms += self.alpha * (rtt - self.rtt_ms)
+        self.synced_at = time.time()
+        self.syncs += 1
+        return True
+
+    async def sync(self, fetch_server_time: ServerTimeFetcher, smooth: bool = True) -> bool:
+        """Sample the server time and update the offset.
+
+        Args:
+            fetch_server_time: Returns the server time in milliseconds.
+            smooth: Blend into the EWMA (periodic syncs). Pass False after the
+                exchange rejected a timestamp: the clock may have stepped, and
+                a smoothed offset would only move part of the way.
+
+        Returns:
+            True if a usable sample was taken.
+        """
+        best: tuple[float, float, float] | None = None
+        for _ in range(self.samples):
+            try:
+                sent = time.time() * 1000
+                server = await fetch_server_time()
+                received = time.time() * 1000
+            except Exception as e:
+                error_logger.warning(f"Falha ao consultar horário do servidor BingX: {e}")
+                continue
+            if best is None or received - sent < best[2] - best[0]:
+                best = (sent, float(server), received)
+
+        if best is None or not self.add_sample(*best, smooth=smooth):
+            self.failures += 1
+            return False
+        return True
+
+    def start(self, fetch_server_time: ServerTimeFetcher, interval: float | None = None) -> None:
+        """Start resyncing every interval seconds (default: BINGX_TIME_SYNC_INTERVAL)."""
+        if self._task is not None and not self._task.done():
+            return
+        if interval is None:
+            interval = float(os.getenv("BINGX_TIME_SYNC_INTERVAL", "300"))
+        self._task = asyncio.create_task(self._sync_loop(fetch_server_time, interval))
+
+    async def stop(self) -> None:
+        """Stop the resync loop."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _sync_loop(self, fetch_server_time: ServerTimeFetcher, interval: float) -> None:
+        while True:
+            if await self.sync(fetch_server_time) and self.syncs == 1:
+                main_logger.info(
+                    f"Relógio sincronizado com BingX: offset {self.offset_ms:+.0f}ms, "
+                    f"RTT {self.rtt_ms:.0f}ms"
+                )
+            await asyncio.sleep(interval)
+
+    def stats(self) -> dict[str, Any]:
+        """Offset, RTT and sync counters."""
+        return {
+            "synced": self.is_synced,
+            "offset_ms": round(self.offset_ms, 1),
+            "rtt_ms": round(self.rtt_ms, 1) if self.rtt_ms is not None else None,
+            "last_sync_age_s": (
+                round(time.time() - self.synced_at, 1) if self.synced_at is not None else None
+            ),
+            "syncs": self.syncs,
+            "failures": self.failures,
+        }
+
+
+# Shared by every BingXClient in the process
+server_clock = ServerClock()
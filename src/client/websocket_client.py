@@ -13,6 +13,20 @@ from websockets.protocol import State
 
 from config import BingXConfig
 from src.utils.logger import main_logger, orders_logger
+from src.utils.metrics import metrics
+
+# stream label: "market" (BingXWebSocket) or "account" (BingXAccountWebSocket)
+MESSAGES = metrics.counter(
+    "websocket_messages_total", "Frames received from BingX WebSockets", ("stream",)
+)
+CONNECTIONS = metrics.counter(
+    "websocket_connections_total", "Successful BingX WebSocket connects", ("stream",)
+)
+RECONNECTS = metrics.counter(
+    "websocket_reconnects_total",
+    "BingX WebSocket reconnect attempts after a drop or failed connect",
+    ("stream",),
+)
 
 
 class BingXWebSocket:
@@ -29,8 +43,29 @@ class BingXWebSocket:
         self._ws: Any = None
         self._running = False
         self._subscriptions: dict[str, Callable[[dict[str, Any]], None]] = {}
+        self._connect_callbacks: list[Callable[[], None]] = []
         self._reconnect_delay: float = 1.0
         self._max_reconnect_delay: float = 60.0
+        self._messages = MESSAGES.labels("market")
+        self._connections = CONNECTIONS.labels("market")
+        self._reconnects = RECONNECTS.labels("market")
+
+    def add_connect_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after every (re)connect.
+
+        Called once all channels have been resubscribed, so consumers can
+        backfill data missed while disconnected.
+
+        Args:
+            callback: Function called with no arguments
+        """
+        self._connect_callbacks.append(callback)
+
+    def remove_connect_callback(self, callback: Callable[[], None]) -> None:
+        """Unregister a connect callback (no-op if not registered)."""
+        if callback in self._connect_callbacks:
+            self._connect_callbacks.remove(callback)
 
     async def connect(self) -> None:
         """Connect to WebSocket server."""
@@ -49,11 +84,18 @@ class BingXWebSocket:
                 ) as ws:
                     self._ws = ws
                     self._reconnect_delay = 1.0
+                    self._connections.inc()
                     main_logger.info("WebSocket conectado")
 
                     # Resubscribe to all channels
                     await self._resubscribe()
 
+                    for callback in self._connect_callbacks:
+                        try:
+                            callback()
+                        except Exception as e:
+                            main_logger.error(f"Connect callback error: {e}")
+
                     # Process messages
                     await self._message_loop()
 
@@ -63,6 +105,7 @@ class BingXWebSocket:
                 main_logger.error(f"Erro WebSocket: {e}")
 
             if self._running:
+                self._reconnects.inc()
                 main_logger.info(f"Reconectando em {self._reconnect_delay}s...")
                 await asyncio.sleep(self._reconnect_delay)
                 self._reconnect_delay = min(
@@ -74,6 +117,7 @@ class BingXWebSocket:
         """Process incoming messages."""
         assert self._ws is not None
         async for message in self._ws:
+            self._messages.inc()
             try:
                 # BingX sends GZIP compressed data
                 if isinstance(message, bytes):
@@ -234,24 +278,41 @@ class BingXAccountWebSocket:
     - Position changes
     """
 
-    def __init__(self, listen_key: str):
+    def __init__(self, listen_key: str, base_url: str = "wss://open-api-ws.bingx.com/market"):
         self._listen_key = listen_key
+        self._base_url = base_url
         self._ws: Any = None
         self._running = False
         self._reconnect_delay: float = 1.0
         self._max_reconnect_delay: float = 60.0
         self._listen_key_expired = False
         self._renewal_in_progress = False  # Prevent duplicate renewal calls
+        self._messages = MESSAGES.labels("account")
+        self._connections = CONNECTIONS.labels("account")
+        self._reconnects = RECONNECTS.labels("account")
 
         # Callbacks
         self._on_order_update: Callable[[dict[str, Any]], None] | None = None
         self._on_position_update: Callable[[dict[str, Any]], None] | None = None
         self._on_account_update: Callable[[dict[str, Any]], None] | None = None
         self._on_listen_key_expired: Callable[[], None] | None = None
+        self._connect_callbacks: list[Callable[[], None]] = []
 
     @property
     def ws_url(self) -> str:
-        return f"wss://open-api-ws.bingx.com/market?listenKey={self._listen_key}"
+        return f"{self._base_url}?listenKey={self._listen_key}"
+
+    def add_connect_callback(self, callback: Callable[[], None]) -> None:
+        """
+        Register a callback invoked after every (re)connect.
+
+        Events sent while disconnected are lost, so consumers mirroring
+        account state should resync from REST when called.
+
+        Args:
+            callback: Function called with no arguments
+        """
+        self._connect_callbacks.append(callback)
 
     def update_listen_key(self, new_key: str) -> None:
         """Update listenKey for reconnection."""
@@ -294,8 +355,15 @@ class BingXAccountWebSocket:
                 ) as ws:
                     self._ws = ws
                     self._reconnect_delay = 1.0
+                    self._connections.inc()
                     main_logger.info("Account WebSocket conectado")
 
+                    for callback in self._connect_callbacks:
+                        try:
+                            callback()
+                        except Exception as e:
+                            main_logger.error(f"Connect callback error: {e}")
+
                     # Process messages
                     await self._message_loop()
 
@@ -317,6 +385,7 @@ class BingXAccountWebSocket:
                 main_logger.error(f"Erro Account WebSocket: {e}")
 
             if self._running:
+                self._reconnects.inc()
                 # Short delay for normal reconnects, don't log excessively
                 await asyncio.sleep(min(2, self._reconnect_delay))
                 self._reconnect_delay = min(
@@ -328,6 +397,7 @@ class BingXAccountWebSocket:
         """Process incoming messages."""
         assert self._ws is not None
         async for message in self._ws:
+            self._messages.inc()
             try:
                 # BingX sends GZIP compressed data
                 if isinstance(message, bytes):
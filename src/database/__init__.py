@@ -1,6 +1,19 @@
 """Database module for BTC Grid Bot."""
 
 from src.database.base import Base
-from src.database.engine import get_engine, get_session
+from src.database.engine import (
+    dispose_engine,
+    get_engine,
+    get_pool_stats,
+    get_session,
+    init_engine,
+)
 
-__all__ = ["Base", "get_engine", "get_session"]
+__all__ = [
+    "Base",
+    "dispose_engine",
+    "get_engine",
+    "get_pool_stats",
+    "get_session",
+    "init_engine",
+]
@@ -1,9 +1,103 @@
-"""Database engine and session configuration."""
+"""Database engine and session configuration.
+
+A single async engine (and connection pool) is shared by the whole process.
+It is created lazily on first use or explicitly via ``init_engine()`` at
+startup, and released with ``dispose_engine()`` on shutdown.
+"""
 
 import os
+import time
 from collections.abc import AsyncGenerator
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from src.utils.logger import main_logger
+from src.utils.metrics import metrics
+
+# Process-wide engine and session factory (see init_engine/dispose_engine)
+_engine: AsyncEngine | None = None
+_session_maker: async_sessionmaker[AsyncSession] | None = None
+
+
+@dataclass
+class PoolConfig:
+    """Connection pool settings for the shared engine."""
+
+    pool_size: int = 5  # Connections kept open in the pool
+    max_overflow: int = 10  # Extra connections allowed under burst load
+    pool_recycle: int = 1800  # Recycle connections older than N seconds
+    pool_timeout: float = 30.0  # Seconds to wait for a free connection
+
+
+@dataclass
+class PoolMetrics:
+    """Counters for connection checkouts from the shared pool."""
+
+    checkouts: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        """Record time spent waiting for a connection."""
+        self.checkouts += 1
+        self.total_wait_seconds += seconds
+        if seconds > self.max_wait_seconds:
+            self.max_wait_seconds = seconds
+
+    def reset(self) -> None:
+        """Reset all counters."""
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+
+_pool_metrics = PoolMetrics()
+
+ACQUIRE_SECONDS = metrics.histogram(
+    "db_connection_acquire_seconds", "Wait for a connection from the shared pool"
+)
+QUERY_SECONDS = metrics.histogram(
+    "db_query_duration_seconds", "SQL statement execution time", ("operation",)
+)
+_QUERY_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+class _TimedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """Queue pool that records how long each checkout waited for a connection."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            waited = time.perf_counter() - start
+            _pool_metrics.record_wait(waited)
+            ACQUIRE_SECONDS.observe(waited)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Statements on one connection run one at a time (a failed one simply
+    # leaves a start time that the next statement overwrites)
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    if started is None:
+        return
+    operation = statement.lstrip()[:6].upper()
+    if operation not in _QUERY_OPERATIONS:
+        operation = "OTHER"
+    QUERY_SECONDS.labels(operation).observe(time.perf_counter() - started)
 
 
 def get_database_url() -> str:
@@ -21,39 +115,126 @@ def get_database_url() -> str:
     return url
 
 
-def get_engine(echo: bool = False):
-    """Create async database engine.
+def get_pool_config() -> PoolConfig:
+    """Get connection pool settings from environment.
+
+    Reads DB_POOL_SIZE, DB_MAX_OVERFLOW, DB_POOL_RECYCLE and DB_POOL_TIMEOUT,
+    falling back to PoolConfig defaults.
+    """
+    return PoolConfig(
+        pool_size=int(os.getenv("DB_POOL_SIZE", "5")),
+        max_overflow=int(os.getenv("DB_MAX_OVERFLOW", "10")),
+        pool_recycle=int(os.getenv("DB_POOL_RECYCLE", "1800")),
+        pool_timeout=float(os.getenv("DB_POOL_TIMEOUT", "30")),
+    )
+
+
+def create_engine(echo: bool = False, pool_config: PoolConfig | None = None) -> AsyncEngine:
+    """Create a new async database engine.
+
+    Most code should use get_engine() instead, which returns the shared
+    process-wide engine. This is exposed for tools that need an isolated
+    engine of their own.
 
     Args:
         echo: If True, log all SQL statements (useful for debugging).
+        pool_config: Pool settings. Defaults to get_pool_config().
 
     Returns:
         AsyncEngine instance.
     """
-    return create_async_engine(
-        get_database_url(),
-        echo=echo,
-        pool_pre_ping=True,
-    )
+    url = get_database_url()
+    kwargs: dict[str, Any] = {"echo": echo, "pool_pre_ping": True}
+
+    # SQLite (tests) manages its own pooling; only tune pools for server databases
+    if not url.startswith("sqlite"):
+        pool_config = pool_config or get_pool_config()
+        kwargs.update(
+            poolclass=_TimedAsyncQueuePool,
+            pool_size=pool_config.pool_size,
+            max_overflow=pool_config.max_overflow,
+            pool_recycle=pool_config.pool_recycle,
+            pool_timeout=pool_config.pool_timeout,
+        )
+
+    engine = create_async_engine(url, **kwargs)
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    return engine
+
 
+def init_engine(echo: bool = False) -> AsyncEngine:
+    """Create the shared engine and session factory (startup hook).
 
-def get_session_maker(engine=None) -> async_sessionmaker[AsyncSession]:
-    """Create async session maker.
+    Safe to call more than once; subsequent calls return the existing engine.
 
     Args:
-        engine: Optional engine instance. If not provided, creates a new one.
+        echo: If True, log all SQL statements (only applies on first call).
+
+    Returns:
+        The shared AsyncEngine instance.
+    """
+    global _engine, _session_maker
+
+    if _engine is None:
+        _engine = create_engine(echo=echo)
+        _session_maker = async_sessionmaker(
+            _engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
+        main_logger.info("Database engine initialized")
+
+    return _engine
+
+
+async def dispose_engine() -> None:
+    """Close all pooled connections and drop the shared engine (shutdown hook)."""
+    global _engine, _session_maker
+
+    if _engine is None:
+        return
+
+    engine = _engine
+    _engine = None
+    _session_maker = None
+    _pool_metrics.reset()
+    await engine.dispose()
+    main_logger.info("Database engine disposed")
+
+
+def get_engine(echo: bool = False) -> AsyncEngine:
+    """Get the shared async database engine, creating it if needed.
+
+    Args:
+        echo: If True, log all SQL statements (only applies on first call).
+
+    Returns:
+        AsyncEngine instance.
+    """
+    return init_engine(echo=echo)
+
+
+def get_session_maker(engine: AsyncEngine | None = None) -> async_sessionmaker[AsyncSession]:
+    """Get async session maker.
+
+    Args:
+        engine: Optional engine instance. If not provided, returns the shared
+            session maker bound to the process-wide engine.
 
     Returns:
         Async session maker.
     """
-    if engine is None:
-        engine = get_engine()
+    if engine is not None:
+        return async_sessionmaker(
+            engine,
+            class_=AsyncSession,
+            expire_on_commit=False,
+        )
 
-    return async_sessionmaker(
-        engine,
-        class_=AsyncSession,
-        expire_on_commit=False,
-    )
+    init_engine()
+    assert _session_maker is not None
+    return _session_maker
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
@@ -69,3 +250,37 @@ async def get_session() -> AsyncGenerator[AsyncSession, None]:
     session_maker = get_session_maker()
     async with session_maker() as session:
         yield session
+
+
+def get_pool_stats() -> dict[str, Any]:
+    """Get connection pool metrics for the shared engine.
+
+    Returns:
+        Dict with pool size, checked-in/checked-out connections, overflow
+        and checkout wait times. Only ``initialized`` is set when the engine
+        has not been created yet.
+    """
+    if _engine is None:
+        return {"initialized": False}
+
+    pool = _engine.pool
+    stats: dict[str, Any] = {"initialized": True, "pool_class": type(pool).__name__}
+
+    if isinstance(pool, AsyncAdaptedQueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(0, pool.overflow()),
+            max_overflow=pool._max_overflow,
+        )
+
+    checkouts = _pool_metrics.checkouts
+    stats.update(
+        checkouts=checkouts,
+        avg_wait_ms=round(_pool_metrics.total_wait_seconds / checkouts * 1000, 3)
+        if checkouts
+        else 0.0,
+        max_wait_ms=round(_pool_metrics.max_wait_seconds * 1000, 3),
+    )
+    return stats
@@ -25,7 +25,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from src.database.engine import get_engine, get_session_maker
+from src.database.engine import create_engine, get_session_maker
 from src.database.models.account import Account
 from src.database.models.grid_config import GridConfig
 from src.database.models.macd_filter_config import MACDFilterConfig
@@ -221,7 +221,7 @@ async def run_migration(dry_run: bool = True, verbose: bool = False) -> Migratio
     Returns:
         MigrationSummary with results
     """
-    engine = get_engine()
+    engine = create_engine()
     session_maker = get_session_maker(engine)
     results: list[MigrationResult] = []
     migrated = 0
@@ -3,6 +3,7 @@
 from src.database.models.account import Account
 from src.database.models.activity_event import ActivityEvent, EventType
 from src.database.models.bot_state import BotState
+from src.database.models.daily_pnl import DailyPnl
 from src.database.models.ema_filter_config import EMAFilterConfig
 from src.database.models.grid_config import GridConfig
 from src.database.models.macd_filter_config import MACDFilterConfig
@@ -16,6 +17,7 @@ __all__ = [
     "Account",
     "ActivityEvent",
     "BotState",
+    "DailyPnl",
     "EMAFilterConfig",
     "EventType",
     "GridConfig",
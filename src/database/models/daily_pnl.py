@@ -0,0 +1,62 @@
+"""Daily P&L rollup model."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from uuid import UUID
+
+from sqlalchemy import Date, DateTime, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.database.base import Base
+
+
+class DailyPnl(Base):
+    """Realized P&L per account, symbol and close date (UTC).
+
+    Maintained by TradeRepository in the same transaction that closes a
+    trade, so day-level analytics (e.g. the equity curve) read one row per
+    day instead of every trade. Can be rebuilt from the trades table with
+    DailyPnlRepository.rebuild().
+
+    Attributes:
+        account_id: Account the trades belong to.
+        symbol: Trading symbol.
+        date: UTC date the trades were closed.
+        realized_pnl: Sum of closed trades' P&L.
+        fees: Sum of closed trades' trading and funding fees.
+        trade_count: Number of closed trades.
+        wins: Closed trades with positive P&L.
+        losses: Closed trades with negative P&L.
+        updated_at: Timestamp of last update.
+    """
+
+    __tablename__ = "daily_pnl"
+
+    # Composite primary key
+    account_id: Mapped[UUID] = mapped_column(primary_key=True)
+    symbol: Mapped[str] = mapped_column(String(20), primary_key=True)
+    date: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    # Aggregates
+    realized_pnl: Mapped[Decimal] = mapped_column(
+        Numeric(20, 8), nullable=False, default=Decimal("0")
+    )
+    fees: Mapped[Decimal] = mapped_column(Numeric(20, 8), nullable=False, default=Decimal("0"))
+    trade_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wins: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    losses: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # Timestamp
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        onupdate=lambda: datetime.now(UTC),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of DailyPnl."""
+        return (
+            f"<DailyPnl(account_id={self.account_id}, symbol={self.symbol}, "
+            f"date={self.date}, realized_pnl={self.realized_pnl}, trades={self.trade_count})>"
+        )
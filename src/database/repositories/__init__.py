@@ -4,11 +4,13 @@ from .account_repository import AccountRepository
 from .activity_event_repository import ActivityEventRepository
 from .base_repository import BaseRepository
 from .bot_state_repository import BotStateRepository
+from .daily_pnl_repository import DailyPnlRepository
 from .ema_filter_config_repository import EMAFilterConfigRepository
 from .grid_config_repository import GridConfigRepository
 from .macd_filter_config_repository import MACDFilterConfigRepository
 from .strategy_repository import StrategyRepository
 from .tp_adjustment_repository import TPAdjustmentRepository
+from .trade_analytics_repository import TradeAnalyticsRepository
 from .trade_repository import TradeRepository
 from .trading_config_repository import TradingConfigRepository
 
@@ -17,11 +19,13 @@ __all__ = [
     "ActivityEventRepository",
     "BaseRepository",
     "BotStateRepository",
+    "DailyPnlRepository",
     "EMAFilterConfigRepository",
     "GridConfigRepository",
     "MACDFilterConfigRepository",
     "StrategyRepository",
     "TPAdjustmentRepository",
+    "TradeAnalyticsRepository",
     "TradeRepository",
     "TradingConfigRepository",
 ]
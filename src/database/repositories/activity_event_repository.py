@@ -1,9 +1,10 @@
 """Activity event repository for managing activity event records."""
 
-from datetime import datetime
-from uuid import UUID
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID, uuid4
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.activity_event import ActivityEvent, EventType
@@ -74,6 +75,53 @@ class ActivityEventRepository(BaseRepository[ActivityEvent]):
             main_logger.error(f"Error creating activity event: {e}")
             raise
 
+    async def create_events_bulk(self, events: list[dict[str, Any]]) -> int:
+        """Insert many activity events with a single multi-row INSERT.
+
+        Each event dict takes the same keys as create_event() (account_id,
+        event_type, description, and optionally event_data and timestamp).
+        Missing timestamps default to now.
+
+        Args:
+            events: List of event dicts to insert.
+
+        Returns:
+            Number of events inserted.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        if not events:
+            return 0
+
+        try:
+            now = datetime.now(UTC)
+            rows = []
+            for event in events:
+                event_type = event["event_type"]
+                rows.append(
+                    {
+                        "id": uuid4(),
+                        "account_id": event["account_id"],
+                        "event_type": (
+                            event_type.value if isinstance(event_type, EventType) else event_type
+                        ),
+                        "description": event["description"],
+                        "event_data": event.get("event_data"),
+                        "timestamp": event.get("timestamp") or now,
+                    }
+                )
+
+            await self.session.execute(insert(ActivityEvent).values(rows))
+            await self.session.commit()
+            main_logger.debug(f"Activity events created in bulk: {len(rows)}")
+            return len(rows)
+
+        except Exception as e:
+            await self.session.rollback()
+            main_logger.error(f"Error creating activity events in bulk: {e}")
+            raise
+
     async def get_events_by_account(
         self,
         account_id: UUID,
@@ -0,0 +1,196 @@
+"""Repository for the daily P&L rollup."""
+
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.daily_pnl import DailyPnl
+from src.database.models.trade import Trade
+from src.utils.logger import main_logger
+
+
+def utc_date(moment: datetime) -> date:
+    """UTC calendar date of a timestamp (naive timestamps are taken as UTC)."""
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(UTC)
+    return moment.date()
+
+
+class DailyPnlRepository:
+    """Maintains and reads the daily_pnl rollup table.
+
+    Writes never commit: TradeRepository applies them in the same transaction
+    that closes the trade, so the rollup cannot drift from the trades table.
+
+    Example:
+        async with get_session() as session:
+            repo = DailyPnlRepository(session)
+            days = await repo.get_by_period(account_id, date(2026, 1, 1), date(2026, 1, 31))
+
+            # Recompute from trades (e.g. after a manual data fix)
+            await repo.rebuild(account_id)
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session.
+
+        Args:
+            session: Async database session.
+        """
+        self.session = session
+
+    def _dialect(self) -> str:
+        bind = self.session.bind
+        return bind.dialect.name if bind is not None else "postgresql"
+
+    async def add_trade(self, trade: Trade, sign: int = 1) -> None:
+        """Add (or with sign=-1, remove) a closed trade's contribution.
+
+        Upserts the (account, symbol, date) row without committing.
+
+        Args:
+            trade: Closed trade with pnl and closed_at set.
+            sign: 1 to add the trade, -1 to remove it.
+        """
+        if trade.status != "CLOSED" or trade.pnl is None or trade.closed_at is None:
+            return
+
+        pnl = Decimal(str(trade.pnl))
+        fees = Decimal(str(trade.trading_fee or 0)) + Decimal(str(trade.funding_fee or 0))
+        values = {
+            "account_id": trade.account_id,
+            "symbol": trade.symbol,
+            "date": utc_date(trade.closed_at),
+            "realized_pnl": sign * pnl,
+            "fees": sign * fees,
+            "trade_count": sign,
+            "wins": sign if pnl > 0 else 0,
+            "losses": sign if pnl < 0 else 0,
+            "updated_at": datetime.now(UTC),
+        }
+        insert = sqlite.insert if self._dialect() == "sqlite" else postgresql.insert
+        stmt = insert(DailyPnl).values(**values)
+        counters = ("realized_pnl", "fees", "trade_count", "wins", "losses")
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["account_id", "symbol", "date"],
+            set_={
+                **{key: getattr(DailyPnl, key) + getattr(stmt.excluded, key) for key in counters},
+                "updated_at": stmt.excluded.updated_at,
+            },
+        )
+        await self.session.execute(stmt)
+
+    async def remove_trade(self, trade: Trade) -> None:
+        """Remove a closed trade's contribution (before it is changed)."""
+        await self.add_trade(trade, sign=-1)
+
+    async def get_by_period(
+        self,
+        account_id: UUID,
+        start: date,
+        end: date,
+    ) -> list[DailyPnl]:
+        """Get rollup rows for an account between two dates.
+
+        Args:
+            account_id: Account UUID.
+            start: First date (inclusive).
+            end: Last date (inclusive).
+
+        Returns:
+            Rows for every symbol, ordered by date.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        try:
+            stmt = (
+                select(DailyPnl)
+                .where(
+                    DailyPnl.account_id == account_id,
+                    DailyPnl.date >= start,
+                    DailyPnl.date <= end,
+                )
+                .order_by(DailyPnl.date, DailyPnl.symbol)
+            )
+            result = await self.session.execute(stmt)
+            return list(result.scalars().all())
+        except Exception as e:
+            main_logger.error(f"Error fetching daily P&L for account {account_id}: {e}")
+            raise
+
+    def _close_day(self) -> Any:
+        """SQL expression for the UTC date of Trade.closed_at."""
+        if self._dialect() == "sqlite":
+            return func.date(Trade.closed_at)
+        return func.date(func.timezone("UTC", Trade.closed_at))
+
+    async def rebuild(self, account_id: UUID | None = None) -> int:
+        """Recompute the rollup from the trades table and commit.
+
+        Args:
+            account_id: Only rebuild this account (default: all accounts).
+
+        Returns:
+            Number of rollup rows written.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        realized = and_(
+            Trade.status == "CLOSED", Trade.pnl.isnot(None), Trade.closed_at.isnot(None)
+        )
+        day = self._close_day().label("day")
+        stmt = (
+            select(
+                Trade.account_id,
+                Trade.symbol,
+                day,
+                func.sum(Trade.pnl),
+                func.sum(Trade.trading_fee + Trade.funding_fee),
+                func.count(),
+                func.count().filter(Trade.pnl > 0),
+                func.count().filter(Trade.pnl < 0),
+            )
+            .where(realized)
+            .group_by(Trade.account_id, Trade.symbol, day)
+        )
+        clear = delete(DailyPnl)
+        if account_id is not None:
+            stmt = stmt.where(Trade.account_id == account_id)
+            clear = clear.where(DailyPnl.account_id == account_id)
+
+        try:
+            rows = (await self.session.execute(stmt)).all()
+            await self.session.execute(clear)
+            now = datetime.now(UTC)
+            self.session.add_all(
+                DailyPnl(
+                    account_id=row_account_id,
+                    symbol=symbol,
+                    date=row_day if isinstance(row_day, date) else date.fromisoformat(row_day),
+                    realized_pnl=Decimal(str(pnl)),
+                    fees=Decimal(str(fees or 0)),
+                    trade_count=count,
+                    wins=wins,
+                    losses=losses,
+                    updated_at=now,
+                )
+                for row_account_id, symbol, row_day, pnl, fees, count, wins, losses in rows
+            )
+            await self.session.commit()
+        except Exception as e:
+            await self.session.rollback()
+            main_logger.error(f"Error rebuilding daily P&L: {e}")
+            raise
+
+        main_logger.info(
+            f"Daily P&L rebuilt: {len(rows)} rows"
+            + (f" for account {account_id}" if account_id else "")
+        )
+        return len(rows)
@@ -132,6 +132,43 @@ class TPAdjustmentRepository(BaseRepository[TPAdjustment]):
         except Exception as e:
             raise Exception(f"Error fetching adjustments for trade {trade_id}: {e}") from e
 
+    async def get_by_trades(self, trade_ids: list[UUID]) -> dict[UUID, list[TPAdjustment]]:
+        """Get adjustments for several trades in a single query.
+
+        Bulk variant of get_by_trade for list endpoints, avoiding one query
+        per trade (N+1).
+
+        Args:
+            trade_ids: UUIDs of the trades to retrieve adjustments for.
+
+        Returns:
+            Dict mapping trade_id to its adjustments, ordered by adjusted_at desc.
+            Trades without adjustments are not included.
+
+        Raises:
+            Exception: If database operation fails.
+
+        Example:
+            adjustments_by_trade = await repo.get_by_trades([t.id for t in trades])
+            for trade in trades:
+                adjustments = adjustments_by_trade.get(trade.id, [])
+        """
+        if not trade_ids:
+            return {}
+
+        try:
+            result = await self.session.execute(
+                select(TPAdjustment)
+                .where(TPAdjustment.trade_id.in_(set(trade_ids)))
+                .order_by(TPAdjustment.adjusted_at.desc())
+            )
+            adjustments_by_trade: dict[UUID, list[TPAdjustment]] = {}
+            for adjustment in result.scalars():
+                adjustments_by_trade.setdefault(adjustment.trade_id, []).append(adjustment)
+            return adjustments_by_trade
+        except Exception as e:
+            raise Exception(f"Error fetching adjustments for {len(trade_ids)} trades: {e}") from e
+
     async def get_recent(
         self,
         limit: int = 100,
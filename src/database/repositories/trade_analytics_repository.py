@@ -0,0 +1,184 @@
+"""Aggregate trade statistics computed in the database."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import ColumnElement, and_, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models.trade import Trade
+from src.database.repositories.trade_repository import trade_in_period
+from src.utils.logger import main_logger
+
+
+@dataclass
+class TradeSummary:
+    """Aggregates over an account's trades.
+
+    "Realized" fields only cover closed trades with a recorded P&L; the
+    status counts and total_fees cover every trade in scope.
+    """
+
+    total_trades: int = 0
+    open_trades: int = 0
+    closed_trades: int = 0
+    total_fees: Decimal = Decimal("0")  # trading + funding fees of all trades
+
+    realized_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    realized_pnl: Decimal = Decimal("0")
+    realized_fees: Decimal = Decimal("0")
+    capital_employed: Decimal = Decimal("0")  # sum(entry_price * quantity)
+    gross_profit: Decimal = Decimal("0")  # sum of winning P&L
+    gross_loss: Decimal = Decimal("0")  # sum of losing P&L (negative)
+    best_pnl: Decimal = Decimal("0")
+    worst_pnl: Decimal = Decimal("0")
+    largest_win: Decimal = Decimal("0")
+    largest_loss: Decimal = Decimal("0")
+
+
+_COUNT_FIELDS = frozenset(
+    {
+        "total_trades",
+        "open_trades",
+        "closed_trades",
+        "realized_trades",
+        "winning_trades",
+        "losing_trades",
+    }
+)
+
+
+def _realized() -> ColumnElement[bool]:
+    return and_(Trade.status == "CLOSED", Trade.pnl.isnot(None))
+
+
+class TradeAnalyticsRepository:
+    """Read-only analytics queries over the trades table.
+
+    Statistics are computed with aggregate queries (COUNT ... FILTER, SUM,
+    MIN/MAX) so the cost of a request does not grow with the number of
+    trades loaded into Python.
+
+    Example:
+        async with get_session() as session:
+            analytics = TradeAnalyticsRepository(session)
+            summary = await analytics.summarize(account_id, start, end)
+            best, worst = await analytics.get_best_worst_trades(account_id, start, end)
+    """
+
+    def __init__(self, session: AsyncSession):
+        """Initialize repository with database session.
+
+        Args:
+            session: Async database session.
+        """
+        self.session = session
+
+    @staticmethod
+    def _scope(
+        account_id: UUID, start: datetime | None, end: datetime | None
+    ) -> list[ColumnElement[bool]]:
+        conditions: list[ColumnElement[bool]] = [Trade.account_id == account_id]
+        if start is not None and end is not None:
+            conditions.append(trade_in_period(start, end))
+        return conditions
+
+    async def summarize(
+        self,
+        account_id: UUID,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> TradeSummary:
+        """Aggregate an account's trades in a single query.
+
+        Args:
+            account_id: Account UUID.
+            start: Period start (inclusive). The period only applies when both
+                start and end are given, with the same semantics as
+                TradeRepository.get_trades_by_period.
+            end: Period end (inclusive).
+
+        Returns:
+            TradeSummary for the trades in scope.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        realized = _realized()
+        winning = and_(realized, Trade.pnl > 0)
+        losing = and_(realized, Trade.pnl < 0)
+        fees = Trade.trading_fee + Trade.funding_fee
+
+        stmt = select(
+            func.count().label("total_trades"),
+            func.count().filter(Trade.status == "OPEN").label("open_trades"),
+            func.count().filter(Trade.status == "CLOSED").label("closed_trades"),
+            func.sum(fees).label("total_fees"),
+            func.count().filter(realized).label("realized_trades"),
+            func.count().filter(winning).label("winning_trades"),
+            func.count().filter(losing).label("losing_trades"),
+            func.sum(Trade.pnl).filter(realized).label("realized_pnl"),
+            func.sum(fees).filter(realized).label("realized_fees"),
+            func.sum(Trade.entry_price * Trade.quantity).filter(realized).label("capital_employed"),
+            func.sum(Trade.pnl).filter(winning).label("gross_profit"),
+            func.sum(Trade.pnl).filter(losing).label("gross_loss"),
+            func.max(Trade.pnl).filter(realized).label("best_pnl"),
+            func.min(Trade.pnl).filter(realized).label("worst_pnl"),
+            func.max(Trade.pnl).filter(winning).label("largest_win"),
+            func.min(Trade.pnl).filter(losing).label("largest_loss"),
+        ).where(*self._scope(account_id, start, end))
+
+        try:
+            row = (await self.session.execute(stmt)).one()
+        except Exception as e:
+            main_logger.error(f"Error summarizing trades for account {account_id}: {e}")
+            raise
+
+        # Sums/min/max over no rows are NULL; SQLite may return floats
+        values: dict[str, Any] = {
+            key: value if key in _COUNT_FIELDS else Decimal(str(value))
+            for key, value in row._mapping.items()
+            if value is not None
+        }
+        return TradeSummary(**values)
+
+    async def get_best_worst_trades(
+        self,
+        account_id: UUID,
+        start: datetime | None = None,
+        end: datetime | None = None,
+    ) -> tuple[Trade | None, Trade | None]:
+        """Get the realized trades with the highest and lowest P&L.
+
+        Each is one ORDER BY pnl ... LIMIT 1 lookup. Ties go to the most
+        recently closed trade.
+
+        Args:
+            account_id: Account UUID.
+            start: Period start (inclusive), applied when end is also given.
+            end: Period end (inclusive).
+
+        Returns:
+            Tuple of (best, worst) trades; both None when there are no
+            realized trades. With a single realized trade both are that trade.
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        base = select(Trade).where(*self._scope(account_id, start, end), _realized()).limit(1)
+        try:
+            best = await self.session.scalar(
+                base.order_by(Trade.pnl.desc(), Trade.closed_at.desc())
+            )
+            worst = await self.session.scalar(
+                base.order_by(Trade.pnl.asc(), Trade.closed_at.desc())
+            )
+        except Exception as e:
+            main_logger.error(f"Error fetching best/worst trades for account {account_id}: {e}")
+            raise
+        return best, worst
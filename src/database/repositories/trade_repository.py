@@ -1,19 +1,90 @@
 """Trade repository for managing trade records."""
 
+import base64
+import binascii
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 from uuid import UUID
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import ColumnElement, and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.database.models.trade import Trade
 from src.database.repositories.base_repository import BaseRepository
+from src.database.repositories.daily_pnl_repository import DailyPnlRepository
 from src.utils.logger import main_logger
+from src.utils.response_cache import invalidate_account
 
 if TYPE_CHECKING:
-    from src.api.routes.trading_data import SortByField, SortDirection
+    from src.api.routes.trading_data import ProfitFilter, SortByField, SortDirection
+
+
+class InvalidCursorError(ValueError):
+    """Pagination cursor is malformed or was issued for a different sort."""
+
+
+@dataclass
+class TradePage:
+    """One page of filtered trades."""
+
+    trades: list[Trade]
+    total: int  # Matching trades across all pages
+    next_cursor: str | None  # Cursor for the following page (None on the last page)
+
+
+_CURSOR_PARSERS: dict[str, Callable[[str], Any]] = {
+    "dt": datetime.fromisoformat,
+    "dec": Decimal,
+    "num": float,
+}
+
+
+def _encode_cursor(sort_key: str, direction: str, value: Any, trade_id: UUID) -> str:
+    """Encode the sort position of the last trade of a page as an opaque cursor."""
+    if value is None:
+        tagged = None
+    elif isinstance(value, datetime):
+        tagged = ["dt", value.isoformat()]
+    elif isinstance(value, Decimal):
+        tagged = ["dec", str(value)]
+    else:
+        tagged = ["num", repr(float(value))]
+    payload = json.dumps([sort_key, direction, tagged, str(trade_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str, sort_key: str, direction: str) -> tuple[Any, UUID]:
+    """Decode a cursor into (sort value, trade id), checking it matches the sort."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key, cursor_direction, tagged, trade_id = json.loads(base64.urlsafe_b64decode(padded))
+        if tagged is None:
+            value = None
+        else:
+            kind, raw = tagged
+            value = _CURSOR_PARSERS[kind](raw)
+        parsed_id = UUID(trade_id)
+    except (binascii.Error, ValueError, TypeError, KeyError) as e:
+        raise InvalidCursorError("Invalid cursor") from e
+    if key != sort_key or cursor_direction != direction:
+        raise InvalidCursorError("Cursor was issued for a different sort")
+    return value, parsed_id
+
+
+def trade_in_period(start: datetime, end: datetime) -> ColumnElement[bool]:
+    """Condition for trades opened or closed within [start, end]."""
+    return or_(
+        and_(Trade.opened_at >= start, Trade.opened_at <= end),
+        and_(
+            Trade.closed_at.isnot(None),
+            Trade.closed_at >= start,
+            Trade.closed_at <= end,
+        ),
+    )
 
 
 class TradeRepository(BaseRepository[Trade]):
@@ -103,8 +174,12 @@ class TradeRepository(BaseRepository[Trade]):
                 filled_at=trade_data.get("filled_at"),
                 closed_at=trade_data.get("closed_at"),
             )
+            # Roll up trades persisted already closed; committed together by create()
+            await DailyPnlRepository(self.session).add_trade(trade)
+
             # Use inherited create method
             created_trade = await super().create(trade)
+            invalidate_account(created_trade.account_id)
             main_logger.info(
                 f"Trade saved: {created_trade.id} for account {created_trade.account_id}"
             )
@@ -171,17 +246,7 @@ class TradeRepository(BaseRepository[Trade]):
         try:
             stmt = (
                 select(Trade)
-                .where(
-                    Trade.account_id == account_id,
-                    or_(
-                        and_(Trade.opened_at >= start, Trade.opened_at <= end),
-                        and_(
-                            Trade.closed_at.isnot(None),
-                            Trade.closed_at >= start,
-                            Trade.closed_at <= end,
-                        ),
-                    ),
-                )
+                .where(Trade.account_id == account_id, trade_in_period(start, end))
                 .order_by(func.coalesce(Trade.closed_at, Trade.opened_at).desc())
             )
             result = await self.session.execute(stmt)
@@ -254,6 +319,11 @@ class TradeRepository(BaseRepository[Trade]):
             if not trade:
                 raise ValueError(f"Trade {trade_id} not found")
 
+            # Keep the daily rollup in step: replace the trade's previous
+            # contribution (if it was already closed) with the new one
+            daily_pnl = DailyPnlRepository(self.session)
+            await daily_pnl.remove_trade(trade)
+
             trade.exit_price = exit_price
             trade.pnl = pnl
             trade.pnl_percent = pnl_percent
@@ -264,8 +334,11 @@ class TradeRepository(BaseRepository[Trade]):
             if funding_fee is not None:
                 trade.funding_fee = funding_fee
 
-            # Use inherited update method
+            await daily_pnl.add_trade(trade)
+
+            # Use inherited update method (commits the trade and rollup together)
             await super().update(trade)
+            invalidate_account(trade.account_id)
             main_logger.info(
                 f"Trade {trade_id} updated with exit data: pnl={pnl}"
                 + (f", funding_fee={funding_fee}" if funding_fee else "")
@@ -276,16 +349,25 @@ class TradeRepository(BaseRepository[Trade]):
             main_logger.error(f"Error updating trade exit for {trade_id}: {e}")
             raise
 
-    def _get_sort_column(self, sort_by: "SortByField | None"):
-        """Map sort_by enum to SQLAlchemy column.
+    def _duration_seconds(self) -> Any:
+        """SQL expression for trade duration in seconds (NULL while the trade is open)."""
+        if self.session.bind is not None and self.session.bind.dialect.name == "sqlite":
+            return (func.julianday(Trade.closed_at) - func.julianday(Trade.opened_at)) * 86400
+        return func.extract("epoch", Trade.closed_at - Trade.opened_at)
+
+    def _get_sort_column(self, sort_by: "SortByField | None") -> Any:
+        """Map sort_by enum to SQLAlchemy column or expression.
 
         Args:
             sort_by: Field to sort by, or None for default.
 
         Returns:
-            SQLAlchemy column for ordering.
+            SQLAlchemy column/expression for ordering.
         """
         # Use string values for comparison to handle enums from different modules
+        sort_value = sort_by.value if sort_by else None
+        if sort_value == "duration":
+            return self._duration_seconds()
         sort_map = {
             "closedAt": Trade.closed_at,
             "entryPrice": Trade.entry_price,
@@ -293,53 +375,86 @@ class TradeRepository(BaseRepository[Trade]):
             "quantity": Trade.quantity,
             "pnl": Trade.pnl,
             "pnlPercent": Trade.pnl_percent,
-            # "duration" is computed in memory, not sortable in SQL
         }
-        sort_value = sort_by.value if sort_by else None
         return sort_map.get(sort_value, Trade.closed_at) if sort_value else Trade.closed_at
 
     async def get_trades_with_filters(
+        self,
+        account_id: UUID,
+        **filters: Any,
+    ) -> tuple[list[Trade], int]:
+        """Get trades with SQL-level filtering and sorting.
+
+        Same as get_trades_page, returning only (trades, total count).
+
+        Args:
+            account_id: Account UUID.
+            **filters: Keyword arguments of get_trades_page.
+
+        Returns:
+            Tuple of (list of Trade instances, total count before pagination).
+
+        Raises:
+            Exception: If database operation fails.
+        """
+        page = await self.get_trades_page(account_id, **filters)
+        return page.trades, page.total
+
+    async def get_trades_page(
         self,
         account_id: UUID,
         *,
         start_date: datetime | None = None,
         end_date: datetime | None = None,
         status: str | None = None,
+        profit_filter: "ProfitFilter | None" = None,
         min_entry_price: Decimal | None = None,
         max_entry_price: Decimal | None = None,
+        min_duration: int | None = None,
+        max_duration: int | None = None,
         min_quantity: Decimal | None = None,
         max_quantity: Decimal | None = None,
+        search_query: str | None = None,
         limit: int = 100,
         offset: int = 0,
+        cursor: str | None = None,
         sort_by: "SortByField | None" = None,
         sort_direction: "SortDirection | None" = None,
-    ) -> tuple[list[Trade], int]:
-        """Get trades with SQL-level filtering and sorting.
-
-        Applies filters and sorting at database level for efficiency. Returns both
-        filtered trades and total count for pagination.
+    ) -> TradePage:
+        """Get one page of trades with all filtering, sorting and pagination in SQL.
 
         Date filtering includes trades that were opened OR closed within the period,
         ensuring trades opened before the period but closed within it are included.
 
+        Pages are ordered by the sort field, then by id so ties are stable. Open
+        trades (NULL sort values) come first when descending and last when
+        ascending. Pass the returned next_cursor as cursor to get the following
+        page by keyset (cost independent of depth); otherwise offset is used.
+
         Args:
             account_id: Account UUID.
             start_date: Filter trades opened or closed after this date.
             end_date: Filter trades opened or closed before this date.
             status: Filter by status (OPEN, CLOSED, CANCELLED).
+            profit_filter: Filter by pnl sign (profitable: pnl > 0, losses: pnl < 0).
             min_entry_price: Minimum entry price filter.
             max_entry_price: Maximum entry price filter.
+            min_duration: Minimum duration in whole seconds (excludes open trades).
+            max_duration: Maximum duration in whole seconds (excludes open trades).
             min_quantity: Minimum quantity filter.
             max_quantity: Maximum quantity filter.
+            search_query: Substring of exchange_order_id or exchange_tp_order_id.
             limit: Maximum number of trades to return.
-            offset: Number of trades to skip.
+            offset: Number of trades to skip (ignored when cursor is given).
+            cursor: next_cursor of the previous page.
             sort_by: Field to sort by (None for default closed_at).
             sort_direction: Sort direction (asc or desc, default desc).
 
         Returns:
-            Tuple of (list of Trade instances, total count before pagination).
+            TradePage with the trades, total count and next page cursor.
 
         Raises:
+            InvalidCursorError: If cursor is malformed or from a different sort.
             Exception: If database operation fails.
         """
         try:
@@ -380,41 +495,103 @@ class TradeRepository(BaseRepository[Trade]):
             if status:
                 conditions.append(Trade.status == status)
 
+            # Profit filter (pnl sign; trades without pnl match neither)
+            profit_value = profit_filter.value if profit_filter else None
+            if profit_value == "profitable":
+                conditions.append(Trade.pnl > 0)
+            elif profit_value == "losses":
+                conditions.append(Trade.pnl < 0)
+
             # Price range filters
             if min_entry_price is not None:
                 conditions.append(Trade.entry_price >= min_entry_price)
             if max_entry_price is not None:
                 conditions.append(Trade.entry_price <= max_entry_price)
 
+            # Duration range filters (whole seconds, like the API's duration field)
+            if min_duration is not None or max_duration is not None:
+                duration = self._duration_seconds()
+                conditions.append(Trade.closed_at.isnot(None))
+                if min_duration is not None:
+                    conditions.append(duration >= min_duration)
+                if max_duration is not None:
+                    conditions.append(duration < max_duration + 1)
+
             # Quantity range filters
             if min_quantity is not None:
                 conditions.append(Trade.quantity >= min_quantity)
             if max_quantity is not None:
                 conditions.append(Trade.quantity <= max_quantity)
 
+            # Search filter (substring of exchange order IDs)
+            if search_query:
+                conditions.append(
+                    or_(
+                        Trade.exchange_order_id.contains(search_query, autoescape=True),
+                        Trade.exchange_tp_order_id.contains(search_query, autoescape=True),
+                    )
+                )
+
             # Get total count first
-            count_stmt = select(Trade).where(*conditions)
-            count_result = await self.session.execute(count_stmt)
-            total_count = len(list(count_result.scalars().all()))
+            count_stmt = select(func.count()).select_from(Trade).where(*conditions)
+            total_count = (await self.session.execute(count_stmt)).scalar_one()
 
-            # Determine sort column and direction
+            # Determine sort expression and direction
             sort_column = self._get_sort_column(sort_by)
+            sort_key = sort_by.value if sort_by else "closedAt"
             # Use string comparison to handle enums from different modules
             is_ascending = sort_direction.value == "asc" if sort_direction else False
-            order_clause = sort_column.asc() if is_ascending else sort_column.desc()
-
-            # Get paginated results with sorting
-            stmt = (
-                select(Trade).where(*conditions).order_by(order_clause).limit(limit).offset(offset)
-            )
-            result = await self.session.execute(stmt)
-            trades = list(result.scalars().all())
-
-            return trades, total_count
+            direction = "asc" if is_ascending else "desc"
+            if is_ascending:
+                order_by = [sort_column.asc().nulls_last(), Trade.id.asc()]
+            else:
+                order_by = [sort_column.desc().nulls_first(), Trade.id.desc()]
+
+            stmt = select(Trade, sort_column.label("sort_value")).where(*conditions)
+            if cursor:
+                value, last_id = _decode_cursor(cursor, sort_key, direction)
+                stmt = stmt.where(self._after_cursor(sort_column, is_ascending, value, last_id))
+            else:
+                stmt = stmt.offset(offset)
+
+            # Fetch one extra row to know whether there is a next page
+            result = await self.session.execute(stmt.order_by(*order_by).limit(limit + 1))
+            rows = list(result.all())
+            trades = [row[0] for row in rows[:limit]]
+
+            next_cursor = None
+            if len(rows) > limit:
+                last = rows[limit - 1]
+                next_cursor = _encode_cursor(sort_key, direction, last.sort_value, last[0].id)
+
+            return TradePage(trades=trades, total=total_count, next_cursor=next_cursor)
+        except InvalidCursorError:
+            raise
         except Exception as e:
             main_logger.error(f"Error fetching trades with filters for account {account_id}: {e}")
             raise
 
+    @staticmethod
+    def _after_cursor(sort_column: Any, is_ascending: bool, value: Any, last_id: UUID) -> Any:
+        """Keyset condition for rows after (value, last_id) in the page ordering.
+
+        Ordering is (sort ASC NULLS LAST, id ASC) or (sort DESC NULLS FIRST, id DESC).
+        """
+        if is_ascending:
+            if value is None:
+                return and_(sort_column.is_(None), Trade.id > last_id)
+            return or_(
+                sort_column > value,
+                and_(sort_column == value, Trade.id > last_id),
+                sort_column.is_(None),
+            )
+        if value is None:
+            return or_(
+                and_(sort_column.is_(None), Trade.id < last_id),
+                sort_column.isnot(None),
+            )
+        return or_(sort_column < value, and_(sort_column == value, Trade.id < last_id))
+
     async def get_by_exchange_order_id(
         self,
         account_id: UUID,
@@ -482,6 +659,7 @@ class TradeRepository(BaseRepository[Trade]):
                 trade.tp_percent = ((new_tp_price - trade.entry_price) / trade.entry_price) * 100
 
             await self.session.commit()
+            invalidate_account(trade.account_id)
             main_logger.debug(f"Trade {trade_id} TP updated to ${new_tp_price}")
 
         except Exception as e:
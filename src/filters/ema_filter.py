@@ -5,10 +5,15 @@ Implements EMA direction-based filtering for the Impulse System (Alexander Elder
 Determines if orders should be created based on EMA trend direction.
 """
 
+from collections.abc import Sequence
 from enum import Enum
 from typing import TYPE_CHECKING
 from uuid import UUID
 
+import numpy as np
+import pandas as pd
+
+from src.client.klines import Klines
 from src.filters.base import Filter, FilterState
 from src.utils.logger import main_logger
 
@@ -79,6 +84,12 @@ class EMAFilter(Filter):
         self._direction = EMADirection.FLAT
         self._last_close: float | None = None
 
+        # Running EMA over closed candles, advanced only when a candle closes.
+        # Rebuilt when (period, timeframe) changes or the klines skip candles.
+        self._closed_ema: float | None = None
+        self._closed_ema_key: tuple[int, str] | None = None
+        self._closed_ema_time: int | None = None  # Open time (ms) of last closed candle
+
         # Set initial enabled state if provided
         if enabled is not None:
             self._enabled = enabled
@@ -133,7 +144,7 @@ class EMAFilter(Filter):
         """Get current EMA value."""
         return self._current_ema
 
-    def _calculate_ema(self, closes: list[float]) -> float | None:
+    def _calculate_ema(self, closes: Sequence[float] | np.ndarray) -> float | None:
         """
         Calculate EMA from closing prices.
 
@@ -141,8 +152,13 @@ class EMAFilter(Filter):
         EMA = Close * multiplier + Previous_EMA * (1 - multiplier)
         where multiplier = 2 / (period + 1)
 
+        Seeded with the SMA of the first ``period`` closes. The recursion is
+        evaluated in one vectorized pass: the last EMA equals the seed decayed
+        by (1 - multiplier)^n plus the remaining closes weighted by
+        multiplier * (1 - multiplier)^age.
+
         Args:
-            closes: List of closing prices (oldest first)
+            closes: Closing prices (oldest first)
 
         Returns:
             EMA value or None if not enough data
@@ -150,16 +166,15 @@ class EMAFilter(Filter):
         if len(closes) < self._period:
             return None
 
+        values = np.asarray(closes, dtype=np.float64)
         multiplier = 2 / (self._period + 1)
+        decay = 1 - multiplier
 
-        # Initialize with SMA for the first period
-        ema = sum(closes[: self._period]) / self._period
+        seed = values[: self._period].mean()
+        rest = values[self._period :]
+        weights = decay ** np.arange(len(rest) - 1, -1, -1, dtype=np.float64)
 
-        # Calculate EMA for remaining data points
-        for close in closes[self._period :]:
-            ema = close * multiplier + ema * (1 - multiplier)
-
-        return ema
+        return float(seed * decay ** len(rest) + multiplier * (weights @ rest))
 
     def _determine_direction(self) -> EMADirection:
         """
@@ -181,17 +196,35 @@ class EMAFilter(Filter):
         else:
             return EMADirection.FLAT
 
-    def update(self, klines: list) -> None:
+    def update(self, klines: Klines | pd.DataFrame | list | None) -> None:
         """
         Update EMA calculation with new klines data.
 
         Extracts closing prices from klines and calculates EMA.
         Updates direction based on current vs previous EMA.
 
+        Klines (and DataFrames with a 'timestamp' column) use the incremental
+        path (see update_from_arrays); lists are recomputed on every call.
+
         Args:
-            klines: List of klines data. Each kline should have close price at index 4.
-                   Format: [open_time, open, high, low, close, volume, ...]
+            klines: Klines, DataFrame with 'close' (and optionally 'timestamp')
+                columns, or list of klines with close price at index 4.
+                   List format: [open_time, open, high, low, close, volume, ...]
         """
+        if isinstance(klines, Klines):
+            self.update_from_arrays(klines.timestamp, klines.close)
+            return
+        if isinstance(klines, pd.DataFrame):
+            closes = klines["close"].to_numpy(dtype=np.float64)
+            if "timestamp" not in klines.columns:
+                self.update_closes(closes)
+                return
+            timestamps = klines["timestamp"].to_numpy()
+            if timestamps.dtype.kind == "M":
+                timestamps = timestamps.astype("datetime64[ms]").astype(np.int64)
+            self.update_from_arrays(timestamps, closes)
+            return
+
         if not klines or len(klines) < self._period + 1:
             main_logger.debug(
                 f"EMA filter: insufficient klines ({len(klines) if klines else 0} < {self._period + 1})"
@@ -200,33 +233,113 @@ class EMAFilter(Filter):
 
         try:
             # Extract closing prices (index 4 in standard kline format)
-            closes = [float(kline[4]) for kline in klines]
+            close_values = [float(kline[4]) for kline in klines]
+        except (IndexError, ValueError, TypeError) as e:
+            main_logger.warning(f"EMA filter: error processing klines: {e}")
+            return
+
+        self.update_closes(close_values)
+
+    def update_closes(self, closes: Sequence[float] | np.ndarray) -> None:
+        """
+        Update EMA calculation from closing prices (full recompute).
 
-            # Store previous EMA for direction calculation
-            self._previous_ema = self._current_ema
+        Args:
+            closes: Closing prices, oldest first.
+                The last element is the current (forming) candle.
+        """
+        if len(closes) < self._period + 1:
+            main_logger.debug(
+                f"EMA filter: insufficient klines ({len(closes)} < {self._period + 1})"
+            )
+            return
 
-            # Calculate current EMA with all data except last candle (for previous)
-            if len(closes) > self._period:
-                # Calculate EMA up to second-to-last candle first
-                prev_closes = closes[:-1]
-                self._previous_ema = self._calculate_ema(prev_closes)
+        try:
+            # EMA up to second-to-last candle (for direction), then one step
+            # with the forming candle
+            self._set_emas(self._calculate_ema(closes[:-1]), float(closes[-1]))
+        except (IndexError, ValueError, TypeError) as e:
+            main_logger.warning(f"EMA filter: error processing klines: {e}")
 
-            # Calculate current EMA with all data
-            self._current_ema = self._calculate_ema(closes)
-            self._last_close = closes[-1] if closes else None
+    def update_from_arrays(self, timestamps: np.ndarray, closes: np.ndarray) -> None:
+        """
+        Update EMA, advancing the running state only on newly closed candles.
 
-            # Determine direction
-            self._direction = self._determine_direction()
+        The closed-candle EMA is seeded once (vectorized) and then advanced
+        O(1) per candle that closed since the previous call; the forming
+        candle is applied on top without changing the state. The state is
+        re-seeded when period/timeframe change (e.g. via sync_config) or
+        when the klines no longer contain the last seen candle (gap).
 
+        Args:
+            timestamps: Candle open times in milliseconds, oldest first.
+            closes: Close prices aligned with timestamps. The last element is
+                the current (forming) candle.
+        """
+        if len(closes) < self._period + 1:
             main_logger.debug(
-                f"EMA filter updated: period={self._period}, "
-                f"ema={f'{self._current_ema:.2f}' if self._current_ema is not None else 'N/A'}, "
-                f"direction={self._direction.value}"
+                f"EMA filter: insufficient klines ({len(closes)} < {self._period + 1})"
             )
+            return
 
+        try:
+            key = (self._period, self._timeframe)
+            closed_ts = timestamps[:-1]
+            last_closed = int(closed_ts[-1])
+
+            if (
+                self._closed_ema is None
+                or self._closed_ema_key != key
+                or self._closed_ema_time is None
+                or last_closed < self._closed_ema_time
+            ):
+                self._seed_closed_ema(closes[:-1], key, last_closed)
+            elif last_closed > self._closed_ema_time:
+                # Position of the last candle already included in the state
+                index = int(np.searchsorted(closed_ts, self._closed_ema_time))
+                if index >= len(closed_ts) or int(closed_ts[index]) != self._closed_ema_time:
+                    self._seed_closed_ema(closes[:-1], key, last_closed)
+                else:
+                    multiplier = 2 / (self._period + 1)
+                    ema = self._closed_ema
+                    for close in closes[index + 1 : -1]:
+                        ema = multiplier * float(close) + (1 - multiplier) * ema
+                    self._closed_ema = ema
+                    self._closed_ema_time = last_closed
+
+            self._set_emas(self._closed_ema, float(closes[-1]))
         except (IndexError, ValueError, TypeError) as e:
             main_logger.warning(f"EMA filter: error processing klines: {e}")
 
+    def _seed_closed_ema(
+        self, closed: Sequence[float] | np.ndarray, key: tuple[int, str], last_closed: int
+    ) -> None:
+        """Rebuild the running closed-candle EMA from history."""
+        self._closed_ema = self._calculate_ema(closed)
+        self._closed_ema_key = key
+        self._closed_ema_time = last_closed
+        main_logger.debug(f"EMA filter state seeded: period={key[0]}, timeframe={key[1]}")
+
+    def _set_emas(self, previous_ema: float | None, last_close: float) -> None:
+        """Set previous/current EMA from the closed-candle EMA and the forming close."""
+        multiplier = 2 / (self._period + 1)
+        self._previous_ema = previous_ema
+        self._current_ema = (
+            multiplier * last_close + (1 - multiplier) * previous_ema
+            if previous_ema is not None
+            else None
+        )
+        self._last_close = last_close
+
+        # Determine direction
+        self._direction = self._determine_direction()
+
+        main_logger.debug(
+            f"EMA filter updated: period={self._period}, "
+            f"ema={f'{self._current_ema:.2f}' if self._current_ema is not None else 'N/A'}, "
+            f"direction={self._direction.value}"
+        )
+
     def should_allow_trade(self) -> bool:
         """
         Check if trade should be allowed based on EMA direction.
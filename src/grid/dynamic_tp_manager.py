@@ -16,6 +16,7 @@ if TYPE_CHECKING:
     )
     from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
     from src.grid.order_tracker import OrderTracker, TrackedOrder
+    from src.services.activity_event_sink import ActivityEventSink
 
 
 @dataclass
@@ -51,6 +52,7 @@ class DynamicTPManager:
         tp_adjustment_repository: "TPAdjustmentRepository | None" = None,
         account_id: UUID | None = None,
         activity_event_repository: "ActivityEventRepository | None" = None,
+        activity_event_sink: "ActivityEventSink | None" = None,
     ):
         self.config = config
         self.client = client
@@ -59,6 +61,7 @@ class DynamicTPManager:
         self._tp_adjustment_repository = tp_adjustment_repository
         self._account_id = account_id
         self._activity_event_repository = activity_event_repository
+        self._activity_event_sink = activity_event_sink
         self._running = False
         self._task: asyncio.Task | None = None
         self._last_update: dict[str, datetime] = {}  # order_id -> last update time
@@ -78,14 +81,27 @@ class DynamicTPManager:
         """Log an activity event to the database (non-blocking).
 
         Creates an activity event record for the dashboard timeline.
-        Runs asynchronously to avoid blocking the monitoring loop.
+        Queued on the ActivityEventSink when configured, otherwise persisted
+        in a background task to avoid blocking the monitoring loop.
 
         Args:
             event_type: Type of event (from EventType enum).
             description: Human-readable description of the event.
             event_data: Optional additional event data as dictionary.
         """
-        if not self._activity_event_repository or not self._account_id:
+        if not self._account_id:
+            return
+
+        if self._activity_event_sink is not None:
+            self._activity_event_sink.enqueue(
+                account_id=self._account_id,
+                event_type=event_type,
+                description=description,
+                event_data=event_data,
+            )
+            return
+
+        if not self._activity_event_repository:
             return
 
         # Capture values for closure (type narrowing)
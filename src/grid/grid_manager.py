@@ -19,6 +19,8 @@ from src.api.websocket.events import (
     WebSocketEvent,
 )
 from src.client.bingx_client import BingXClient
+from src.client.order_book import ExchangeOrderBook
+from src.client.rate_limiter import RateLimitError
 from src.client.websocket_client import BingXAccountWebSocket
 from src.database.models.activity_event import EventType
 from src.filters.ema_filter import EMADirection, EMAFilter
@@ -28,16 +30,27 @@ from src.grid.dynamic_tp_manager import DynamicTPManager
 from src.grid.grid_calculator import GridCalculator, GridLevel
 from src.grid.order_tracker import OrderTracker, TrackedOrder
 from src.grid.reconciliation import TradeReconciliation
-from src.strategy.macd_strategy import GridState, MACDStrategy
+from src.grid.update_scheduler import UpdateScheduler, UpdateTrigger
+from src.strategy.macd_strategy import GridState, MACDStrategy, MACDValues
 from src.utils.logger import main_logger, orders_logger
+from src.utils.metrics import metrics
 
 if TYPE_CHECKING:
+    from src.client.kline_store import KlineStore
     from src.database.repositories.activity_event_repository import ActivityEventRepository
     from src.database.repositories.bot_state_repository import BotStateRepository
     from src.database.repositories.ema_filter_config_repository import EMAFilterConfigRepository
     from src.database.repositories.macd_filter_config_repository import MACDFilterConfigRepository
     from src.database.repositories.strategy_repository import StrategyRepository
     from src.database.repositories.tp_adjustment_repository import TPAdjustmentRepository
+    from src.services.activity_event_sink import ActivityEventSink
+
+PHASE_SECONDS = metrics.histogram(
+    "grid_update_phase_seconds",
+    "Duration of each GridManager update phase",
+    ("phase",),
+)
+CYCLE_ERRORS = metrics.counter("grid_update_errors_total", "Update cycles aborted by an error")
 
 
 @dataclass
@@ -68,6 +81,11 @@ class GridManager:
     - BingX client for order execution
     """
 
+    # Price move (fraction of grid spacing) that triggers grid repositioning
+    REPOSITION_SPACING_FRACTION = 0.5
+    # Minimum seconds between P&L broadcasts triggered by price ticks
+    PNL_BROADCAST_INTERVAL = 2.0
+
     def __init__(
         self,
         config: Config,
@@ -83,6 +101,7 @@ class GridManager:
         ema_filter_config_repository: EMAFilterConfigRepository | None = None,
         activity_event_repository: ActivityEventRepository | None = None,
         tp_adjustment_repository: TPAdjustmentRepository | None = None,
+        activity_event_sink: ActivityEventSink | None = None,
     ):
         self.config = config
         self.client = client
@@ -95,6 +114,7 @@ class GridManager:
         self._macd_filter_config_repository = macd_filter_config_repository
         self._ema_filter_config_repository = ema_filter_config_repository
         self._activity_event_repository = activity_event_repository
+        self._activity_event_sink = activity_event_sink
         self._tp_adjustment_repository = tp_adjustment_repository
 
         self.strategy = MACDStrategy(
@@ -129,6 +149,10 @@ class GridManager:
         self._current_state = GridState.WAIT
         self._current_price = 0.0
         self._ws_price_timestamp = 0.0  # Timestamp of last WebSocket price update
+        self._kline_store: KlineStore | None = None  # Streaming klines (REST fallback)
+        self._scheduler: UpdateScheduler | None = None  # Event-driven updates (see start_scheduler)
+        self._last_grid_price = 0.0  # Price at the last grid repositioning
+        self._last_pnl_broadcast = 0.0  # Monotonic time of the last P&L broadcast
         self._last_macd_line = 0.0
         self._last_histogram = 0.0
         self._running = False
@@ -137,10 +161,13 @@ class GridManager:
         self._margin_error = False  # Pause order creation on margin error
         self._margin_error_time = 0.0  # When the error occurred
         self._rate_limited_until = 0.0  # Rate limit backoff
+        self._error_pause_until = 0.0  # Short pause after consecutive order errors
         self._consecutive_errors = 0  # Track consecutive errors
 
         # WebSocket
         self._account_ws: BingXAccountWebSocket | None = None
+        # Open orders mirrored from the account WebSocket (REST fallback)
+        self._order_book = ExchangeOrderBook(client, self._symbol_from_config)
         self._listen_key: str = ""
         self._ws_task: asyncio.Task | None = None
         self._keepalive_task: asyncio.Task | None = None
@@ -235,6 +262,122 @@ class GridManager:
         self._current_price = price
         self._ws_price_timestamp = time.time()
 
+        scheduler = self._scheduler
+        if scheduler is None:
+            return
+
+        # Reposition only when price moved a meaningful fraction of the grid spacing
+        threshold = self.calculator.calculate_spacing(price) * self.REPOSITION_SPACING_FRACTION
+        if abs(price - self._last_grid_price) >= threshold:
+            scheduler.notify(UpdateTrigger.PRICE)
+        elif (
+            self.tracker.filled_orders
+            and time.monotonic() - self._last_pnl_broadcast >= self.PNL_BROADCAST_INTERVAL
+        ):
+            scheduler.notify(UpdateTrigger.PNL)
+
+    @property
+    def kline_store(self) -> KlineStore | None:
+        """Streaming kline store in use (replaced when the strategy timeframe changes)."""
+        return self._kline_store
+
+    def set_kline_store(self, kline_store: KlineStore | None) -> None:
+        """Use a streaming KlineStore for MACD/EMA instead of polling klines via REST.
+
+        The store is only used while it is ready (not stale) and matches the
+        strategy timeframe; otherwise update() falls back to REST. When the
+        strategy timeframe changes, the next indicator refresh moves to a new
+        store on that interval. Candle closes from the store trigger MACD/EMA
+        re-evaluation when the scheduler is running.
+
+        Args:
+            kline_store: KlineStore fed by the market WebSocket, or None to disable
+        """
+        if self._kline_store is not None:
+            self._kline_store.remove_close_callback(self._on_candle_close)
+        self._kline_store = kline_store
+        if kline_store is not None:
+            kline_store.add_close_callback(self._on_candle_close)
+
+    def _on_candle_close(self, open_time: int) -> None:
+        """Re-evaluate indicators when the kline store closes a candle."""
+        if self._scheduler is not None:
+            self._scheduler.notify(UpdateTrigger.CANDLE)
+
+    async def _follow_strategy_timeframe(self) -> None:
+        """Move the kline stream to the strategy timeframe after it changed.
+
+        Without this the store keeps streaming the old interval: indicators
+        fall back to REST and candle closes no longer trigger updates. If the
+        new store cannot start, the old one is kept (REST fallback) and the
+        switch is retried on the next refresh.
+        """
+        store = self._kline_store
+        timeframe = self.strategy.timeframe
+        if store is None or store.interval == timeframe:
+            return
+
+        new_store = store.for_interval(timeframe)
+        try:
+            await new_store.start()
+        except Exception as e:
+            main_logger.warning(f"Falha ao iniciar klines {timeframe}: {e} - usando REST")
+            await new_store.stop()
+            return
+
+        self.set_kline_store(new_store)
+        await store.stop()
+        main_logger.info(f"Klines: timeframe alterado de {store.interval} para {timeframe}")
+
+    def _notify_scheduler(self, trigger: UpdateTrigger) -> None:
+        """Forward an exchange event to the scheduler, if running."""
+        if self._scheduler is not None:
+            self._scheduler.notify(trigger)
+
+    async def _get_open_orders(self) -> list[dict]:
+        """Open orders from the local order book (REST when the account WebSocket is down)."""
+        if self._order_book.symbol != self.symbol:
+            self._order_book.clear(self.symbol)
+        return await self._order_book.get_open_orders()
+
+    @property
+    def order_book(self) -> ExchangeOrderBook:
+        """Local mirror of open exchange orders."""
+        return self._order_book
+
+    @property
+    def scheduler_stats(self) -> dict[str, Any] | None:
+        """Update scheduler counters, or None when running in polling mode."""
+        return self._scheduler.stats if self._scheduler is not None else None
+
+    def start_scheduler(self, poll_interval: float = 30.0, debounce: float = 0.05) -> None:
+        """Run updates on events instead of a fixed polling loop.
+
+        Triggers and the work they run:
+        - Price moved >= REPOSITION_SPACING_FRACTION of the grid spacing: grid repositioning
+        - Order filled/cancelled, position changed (account WebSocket): sync + grid
+        - Candle closed (KlineStore): MACD/EMA re-evaluation + grid
+        - Every poll_interval seconds: full update() as safety net
+
+        An initial full update runs immediately.
+
+        Args:
+            poll_interval: Seconds between safety-net full updates
+            debounce: Seconds to coalesce bursts of events into one run
+        """
+        if self._scheduler is None:
+            self._scheduler = UpdateScheduler(
+                self.run_triggers, poll_interval=poll_interval, debounce=debounce
+            )
+        self._scheduler.start()
+        self._scheduler.notify(UpdateTrigger.POLL)
+
+    async def stop_scheduler(self) -> None:
+        """Stop event-driven updates."""
+        if self._scheduler is not None:
+            await self._scheduler.stop()
+            self._scheduler = None
+
     def _is_ws_price_fresh(self, max_age_seconds: float = 10.0) -> bool:
         """Check if WebSocket price is fresh enough to use.
 
@@ -272,31 +415,48 @@ class GridManager:
         """Log an activity event to the database and broadcast via WebSocket (fire-and-forget).
 
         This method is non-blocking and failures will not crash the bot.
-        Uses asyncio.create_task for fire-and-forget behavior.
+        When an ActivityEventSink is configured the event is queued for a
+        batched write; otherwise it is persisted in a background task.
 
         Args:
             event_type: EventType enum value (e.g., EventType.BOT_STARTED)
             description: Human-readable description of the event
             event_data: Optional JSON-serializable dict with additional context
         """
-        if not self._activity_event_repository or not self._account_id:
+        if not self._account_id:
             return
 
-        # Capture values for closure (type narrowing)
+        sink = self._activity_event_sink
         repo = self._activity_event_repository
+        if sink is None and not repo:
+            return
+
+        # Capture values for closure (type narrowing)
         account_id = self._account_id
         connection_manager = self._connection_manager
 
+        if sink is not None:
+            sink.enqueue(
+                account_id=account_id,
+                event_type=event_type,
+                description=description,
+                event_data=event_data,
+            )
+            # Only broadcasting remains; skip the task if nobody is listening
+            if not connection_manager or connection_manager.active_connections_count == 0:
+                return
+
         async def _do_log():
             try:
-                # Persist to database
-                await repo.create_event(
-                    account_id=account_id,
-                    event_type=event_type,
-                    description=description,
-                    event_data=event_data,
-                )
-                main_logger.debug(f"Activity event logged: {event_type}")
+                # Persist to database (sink already queued it)
+                if sink is None and repo is not None:
+                    await repo.create_event(
+                        account_id=account_id,
+                        event_type=event_type,
+                        description=description,
+                        event_data=event_data,
+                    )
+                    main_logger.debug(f"Activity event logged: {event_type}")
 
                 # Broadcast via WebSocket if clients are connected
                 if connection_manager and connection_manager.active_connections_count > 0:
@@ -513,8 +673,8 @@ class GridManager:
     async def _broadcast_pnl_updates(self) -> None:
         """Broadcast P&L updates for all open positions.
 
-        Called periodically from the main update loop to push real-time P&L
-        updates to the dashboard. Updates are throttled by the loop interval (5s).
+        Called from update cycles to push real-time P&L updates to the
+        dashboard. Price ticks request it at most every PNL_BROADCAST_INTERVAL.
         """
         # Skip if no clients connected
         if self._connection_manager.active_connections_count == 0:
@@ -709,7 +869,7 @@ class GridManager:
         # Load existing positions and orders
         try:
             positions = await self.client.get_positions(self.symbol)
-            open_orders = await self.client.get_open_orders(self.symbol)
+            open_orders = await self._get_open_orders()
 
             # Get realized PnL from exchange (source of truth)
             for pos in positions:
@@ -770,6 +930,7 @@ class GridManager:
             tp_adjustment_repository=self._tp_adjustment_repository,
             account_id=self._account_id,
             activity_event_repository=self._activity_event_repository,
+            activity_event_sink=self._activity_event_sink,
         )
 
         # Iniciar monitoramento
@@ -810,7 +971,13 @@ class GridManager:
             main_logger.info("ListenKey gerado para WebSocket")
 
             # Create WebSocket client
-            self._account_ws = BingXAccountWebSocket(self._listen_key)
+            self._account_ws = BingXAccountWebSocket(
+                self._listen_key, base_url=self.config.bingx.ws_url
+            )
+
+            # Mirror open orders from ORDER_TRADE_UPDATE (resync on every reconnect)
+            self._order_book.attach(self._account_ws)
+            self._order_book.start()
 
             # Set callbacks
             self._account_ws.set_order_callback(self._on_ws_order_update)
@@ -909,6 +1076,8 @@ class GridManager:
 
     def _on_ws_order_update(self, order_data: dict) -> None:
         """Handle order update from WebSocket."""
+        self._order_book.apply_event(order_data)
+
         order_id = str(order_data.get("i", ""))
         status = order_data.get("X", "")  # NEW, FILLED, CANCELED, etc.
         order_type = order_data.get("o", "")  # LIMIT, MARKET, etc.
@@ -926,6 +1095,7 @@ class GridManager:
         elif status == "CANCELED":
             self.tracker.cancel_order(order_id)
             orders_logger.info(f"WS: Ordem cancelada: {order_id}")
+            self._notify_scheduler(UpdateTrigger.ORDER)
 
     async def _handle_order_filled_ws(self, order_id: str, order: TrackedOrder) -> None:
         """Handle order filled event from WebSocket (async wrapper)."""
@@ -956,6 +1126,9 @@ class GridManager:
             self._on_order_filled(order)
         orders_logger.info(f"WS: Ordem executada em tempo real: {order_id}")
 
+        # Fill processed: free slot / new TP, let the scheduler sync and reposition
+        self._notify_scheduler(UpdateTrigger.ORDER)
+
         # Log ORDER_FILLED event
         self._log_activity_event(
             EventType.ORDER_FILLED,
@@ -981,40 +1154,42 @@ class GridManager:
             filled_order: The TrackedOrder that was just filled
         """
         try:
-            # Query open orders to find the TP order
-            open_orders = await self.client.get_open_orders(self.symbol)
-
-            # Look for TP orders that match this position
-            for open_order in open_orders:
-                order_type = open_order.get("type", "")
-                if order_type not in ["TAKE_PROFIT_MARKET", "TAKE_PROFIT"]:
-                    continue
-
-                # Check if this TP order matches our filled order
-                tp_price = float(open_order.get("stopPrice", 0))
-                quantity = float(open_order.get("origQty", 0))
-
-                # Match by TP price and quantity
-                # Note: BingX may round quantities, so use 0.0001 tolerance (not 0.00001)
-                if (
-                    abs(tp_price - filled_order.tp_price) < 0.01
-                    and abs(quantity - filled_order.quantity) < 0.0001
-                ):
-                    tp_order_id = str(open_order.get("orderId", ""))
-                    filled_order.exchange_tp_order_id = tp_order_id
-                    orders_logger.info(
-                        f"Captured TP order ID {tp_order_id[:8]} for filled order {filled_order.order_id[:8]}"
-                    )
-
-                    # Update database with TP order ID (BUG #1 FIX)
-                    if filled_order.trade_id:
-                        await self._update_trade_tp_order_id(filled_order.trade_id, tp_order_id)
-                    else:
-                        orders_logger.warning(
-                            f"Cannot update TP order ID in database: trade_id is None for {filled_order.order_id[:8]}"
+            # Make sure the order book is loaded (REST when the account WebSocket is down)
+            await self._get_open_orders()
+
+            # Look up TP orders by price in the order book. The exchange creates
+            # the TP right after the fill, so its event may not have arrived yet:
+            # resync once from REST before giving up.
+            for attempt in range(2):
+                for open_order in self._order_book.at_price(filled_order.tp_price):
+                    order_type = open_order.get("type", "")
+                    if order_type not in ["TAKE_PROFIT_MARKET", "TAKE_PROFIT"]:
+                        continue
+
+                    # Match by quantity
+                    # Note: BingX may round quantities, so use 0.0001 tolerance (not 0.00001)
+                    quantity = float(open_order.get("origQty", 0))
+                    if abs(quantity - filled_order.quantity) < 0.0001:
+                        tp_order_id = str(open_order.get("orderId", ""))
+                        filled_order.exchange_tp_order_id = tp_order_id
+                        orders_logger.info(
+                            f"Captured TP order ID {tp_order_id[:8]} for filled order {filled_order.order_id[:8]}"
                         )
 
-                    return
+                        # Update database with TP order ID (BUG #1 FIX)
+                        if filled_order.trade_id:
+                            await self._update_trade_tp_order_id(filled_order.trade_id, tp_order_id)
+                        else:
+                            orders_logger.warning(
+                                f"Cannot update TP order ID in database: trade_id is None for {filled_order.order_id[:8]}"
+                            )
+
+                        return
+
+                if attempt == 0 and self._order_book.is_live:
+                    await self._order_book.refresh()
+                else:
+                    break
 
             orders_logger.warning(
                 f"Could not find TP order for filled order {filled_order.order_id[:8]}"
@@ -1072,8 +1247,10 @@ class GridManager:
 
         # If position closed (amt = 0), mark as TP hit
         if position_amt == 0 and self.tracker.filled_orders:
-            # Schedule async handling for all TP hits
+            # Schedule async handling for all TP hits (notifies the scheduler when done)
             asyncio.create_task(self._handle_position_closed_ws())
+        else:
+            self._notify_scheduler(UpdateTrigger.POSITION)
 
     async def _handle_position_closed_ws(self) -> None:
         """Handle position closed event from WebSocket (async wrapper)."""
@@ -1116,8 +1293,12 @@ class GridManager:
                 },
             )
 
+        self._notify_scheduler(UpdateTrigger.POSITION)
+
     async def _stop_websocket(self) -> None:
         """Stop WebSocket and cleanup."""
+        await self._order_book.stop()
+
         if self._keepalive_task:
             self._keepalive_task.cancel()
             try:
@@ -1163,6 +1344,8 @@ class GridManager:
         self._running = False
         main_logger.info("Grid Manager encerrando...")
 
+        await self.stop_scheduler()
+
         # Log BOT_STOPPED event (capture state before clearing)
         self._log_activity_event(
             EventType.BOT_STOPPED,
@@ -1184,24 +1367,15 @@ class GridManager:
 
         # Cancel only LIMIT orders (grid orders), preserve TP/SL orders
         try:
-            open_orders = await self.client.get_open_orders(self.symbol)
+            open_orders = await self._get_open_orders()
             if open_orders:
-                cancelled = 0
-                preserved = 0
-                for order in open_orders:
-                    order_type = order.get("type", "")
-                    order_id = str(order.get("orderId", ""))
-
-                    # Only cancel LIMIT orders (grid entry orders)
-                    # Preserve: TAKE_PROFIT_MARKET, STOP_MARKET, TAKE_PROFIT, STOP
-                    if order_type == "LIMIT" and order_id:
-                        try:
-                            await self.client.cancel_order(self.symbol, order_id)
-                            cancelled += 1
-                        except Exception:
-                            pass
-                    else:
-                        preserved += 1
+                # Only cancel LIMIT orders (grid entry orders)
+                # Preserve: TAKE_PROFIT_MARKET, STOP_MARKET, TAKE_PROFIT, STOP
+                limit_orders = [
+                    o for o in open_orders if o.get("type", "") == "LIMIT" and o.get("orderId")
+                ]
+                preserved = len(open_orders) - len(limit_orders)
+                cancelled = await self._cancel_orders(limit_orders, "bot parado")
 
                 if cancelled > 0:
                     main_logger.info(f"{cancelled} ordem(ns) LIMIT cancelada(s)")
@@ -1227,88 +1401,137 @@ class GridManager:
             signal_line=None,
         )
 
+    async def _update_indicators_from_rest(self) -> tuple[MACDValues | None, GridState]:
+        """Fetch klines via REST and update MACD and EMA filter.
+
+        Returns:
+            Tuple of (MACD values, grid state)
+        """
+        # Get klines for MACD calculation
+        # Use timeframe from DB config (strategy.timeframe), not env (config.macd.timeframe)
+        klines = await self.client.get_klines(
+            self.symbol,
+            interval=self.strategy.timeframe,
+            limit=100,
+        )
+
+        # MACD only advances when a candle closes; EMA reads the close column directly
+        macd_values = self.strategy.update_macd(klines)
+        new_state = self.strategy.evaluate_state(macd_values)
+        self._ema_filter.update(klines)
+
+        return macd_values, new_state
+
     async def update(self) -> None:
         """
-        Main update cycle - called periodically.
+        Main update cycle - full refresh (safety-net poll or polling mode).
 
         1. Fetch current price and klines
         2. Calculate MACD state
         3. Execute actions based on state
+        4. Sync with exchange and broadcast P&L
         """
-        if not self._running:
-            return
+        await self._run_cycle(refresh_indicators=True, grid=True, sync=True, pnl=True)
 
-        try:
-            # Get current price - prefer WebSocket (real-time) over REST API (polling)
-            if not self._is_ws_price_fresh():
-                # WebSocket price is stale or not available, fetch from REST API
-                self._current_price = await self.client.get_price(self.symbol)
-            # else: _current_price is already up-to-date from WebSocket callback
-
-            # Get klines for MACD calculation
-            # Use timeframe from DB config (strategy.timeframe), not env (config.macd.timeframe)
-            klines = await self.client.get_klines(
-                self.symbol,
-                interval=self.strategy.timeframe,
-                limit=100,
-            )
+    async def run_triggers(self, triggers: frozenset[UpdateTrigger]) -> None:
+        """
+        Run only the work affected by a batch of scheduler triggers.
 
-            # Calculate MACD state
-            macd_values = self.strategy.calculate_macd(klines)
-            if macd_values:
-                self._last_macd_line = macd_values.macd_line
-                self._last_histogram = macd_values.histogram
-
-            new_state = self.strategy.get_state(klines)
-
-            # Update MACD filter with current state
-            self._macd_filter.set_current_state(new_state)
-
-            # Update EMA filter with klines data
-            # EMAFilter expects list format with close at index 4: [timestamp, open, high, low, close, volume]
-            # Convert DataFrame to list if needed
-            klines_list: list[Any]
-            if hasattr(klines, "values"):
-                klines_list = klines[
-                    ["timestamp", "open", "high", "low", "close", "volume"]
-                ].values.tolist()
-            else:
-                klines_list = list(klines)
-            self._ema_filter.update(klines_list)
-
-            # Log EMA direction changes
-            current_direction = self._ema_filter.direction
-            if (
-                self._previous_ema_direction is not None
-                and current_direction != self._previous_ema_direction
-            ):
-                ema_value = (
-                    f"{self._ema_filter.current_ema:.2f}"
-                    if self._ema_filter.current_ema is not None
-                    else "N/A"
-                )
-                main_logger.info(
-                    f"EMA direction changed: {self._previous_ema_direction.value} → "
-                    f"{current_direction.value} (EMA={ema_value})"
-                )
-            self._previous_ema_direction = current_direction
+        Args:
+            triggers: Coalesced triggers from UpdateScheduler
+        """
+        if UpdateTrigger.POLL in triggers:
+            await self.update()
+            return
 
-            # Handle state change
-            if new_state != self._current_state:
-                await self._handle_state_change(new_state)
-                self._current_state = new_state
+        exchange_changed = bool(triggers & {UpdateTrigger.ORDER, UpdateTrigger.POSITION})
+        await self._run_cycle(
+            refresh_indicators=UpdateTrigger.CANDLE in triggers,
+            grid=exchange_changed or bool(triggers & {UpdateTrigger.PRICE, UpdateTrigger.CANDLE}),
+            sync=exchange_changed,
+            pnl=exchange_changed or bool(triggers & {UpdateTrigger.PRICE, UpdateTrigger.PNL}),
+        )
 
-            # Execute state-specific actions
-            await self._execute_state_actions()
+    async def _refresh_indicators(self) -> None:
+        """Update price (REST fallback), MACD/EMA and handle MACD state changes."""
+        # Get current price - prefer WebSocket (real-time) over REST API (polling)
+        if not self._is_ws_price_fresh():
+            # WebSocket price is stale or not available, fetch from REST API
+            self._current_price = await self.client.get_price(self.symbol)
+        # else: _current_price is already up-to-date from WebSocket callback
+
+        await self._follow_strategy_timeframe()
+        store = self._kline_store
+        if store is not None and store.interval == self.strategy.timeframe and store.is_ready:
+            # Streaming klines: zero-copy views, MACD only advances on candle close
+            klines = store.klines()
+            macd_values = self.strategy.update_macd(klines)
+            new_state = self.strategy.evaluate_state(macd_values)
+            self._ema_filter.update(klines)
+        else:
+            macd_values, new_state = await self._update_indicators_from_rest()
+
+        if macd_values:
+            self._last_macd_line = macd_values.macd_line
+            self._last_histogram = macd_values.histogram
+
+        # Update MACD filter with current state
+        self._macd_filter.set_current_state(new_state)
+
+        # Log EMA direction changes
+        current_direction = self._ema_filter.direction
+        if (
+            self._previous_ema_direction is not None
+            and current_direction != self._previous_ema_direction
+        ):
+            ema_value = (
+                f"{self._ema_filter.current_ema:.2f}"
+                if self._ema_filter.current_ema is not None
+                else "N/A"
+            )
+            main_logger.info(
+                f"EMA direction changed: {self._previous_ema_direction.value} → "
+                f"{current_direction.value} (EMA={ema_value})"
+            )
+        self._previous_ema_direction = current_direction
 
-            # Sync with exchange
-            await self._sync_with_exchange()
+        # Handle state change
+        if new_state != self._current_state:
+            await self._handle_state_change(new_state)
+            self._current_state = new_state
 
-            # Broadcast P&L updates for open positions (throttled to 5s by loop interval)
-            await self._broadcast_pnl_updates()
+    async def _run_cycle(
+        self, *, refresh_indicators: bool, grid: bool, sync: bool, pnl: bool
+    ) -> None:
+        """Run the selected update phases, in order, with shared error handling."""
+        if not self._running:
+            return
+
+        try:
+            if refresh_indicators:
+                with PHASE_SECONDS.labels("refresh_indicators").time():
+                    await self._refresh_indicators()
+
+            if grid:
+                # Execute state-specific actions
+                self._last_grid_price = self._current_price
+                with PHASE_SECONDS.labels("grid").time():
+                    await self._execute_state_actions()
+
+            if sync:
+                # Sync with exchange
+                with PHASE_SECONDS.labels("sync").time():
+                    await self._sync_with_exchange()
+
+            if pnl:
+                # Broadcast P&L updates for open positions
+                self._last_pnl_broadcast = time.monotonic()
+                with PHASE_SECONDS.labels("pnl").time():
+                    await self._broadcast_pnl_updates()
 
         except Exception as e:
             main_logger.error(f"Erro no update: {e}", exc_info=True)
+            CYCLE_ERRORS.inc()
             # Log ERROR_OCCURRED event for main loop errors
             self._log_activity_event(
                 EventType.ERROR_OCCURRED,
@@ -1455,15 +1678,15 @@ class GridManager:
             else:
                 return  # Still paused
 
-        # Check rate limiting
-        if time.time() < self._rate_limited_until:
-            return  # Still rate limited
+        # Check rate limiting and the pause after consecutive errors
+        if time.time() < max(self._rate_limited_until, self._error_pause_until):
+            return  # Still paused
 
         # Refresh grid calculator with latest config from database
         await self._refresh_grid_calculator()
 
         # Get existing orders from exchange
-        exchange_orders = await self.client.get_open_orders(self.symbol)
+        exchange_orders = await self._get_open_orders()
 
         # BE-008: Count filled orders awaiting TP for dynamic slot calculation
         # Note: We count TP orders, not positions, because BingX consolidates
@@ -1483,22 +1706,11 @@ class GridManager:
             exchange_orders,
             filled_orders_count,
         )
-        for order in drift_orders:
-            try:
-                order_price = float(order.get("price", 0))
-                order_id = str(order["orderId"])
-                await self.client.cancel_order(self.symbol, order_id)
-
-                # Log drift cancellation
-                orders_logger.info(
-                    f"Ordem cancelada (grid drift): ${order_price:,.2f} - ID: {order_id}"
-                )
-            except Exception as e:
-                orders_logger.error(f"Erro ao cancelar ordem (drift): {e}")
+        await self._cancel_orders(drift_orders, "grid drift")
 
         # Refresh orders after drift cancellations
         if drift_orders:
-            exchange_orders = await self.client.get_open_orders(self.symbol)
+            exchange_orders = await self._get_open_orders()
 
         # STEP 1: Cancel orders outside range FIRST
         # This frees up slots for new orders in the same cycle
@@ -1507,23 +1719,12 @@ class GridManager:
             exchange_orders,
             filled_orders_count,  # BE-008: pass filled orders (TP count)
         )
-        for order in orders_to_cancel:
-            try:
-                order_price = float(order.get("price", 0))
-                order_id = str(order["orderId"])
-                await self.client.cancel_order(self.symbol, order_id)
-
-                # Log cancellation
-                orders_logger.info(
-                    f"Ordem cancelada (fora do range): ${order_price:,.2f} - ID: {order_id}"
-                )
-            except Exception as e:
-                orders_logger.error(f"Erro ao cancelar ordem: {e}")
+        await self._cancel_orders(orders_to_cancel, "fora do range")
 
         # STEP 2: Refresh orders after cancellations
         # This ensures get_levels_to_create() sees the freed-up slots
         if orders_to_cancel:
-            exchange_orders = await self.client.get_open_orders(self.symbol)
+            exchange_orders = await self._get_open_orders()
 
         # STEP 3: Calculate levels to create (now with freed-up slots)
         # BE-008: Pass filled_orders_count to limit new orders
@@ -1566,63 +1767,117 @@ class GridManager:
                 "Nenhum filtro ativo - criando ordens apenas com base no preço e MAX_TOTAL_ORDERS"
             )
 
-        # STEP 4: Create orders (with rate limiting)
-        for level in levels[:10]:  # Max 10 orders per cycle
-            try:
-                await self._create_order(level)
+        # STEP 4: Create orders with the batch endpoint (Max 10 orders per cycle)
+        strategy = await self._get_active_strategy()
+        batch = [
+            (level, spec)
+            for level in levels[:10]
+            if (spec := self._order_spec(level, strategy)) is not None
+        ]
+        if not batch:
+            return
+
+        results = await self.client.create_orders_batch(
+            batch[0][1]["symbol"],
+            [
+                BingXClient.limit_order_with_tp_spec(
+                    side="BUY",
+                    position_side="BOTH",  # One-way mode
+                    price=spec["price"],
+                    quantity=spec["quantity"],
+                    tp_price=spec["tp_price"],
+                )
+                for _, spec in batch
+            ],
+        )
+        self._handle_batch_results(batch, results)
+
+    def _handle_batch_results(
+        self,
+        batch: list[tuple[GridLevel, dict[str, Any]]],
+        results: list[dict[str, Any]],
+    ) -> None:
+        """
+        Track created orders, then pause order creation if failures call for it.
+
+        Every successful order is live on the exchange, so all of them are
+        tracked before any failure is looked at (a margin error early in the
+        batch must not hide the orders placed after it).
+
+        Args:
+            batch: (level, spec) pairs sent in the batch request
+            results: Per-order results from create_orders_batch, in batch order
+        """
+        for (level, spec), result in zip(batch, results, strict=True):
+            if result["success"]:
+                self._track_created_order(level, spec, result)
+
+        for result in results:
+            if result["success"]:
                 self._consecutive_errors = 0  # Reset on success
-                await asyncio.sleep(0.1)  # Rate limiting
-            except Exception as e:
-                error_msg = str(e)
-                self._consecutive_errors += 1
-
-                # Handle specific errors
-                if "Insufficient margin" in error_msg:
-                    self._margin_error = True
-                    self._margin_error_time = time.time()
-                    main_logger.warning(
-                        "Margem insuficiente - pausando criação de ordens por 5 min"
-                    )
-                    # Log ERROR_OCCURRED event for margin error
-                    self._log_activity_event(
-                        EventType.ERROR_OCCURRED,
-                        "Insufficient margin - pausing order creation",
-                        {
-                            "error_type": "MARGIN_ERROR",
-                            "pause_duration_seconds": 300,
-                            "current_price": self._current_price,
-                            "error_message": error_msg[:200],
-                        },
-                    )
-                    break
-                elif "over 20 error" in error_msg or "rate limit" in error_msg.lower():
-                    # Rate limited - backoff for 8 minutes
-                    self._rate_limited_until = time.time() + 480
-                    main_logger.warning("Rate limit atingido - pausando por 8 min")
-                    # Log ERROR_OCCURRED event for rate limit
-                    self._log_activity_event(
-                        EventType.ERROR_OCCURRED,
-                        "Rate limit reached - pausing for 8 minutes",
-                        {
-                            "error_type": "RATE_LIMIT",
-                            "pause_duration_seconds": 480,
-                            "error_message": error_msg[:200],
-                        },
-                    )
-                    break
-                elif self._consecutive_errors >= 3:
-                    # Too many consecutive errors - pause briefly
-                    main_logger.warning(f"3 erros consecutivos - pausando brevemente: {e}")
-                    await asyncio.sleep(5)
-                    break
+                continue
+
+            e = result.get("exception") or Exception(result["error"])
+            error_msg = str(e)
+            self._consecutive_errors += 1
+
+            # Handle specific errors
+            if "Insufficient margin" in error_msg:
+                self._margin_error = True
+                self._margin_error_time = time.time()
+                main_logger.warning("Margem insuficiente - pausando criação de ordens por 5 min")
+                # Log ERROR_OCCURRED event for margin error
+                self._log_activity_event(
+                    EventType.ERROR_OCCURRED,
+                    "Insufficient margin - pausing order creation",
+                    {
+                        "error_type": "MARGIN_ERROR",
+                        "pause_duration_seconds": 300,
+                        "current_price": self._current_price,
+                        "error_message": error_msg[:200],
+                    },
+                )
+                return
+            if isinstance(e, RateLimitError):
+                # Still rate limited after the client's retries - skip order
+                # creation until the endpoint group's cool-down has passed
+                self._rate_limited_until = time.time() + e.retry_after
+                main_logger.warning(
+                    f"Rate limit atingido - pausando criação por {e.retry_after:.0f}s"
+                )
+                # Log ERROR_OCCURRED event for rate limit
+                self._log_activity_event(
+                    EventType.ERROR_OCCURRED,
+                    f"Rate limit reached - pausing order creation for {e.retry_after:.0f}s",
+                    {
+                        "error_type": "RATE_LIMIT",
+                        "pause_duration_seconds": e.retry_after,
+                        "error_message": error_msg[:200],
+                    },
+                )
+                return
 
-                orders_logger.error(f"Erro ao criar ordem: {e}")
+            orders_logger.error(f"Erro ao criar ordem: {e}")
 
-    async def _create_order(self, level: GridLevel) -> None:
-        """Create a single grid order."""
-        # Fetch active strategy from DB (or fallback to env vars)
-        strategy = await self._get_active_strategy()
+        if self._consecutive_errors >= 3:
+            # Too many consecutive errors - skip order creation briefly
+            self._error_pause_until = time.time() + 5
+            main_logger.warning(
+                f"{self._consecutive_errors} erros consecutivos - pausando criação por 5s"
+            )
+
+    def _order_spec(self, level: GridLevel, strategy: Any) -> dict[str, Any] | None:
+        """
+        Build symbol, price and quantity for a grid order.
+
+        Args:
+            level: Grid level to place
+            strategy: Active strategy from DB (None to use env vars)
 
+        Returns:
+            Dict with symbol, price, quantity and tp_price, or None if the
+            quantity is below the exchange minimum
+        """
         if strategy:
             order_size = float(strategy.order_size_usdt)
             symbol = strategy.symbol
@@ -1639,15 +1894,30 @@ class GridManager:
         # BingX minimum order: 0.0001 BTC
         if quantity_btc < 0.0001:
             orders_logger.warning(f"Quantidade muito pequena: {quantity_btc} BTC. Mínimo: 0.0001")
+            return None
+
+        return {
+            "symbol": symbol,
+            "price": level.entry_price,
+            "quantity": quantity_btc,
+            "tp_price": level.tp_price,
+        }
+
+    async def _create_order(self, level: GridLevel) -> None:
+        """Create a single grid order."""
+        # Fetch active strategy from DB (or fallback to env vars)
+        strategy = await self._get_active_strategy()
+        spec = self._order_spec(level, strategy)
+        if spec is None:
             return
 
         result = await self.client.create_limit_order_with_tp(
-            symbol=symbol,
+            symbol=spec["symbol"],
             side="BUY",
             position_side="BOTH",  # One-way mode
-            price=level.entry_price,
-            quantity=quantity_btc,
-            tp_price=level.tp_price,
+            price=spec["price"],
+            quantity=spec["quantity"],
+            tp_price=spec["tp_price"],
         )
 
         # Validate result is a dict before accessing .get()
@@ -1658,6 +1928,14 @@ class GridManager:
             )
             raise ValueError(f"API returned non-dict response: {type(result).__name__}")
 
+        self._track_created_order(level, spec, result)
+
+    def _track_created_order(
+        self, level: GridLevel, spec: dict[str, Any], result: dict[str, Any]
+    ) -> None:
+        """Track a created order locally, mirror it in the order book and notify."""
+        symbol = spec["symbol"]
+        quantity_btc = spec["quantity"]
         order_id = str(
             result.get(
                 "entry_order_id",
@@ -1675,6 +1953,19 @@ class GridManager:
                 exchange_tp_order_id=tp_order_id,
             )
 
+            # Reflect the new order locally until its WebSocket event arrives
+            self._order_book.add_order(
+                {
+                    "orderId": order_id,
+                    "symbol": symbol,
+                    "side": "BUY",
+                    "type": "LIMIT",
+                    "price": level.entry_price,
+                    "origQty": quantity_btc,
+                    "status": "NEW",
+                }
+            )
+
             # Broadcast order creation to dashboard
             self._broadcast_order_update(tracked_order)
 
@@ -1684,6 +1975,36 @@ class GridManager:
             # Log order creation
             orders_logger.info(f"Ordem criada: {level}")
 
+    async def _cancel_orders(self, orders: list[dict], reason: str) -> int:
+        """
+        Cancel orders with the batch endpoint.
+
+        Args:
+            orders: Open orders (exchange format) to cancel
+            reason: Reason for cancellation (for logging)
+
+        Returns:
+            Number of orders cancelled
+        """
+
+        if not orders:
+            return 0
+
+        prices = {str(o["orderId"]): float(o.get("price", 0)) for o in orders}
+        results = await self.client.cancel_orders_batch(self.symbol, list(prices))
+        cancelled = 0
+        for result in results:
+            order_id = result["orderId"]
+            if result["success"]:
+                self._order_book.discard(order_id)
+                orders_logger.info(
+                    f"Ordem cancelada ({reason}): ${prices[order_id]:,.2f} - ID: {order_id}"
+                )
+                cancelled += 1
+            else:
+                orders_logger.error(f"Erro ao cancelar ordem ({reason}): {result['error']}")
+        return cancelled
+
     async def _cancel_all_limit_orders(self, reason: str = "filter change") -> None:
         """
         Cancel all pending LIMIT orders (preserves TPs).
@@ -1692,20 +2013,13 @@ class GridManager:
             reason: Reason for cancellation (for logging)
         """
         try:
-            open_orders = await self.client.get_open_orders(self.symbol)
-            cancelled = 0
-
-            for open_order in open_orders:
-                order_type = open_order.get("type", "")
-                order_id = str(open_order.get("orderId", ""))
+            open_orders = await self._get_open_orders()
 
-                # Only cancel LIMIT orders, preserve TP/SL
-                if order_type == "LIMIT" and order_id:
-                    try:
-                        await self.client.cancel_order(self.symbol, order_id)
-                        cancelled += 1
-                    except Exception:
-                        pass
+            # Only cancel LIMIT orders, preserve TP/SL
+            limit_orders = [
+                o for o in open_orders if o.get("type", "") == "LIMIT" and o.get("orderId")
+            ]
+            cancelled = await self._cancel_orders(limit_orders, reason)
 
             # Update tracker and broadcast cancellations
             for pending_order in list(self.tracker.pending_orders):
@@ -1725,7 +2039,7 @@ class GridManager:
     async def _sync_with_exchange(self) -> None:
         """Sync local state with exchange."""
         try:
-            exchange_orders = await self.client.get_open_orders(self.symbol)
+            exchange_orders = await self._get_open_orders()
             positions = await self.client.get_positions(self.symbol)
 
             # Get current position amount from exchange
@@ -2116,6 +2430,7 @@ class GridManager:
                     client=self.client,
                     account_id=self._account_id,
                     symbol=self.symbol,
+                    order_book=self._order_book,
                 )
 
                 stats = await reconciliation.reconcile()
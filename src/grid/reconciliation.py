@@ -18,6 +18,7 @@ from typing import Any
 from uuid import UUID
 
 from src.client.bingx_client import BingXClient
+from src.client.order_book import ExchangeOrderBook
 from src.database.engine import get_session
 from src.database.repositories.trade_repository import TradeRepository
 from src.utils.logger import main_logger as logger
@@ -26,17 +27,26 @@ from src.utils.logger import main_logger as logger
 class TradeReconciliation:
     """Reconciles database trades with BingX exchange state."""
 
-    def __init__(self, client: BingXClient, account_id: UUID, symbol: str = "BTC-USDT"):
+    def __init__(
+        self,
+        client: BingXClient,
+        account_id: UUID,
+        symbol: str = "BTC-USDT",
+        order_book: ExchangeOrderBook | None = None,
+    ):
         """Initialize reconciliation service.
 
         Args:
             client: BingX API client
             account_id: Account UUID for trade filtering
             symbol: Trading symbol (default: BTC-USDT)
+            order_book: Local open-orders mirror; when given, open orders are
+                read from it instead of REST
         """
         self.client = client
         self.account_id = account_id
         self.symbol = symbol
+        self.order_book = order_book
 
     async def reconcile(self) -> dict:
         """Run full reconciliation between database and BingX.
@@ -53,7 +63,10 @@ class TradeReconciliation:
 
         try:
             # Get BingX state
-            open_orders = await self.client.get_open_orders(self.symbol)
+            if self.order_book is not None:
+                open_orders = await self.order_book.get_open_orders()
+            else:
+                open_orders = await self.client.get_open_orders(self.symbol)
             tp_orders = {
                 str(o.get("orderId")): o
                 for o in open_orders
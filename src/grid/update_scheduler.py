@@ -0,0 +1,162 @@
+"""Event-driven update scheduler for GridManager.
+
+Instead of running the full update cycle on a fixed interval, producers
+(price ticks, account WebSocket order/position events, candle closes) call
+``notify()`` with an ``UpdateTrigger``. Triggers are coalesced: a burst of
+events arriving within ``debounce`` seconds, or while the handler is still
+running, results in a single handler call with the union of triggers.
+
+A slow safety-net ``POLL`` trigger fires every ``poll_interval`` seconds
+(regardless of other activity), covering lost WebSocket events and stale
+streams.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any
+
+from src.utils.logger import main_logger
+
+
+class UpdateTrigger(str, Enum):
+    """Source of a scheduled update."""
+
+    PRICE = "price"  # Price moved enough to reposition the grid
+    ORDER = "order"  # Order filled/cancelled on the exchange
+    POSITION = "position"  # Position changed on the exchange
+    CANDLE = "candle"  # Candle closed (MACD/EMA re-evaluation)
+    PNL = "pnl"  # Open-position P&L due for a dashboard refresh
+    POLL = "poll"  # Safety-net full cycle
+
+
+UpdateHandler = Callable[[frozenset[UpdateTrigger]], Awaitable[None]]
+
+
+class UpdateScheduler:
+    """
+    Coalesce update triggers and run a handler for each batch.
+
+    Example:
+        scheduler = UpdateScheduler(grid_manager.run_triggers, poll_interval=30)
+        scheduler.start()
+        scheduler.notify(UpdateTrigger.PRICE)  # from any callback on the loop
+        await scheduler.stop()
+    """
+
+    def __init__(
+        self,
+        handler: UpdateHandler,
+        poll_interval: float = 30.0,
+        debounce: float = 0.05,
+    ):
+        """
+        Initialize the scheduler (not started).
+
+        Args:
+            handler: Coroutine called with the set of pending triggers
+            poll_interval: Seconds between safety-net POLL triggers
+            debounce: Seconds to wait after the first trigger to coalesce bursts
+        """
+        self._handler = handler
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+
+        self._pending: set[UpdateTrigger] = set()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+        self._last_poll = 0.0
+
+        self._stats: dict[str, Any] = {
+            "runs": 0,
+            "errors": 0,
+            "coalesced": 0,
+            "last_latency_ms": 0.0,
+            "max_latency_ms": 0.0,
+            "triggers": {trigger.value: 0 for trigger in UpdateTrigger},
+        }
+        self._first_pending_at = 0.0
+
+    @property
+    def is_running(self) -> bool:
+        """True while the scheduler task is alive."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Run/trigger counters and trigger-to-run latency."""
+        return {
+            **self._stats,
+            "triggers": dict(self._stats["triggers"]),
+            "pending": sorted(trigger.value for trigger in self._pending),
+        }
+
+    def notify(self, trigger: UpdateTrigger) -> None:
+        """
+        Request an update (non-blocking, safe to call from sync callbacks).
+
+        Args:
+            trigger: What changed
+        """
+        self._stats["triggers"][trigger.value] += 1
+        if self._pending:
+            self._stats["coalesced"] += 1
+        else:
+            self._first_pending_at = time.monotonic()
+        self._pending.add(trigger)
+        self._wakeup.set()
+
+    def start(self) -> None:
+        """Start the scheduler task (requires a running event loop)."""
+        if self.is_running:
+            return
+        self._last_poll = time.monotonic()
+        self._task = asyncio.create_task(self._run())
+        main_logger.info(
+            f"Update scheduler started (poll every {self.poll_interval:.0f}s, "
+            f"debounce {self.debounce * 1000:.0f}ms)"
+        )
+
+    async def stop(self) -> None:
+        """Stop the scheduler task, waiting for a running handler to be cancelled."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            timeout = max(0.0, self._last_poll + self.poll_interval - time.monotonic())
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=timeout)
+            except TimeoutError:
+                self.notify(UpdateTrigger.POLL)
+
+            if self.debounce > 0:
+                await asyncio.sleep(self.debounce)
+
+            triggers = frozenset(self._pending)
+            self._pending.clear()
+            self._wakeup.clear()
+            if not triggers:
+                continue
+
+            latency_ms = (time.monotonic() - self._first_pending_at) * 1000
+            self._stats["last_latency_ms"] = round(latency_ms, 2)
+            self._stats["max_latency_ms"] = max(self._stats["max_latency_ms"], latency_ms)
+            self._stats["runs"] += 1
+            if UpdateTrigger.POLL in triggers:
+                self._last_poll = time.monotonic()
+
+            try:
+                await self._handler(triggers)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._stats["errors"] += 1
+                main_logger.error(f"Erro no update agendado ({sorted(triggers)}): {e}")
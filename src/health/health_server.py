@@ -21,9 +21,14 @@ from uuid import UUID
 
 from aiohttp import web
 
+from src.client.http_pool import get_http_pool_stats
+from src.client.time_sync import server_clock
+from src.database.engine import get_pool_stats
 from src.filters.macd_filter import MACDFilter
 from src.filters.registry import FilterRegistry
 from src.utils.logger import main_logger
+from src.utils.metrics import CONTENT_TYPE, MetricFamily, metrics
+from src.utils.response_cache import analytics_cache
 
 if TYPE_CHECKING:
     from src.client.bingx_client import BingXClient
@@ -42,6 +47,7 @@ class HealthServer:
 
     Provides:
     - GET /health - Full health status with component checks
+    - GET /metrics - Prometheus metrics (hot-path timings and component stats)
     - Status codes:
         - 200: All components healthy
         - 503: One or more components unhealthy
@@ -126,6 +132,7 @@ class HealthServer:
 
         self._app = web.Application()
         self._app.router.add_get("/health", self._handle_health)
+        self._app.router.add_get("/metrics", self._handle_metrics)
         self._app.router.add_get("/filters", self._handle_get_filters)
         self._app.router.add_post("/filters/{filter_name}", self._handle_toggle_filter)
         self._app.router.add_post("/filters/disable-all", self._handle_disable_all)
@@ -173,6 +180,7 @@ class HealthServer:
         self._site = web.TCPSite(self._runner, "0.0.0.0", self.port)
         await self._site.start()
 
+        metrics.register_collector(self._collect_metrics)
         self._running = True
         main_logger.info(f"Health server started on port {self.port}")
 
@@ -184,6 +192,7 @@ class HealthServer:
         if self._runner:
             await self._runner.cleanup()
 
+        metrics.unregister_collector(self._collect_metrics)
         self._running = False
         main_logger.info("Health server stopped")
 
@@ -231,6 +240,100 @@ class HealthServer:
                 status=503,
             )
 
+    async def _handle_metrics(self, request: web.Request) -> web.Response:
+        """Handle GET /metrics request (Prometheus text exposition format)."""
+        return web.Response(body=metrics.render().encode(), headers={"Content-Type": CONTENT_TYPE})
+
+    def _collect_metrics(self) -> list[MetricFamily]:
+        """
+        Export component stats as metrics (runs only when /metrics is scraped).
+
+        Returns:
+            Metric families for caches, connection pools, the server clock,
+            WebSocket state and the grid
+        """
+        families = []
+
+        # BingX request cache (counters are kept per key kind, e.g. "klines")
+        bingx_cache = MetricFamily(
+            "bingx_cache_requests_total",
+            "counter",
+            "BingX request cache lookups by result",
+        )
+        if self._bingx_client:
+            for kind, counters in sorted(self._bingx_client.cache_stats().items()):
+                for result, count in counters.items():
+                    bingx_cache.add(count, kind=kind, result=result)
+        families.append(bingx_cache)
+
+        cache = analytics_cache.stats()
+        analytics = MetricFamily(
+            "analytics_cache_requests_total", "counter", "Analytics response cache lookups"
+        )
+        analytics.add(cache["hits"], result="hit")
+        analytics.add(cache["misses"], result="miss")
+        evictions = MetricFamily(
+            "analytics_cache_evictions_total", "counter", "Analytics cache LRU evictions"
+        )
+        evictions.add(cache["evictions"])
+        entries = MetricFamily("analytics_cache_entries", "gauge", "Analytics cache entries")
+        entries.add(cache["entries"])
+        size = MetricFamily("analytics_cache_bytes", "gauge", "Analytics cache estimated size")
+        size.add(cache["bytes"])
+        families += [analytics, evictions, entries, size]
+
+        pool = get_pool_stats()
+        if pool.get("initialized"):
+            connections = MetricFamily(
+                "db_pool_connections", "gauge", "Shared database pool connections by state"
+            )
+            if "size" in pool:
+                connections.add(pool["checked_out"], state="checked_out")
+                connections.add(pool["checked_in"], state="checked_in")
+                connections.add(pool["overflow"], state="overflow")
+            families.append(connections)
+
+        http = get_http_pool_stats()
+        if http.get("initialized"):
+            http_requests = MetricFamily(
+                "bingx_http_requests_total", "counter", "Requests on the shared BingX HTTP client"
+            )
+            http_requests.add(http["requests"])
+            opened = MetricFamily(
+                "bingx_http_connections_opened_total", "counter", "New BingX HTTP connections"
+            )
+            opened.add(http["connections_opened"])
+            families += [http_requests, opened]
+
+        clock = server_clock.stats()
+        offset = MetricFamily(
+            "bingx_clock_offset_ms", "gauge", "BingX server time minus local time"
+        )
+        offset.add(clock["offset_ms"] if clock["synced"] else None)
+        rtt = MetricFamily("bingx_clock_rtt_ms", "gauge", "Round trip of the last clock sync")
+        rtt.add(clock["rtt_ms"])
+        families += [offset, rtt]
+
+        if self._account_ws:
+            connected = MetricFamily(
+                "websocket_connected", "gauge", "Account WebSocket connection state"
+            )
+            connected.add(int(self._account_ws.is_connected), stream="account")
+            families.append(connected)
+
+        if self._grid_manager:
+            try:
+                status = self._grid_manager.get_status()
+            except Exception as e:
+                main_logger.warning(f"Error getting grid status: {e}")
+            else:
+                orders = MetricFamily("grid_orders", "gauge", "Grid orders by state")
+                orders.add(status.pending_orders, state="pending")
+                orders.add(status.open_positions, state="open_position")
+                families.append(orders)
+
+        return families
+
     async def _get_health_status(self) -> dict[str, Any]:
         """
         Get comprehensive health status.
@@ -253,6 +356,15 @@ class HealthServer:
         # WebSocket is not critical for health - bot can work with polling
         # So we don't set overall_healthy = False here
 
+        # Check database connection pool (non-critical, informational)
+        components["database"] = self._check_database_pool()
+
+        # Check BingX HTTP connection pool (non-critical, informational)
+        components["http_pool"] = self._check_http_pool()
+
+        # Check server clock offset used for signed timestamps (non-critical)
+        components["clock"] = self._check_clock()
+
         # Get grid status
         grid_status = self._get_grid_status()
 
@@ -323,6 +435,71 @@ class HealthServer:
             "connected": is_connected,
         }
 
+    def _check_database_pool(self) -> dict[str, Any]:
+        """
+        Check shared database connection pool usage.
+
+        Returns:
+            Dict with pool status and metrics (checked-out, overflow, wait time)
+        """
+        stats = get_pool_stats()
+        if not stats.get("initialized"):
+            return {
+                "status": "unknown",
+                "message": "Database engine not initialized",
+            }
+
+        # Pool is saturated when every overflow slot is in use
+        exhausted = "max_overflow" in stats and stats["overflow"] >= stats["max_overflow"]
+
+        return {
+            "status": "degraded" if exhausted else "healthy",
+            "pool": stats,
+        }
+
+    def _check_http_pool(self) -> dict[str, Any]:
+        """
+        Check shared BingX HTTP connection pool usage.
+
+        Returns:
+            Dict with pool status and connection reuse metrics
+        """
+        stats = get_http_pool_stats()
+        if not stats.get("initialized"):
+            return {
+                "status": "unknown",
+                "message": "HTTP client not initialized",
+            }
+
+        return {
+            "status": "healthy",
+            "pool": stats,
+        }
+
+    def _check_clock(self) -> dict[str, Any]:
+        """
+        Check synchronization with the BingX server clock.
+
+        Returns:
+            Dict with status, measured skew (server minus local time) and RTT
+        """
+        stats = server_clock.stats()
+        if not stats["synced"]:
+            return {
+                "status": "unknown",
+                "message": "Server time not synchronized yet",
+                "failures": stats["failures"],
+            }
+
+        return {
+            "status": "healthy",
+            "skew_ms": stats["offset_ms"],
+            "rtt_ms": stats["rtt_ms"],
+            "last_sync_age_s": stats["last_sync_age_s"],
+            "syncs": stats["syncs"],
+            "failures": stats["failures"],
+        }
+
     def _get_grid_status(self) -> dict[str, Any]:
         """
         Get current grid trading status.
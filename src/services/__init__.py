@@ -1,5 +1,6 @@
 """Business logic services."""
 
 from .account_service import AccountService
+from .activity_event_sink import ActivityEventSink, OverflowPolicy
 
-__all__ = ["AccountService"]
+__all__ = ["AccountService", "ActivityEventSink", "OverflowPolicy"]
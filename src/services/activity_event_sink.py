@@ -0,0 +1,270 @@
+"""Write-behind sink for activity events.
+
+Buffers activity events in a bounded in-memory queue and persists them in
+batches with a single multi-row INSERT, instead of opening a session and
+inserting one row per event.
+"""
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+from src.database.engine import get_session
+from src.database.models.activity_event import EventType
+from src.database.repositories.activity_event_repository import ActivityEventRepository
+from src.utils.logger import main_logger
+
+# Persists a batch of event dicts and returns the number written
+EventWriter = Callable[[list[dict[str, Any]]], Awaitable[int]]
+
+
+class OverflowPolicy(str, Enum):
+    """What to do when the queue is full."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event
+    BLOCK = "block"  # Make put() wait for a flush (enqueue() rejects the new event)
+
+
+@dataclass
+class ActivityEventSinkStats:
+    """Counters for the activity event sink."""
+
+    queued: int = 0  # Events accepted into the queue
+    flushed: int = 0  # Events written to the database
+    dropped: int = 0  # Events discarded due to a full queue
+    failed: int = 0  # Events lost because a batch write failed
+    batches: int = 0  # Successful batch writes
+
+
+async def _write_with_session(events: list[dict[str, Any]]) -> int:
+    """Persist a batch of events using a session from the shared engine."""
+    async for session in get_session():
+        repo = ActivityEventRepository(session)
+        return await repo.create_events_bulk(events)
+    return 0
+
+
+class ActivityEventSink:
+    """Batched, write-behind sink for activity events.
+
+    Producers call enqueue() (sync, never blocks) or put() (async, honours
+    the BLOCK policy). A background task flushes the queue whenever it
+    reaches batch_size events or flush_interval seconds elapse, and stop()
+    flushes whatever is left.
+    """
+
+    def __init__(
+        self,
+        writer: EventWriter | None = None,
+        max_queue_size: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 1.0,
+        overflow_policy: OverflowPolicy = OverflowPolicy.DROP_OLDEST,
+    ):
+        """Initialize the sink.
+
+        Args:
+            writer: Coroutine that persists a batch of events. Defaults to
+                ActivityEventRepository.create_events_bulk on a new session.
+            max_queue_size: Maximum number of events held in memory.
+            batch_size: Flush as soon as this many events are queued (also the
+                maximum rows per INSERT).
+            flush_interval: Maximum seconds an event waits before being flushed.
+            overflow_policy: Backpressure policy when the queue is full.
+        """
+        if max_queue_size < 1 or batch_size < 1:
+            raise ValueError("max_queue_size and batch_size must be positive")
+
+        self._writer = writer or _write_with_session
+        self._max_queue_size = max_queue_size
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._overflow_policy = OverflowPolicy(overflow_policy)
+
+        self._queue: deque[dict[str, Any]] = deque()
+        self._stats = ActivityEventSinkStats()
+        self._flush_requested = asyncio.Event()
+        self._space_available = asyncio.Event()
+        self._flush_lock = asyncio.Lock()
+        self._running = False
+        self._task: asyncio.Task | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the background flush task is running."""
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """Number of events waiting to be flushed."""
+        return len(self._queue)
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Sink counters plus current queue depth."""
+        return {
+            **asdict(self._stats),
+            "pending": len(self._queue),
+            "max_queue_size": self._max_queue_size,
+            "overflow_policy": self._overflow_policy.value,
+        }
+
+    async def start(self) -> None:
+        """Start the background flush task."""
+        if self._running:
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._flush_loop())
+        main_logger.info(
+            f"Activity event sink started (batch={self._batch_size}, "
+            f"interval={self._flush_interval}s, max_queue={self._max_queue_size})"
+        )
+
+    async def stop(self) -> None:
+        """Stop the flush task and write any remaining events."""
+        self._running = False
+        if self._task:
+            self._flush_requested.set()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        await self.flush()
+        main_logger.info(f"Activity event sink stopped: {self.stats}")
+
+    def enqueue(
+        self,
+        account_id: UUID,
+        event_type: EventType | str,
+        description: str,
+        event_data: dict | None = None,
+        timestamp: datetime | None = None,
+    ) -> bool:
+        """Queue an event without blocking.
+
+        When the queue is full, DROP_OLDEST evicts the oldest event; BLOCK
+        rejects the new one (sync callers cannot wait).
+
+        Args:
+            account_id: Account UUID.
+            event_type: Type of event (EventType enum or string).
+            description: Human-readable description of the event.
+            event_data: Optional additional event data as dictionary.
+            timestamp: Event timestamp (defaults to now).
+
+        Returns:
+            True if the event was queued, False if it was rejected.
+        """
+        if len(self._queue) >= self._max_queue_size:
+            self._stats.dropped += 1
+            if self._overflow_policy == OverflowPolicy.BLOCK:
+                main_logger.warning(f"Activity event queue full, dropping {event_type}")
+                return False
+            self._queue.popleft()
+
+        self._append(account_id, event_type, description, event_data, timestamp)
+        return True
+
+    async def put(
+        self,
+        account_id: UUID,
+        event_type: EventType | str,
+        description: str,
+        event_data: dict | None = None,
+        timestamp: datetime | None = None,
+    ) -> None:
+        """Queue an event, waiting for space under the BLOCK policy.
+
+        Args:
+            account_id: Account UUID.
+            event_type: Type of event (EventType enum or string).
+            description: Human-readable description of the event.
+            event_data: Optional additional event data as dictionary.
+            timestamp: Event timestamp (defaults to now).
+        """
+        if self._overflow_policy == OverflowPolicy.BLOCK:
+            # Capture the event time before waiting for space
+            timestamp = timestamp or datetime.now(UTC)
+            while len(self._queue) >= self._max_queue_size:
+                self._space_available.clear()
+                self._flush_requested.set()
+                if not self._running:
+                    await self.flush()
+                    continue
+                await self._space_available.wait()
+
+        self.enqueue(account_id, event_type, description, event_data, timestamp)
+
+    async def flush(self) -> int:
+        """Write all queued events in batches of at most batch_size.
+
+        Write failures are logged and counted; they never raise.
+
+        Returns:
+            Number of events written.
+        """
+        written = 0
+        async with self._flush_lock:
+            while self._queue:
+                batch = [
+                    self._queue.popleft() for _ in range(min(self._batch_size, len(self._queue)))
+                ]
+                self._space_available.set()
+
+                try:
+                    await self._writer(batch)
+                    written += len(batch)
+                    self._stats.flushed += len(batch)
+                    self._stats.batches += 1
+                except Exception as e:
+                    self._stats.failed += len(batch)
+                    main_logger.warning(f"Failed to flush {len(batch)} activity events: {e}")
+
+        if written:
+            main_logger.debug(f"Activity events flushed: {written}")
+        return written
+
+    def _append(
+        self,
+        account_id: UUID,
+        event_type: EventType | str,
+        description: str,
+        event_data: dict | None,
+        timestamp: datetime | None,
+    ) -> None:
+        """Append an event and wake the flusher once a batch is ready."""
+        self._queue.append(
+            {
+                "account_id": account_id,
+                "event_type": event_type,
+                "description": description,
+                "event_data": event_data,
+                "timestamp": timestamp or datetime.now(UTC),
+            }
+        )
+        self._stats.queued += 1
+
+        if len(self._queue) >= self._batch_size:
+            self._flush_requested.set()
+
+    async def _flush_loop(self) -> None:
+        """Flush on size threshold or every flush_interval seconds."""
+        while self._running:
+            try:
+                await asyncio.wait_for(self._flush_requested.wait(), timeout=self._flush_interval)
+            except TimeoutError:
+                pass
+            self._flush_requested.clear()
+
+            try:
+                await self.flush()
+            except Exception as e:
+                main_logger.error(f"Activity event sink flush loop error: {e}")
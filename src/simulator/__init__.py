@@ -0,0 +1,19 @@
+"""
+Local BingX exchange simulator.
+
+Serves the REST and WebSocket APIs the bot uses from an in-process matching
+engine, with configurable latency, rate limits and error injection, for
+end-to-end tests and offline load runs.
+"""
+
+from src.simulator.exchange import ExchangeError, ExchangeOrder, FakeExchange, candle_ticks
+from src.simulator.server import BingXSimulator, SimulatorConfig
+
+__all__ = [
+    "BingXSimulator",
+    "ExchangeError",
+    "ExchangeOrder",
+    "FakeExchange",
+    "SimulatorConfig",
+    "candle_ticks",
+]
@@ -0,0 +1,567 @@
+"""
+Matching engine and account state of the BingX simulator.
+
+``FakeExchange`` holds one symbol's price, candles, open orders, the netted
+position (one-way mode), the USDT balance and the income history. Prices are
+driven from outside (``set_price``); every tick matches the open orders and
+emits the same ``ORDER_TRADE_UPDATE`` / ``ACCOUNT_UPDATE`` events BingX
+pushes on the account stream. Orders and positions are returned in the shape
+of the REST endpoints ``BingXClient`` reads.
+
+Matching rules:
+- LIMIT orders fill at their price when the market reaches it (at the market
+  price if marketable when placed); MARKET orders fill immediately.
+- TAKE_PROFIT / STOP orders trigger on their stopPrice and fill at the
+  market; they only reduce the position and expire when it is flat.
+- A LIMIT order with an embedded ``takeProfit`` places that TP order for the
+  filled quantity right after the fill, like BingX.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+
+from src.client.kline_store import INTERVAL_MS
+from src.client.klines import Klines
+
+# Order types that trigger on stopPrice and reduce the position
+_TAKE_PROFIT_TYPES = frozenset({"TAKE_PROFIT_MARKET", "TAKE_PROFIT"})
+_STOP_TYPES = frozenset({"STOP_MARKET", "STOP"})
+_TRIGGER_TYPES = _TAKE_PROFIT_TYPES | _STOP_TYPES
+
+
+class ExchangeError(Exception):
+    """Order rejected by the simulated exchange (code and message as BingX returns them)."""
+
+    def __init__(self, code: int, msg: str):
+        super().__init__(msg)
+        self.code = code
+        self.msg = msg
+
+
+def _num(value: float) -> str:
+    """Format a number like BingX does in REST payloads (plain decimal string)."""
+    return f"{value:.8f}".rstrip("0").rstrip(".") or "0"
+
+
+@dataclass
+class ExchangeOrder:
+    """An order on the simulated exchange."""
+
+    order_id: str
+    symbol: str
+    side: str  # BUY / SELL
+    position_side: str  # BOTH / LONG / SHORT
+    type: str
+    quantity: float
+    price: float = 0.0
+    stop_price: float = 0.0
+    client_order_id: str = ""
+    take_profit: dict[str, Any] | None = None
+    status: str = "NEW"
+    executed_qty: float = 0.0
+    avg_price: float = 0.0
+    time: int = 0
+    update_time: int = 0
+
+    @property
+    def reduce_only(self) -> bool:
+        return self.type in _TRIGGER_TYPES
+
+    def triggered(self, price: float) -> bool:
+        """Whether the order executes at this market price."""
+        buy = self.side == "BUY"
+        if self.type == "MARKET":
+            return True
+        if self.type == "LIMIT":
+            return price <= self.price if buy else price >= self.price
+        if self.type in _TAKE_PROFIT_TYPES:
+            return price <= self.stop_price if buy else price >= self.stop_price
+        # Stops
+        return price >= self.stop_price if buy else price <= self.stop_price
+
+    def to_rest(self) -> dict[str, Any]:
+        """Order as returned by openOrders / order create."""
+        return {
+            "symbol": self.symbol,
+            "orderId": self.order_id,
+            "side": self.side,
+            "positionSide": self.position_side,
+            "type": self.type,
+            "origQty": _num(self.quantity),
+            "price": _num(self.price),
+            "executedQty": _num(self.executed_qty),
+            "avgPrice": _num(self.avg_price),
+            "stopPrice": _num(self.stop_price),
+            "status": self.status,
+            "clientOrderId": self.client_order_id,
+            "time": self.time,
+            "updateTime": self.update_time,
+            "workingType": "MARK_PRICE",
+        }
+
+    def to_event(self, execution: str) -> dict[str, Any]:
+        """The "o" object of an ORDER_TRADE_UPDATE event."""
+        return {
+            "s": self.symbol,
+            "c": self.client_order_id,
+            "i": self.order_id,
+            "S": self.side,
+            "o": self.type,
+            "q": _num(self.quantity),
+            "p": _num(self.price),
+            "sp": _num(self.stop_price),
+            "ap": _num(self.avg_price),
+            "x": execution,
+            "X": self.status,
+            "z": _num(self.executed_qty),
+            "ps": self.position_side,
+            "T": self.update_time,
+            "N": "USDT",
+        }
+
+
+@dataclass
+class _Candle:
+    open_time: int
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+
+
+@dataclass
+class FakeExchange:
+    """
+    One-symbol BingX perpetual futures exchange.
+
+    Args:
+        symbol: Traded symbol
+        price: Initial price
+        balance: Initial USDT wallet balance
+        maker_fee: Fee rate of LIMIT fills
+        taker_fee: Fee rate of MARKET / triggered fills
+        funding_rate: Rate reported by premiumIndex (funding is not charged)
+        clock: Time source in seconds (time.time by default)
+    """
+
+    symbol: str = "BTC-USDT"
+    price: float = 100_000.0
+    balance: float = 10_000.0
+    maker_fee: float = 0.0002
+    taker_fee: float = 0.0005
+    funding_rate: float = 0.0001
+    candle_ms: int = 60_000  # Interval of the stored candles
+    clock: Callable[[], float] = time.time
+
+    leverage: int = 10
+    margin_type: str = "CROSSED"
+    position_amt: float = 0.0  # Signed: > 0 long, < 0 short
+    entry_price: float = 0.0
+    realized_pnl: float = 0.0
+    orders: dict[str, ExchangeOrder] = field(default_factory=dict)
+    income: list[dict[str, Any]] = field(default_factory=list)
+    listeners: list[Callable[[dict[str, Any]], None]] = field(default_factory=list)
+    stats: dict[str, int] = field(
+        default_factory=lambda: {"orders": 0, "fills": 0, "cancels": 0, "ticks": 0}
+    )
+
+    def __post_init__(self) -> None:
+        self._ids = itertools.count(1_900_000_000_000_000_001)
+        self._candles: list[_Candle] = []
+        self._history: Klines | None = None  # Candles before the first tick (seed_klines)
+
+    def now_ms(self) -> int:
+        return int(self.clock() * 1000)
+
+    # ------------------------------------------------------------------
+    # Market
+    # ------------------------------------------------------------------
+
+    def seed_klines(self, klines: Klines) -> None:
+        """
+        Load historical candles, shifted so the last one closes now.
+
+        Gives indicators their warm-up history; live ticks then extend it.
+        """
+        if not len(klines):
+            return
+        if len(klines) > 1:
+            self.candle_ms = int(np.median(np.diff(klines.timestamp)))
+        current = self.now_ms() // self.candle_ms * self.candle_ms
+        shift = current - self.candle_ms - int(klines.timestamp[-1])
+        self._history = Klines(
+            klines.timestamp + shift,
+            klines.open,
+            klines.high,
+            klines.low,
+            klines.close,
+            klines.volume,
+        )
+        self._candles = []
+        self.price = float(klines.close[-1])
+
+    def set_price(self, price: float, volume: float = 0.0) -> None:
+        """Move the market: update the forming candle and match open orders."""
+        self.price = price
+        self.stats["ticks"] += 1
+
+        open_time = self.now_ms() // self.candle_ms * self.candle_ms
+        candle = self._candles[-1] if self._candles else None
+        if candle is None or candle.open_time < open_time:
+            self._candles.append(_Candle(open_time, price, price, price, price, volume))
+        else:
+            candle.high = max(candle.high, price)
+            candle.low = min(candle.low, price)
+            candle.close = price
+            candle.volume += volume
+
+        self._match()
+
+    def klines(self, interval: str, limit: int = 500) -> list[dict[str, Any]]:
+        """Candles of an interval as the klines endpoint returns them (oldest first)."""
+        target_ms = INTERVAL_MS.get(interval)
+        if target_ms is None:
+            raise ExchangeError(109400, f"interval {interval} not supported")
+
+        parts = [self._history] if self._history is not None else []
+        if self._candles:
+            parts.append(
+                Klines(
+                    *(
+                        np.array([getattr(c, name) for c in self._candles])
+                        for name in ("open_time", "open", "high", "low", "close", "volume")
+                    )
+                )
+            )
+        if not parts:
+            return []
+        timestamp = np.concatenate([k.timestamp for k in parts])
+        high = np.concatenate([k.high for k in parts])
+        low = np.concatenate([k.low for k in parts])
+        volume = np.concatenate([k.volume for k in parts])
+        opens = np.concatenate([k.open for k in parts])
+        closes = np.concatenate([k.close for k in parts])
+
+        buckets = timestamp // target_ms
+        starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])[-limit:]
+        ends = np.r_[starts[1:], len(timestamp)] - 1
+        first = starts[0]
+        offsets = starts - first
+        return [
+            {
+                "open": _num(o),
+                "close": _num(c),
+                "high": _num(h),
+                "low": _num(lo),
+                "volume": _num(v),
+                "time": int(t),
+            }
+            for t, o, h, lo, c, v in zip(
+                buckets[starts] * target_ms,
+                opens[starts],
+                np.maximum.reduceat(high[first:], offsets),
+                np.minimum.reduceat(low[first:], offsets),
+                closes[ends],
+                np.add.reduceat(volume[first:], offsets),
+                strict=True,
+            )
+        ]
+
+    # ------------------------------------------------------------------
+    # Orders
+    # ------------------------------------------------------------------
+
+    def place_order(self, params: dict[str, Any]) -> ExchangeOrder:
+        """
+        Place an order from BingX order parameters (as BingXClient sends them).
+
+        Raises:
+            ExchangeError: Invalid parameters
+        """
+        if params.get("symbol") != self.symbol:
+            raise ExchangeError(109400, f"symbol {params.get('symbol')} not supported")
+        try:
+            order_type = str(params["type"])
+            quantity = float(params["quantity"])
+            side = str(params["side"])
+        except (KeyError, ValueError) as e:
+            raise ExchangeError(109400, f"invalid order parameters: {e}") from None
+        if quantity <= 0 or side not in ("BUY", "SELL"):
+            raise ExchangeError(109400, "invalid quantity or side")
+        if order_type == "LIMIT" and float(params.get("price") or 0) <= 0:
+            raise ExchangeError(109400, "price is required for LIMIT orders")
+        if order_type in _TRIGGER_TYPES and float(params.get("stopPrice") or 0) <= 0:
+            raise ExchangeError(109400, "stopPrice is required")
+
+        take_profit = params.get("takeProfit")
+        if isinstance(take_profit, str):
+            take_profit = json.loads(take_profit)
+
+        now = self.now_ms()
+        order = ExchangeOrder(
+            order_id=str(next(self._ids)),
+            symbol=self.symbol,
+            side=side,
+            position_side=str(params.get("positionSide") or "BOTH"),
+            type=order_type,
+            quantity=quantity,
+            price=float(params.get("price") or 0),
+            stop_price=float(params.get("stopPrice") or 0),
+            client_order_id=str(params.get("clientOrderID") or params.get("clientOrderId") or ""),
+            take_profit=take_profit,
+            time=now,
+            update_time=now,
+        )
+        self.orders[order.order_id] = order
+        self.stats["orders"] += 1
+        self._emit_order(order, "NEW")
+
+        # Marketable orders execute right away, at the market price
+        if order.triggered(self.price):
+            self._fill(order, self.price, maker=False)
+        return order
+
+    def cancel_order(self, order_id: str) -> ExchangeOrder:
+        """
+        Cancel an open order.
+
+        Raises:
+            ExchangeError: Unknown or no longer open order
+        """
+        order = self.orders.pop(str(order_id), None)
+        if order is None:
+            raise ExchangeError(80018, f"order {order_id} not exist")
+        order.status = "CANCELED"
+        order.update_time = self.now_ms()
+        self.stats["cancels"] += 1
+        self._emit_order(order, "CANCELED")
+        return order
+
+    def cancel_all(self) -> list[ExchangeOrder]:
+        """Cancel every open order."""
+        return [self.cancel_order(order_id) for order_id in list(self.orders)]
+
+    def open_orders(self) -> list[dict[str, Any]]:
+        return [order.to_rest() for order in self.orders.values()]
+
+    # ------------------------------------------------------------------
+    # Account
+    # ------------------------------------------------------------------
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return (self.price - self.entry_price) * self.position_amt
+
+    def positions(self) -> list[dict[str, Any]]:
+        """Open positions as the positions endpoint returns them."""
+        if not self.position_amt:
+            return []
+        return [
+            {
+                "symbol": self.symbol,
+                "positionId": "1",
+                "positionSide": "LONG" if self.position_amt > 0 else "SHORT",
+                "isolated": self.margin_type == "ISOLATED",
+                "marginType": self.margin_type,
+                "positionAmt": _num(abs(self.position_amt)),
+                "availableAmt": _num(abs(self.position_amt)),
+                "avgPrice": _num(self.entry_price),
+                "markPrice": _num(self.price),
+                "unrealizedProfit": _num(self.unrealized_pnl),
+                "realisedProfit": _num(self.realized_pnl),
+                "leverage": self.leverage,
+                "onlyOnePosition": True,
+            }
+        ]
+
+    def balance_info(self) -> dict[str, Any]:
+        """Account balance as the balance endpoint returns it."""
+        used = abs(self.position_amt) * self.entry_price / self.leverage
+        equity = self.balance + self.unrealized_pnl
+        return {
+            "balance": {
+                "asset": "USDT",
+                "balance": _num(self.balance),
+                "equity": _num(equity),
+                "unrealizedProfit": _num(self.unrealized_pnl),
+                "realisedProfit": _num(self.realized_pnl),
+                "availableMargin": _num(equity - used),
+                "usedMargin": _num(used),
+                "freezedMargin": "0",
+            }
+        }
+
+    def income_history(
+        self,
+        income_type: str | None = None,
+        start_time: int | None = None,
+        end_time: int | None = None,
+        limit: int = 100,
+    ) -> list[dict[str, Any]]:
+        records = [
+            r
+            for r in self.income
+            if (income_type is None or r["incomeType"] == income_type)
+            and (start_time is None or r["time"] >= start_time)
+            and (end_time is None or r["time"] <= end_time)
+        ]
+        return records[-limit:]
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def _match(self) -> None:
+        for order in [o for o in self.orders.values() if o.triggered(self.price)]:
+            if order.order_id not in self.orders:
+                continue  # Expired by an earlier fill in this tick
+            if order.type == "LIMIT":
+                self._fill(order, order.price, maker=True)
+            else:
+                self._fill(order, self.price, maker=False)
+
+    def _fill(self, order: ExchangeOrder, price: float, maker: bool) -> None:
+        quantity = order.quantity
+        if order.reduce_only:
+            closing = -1 if order.side == "BUY" else 1  # Direction of the position it closes
+            quantity = min(quantity, max(0.0, self.position_amt * closing))
+            if quantity <= 0:
+                self._expire(order)
+                return
+
+        now = self.now_ms()
+        self.orders.pop(order.order_id, None)
+        order.status = "FILLED"
+        order.executed_qty = quantity
+        order.avg_price = price
+        order.update_time = now
+        self.stats["fills"] += 1
+
+        fee = price * quantity * (self.maker_fee if maker else self.taker_fee)
+        pnl = self._apply_fill(quantity if order.side == "BUY" else -quantity, price)
+        self.balance += pnl - fee
+        self.realized_pnl += pnl
+        self._record_income("COMMISSION", -fee, now, order)
+        if pnl:
+            self._record_income("REALIZED_PNL", pnl, now, order)
+
+        self._emit_order(order, "TRADE")
+        self._emit_account(now)
+
+        if order.take_profit:
+            self._place_attached_tp(order, quantity)
+        if not self.position_amt:
+            for stale in [o for o in self.orders.values() if o.reduce_only]:
+                self._expire(stale)
+
+    def _apply_fill(self, delta: float, price: float) -> float:
+        """Net a fill into the position; returns the realized P&L."""
+        amt = self.position_amt
+        if amt == 0 or (amt > 0) == (delta > 0):
+            total = abs(amt) + abs(delta)
+            self.entry_price = (abs(amt) * self.entry_price + abs(delta) * price) / total
+            self.position_amt = amt + delta
+            return 0.0
+
+        closed = min(abs(delta), abs(amt))
+        pnl = (price - self.entry_price) * closed * (1 if amt > 0 else -1)
+        self.position_amt = amt + delta
+        if abs(self.position_amt) < 1e-12:
+            self.position_amt = 0.0
+            self.entry_price = 0.0
+        elif (self.position_amt > 0) != (amt > 0):
+            self.entry_price = price  # Flipped: the remainder opened at this price
+        return pnl
+
+    def _place_attached_tp(self, entry: ExchangeOrder, quantity: float) -> None:
+        spec = entry.take_profit or {}
+        stop_price = float(spec.get("stopPrice") or spec.get("price") or 0)
+        if stop_price <= 0:
+            return
+        self.place_order(
+            {
+                "symbol": entry.symbol,
+                "side": "SELL" if entry.side == "BUY" else "BUY",
+                "positionSide": entry.position_side,
+                "type": spec.get("type", "TAKE_PROFIT_MARKET"),
+                "quantity": quantity,
+                "stopPrice": stop_price,
+            }
+        )
+
+    def _expire(self, order: ExchangeOrder) -> None:
+        self.orders.pop(order.order_id, None)
+        order.status = "EXPIRED"
+        order.update_time = self.now_ms()
+        self._emit_order(order, "EXPIRED")
+
+    def _record_income(
+        self, income_type: str, amount: float, time_ms: int, order: ExchangeOrder
+    ) -> None:
+        self.income.append(
+            {
+                "symbol": self.symbol,
+                "incomeType": income_type,
+                "income": _num(amount),
+                "asset": "USDT",
+                "info": order.order_id,
+                "time": time_ms,
+                "tranId": str(len(self.income) + 1),
+                "tradeId": order.order_id,
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Events
+    # ------------------------------------------------------------------
+
+    def _emit(self, event: dict[str, Any]) -> None:
+        for listener in list(self.listeners):
+            listener(event)
+
+    def _emit_order(self, order: ExchangeOrder, execution: str) -> None:
+        self._emit(
+            {"e": "ORDER_TRADE_UPDATE", "E": order.update_time, "o": order.to_event(execution)}
+        )
+
+    def _emit_account(self, time_ms: int) -> None:
+        self._emit(
+            {
+                "e": "ACCOUNT_UPDATE",
+                "E": time_ms,
+                "a": {
+                    "m": "ORDER",
+                    "B": [{"a": "USDT", "wb": _num(self.balance), "cw": _num(self.balance)}],
+                    "P": [
+                        {
+                            "s": self.symbol,
+                            "pa": _num(self.position_amt),
+                            "ep": _num(self.entry_price),
+                            "up": _num(self.unrealized_pnl),
+                            "mt": self.margin_type.lower(),
+                            "ps": "LONG" if self.position_amt >= 0 else "SHORT",
+                        }
+                    ],
+                },
+            }
+        )
+
+
+def candle_ticks(klines: Klines) -> Iterator[float]:
+    """
+    Price path through each candle: open, the nearer extreme, the other, close.
+
+    Turns stored OHLC candles into a scripted tick sequence for set_price.
+    """
+    for o, h, lo, c in zip(klines.open, klines.high, klines.low, klines.close, strict=True):
+        first, second = (lo, h) if c >= o else (h, lo)
+        yield from (float(o), float(first), float(second), float(c))
@@ -0,0 +1,587 @@
+"""
+Local BingX simulator: REST and WebSocket endpoints over a FakeExchange.
+
+``BingXSimulator`` serves the endpoints ``BingXClient``, ``BingXWebSocket``
+and ``BingXAccountWebSocket`` use, on a local port, so the real client code
+(signing, retries, rate limiting, WebSocket reconnects) runs unchanged:
+
+    simulator = BingXSimulator(SimulatorConfig(latency_ms=30))
+    await simulator.start()
+    config = BingXConfig(api_key, secret, rest_url=simulator.rest_url,
+                         stream_url=simulator.ws_url)
+
+For the full bot, run scripts/simulator.py and point BINGX_REST_URL and
+BINGX_WS_URL at it.
+
+Faults can be configured or injected at runtime: a fixed latency (plus
+jitter) before every REST response and WebSocket event, per-group request
+rate limits (answered with BingX's rate-limit code), a random error rate,
+scripted errors for an endpoint, rejected timestamps (clock_offset_ms), and
+dropped WebSocket connections.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import hashlib
+import hmac
+import json
+import random
+import time
+import uuid
+from collections import defaultdict, deque
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import parse_qsl
+
+from aiohttp import WSMsgType, web
+from aiohttp.typedefs import Handler
+
+from src.client.rate_limiter import endpoint_group
+from src.simulator.exchange import ExchangeError, FakeExchange
+from src.utils.logger import main_logger
+
+API = "/openApi/swap/v2"
+LISTEN_KEY_ENDPOINT = "/openApi/user/auth/userDataStream"
+
+
+@dataclass
+class SimulatorConfig:
+    """Network behavior and credentials of the simulator."""
+
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 = any free port (see BingXSimulator.port)
+    api_key: str = ""  # Checked against X-BX-APIKEY when set
+    secret_key: str = ""  # Signatures are verified when set
+    latency_ms: float = 0.0  # Added to every REST response and WebSocket event
+    jitter_ms: float = 0.0  # Uniform extra latency in [0, jitter_ms]
+    rate_limits: dict[str, int] = field(default_factory=dict)  # Group -> requests per second
+    error_rate: float = 0.0  # Fraction of requests answered with a server error
+    clock_offset_ms: int = 0  # Server clock minus local clock
+    recv_window_ms: int = 5000  # Accepted timestamp skew of signed requests
+    ping_interval: float = 5.0  # Seconds between WebSocket pings (0 = off)
+    seed: int | None = None  # RNG seed for jitter and random errors
+
+
+@dataclass
+class _ScriptedError:
+    endpoint: str
+    code: int
+    msg: str
+    status: int
+    remaining: int
+
+
+class BingXSimulator:
+    """
+    HTTP + WebSocket server emulating BingX perpetual futures.
+
+    Args:
+        config: Network behavior and credentials
+        exchange: Matching engine (a default FakeExchange if omitted)
+    """
+
+    def __init__(self, config: SimulatorConfig | None = None, exchange: FakeExchange | None = None):
+        self.config = config or SimulatorConfig()
+        self.exchange = exchange or FakeExchange()
+        self.exchange.listeners.append(self._on_account_event)
+
+        self.listen_keys: set[str] = set()
+        self.requests: defaultdict[str, int] = defaultdict(int)  # Endpoint -> count
+        self._random = random.Random(self.config.seed)
+        self._windows: defaultdict[str, deque[float]] = defaultdict(deque)
+        self._errors: list[_ScriptedError] = []
+        self._market_clients: dict[web.WebSocketResponse, set[str]] = {}
+        self._account_clients: dict[web.WebSocketResponse, str] = {}
+        # Outgoing messages per connection: (due loop time, message), sent in order
+        self._outboxes: dict[web.WebSocketResponse, asyncio.Queue[tuple[float, Any]]] = {}
+        self._runner: web.AppRunner | None = None
+        self._site: web.TCPSite | None = None
+        self.app = self._create_app()
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    async def start(self) -> None:
+        """Start serving on config.host/config.port."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self.config.host, self.config.port)
+        await self._site.start()
+        main_logger.info(f"Simulador BingX em {self.rest_url} (WebSocket {self.ws_url})")
+
+    async def stop(self) -> None:
+        """Close WebSocket clients and stop the server."""
+        await self.drop_connections()
+        if self._runner:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> BingXSimulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    @property
+    def port(self) -> int:
+        assert self._runner is not None, "Simulator not started"
+        server = self._runner.addresses[0]
+        return int(server[1])
+
+    @property
+    def rest_url(self) -> str:
+        """Value for BingXConfig.rest_url / BINGX_REST_URL."""
+        return f"http://{self.config.host}:{self.port}"
+
+    @property
+    def ws_url(self) -> str:
+        """Value for BingXConfig.stream_url / BINGX_WS_URL."""
+        return f"ws://{self.config.host}:{self.port}/market"
+
+    # ------------------------------------------------------------------
+    # Scripting
+    # ------------------------------------------------------------------
+
+    def set_price(self, price: float, volume: float = 0.0) -> None:
+        """Move the market and push trade/kline/depth updates to subscribers."""
+        self.exchange.set_price(price, volume)
+        self._publish_market()
+
+    async def play(self, prices: Iterable[float], interval: float = 0.0) -> None:
+        """
+        Replay a scripted price path, one tick every ``interval`` seconds.
+
+        Args:
+            prices: Tick prices (e.g. candle_ticks(klines))
+            interval: Delay between ticks (0 still yields to other tasks)
+        """
+        for price in prices:
+            self.set_price(price)
+            await asyncio.sleep(interval)
+
+    def inject_error(
+        self,
+        endpoint: str,
+        code: int = 100500,
+        msg: str = "Internal system error",
+        status: int = 200,
+        count: int = 1,
+    ) -> None:
+        """
+        Fail the next ``count`` requests to an endpoint.
+
+        Args:
+            endpoint: Path, or a prefix of it (e.g. "/openApi/swap/v2/trade/")
+            code: BingX error code in the JSON body
+            msg: Error message
+            status: HTTP status (non-200 to simulate gateway errors)
+            count: Number of requests to fail
+        """
+        self._errors.append(_ScriptedError(endpoint, code, msg, status, count))
+
+    async def drop_connections(self) -> None:
+        """Close every WebSocket connection (clients are expected to reconnect)."""
+        clients = list(self._market_clients) + list(self._account_clients)
+        for ws in clients:
+            await ws.close()
+
+    async def expire_listen_key(self, listen_key: str) -> None:
+        """Invalidate a listenKey and notify its account streams."""
+        self.listen_keys.discard(listen_key)
+        event = {"e": "listenKeyExpired", "E": self.exchange.now_ms(), "listenKey": listen_key}
+        for ws, key in list(self._account_clients.items()):
+            if key == listen_key:
+                await self._send(ws, event)
+
+    @property
+    def connections(self) -> dict[str, int]:
+        """Open WebSocket connections by kind."""
+        return {"market": len(self._market_clients), "account": len(self._account_clients)}
+
+    # ------------------------------------------------------------------
+    # HTTP plumbing
+    # ------------------------------------------------------------------
+
+    def _create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        routes = [
+            ("GET", f"{API}/server/time", self._server_time),
+            ("GET", f"{API}/quote/price", self._price),
+            ("GET", f"{API}/quote/ticker", self._ticker),
+            ("GET", f"{API}/quote/klines", self._klines),
+            ("GET", f"{API}/quote/premiumIndex", self._premium_index),
+            ("GET", f"{API}/user/balance", self._balance),
+            ("GET", f"{API}/user/positions", self._positions),
+            ("GET", f"{API}/user/income", self._income),
+            ("GET", f"{API}/trade/openOrders", self._open_orders),
+            ("POST", f"{API}/trade/order", self._create_order),
+            ("DELETE", f"{API}/trade/order", self._cancel_order),
+            ("DELETE", f"{API}/trade/allOpenOrders", self._cancel_all),
+            ("POST", f"{API}/trade/batchOrders", self._create_batch),
+            ("DELETE", f"{API}/trade/batchOrders", self._cancel_batch),
+            ("POST", f"{API}/trade/leverage", self._leverage),
+            ("POST", f"{API}/trade/marginType", self._margin_type),
+            ("POST", LISTEN_KEY_ENDPOINT, self._create_listen_key),
+            ("PUT", LISTEN_KEY_ENDPOINT, self._extend_listen_key),
+            ("DELETE", LISTEN_KEY_ENDPOINT, self._delete_listen_key),
+            ("GET", "/market", self._websocket),
+        ]
+        for method, path, handler in routes:
+            app.router.add_route(method, path, handler)
+        return app
+
+    def _latency(self) -> float:
+        """Latency of one response or event, in seconds."""
+        return (self.config.latency_ms + self._random.uniform(0, self.config.jitter_ms)) / 1000
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Handler) -> web.StreamResponse:
+        if request.path == "/market":
+            return await handler(request)
+
+        self.requests[request.path] += 1
+        latency = self._latency()
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+        error = self._check_request(request)
+        if error is not None:
+            return error
+        try:
+            return await handler(request)
+        except ExchangeError as e:
+            return self._error(e.code, e.msg)
+        except (KeyError, ValueError) as e:
+            return self._error(109400, f"Invalid parameters: {e}")
+
+    def _check_request(self, request: web.Request) -> web.Response | None:
+        """Apply scripted errors, rate limits, random errors and request signing."""
+        for scripted in self._errors:
+            if request.path.startswith(scripted.endpoint) and scripted.remaining > 0:
+                scripted.remaining -= 1
+                return self._error(scripted.code, scripted.msg, scripted.status)
+        self._errors = [e for e in self._errors if e.remaining > 0]
+
+        group = endpoint_group(request.method, request.path)
+        limit = self.config.rate_limits.get(group)
+        if limit:
+            now = time.monotonic()
+            window = self._windows[group]
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= limit:
+                return self._error(100410, "rate limit exceeded, please try again later")
+            window.append(now)
+
+        if self.config.error_rate and self._random.random() < self.config.error_rate:
+            return self._error(100500, "Internal system error")
+
+        if "signature" in request.query:
+            return self._check_signature(request)
+        return None
+
+    def _check_signature(self, request: web.Request) -> web.Response | None:
+        if self.config.api_key and request.headers.get("X-BX-APIKEY") != self.config.api_key:
+            return self._error(100413, "Incorrect apiKey")
+
+        pairs = parse_qsl(request.query_string, keep_blank_values=True)
+        params = [(k, v) for k, v in pairs if k != "signature"]
+        if self.config.secret_key:
+            payload = "&".join(f"{k}={v}" for k, v in params)
+            expected = hmac.new(
+                self.config.secret_key.encode(), payload.encode(), hashlib.sha256
+            ).hexdigest()
+            if not hmac.compare_digest(expected, request.query["signature"]):
+                return self._error(100001, "Signature verification failed")
+
+        timestamp = int(dict(params).get("timestamp", 0))
+        if abs(timestamp - self._server_now_ms()) > self.config.recv_window_ms:
+            return self._error(100421, "timestamp is invalid")
+        return None
+
+    def _server_now_ms(self) -> int:
+        return self.exchange.now_ms() + self.config.clock_offset_ms
+
+    @staticmethod
+    def _ok(data: Any) -> web.Response:
+        return web.json_response({"code": 0, "msg": "", "data": data})
+
+    @staticmethod
+    def _error(code: int, msg: str, status: int = 200) -> web.Response:
+        return web.json_response({"code": code, "msg": msg}, status=status)
+
+    def _check_symbol(self, request: web.Request) -> None:
+        symbol = request.query.get("symbol")
+        if symbol and symbol != self.exchange.symbol:
+            raise ExchangeError(109400, f"symbol {symbol} not supported")
+
+    # ------------------------------------------------------------------
+    # Market endpoints
+    # ------------------------------------------------------------------
+
+    async def _server_time(self, request: web.Request) -> web.Response:
+        return self._ok({"serverTime": self._server_now_ms()})
+
+    async def _price(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        exchange = self.exchange
+        return self._ok({"symbol": exchange.symbol, "price": str(exchange.price)})
+
+    async def _ticker(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        candles = self.exchange.klines("1d", limit=1)
+        day = candles[-1] if candles else None
+        price = self.exchange.price
+        open_price = float(day["open"]) if day else price
+        return self._ok(
+            {
+                "symbol": self.exchange.symbol,
+                "lastPrice": str(price),
+                "openPrice": str(open_price),
+                "highPrice": day["high"] if day else str(price),
+                "lowPrice": day["low"] if day else str(price),
+                "volume": day["volume"] if day else "0",
+                "quoteVolume": "0",
+                "priceChange": str(price - open_price),
+                "priceChangePercent": str((price / open_price - 1) * 100 if open_price else 0),
+            }
+        )
+
+    async def _klines(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        interval = request.query.get("interval", "1h")
+        limit = min(int(request.query.get("limit", 500)), 1440)
+        return self._ok(self.exchange.klines(interval, limit))
+
+    async def _premium_index(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        funding_ms = 8 * 3_600_000  # Funding every 8 hours
+        return self._ok(
+            {
+                "symbol": self.exchange.symbol,
+                "markPrice": str(self.exchange.price),
+                "lastFundingRate": str(self.exchange.funding_rate),
+                "nextFundingTime": (self.exchange.now_ms() // funding_ms + 1) * funding_ms,
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Account endpoints
+    # ------------------------------------------------------------------
+
+    async def _balance(self, request: web.Request) -> web.Response:
+        return self._ok(self.exchange.balance_info())
+
+    async def _positions(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        return self._ok(self.exchange.positions())
+
+    async def _income(self, request: web.Request) -> web.Response:
+        query = request.query
+        return self._ok(
+            self.exchange.income_history(
+                income_type=query.get("incomeType"),
+                start_time=int(query["startTime"]) if "startTime" in query else None,
+                end_time=int(query["endTime"]) if "endTime" in query else None,
+                limit=int(query.get("limit", 100)),
+            )
+        )
+
+    async def _leverage(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        self.exchange.leverage = int(request.query["leverage"])
+        return self._ok({"leverage": self.exchange.leverage, "symbol": self.exchange.symbol})
+
+    async def _margin_type(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        if self.exchange.position_amt:
+            raise ExchangeError(80001, "cannot change margin type with open positions")
+        self.exchange.margin_type = request.query["marginType"]
+        return self._ok({})
+
+    # ------------------------------------------------------------------
+    # Trading endpoints
+    # ------------------------------------------------------------------
+
+    async def _open_orders(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        return self._ok({"orders": self.exchange.open_orders()})
+
+    async def _create_order(self, request: web.Request) -> web.Response:
+        order = self.exchange.place_order(dict(request.query))
+        return self._ok({"order": order.to_rest()})
+
+    async def _cancel_order(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        order = self.exchange.cancel_order(request.query["orderId"])
+        return self._ok({"order": order.to_rest()})
+
+    async def _cancel_all(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        cancelled = self.exchange.cancel_all()
+        return self._ok({"success": [o.to_rest() for o in cancelled], "failed": None})
+
+    async def _create_batch(self, request: web.Request) -> web.Response:
+        orders = []
+        for params in json.loads(request.query["batchOrders"]):
+            try:
+                orders.append(self.exchange.place_order(params).to_rest())
+            except ExchangeError as e:
+                client_id = params.get("clientOrderID", "")
+                orders.append({"code": e.code, "msg": e.msg, "clientOrderID": client_id})
+        return self._ok({"orders": orders})
+
+    async def _cancel_batch(self, request: web.Request) -> web.Response:
+        self._check_symbol(request)
+        ids = request.query["orderIdList"].strip("[]").split(",")
+        success, failed = [], []
+        for order_id in (i.strip().strip('"') for i in ids if i.strip()):
+            try:
+                success.append(self.exchange.cancel_order(order_id).to_rest())
+            except ExchangeError as e:
+                failed.append({"orderId": order_id, "errorCode": e.code, "errorMessage": e.msg})
+        return self._ok({"success": success, "failed": failed})
+
+    # ------------------------------------------------------------------
+    # listenKey
+    # ------------------------------------------------------------------
+
+    async def _create_listen_key(self, request: web.Request) -> web.Response:
+        listen_key = uuid.uuid4().hex
+        self.listen_keys.add(listen_key)
+        return web.json_response({"listenKey": listen_key})  # Not wrapped in "data"
+
+    async def _extend_listen_key(self, request: web.Request) -> web.Response:
+        if request.query.get("listenKey") not in self.listen_keys:
+            return self._error(100400, "listenKey not exist", status=404)
+        return web.json_response({})
+
+    async def _delete_listen_key(self, request: web.Request) -> web.Response:
+        self.listen_keys.discard(request.query.get("listenKey", ""))
+        return web.json_response({})
+
+    # ------------------------------------------------------------------
+    # WebSocket
+    # ------------------------------------------------------------------
+
+    async def _websocket(self, request: web.Request) -> web.StreamResponse:
+        listen_key = request.query.get("listenKey")
+        if listen_key is not None and listen_key not in self.listen_keys:
+            raise web.HTTPUnauthorized(text="invalid listenKey")
+
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        outbox: asyncio.Queue[tuple[float, Any]] = asyncio.Queue()
+        self._outboxes[ws] = outbox
+        if listen_key is not None:
+            self._account_clients[ws] = listen_key
+        else:
+            self._market_clients[ws] = set()
+
+        tasks = [asyncio.create_task(self._sender(ws, outbox))]
+        if self.config.ping_interval:
+            tasks.append(asyncio.create_task(self._ping(ws)))
+        try:
+            async for message in ws:
+                if message.type == WSMsgType.TEXT:
+                    await self._on_client_message(ws, json.loads(message.data))
+                elif message.type == WSMsgType.ERROR:
+                    break
+        finally:
+            for task in tasks:
+                task.cancel()
+            self._outboxes.pop(ws, None)
+            self._market_clients.pop(ws, None)
+            self._account_clients.pop(ws, None)
+        return ws
+
+    async def _on_client_message(self, ws: web.WebSocketResponse, data: dict[str, Any]) -> None:
+        subscriptions = self._market_clients.get(ws)
+        if subscriptions is None:
+            return  # Account streams only answer pings
+        request_type = data.get("reqType")
+        data_type = data.get("dataType", "")
+        if request_type == "sub":
+            subscriptions.add(data_type)
+        elif request_type == "unsub":
+            subscriptions.discard(data_type)
+        else:
+            return
+        await self._send(ws, {"id": data.get("id"), "code": 0, "msg": "", "dataType": data_type})
+
+    async def _ping(self, ws: web.WebSocketResponse) -> None:
+        while not ws.closed:
+            await asyncio.sleep(self.config.ping_interval)
+            await self._send(ws, {"ping": uuid.uuid4().hex, "time": self.exchange.now_ms()})
+
+    async def _send(self, ws: web.WebSocketResponse, message: dict[str, Any]) -> None:
+        """Send a GZIP-compressed JSON message, as BingX does."""
+        if ws.closed:
+            return
+        try:
+            await ws.send_bytes(gzip.compress(json.dumps(message).encode()))
+        except ConnectionError:
+            pass
+
+    def _dispatch(self, ws: web.WebSocketResponse, message: dict[str, Any]) -> None:
+        """Queue a message for delivery after the configured latency."""
+        outbox = self._outboxes.get(ws)
+        if outbox is not None:
+            outbox.put_nowait((asyncio.get_running_loop().time() + self._latency(), message))
+
+    async def _sender(
+        self, ws: web.WebSocketResponse, outbox: asyncio.Queue[tuple[float, Any]]
+    ) -> None:
+        """Deliver queued messages in order (jitter delays events but never reorders them)."""
+        loop = asyncio.get_running_loop()
+        while True:
+            due, message = await outbox.get()
+            delay = due - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            await self._send(ws, message)
+
+    def _on_account_event(self, event: dict[str, Any]) -> None:
+        for ws in list(self._account_clients):
+            self._dispatch(ws, event)
+
+    def _publish_market(self) -> None:
+        if not self._market_clients:
+            return
+        exchange = self.exchange
+        symbol = exchange.symbol
+        now = exchange.now_ms()
+        for ws, subscriptions in list(self._market_clients.items()):
+            for data_type in subscriptions:
+                channel_symbol, _, channel = data_type.partition("@")
+                if channel_symbol != symbol:
+                    continue
+                if channel == "trade":
+                    data: Any = {"s": symbol, "p": str(exchange.price), "q": "0", "T": now}
+                elif channel.startswith("kline_"):
+                    candles = exchange.klines(channel.removeprefix("kline_"), limit=1)
+                    data = [
+                        {
+                            "T": c["time"],
+                            "o": c["open"],
+                            "h": c["high"],
+                            "l": c["low"],
+                            "c": c["close"],
+                            "v": c["volume"],
+                        }
+                        for c in candles
+                    ]
+                elif channel == "depth":
+                    tick = exchange.price * 0.0001
+                    data = {
+                        "bids": [[str(exchange.price - tick * i), "1"] for i in range(1, 6)],
+                        "asks": [[str(exchange.price + tick * i), "1"] for i in range(1, 6)],
+                    }
+                else:
+                    continue
+                self._dispatch(ws, {"dataType": data_type, "data": data})
@@ -0,0 +1,125 @@
+"""Incremental MACD indicator state.
+
+Keeps the fast/slow/signal EMAs and a short histogram history so MACD can be
+advanced in O(1) per closed candle instead of recomputing the whole series.
+
+The warm-up follows pandas_ta (non TA-Lib path): each EMA is seeded with the
+SMA of its first ``length`` inputs and then updated with
+``alpha = 2 / (length + 1)``; the signal EMA runs over the MACD line starting
+at its first valid value. Seeding with the same history therefore yields the
+same values as ``pandas_ta.macd``.
+"""
+
+from collections import deque
+from collections.abc import Iterable
+
+
+class _SeededEMA:
+    """EMA seeded with the SMA of its first ``length`` inputs."""
+
+    __slots__ = ("length", "alpha", "value", "_count", "_seed_sum")
+
+    def __init__(self, length: int):
+        self.length = length
+        self.alpha = 2.0 / (length + 1)
+        self.value: float | None = None
+        self._count = 0
+        self._seed_sum = 0.0
+
+    def update(self, x: float) -> float | None:
+        """Feed one input and return the EMA (None during warm-up)."""
+        if self.value is not None:
+            self.value = self.alpha * x + (1.0 - self.alpha) * self.value
+            return self.value
+
+        self._count += 1
+        self._seed_sum += x
+        if self._count == self.length:
+            self.value = self._seed_sum / self.length
+        return self.value
+
+
+class IncrementalMACD:
+    """MACD (fast/slow EMA, signal EMA, histogram) advanced one candle at a time.
+
+    Example:
+        macd = IncrementalMACD(12, 26, 9)
+        macd.seed(closed_closes)
+        macd.update(new_close)
+        if macd.is_ready:
+            print(macd.histogram, macd.prev_histogram)
+    """
+
+    def __init__(self, fast: int, slow: int, signal: int, history: int = 3):
+        """Initialize empty MACD state.
+
+        Args:
+            fast: Fast EMA period.
+            slow: Slow EMA period (swapped with fast if smaller, like pandas_ta).
+            signal: Signal EMA period.
+            history: Number of recent histogram values to keep (minimum 2).
+        """
+        if slow < fast:
+            fast, slow = slow, fast
+        self.fast = fast
+        self.slow = slow
+        self.signal = signal
+        self._history_size = max(2, history)
+        self.reset()
+
+    def reset(self) -> None:
+        """Discard all state."""
+        self._fast_ema = _SeededEMA(self.fast)
+        self._slow_ema = _SeededEMA(self.slow)
+        self._signal_ema = _SeededEMA(self.signal)
+        self.macd_line: float | None = None
+        self.signal_line: float | None = None
+        self.histograms: deque[float] = deque(maxlen=self._history_size)
+        self.count = 0
+
+    @property
+    def min_periods(self) -> int:
+        """Closed candles needed before two histogram values are available."""
+        return self.slow + self.signal
+
+    @property
+    def is_ready(self) -> bool:
+        """True once histogram and previous histogram are available."""
+        return len(self.histograms) >= 2
+
+    @property
+    def histogram(self) -> float | None:
+        """Histogram of the most recent candle."""
+        return self.histograms[-1] if self.histograms else None
+
+    @property
+    def prev_histogram(self) -> float | None:
+        """Histogram of the candle before the most recent one."""
+        return self.histograms[-2] if len(self.histograms) >= 2 else None
+
+    def seed(self, closes: Iterable[float]) -> None:
+        """Reset and warm up from a history of closed-candle closes.
+
+        Args:
+            closes: Close prices of closed candles, oldest first.
+        """
+        self.reset()
+        for close in closes:
+            self.update(float(close))
+
+    def update(self, close: float) -> None:
+        """Advance the state with the close of a newly closed candle.
+
+        Args:
+            close: Close price of the candle.
+        """
+        self.count += 1
+        fast = self._fast_ema.update(close)
+        slow = self._slow_ema.update(close)
+        if fast is None or slow is None:
+            return
+
+        self.macd_line = fast - slow
+        self.signal_line = self._signal_ema.update(self.macd_line)
+        if self.signal_line is not None:
+            self.histograms.append(self.macd_line - self.signal_line)
@@ -11,6 +11,8 @@ import pandas as pd
 import pandas_ta as ta
 
 from config import MACDConfig
+from src.client.klines import Klines
+from src.strategy.incremental_macd import IncrementalMACD
 from src.utils.logger import macd_logger
 
 if TYPE_CHECKING:
@@ -22,6 +24,21 @@ if TYPE_CHECKING:
 warnings.filterwarnings("ignore", category=RuntimeWarning, message="overflow encountered")
 
 
+def _safe_float(value) -> float:
+    """Convert to float with overflow protection."""
+    try:
+        result = float(value)
+        if np.isnan(result) or np.isinf(result):
+            return 0.0
+        # Clamp extreme values
+        if abs(result) > 1e10:
+            macd_logger.warning(f"Extreme MACD value detected: {result}, clamping to 0")
+            return 0.0
+        return result
+    except (ValueError, OverflowError, TypeError):
+        return 0.0
+
+
 class GridState(Enum):
     """Estados do grid baseado no MACD."""
 
@@ -112,6 +129,12 @@ class MACDStrategy:
         self._macd_filter_config_repository = macd_filter_config_repository
         self._db_config_loaded = False
 
+        # Incremental MACD, advanced only when a new candle closes
+        self._macd_state: IncrementalMACD | None = None
+        self._macd_state_key: tuple[int, int, int, str] | None = None
+        self._macd_last_closed: int | None = None  # Open time (ms) of last closed candle
+        self._macd_values: MACDValues | None = None
+
     async def load_config_from_db(self) -> bool:
         """Load MACD filter configuration from database.
 
@@ -221,16 +244,19 @@ class MACDStrategy:
             # No event loop running, skip persistence
             macd_logger.warning("No event loop running, skipping state persistence")
 
-    def calculate_macd(self, klines: pd.DataFrame) -> MACDValues | None:
+    def calculate_macd(self, klines: Klines | pd.DataFrame) -> MACDValues | None:
         """
         Calculate MACD values from kline data.
 
         Args:
-            klines: DataFrame with 'close' column
+            klines: Klines or DataFrame with 'close' column
 
         Returns:
             MACDValues with current indicator values
         """
+        if isinstance(klines, Klines):
+            klines = klines.to_frame()
+
         # Need extra candles because we use iloc[-2] and iloc[-3] (closed candles only)
         min_candles = self.slow + self.signal + 2
         if len(klines) < min_candles:
@@ -276,46 +302,141 @@ class MACDStrategy:
             signal_col = f"MACDs_{self.fast}_{self.slow}_{self.signal}"
             hist_col = f"MACDh_{self.fast}_{self.slow}_{self.signal}"
 
-            # Safely extract values with overflow protection
-            def safe_float(value):
-                """Convert to float with overflow protection."""
-                try:
-                    result = float(value)
-                    if np.isnan(result) or np.isinf(result):
-                        return 0.0
-                    # Clamp extreme values
-                    if abs(result) > 1e10:
-                        macd_logger.warning(f"Extreme MACD value detected: {result}, clamping to 0")
-                        return 0.0
-                    return result
-                except (ValueError, OverflowError):
-                    return 0.0
-
             # Use closed candles only (iloc[-2] and iloc[-3])
             # iloc[-1] is the current candle still in formation - ignore it
             # This prevents false signals during candle formation
             return MACDValues(
-                macd_line=safe_float(macd_df[macd_col].iloc[-2]),
-                signal_line=safe_float(macd_df[signal_col].iloc[-2]),
-                histogram=safe_float(macd_df[hist_col].iloc[-2]),
-                prev_histogram=safe_float(macd_df[hist_col].iloc[-3]),
+                macd_line=_safe_float(macd_df[macd_col].iloc[-2]),
+                signal_line=_safe_float(macd_df[signal_col].iloc[-2]),
+                histogram=_safe_float(macd_df[hist_col].iloc[-2]),
+                prev_histogram=_safe_float(macd_df[hist_col].iloc[-3]),
             )
         except Exception as e:
             macd_logger.error(f"Error calculating MACD: {e}")
             return None
 
-    def get_state(self, klines: pd.DataFrame) -> GridState:
+    def update_macd(self, klines: Klines | pd.DataFrame) -> MACDValues | None:
+        """
+        Get MACD values, advancing the incremental state only on new closed candles.
+
+        The state is seeded once from the closed candles in ``klines`` and then
+        advanced O(1) per newly closed candle; while no candle closes, the
+        cached values are returned without any computation. The state is
+        re-seeded when the MACD parameters/timeframe change or when the new
+        klines do not overlap the last seen candle (gap).
+
+        Falls back to calculate_macd() when a DataFrame has no 'timestamp' column.
+
+        Args:
+            klines: Klines, or DataFrame with 'timestamp' and 'close' columns,
+                oldest first. The last candle is still in formation and is ignored.
+
+        Returns:
+            MACDValues for the last closed candle, or None if not enough data
+        """
+        if isinstance(klines, Klines):
+            return self.update_macd_from_arrays(klines.timestamp, klines.close)
+
+        if "timestamp" not in klines.columns:
+            return self.calculate_macd(klines)
+
+        timestamps = klines["timestamp"].to_numpy()
+        if timestamps.dtype.kind == "M":
+            timestamps = timestamps.astype("datetime64[ms]").astype(np.int64)
+        return self.update_macd_from_arrays(timestamps, klines["close"].to_numpy(dtype=float))
+
+    def update_macd_from_arrays(
+        self, timestamps: np.ndarray, closes: np.ndarray
+    ) -> MACDValues | None:
+        """
+        Incremental MACD from raw arrays (e.g. zero-copy views from a KlineStore).
+
+        Args:
+            timestamps: Candle open times in milliseconds (int64), oldest first.
+            closes: Close prices (float64) aligned with timestamps. The last
+                element is the candle still in formation and is ignored.
+
+        Returns:
+            MACDValues for the last closed candle, or None if not enough data
+        """
+        min_candles = self.slow + self.signal + 2
+        if len(closes) < min_candles:
+            macd_logger.warning(
+                f"Not enough data for MACD calculation. Need {min_candles}, got {len(closes)}"
+            )
+            return None
+
+        # Last element is the current candle still in formation - ignore it
+        closed_ts = timestamps[:-1]
+        closed = closes[:-1]
+        last_closed = int(closed_ts[-1])
+        key = (self.fast, self.slow, self.signal, self.timeframe)
+        state = self._macd_state if key == self._macd_state_key else None
+
+        if state is not None and last_closed == self._macd_last_closed:
+            return self._macd_values
+
+        # Advance with only the new candles if the window still overlaps the last one seen
+        new_closes: np.ndarray | None = None
+        if state is not None and (closed_ts == self._macd_last_closed).any():
+            new_closes = closed[closed_ts > self._macd_last_closed]
+
+        values = closed if new_closes is None else new_closes
+        if np.isnan(values).any():
+            macd_logger.warning("Klines contain null values, skipping MACD calculation")
+            return None
+        if values.max() > 1e10 or values.min() < 0:
+            macd_logger.warning(
+                f"Extreme close prices detected (min: {values.min()}, max: {values.max()}), "
+                "skipping"
+            )
+            return None
+
+        if state is None or new_closes is None:
+            state = IncrementalMACD(self.fast, self.slow, self.signal)
+            state.seed(values)
+            self._macd_state = state
+            self._macd_state_key = key
+            macd_logger.debug(f"MACD state seeded from {len(values)} closed candles")
+        else:
+            for close in new_closes:
+                state.update(float(close))
+
+        self._macd_last_closed = last_closed
+        self._macd_values = (
+            MACDValues(
+                macd_line=_safe_float(state.macd_line),
+                signal_line=_safe_float(state.signal_line),
+                histogram=_safe_float(state.histogram),
+                prev_histogram=_safe_float(state.prev_histogram),
+            )
+            if state.is_ready
+            else None
+        )
+        return self._macd_values
+
+    def get_state(self, klines: Klines | pd.DataFrame) -> GridState:
         """
         Determine grid state based on MACD values.
 
         Args:
-            klines: DataFrame with OHLCV data
+            klines: Klines or DataFrame with OHLCV data
 
         Returns:
             GridState indicating what action the grid should take
         """
-        macd = self.calculate_macd(klines)
+        return self.evaluate_state(self.update_macd(klines))
+
+    def evaluate_state(self, macd: MACDValues | None) -> GridState:
+        """
+        Determine grid state from already computed MACD values.
 
+        Args:
+            macd: MACD values for the last closed candle (None means not enough data)
+
+        Returns:
+            GridState indicating what action the grid should take
+        """
         if macd is None:
             return GridState.WAIT
 
@@ -0,0 +1,334 @@
+"""In-process metrics with Prometheus text exposition.
+
+Counters, gauges and histograms live in the process-wide ``metrics`` registry
+and are served by the health server at ``GET /metrics``. Recording a sample is
+a dict lookup plus an addition (a bisect into fixed buckets for histograms):
+no locks, threads or I/O, and nothing is formatted until the endpoint is
+scraped. Components that already keep their own counters (caches, connection
+pools, the server clock) are exported by collectors, which only run at scrape
+time.
+
+Example:
+    REQUEST_SECONDS = metrics.histogram(
+        "bingx_request_duration_seconds", "BingX REST latency", ("endpoint", "status")
+    )
+    REQUEST_SECONDS.labels("/openApi/swap/v2/quote/price", "200").observe(0.042)
+
+    with PHASE_SECONDS.labels("sync").time():
+        await sync()
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.utils.logger import main_logger
+
+# Latency buckets (seconds): sub-millisecond handlers up to slow REST calls
+DEFAULT_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class CounterValue:
+    """Monotonic counter for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+
+class GaugeValue:
+    """Gauge for one label set."""
+
+    __slots__ = ("value",)
+
+    def __init__(self) -> None:
+        self.value = 0.0
+
+    def set(self, value: float) -> None:
+        self.value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self.value -= amount
+
+
+class _Timer:
+    """Context manager observing elapsed perf_counter seconds into a histogram."""
+
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: HistogramValue):
+        self._histogram = histogram
+        self._started = 0.0
+
+    def __enter__(self) -> _Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+class HistogramValue:
+    """Bucketed observations for one label set."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # Last slot is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def time(self) -> _Timer:
+        """Observe the duration of a ``with`` block."""
+        return _Timer(self)
+
+
+class _Metric[V: (CounterValue, GaugeValue, HistogramValue)]:
+    """Named metric holding one value per label set."""
+
+    type = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], V] = {}
+
+    def _new_value(self) -> V:
+        raise NotImplementedError
+
+    def labels(self, *values: str) -> V:
+        """
+        Value for a label set (created on first use).
+
+        Hot paths can keep the returned object and record into it directly.
+
+        Raises:
+            ValueError: If the number of values does not match the label names
+        """
+        value = self._values.get(values)
+        if value is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(
+                    f"{self.name} expects labels {self.labelnames}, got {len(values)} values"
+                )
+            value = self._values[values] = self._new_value()
+        return value
+
+    def items(self) -> list[tuple[tuple[str, ...], V]]:
+        return list(self._values.items())
+
+    def clear(self) -> None:
+        self._values.clear()
+
+
+class Counter(_Metric[CounterValue]):
+    type = "counter"
+
+    def _new_value(self) -> CounterValue:
+        return CounterValue()
+
+    def inc(self, amount: float = 1.0) -> None:
+        """Increment the unlabelled counter."""
+        self.labels().inc(amount)
+
+
+class Gauge(_Metric[GaugeValue]):
+    type = "gauge"
+
+    def _new_value(self) -> GaugeValue:
+        return GaugeValue()
+
+    def set(self, value: float) -> None:
+        """Set the unlabelled gauge."""
+        self.labels().set(value)
+
+
+class Histogram(_Metric[HistogramValue]):
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def _new_value(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+    def observe(self, value: float) -> None:
+        """Observe into the unlabelled histogram."""
+        self.labels().observe(value)
+
+
+@dataclass
+class MetricFamily:
+    """Samples produced by a collector at scrape time (counter or gauge)."""
+
+    name: str
+    type: str
+    documentation: str
+    samples: list[tuple[dict[str, str], float]] = field(default_factory=list)
+
+    def add(self, value: float | None, **labels: str) -> None:
+        """Add a sample; None (value not known yet) is skipped."""
+        if value is not None:
+            self.samples.append((labels, float(value)))
+
+
+Collector = Callable[[], Iterable[MetricFamily]]
+
+
+class MetricsRegistry:
+    """Metrics of the process and the collectors exporting component stats."""
+
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric[Any]] = {}
+        self._collectors: list[Collector] = []
+
+    def _get_or_create(self, cls: type[_Metric[Any]], name: str, *args: Any) -> Any:
+        metric = self._metrics.get(name)
+        if metric is None:
+            metric = self._metrics[name] = cls(name, *args)
+        elif type(metric) is not cls:
+            raise ValueError(f"Metric {name} already registered as a {metric.type}")
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        """Get or create a counter (``name`` should end in ``_total``)."""
+        counter: Counter = self._get_or_create(Counter, name, documentation, labelnames)
+        return counter
+
+    def gauge(self, name: str, documentation: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        """Get or create a gauge."""
+        gauge: Gauge = self._get_or_create(Gauge, name, documentation, labelnames)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """Get or create a histogram (``name`` should end in a unit, e.g. ``_seconds``)."""
+        histogram: Histogram = self._get_or_create(
+            Histogram, name, documentation, labelnames, buckets
+        )
+        return histogram
+
+    def register_collector(self, collector: Collector) -> None:
+        """Add a callable run at every scrape (registering it twice is a no-op)."""
+        if collector not in self._collectors:
+            self._collectors.append(collector)
+
+    def unregister_collector(self, collector: Collector) -> None:
+        if collector in self._collectors:
+            self._collectors.remove(collector)
+
+    def render(self) -> str:
+        """All metrics in the Prometheus text exposition format (version 0.0.4)."""
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            _header(lines, metric.name, metric.type, metric.documentation)
+            for values, value in metric.items():
+                labels = dict(zip(metric.labelnames, values, strict=True))
+                if isinstance(value, HistogramValue):
+                    _histogram_lines(lines, metric.name, labels, value)
+                else:
+                    lines.append(f"{metric.name}{_labels(labels)} {_number(value.value)}")
+
+        for collector in list(self._collectors):
+            try:
+                families = list(collector())
+            except Exception as e:
+                main_logger.warning(f"Metrics collector failed: {e}")
+                continue
+            for family in families:
+                _header(lines, family.name, family.type, family.documentation)
+                for labels, sample in family.samples:
+                    lines.append(f"{family.name}{_labels(labels)} {_number(sample)}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _header(lines: list[str], name: str, type_: str, documentation: str) -> None:
+    help_text = documentation.replace("\\", "\\\\").replace("\n", "\\n")
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {type_}")
+
+
+def _histogram_lines(
+    lines: list[str], name: str, labels: dict[str, str], value: HistogramValue
+) -> None:
+    cumulative = 0
+    for bound, count in zip(value.bounds, value.counts, strict=False):
+        cumulative += count
+        lines.append(f"{name}_bucket{_labels({**labels, 'le': _number(bound)})} {cumulative}")
+    lines.append(f"{name}_bucket{_labels({**labels, 'le': '+Inf'})} {value.count}")
+    lines.append(f"{name}_sum{_labels(labels)} {_number(value.sum)}")
+    lines.append(f"{name}_count{_labels(labels)} {value.count}")
+
+
+def _labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items())
+    return "{" + pairs + "}"
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _number(value: float) -> str:
+    if math.isnan(value):
+        return "NaN"
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if value == int(value) and abs(value) < 1e15:
+        return str(int(value))
+    return repr(float(value))
+
+
+# Shared by every instrumented module in the process
+metrics = MetricsRegistry()
@@ -0,0 +1,174 @@
+"""In-process cache for dashboard analytics responses.
+
+Entries are keyed by (route, account_id, request params) and tagged with the
+account's data version. TradeRepository bumps the version after every
+committed trade insert (save_trade), close (update_trade_exit) or TP change
+(update_tp), so a cached response is never served after the trade data behind
+it has changed. TPAdjustmentRepository does not bump it: an adjustment record
+saved after the matching update_tp may be missing from cached responses until
+the next bump or the TTL. The TTL otherwise only bounds staleness of relative
+periods ("today", "7days") whose end is "now".
+
+Example:
+    key = ("trading/stats", account_id, start_date, end_date)
+    stats, status = await analytics_cache.get_or_compute(
+        key, lambda: compute_stats(account_id, start_date, end_date)
+    )
+"""
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+# Cache statuses reported to callers (and in the X-Cache response header)
+HIT = "HIT"
+MISS = "MISS"
+BYPASS = "BYPASS"
+
+
+@dataclass
+class _Entry:
+    value: Any
+    version: int
+    expires_at: float
+    size: int
+
+
+def _estimate_size(value: Any) -> int:
+    """Approximate memory footprint of a cached value, in bytes."""
+    dump = getattr(value, "model_dump_json", None)
+    if dump is not None:
+        return len(dump())
+    return sys.getsizeof(value)
+
+
+class ResponseCache:
+    """TTL + version-invalidated LRU cache.
+
+    Keys are tuples whose second element is the account UUID. The cache is
+    bounded both by entry count and by the approximate size of the cached
+    values; the least recently used entries are evicted first.
+
+    Args:
+        ttl: Seconds an entry stays valid when the account data is unchanged.
+        max_entries: Maximum number of cached responses.
+        max_bytes: Maximum approximate size of all cached responses.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 30.0,
+        max_entries: int = 512,
+        max_bytes: int = 8 * 1024 * 1024,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._versions: dict[UUID, int] = {}
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def version(self, account_id: UUID) -> int:
+        """Current data version of an account."""
+        return self._versions.get(account_id, 0)
+
+    def bump(self, account_id: UUID) -> None:
+        """Invalidate every cached response for an account."""
+        self._versions[account_id] = self.version(account_id) + 1
+
+    def get(self, key: tuple) -> Any | None:
+        """Return a fresh cached value, or None (counted as a miss)."""
+        entry = self._entries.get(key)
+        if entry is not None and (
+            entry.version != self.version(key[1]) or entry.expires_at <= time.monotonic()
+        ):
+            self._remove(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+
+    def set(self, key: tuple, value: Any, version: int) -> None:
+        """Store a value computed while the account was at ``version``.
+
+        A value computed before a concurrent bump is dropped rather than
+        cached under the old version.
+        """
+        if version != self.version(key[1]):
+            return
+        size = _estimate_size(value)
+        if size > self.max_bytes:
+            return
+        self._remove(key)
+        self._entries[key] = _Entry(value, version, time.monotonic() + self.ttl, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+
+    async def get_or_compute(
+        self,
+        key: tuple,
+        compute: Callable[[], Awaitable[Any]],
+        bypass: bool = False,
+    ) -> tuple[Any, str]:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: (route, account_id, *params).
+            compute: Coroutine factory producing the value.
+            bypass: Skip the lookup and do not store the result.
+
+        Returns:
+            Tuple of (value, cache status: HIT, MISS or BYPASS).
+        """
+        if bypass:
+            return await compute(), BYPASS
+        cached = self.get(key)
+        if cached is not None:
+            return cached, HIT
+        version = self.version(key[1])
+        value = await compute()
+        self.set(key, value, version)
+        return value, MISS
+
+    def clear(self) -> None:
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self._bytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        """Hit/miss counters and current size."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+
+# Shared by the analytics routes and the repositories that invalidate them
+analytics_cache = ResponseCache()
+
+
+def invalidate_account(account_id: UUID) -> None:
+    """Bump an account's data version after its trades changed."""
+    analytics_cache.bump(account_id)
@@ -29,7 +29,7 @@ async def test_get_klines(client: BingXClient, symbol: str):
     print("TESTE: get_klines")
     print("=" * 50)
     try:
-        df = await client.get_klines(symbol, interval="1h", limit=10)
+        df = (await client.get_klines(symbol, interval="1h", limit=10)).to_frame()
         print(f"✅ Sucesso! Recebidos {len(df)} candles")
         print("   Últimos 3 candles:")
         print(df[["timestamp", "open", "high", "low", "close"]].tail(3).to_string(index=False))
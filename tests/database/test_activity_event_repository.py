@@ -108,6 +108,49 @@ class TestActivityEventRepository:
         # Assert - compare without timezone (SQLite doesn't preserve timezone)
         assert event.timestamp.replace(tzinfo=None) == custom_time.replace(tzinfo=None)
 
+    @pytest.mark.asyncio
+    async def test_create_events_bulk(
+        self,
+        repository: ActivityEventRepository,
+        account: Account,
+    ):
+        """Test inserting several events with one multi-row INSERT."""
+        # Arrange
+        base_time = datetime(2024, 1, 15, 10, 0, 0, tzinfo=UTC)
+        events = [
+            {
+                "account_id": account.id,
+                "event_type": EventType.ORDER_FILLED,
+                "description": f"Event {i}",
+                "event_data": {"i": i},
+                "timestamp": base_time + timedelta(minutes=i),
+            }
+            for i in range(3)
+        ]
+        events.append(
+            {"account_id": account.id, "event_type": "CUSTOM_EVENT", "description": "No ts"}
+        )
+
+        # Act
+        inserted = await repository.create_events_bulk(events)
+
+        # Assert
+        assert inserted == 4
+        stored = await repository.get_events_by_account(account.id)
+        assert len(stored) == 4
+        assert {e.event_type for e in stored} == {"ORDER_FILLED", "CUSTOM_EVENT"}
+        by_description = {e.description: e for e in stored}
+        assert by_description["Event 2"].event_data == {"i": 2}
+        assert by_description["No ts"].timestamp is not None
+
+    @pytest.mark.asyncio
+    async def test_create_events_bulk_empty(
+        self,
+        repository: ActivityEventRepository,
+    ):
+        """Test that an empty batch is a no-op."""
+        assert await repository.create_events_bulk([]) == 0
+
     @pytest.mark.asyncio
     async def test_get_events_by_account(
         self,
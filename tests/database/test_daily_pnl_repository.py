@@ -0,0 +1,175 @@
+"""Tests for the daily P&L rollup and its maintenance by TradeRepository."""
+
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import Account, DailyPnl, User
+from src.database.repositories import DailyPnlRepository, TradeRepository
+from tests.trade_analytics_fakes import rollup_trades
+
+DAY = datetime(2026, 3, 10, 12, 0, tzinfo=UTC)
+
+
+@pytest.fixture
+async def account(async_session: AsyncSession) -> Account:
+    """Create a test user and account."""
+    user = User(
+        email="rollup@example.com",
+        password_hash="hashed_password",  # pragma: allowlist secret
+        name="Rollup User",
+    )
+    async_session.add(user)
+    await async_session.flush()
+    account = Account(user_id=user.id, exchange="bingx", name="Rollup", is_demo=True)
+    async_session.add(account)
+    await async_session.commit()
+    return account
+
+
+@pytest.fixture
+def trade_repo(async_session: AsyncSession) -> TradeRepository:
+    return TradeRepository(async_session)
+
+
+@pytest.fixture
+def rollup_repo(async_session: AsyncSession) -> DailyPnlRepository:
+    return DailyPnlRepository(async_session)
+
+
+def _trade_data(account, order_id, **overrides):
+    data = {
+        "account_id": account.id,
+        "exchange_order_id": order_id,
+        "symbol": "BTC-USDT",
+        "entry_price": Decimal("50000"),
+        "quantity": Decimal("0.001"),
+        "trading_fee": Decimal("0.02"),
+        "opened_at": DAY - timedelta(hours=1),
+    }
+    data.update(overrides)
+    return data
+
+
+async def _rows(session) -> list[DailyPnl]:
+    result = await session.execute(select(DailyPnl).order_by(DailyPnl.date, DailyPnl.symbol))
+    return list(result.scalars().all())
+
+
+class TestIncrementalRollup:
+    """TradeRepository keeps daily_pnl in step when trades close."""
+
+    @pytest.mark.asyncio
+    async def test_update_trade_exit_rolls_up(self, async_session, trade_repo, account):
+        first = await trade_repo.save_trade(_trade_data(account, "1"))
+        second = await trade_repo.save_trade(_trade_data(account, "2"))
+
+        await trade_repo.update_trade_exit(first, Decimal("50500"), Decimal("5"), closed_at=DAY)
+        await trade_repo.update_trade_exit(
+            second,
+            Decimal("49800"),
+            Decimal("-2"),
+            closed_at=DAY + timedelta(hours=1),
+            funding_fee=Decimal("0.01"),
+        )
+
+        [row] = await _rows(async_session)
+        assert row.date == date(2026, 3, 10)
+        assert row.realized_pnl == Decimal("3")
+        assert row.fees == Decimal("0.05")
+        assert (row.trade_count, row.wins, row.losses) == (2, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_open_trades_are_not_rolled_up(self, async_session, trade_repo, account):
+        await trade_repo.save_trade(_trade_data(account, "1"))
+        assert await _rows(async_session) == []
+
+    @pytest.mark.asyncio
+    async def test_saving_closed_trade_rolls_up(self, async_session, trade_repo, account):
+        await trade_repo.save_trade(
+            _trade_data(account, "1", status="CLOSED", pnl=Decimal("4"), closed_at=DAY)
+        )
+
+        [row] = await _rows(async_session)
+        assert (row.realized_pnl, row.trade_count, row.wins) == (Decimal("4"), 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_reclosing_replaces_contribution(self, async_session, trade_repo, account):
+        """Closing a trade again moves its contribution instead of double counting."""
+        trade_id = await trade_repo.save_trade(_trade_data(account, "1"))
+        await trade_repo.update_trade_exit(trade_id, Decimal("50500"), Decimal("5"), closed_at=DAY)
+
+        next_day = DAY + timedelta(days=1)
+        await trade_repo.update_trade_exit(
+            trade_id, Decimal("49900"), Decimal("-1"), closed_at=next_day
+        )
+
+        old, new = await _rows(async_session)
+        assert (old.trade_count, old.wins, old.realized_pnl) == (0, 0, Decimal("0"))
+        assert (new.date, new.trade_count, new.losses) == (next_day.date(), 1, 1)
+        assert new.realized_pnl == Decimal("-1")
+
+
+class TestReadsAndRebuild:
+    """Period reads and rebuilding from the trades table."""
+
+    @pytest.fixture
+    async def history(self, trade_repo, account):
+        for i in range(9):
+            trade_id = await trade_repo.save_trade(
+                _trade_data(account, str(i), symbol="ETH-USDT" if i % 3 == 0 else "BTC-USDT")
+            )
+            if i != 8:  # Leave one open
+                await trade_repo.update_trade_exit(
+                    trade_id,
+                    Decimal("50000"),
+                    Decimal(i - 3),
+                    closed_at=DAY + timedelta(days=i // 3, hours=i),
+                )
+
+    @pytest.mark.asyncio
+    async def test_get_by_period(self, rollup_repo, account, history):
+        rows = await rollup_repo.get_by_period(account.id, date(2026, 3, 11), date(2026, 3, 12))
+
+        assert {row.date for row in rows} == {date(2026, 3, 11), date(2026, 3, 12)}
+        assert [row.date for row in rows] == sorted(row.date for row in rows)
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_incremental(self, async_session, rollup_repo, account, history):
+        def snapshot(rows):
+            return [
+                (r.symbol, r.date, r.realized_pnl, r.fees, r.trade_count, r.wins, r.losses)
+                for r in rows
+                if r.trade_count
+            ]
+
+        incremental = snapshot(await _rows(async_session))
+        await async_session.execute(DailyPnl.__table__.delete())
+
+        written = await rollup_repo.rebuild(account.id)
+
+        rebuilt = snapshot(await _rows(async_session))
+        assert written == len(rebuilt)
+        assert rebuilt == incremental
+
+    @pytest.mark.asyncio
+    async def test_rebuild_matches_python(self, async_session, trade_repo, rollup_repo, account):
+        await trade_repo.save_trade(
+            _trade_data(account, "1", status="CLOSED", pnl=Decimal("1.5"), closed_at=DAY)
+        )
+        await trade_repo.save_trade(
+            _trade_data(account, "2", status="CLOSED", pnl=Decimal("-0.5"), closed_at=DAY)
+        )
+        await rollup_repo.rebuild()
+
+        trades = await trade_repo.get_trades_by_account(account.id)
+        [expected] = rollup_trades(trades)
+        [row] = await _rows(async_session)
+        assert (row.realized_pnl, row.fees, row.trade_count) == (
+            expected.realized_pnl,
+            expected.fees,
+            expected.trade_count,
+        )
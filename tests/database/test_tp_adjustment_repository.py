@@ -149,6 +149,53 @@ async def test_get_by_trade_nonexistent(async_session):
     assert len(adjustments) == 0
 
 
+@pytest.mark.asyncio
+async def test_get_by_trades(async_session, test_account, test_trade):
+    """Test retrieving adjustments for several trades in one call."""
+    repo = TPAdjustmentRepository(async_session)
+
+    other_trade = Trade(
+        account_id=test_account.id,
+        exchange_order_id="67890",
+        symbol="BTC-USDT",
+        side="LONG",
+        leverage=10,
+        entry_price=Decimal("51000.00"),
+        quantity=Decimal("0.001"),
+        tp_price=Decimal("51500.00"),
+        tp_percent=Decimal("0.5"),
+        status="OPEN",
+    )
+    async_session.add(other_trade)
+    await async_session.commit()
+
+    for trade, percents in ((test_trade, ("0.6", "0.7")), (other_trade, ("0.8",))):
+        for percent in percents:
+            await repo.save_adjustment(
+                trade_id=trade.id,
+                old_tp_price=Decimal("50500.00"),
+                new_tp_price=Decimal("50600.00"),
+                old_tp_percent=Decimal("0.5"),
+                new_tp_percent=Decimal(percent),
+            )
+
+    without_adjustments = uuid4()
+    adjustments = await repo.get_by_trades([test_trade.id, other_trade.id, without_adjustments])
+
+    assert set(adjustments) == {test_trade.id, other_trade.id}
+    # Same grouping and order as get_by_trade
+    assert adjustments[test_trade.id] == await repo.get_by_trade(test_trade.id)
+    assert [a.new_tp_percent for a in adjustments[other_trade.id]] == [Decimal("0.8")]
+
+
+@pytest.mark.asyncio
+async def test_get_by_trades_empty(async_session):
+    """Test bulk retrieval with no trade IDs."""
+    repo = TPAdjustmentRepository(async_session)
+
+    assert await repo.get_by_trades([]) == {}
+
+
 @pytest.mark.asyncio
 async def test_get_recent(async_session, test_trade):
     """Test retrieving recent adjustments."""
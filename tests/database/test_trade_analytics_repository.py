@@ -0,0 +1,164 @@
+"""Tests for TradeAnalyticsRepository."""
+
+from dataclasses import fields
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.database.models import Account, Trade, User
+from src.database.repositories import TradeAnalyticsRepository, TradeRepository
+from src.database.repositories.trade_analytics_repository import TradeSummary
+from tests.trade_analytics_fakes import best_worst_trades, summarize_trades
+
+BASE = datetime(2026, 1, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def account(async_session: AsyncSession) -> Account:
+    """Create a test user and account."""
+    user = User(
+        email="analytics@example.com",
+        password_hash="hashed_password",  # pragma: allowlist secret
+        name="Analytics User",
+    )
+    async_session.add(user)
+    await async_session.flush()
+    account = Account(user_id=user.id, exchange="bingx", name="Analytics", is_demo=True)
+    async_session.add(account)
+    await async_session.commit()
+    return account
+
+
+@pytest.fixture
+async def other_account(async_session: AsyncSession, account: Account) -> Account:
+    """A second account whose trades must never be counted."""
+    other = Account(user_id=account.user_id, exchange="bingx", name="Other", is_demo=True)
+    async_session.add(other)
+    await async_session.commit()
+    return other
+
+
+def _trade(account_id, i, status, pnl, opened_at, closed_at=None):
+    return Trade(
+        account_id=account_id,
+        exchange_order_id=f"ORDER-{account_id.hex[:6]}-{i}",
+        symbol="BTC-USDT",
+        side="LONG",
+        leverage=10,
+        entry_price=Decimal("50000.5") + i * 17,
+        quantity=Decimal("0.001") * (i % 3 + 1),
+        status=status,
+        pnl=pnl,
+        trading_fee=Decimal("0.0215") * (i % 4),
+        funding_fee=Decimal("0.0031") * (i % 2),
+        opened_at=opened_at,
+        closed_at=closed_at,
+    )
+
+
+@pytest.fixture
+async def trades(async_session: AsyncSession, account: Account, other_account: Account):
+    """Mixed history: wins, losses, break-even, open, cancelled and unpriced trades."""
+    rows = []
+    pnls = ["1.23456789", "-0.5", "0", "2.5", "-3.14159265", "0.01", "-0.01", "2.5"]
+    for i, pnl in enumerate(pnls):
+        opened_at = BASE + timedelta(days=i)
+        rows.append(
+            _trade(account.id, i, "CLOSED", Decimal(pnl), opened_at, opened_at + timedelta(hours=2))
+        )
+    rows.append(_trade(account.id, 20, "OPEN", None, BASE + timedelta(days=3)))
+    rows.append(_trade(account.id, 21, "OPEN", None, BASE + timedelta(days=9)))
+    rows.append(_trade(account.id, 22, "CANCELLED", None, BASE + timedelta(days=4)))
+    # Closed without a recorded P&L: counted as closed but not realized
+    rows.append(
+        _trade(account.id, 23, "CLOSED", None, BASE + timedelta(days=5), BASE + timedelta(days=5))
+    )
+    rows.append(
+        _trade(other_account.id, 0, "CLOSED", Decimal("999"), BASE, BASE + timedelta(hours=1))
+    )
+    async_session.add_all(rows)
+    await async_session.commit()
+    return rows
+
+
+def _assert_same(actual: TradeSummary, expected: TradeSummary) -> None:
+    for field in fields(TradeSummary):
+        a, e = getattr(actual, field.name), getattr(expected, field.name)
+        if isinstance(e, Decimal):
+            a, e = a.quantize(Decimal("1e-8")), e.quantize(Decimal("1e-8"))
+        assert a == e, field.name
+
+
+class TestSummaryParity:
+    """SQL aggregates match the Python implementation they replace."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "start,end",
+        [
+            (None, None),
+            (BASE, BASE + timedelta(days=30)),
+            (BASE + timedelta(days=2), BASE + timedelta(days=5)),
+            (BASE + timedelta(days=100), BASE + timedelta(days=101)),
+        ],
+    )
+    async def test_summarize_matches_python(self, async_session, account, trades, start, end):
+        trade_repo = TradeRepository(async_session)
+        if start is None:
+            loaded = await trade_repo.get_trades_by_account(account.id, limit=100000)
+        else:
+            loaded = await trade_repo.get_trades_by_period(account.id, start, end)
+
+        summary = await TradeAnalyticsRepository(async_session).summarize(account.id, start, end)
+
+        _assert_same(summary, summarize_trades(loaded))
+
+    @pytest.mark.asyncio
+    async def test_best_worst_match_python(self, async_session, account, trades):
+        start, end = BASE, BASE + timedelta(days=30)
+        loaded = await TradeRepository(async_session).get_trades_by_period(account.id, start, end)
+
+        best, worst = await TradeAnalyticsRepository(async_session).get_best_worst_trades(
+            account.id, start, end
+        )
+
+        expected_best, expected_worst = best_worst_trades(loaded)
+        # Two trades tie at 2.5; both implementations pick the most recently closed
+        assert best.id == expected_best.id
+        assert worst.id == expected_worst.id
+
+
+class TestSummarize:
+    """Behaviour of the aggregate query itself."""
+
+    @pytest.mark.asyncio
+    async def test_empty_account(self, async_session, account):
+        summary = await TradeAnalyticsRepository(async_session).summarize(account.id)
+        assert summary == TradeSummary()
+
+    @pytest.mark.asyncio
+    async def test_no_realized_trades_has_no_best_worst(self, async_session, account):
+        async_session.add(_trade(account.id, 0, "OPEN", None, BASE))
+        await async_session.commit()
+
+        best, worst = await TradeAnalyticsRepository(async_session).get_best_worst_trades(
+            account.id
+        )
+        assert best is None and worst is None
+
+    @pytest.mark.asyncio
+    async def test_single_query(self, async_engine, async_session, account, trades):
+        """summarize() runs one statement regardless of the number of trades."""
+        statements = []
+
+        @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+        def count(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        await TradeAnalyticsRepository(async_session).summarize(account.id)
+
+        assert len(statements) == 1
+        assert "FILTER (WHERE" in statements[0]
@@ -464,3 +464,148 @@ class TestTradeRepository:
         trades = await repository.get_trades_by_account(account.id)
         assert len(trades) == 1
         assert trades[0].exchange_order_id == exchange_order_id
+
+
+@pytest.fixture
+async def history(async_session: AsyncSession, account: Account) -> list[Trade]:
+    """Create closed trades with varied pnl/duration plus open trades."""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    trades = []
+    for i in range(12):
+        opened_at = base + timedelta(hours=i)
+        closed = i % 4 != 3  # Every 4th trade is still open
+        trades.append(
+            Trade(
+                account_id=account.id,
+                exchange_order_id=f"ORDER-{i:04d}",
+                exchange_tp_order_id=f"TP-{i:04d}",
+                symbol="BTC-USDT",
+                side="LONG",
+                leverage=10,
+                entry_price=Decimal("50000") + i,
+                quantity=Decimal("0.001"),
+                status="CLOSED" if closed else "OPEN",
+                pnl=Decimal(i - 5) if closed else None,
+                opened_at=opened_at,
+                # Durations repeat (60, 120, 180s) so sorting needs the id tie-break
+                closed_at=opened_at + timedelta(seconds=60 * (i % 3 + 1)) if closed else None,
+            )
+        )
+    async_session.add_all(trades)
+    await async_session.commit()
+    return trades
+
+
+class TestTradesPage:
+    """Test SQL filtering, sorting and pagination of get_trades_page."""
+
+    @pytest.mark.asyncio
+    async def test_profit_filter(self, repository, account, history):
+        from src.api.routes.trading_data import ProfitFilter
+
+        page = await repository.get_trades_page(account.id, profit_filter=ProfitFilter.PROFITABLE)
+        assert page.total == len([t for t in history if t.pnl is not None and t.pnl > 0])
+        assert all(t.pnl > 0 for t in page.trades)
+
+        page = await repository.get_trades_page(account.id, profit_filter=ProfitFilter.LOSSES)
+        assert all(t.pnl < 0 for t in page.trades)
+
+    @pytest.mark.asyncio
+    async def test_duration_filter(self, repository, account, history):
+        page = await repository.get_trades_page(account.id, min_duration=120, max_duration=120)
+        assert page.total == 3
+        assert all((t.closed_at - t.opened_at).total_seconds() == 120 for t in page.trades)
+
+    @pytest.mark.asyncio
+    async def test_search_query(self, repository, account, history):
+        page = await repository.get_trades_page(account.id, search_query="TP-001")
+        assert {t.exchange_order_id for t in page.trades} == {"ORDER-0010", "ORDER-0011"}
+
+    @pytest.mark.asyncio
+    async def test_search_query_escapes_wildcards(self, repository, account, history):
+        page = await repository.get_trades_page(account.id, search_query="ORDER-%")
+        assert page.total == 0
+
+    @pytest.mark.asyncio
+    async def test_sort_by_duration(self, repository, account, history):
+        from src.api.routes.trading_data import SortByField, SortDirection
+
+        page = await repository.get_trades_page(
+            account.id, sort_by=SortByField.DURATION, sort_direction=SortDirection.ASC
+        )
+        durations = [
+            (t.closed_at - t.opened_at).total_seconds() if t.closed_at else None
+            for t in page.trades
+        ]
+        closed = [d for d in durations if d is not None]
+        assert closed == sorted(closed)
+        # Open trades last when ascending
+        assert durations[len(closed) :] == [None] * (len(durations) - len(closed))
+
+    @pytest.mark.parametrize("sort_field", ["DURATION", "PNL", "CLOSED_AT", "ENTRY_PRICE"])
+    @pytest.mark.parametrize("direction", ["ASC", "DESC"])
+    @pytest.mark.asyncio
+    async def test_cursor_pages_match_offset_pages(
+        self, repository, account, history, sort_field, direction
+    ):
+        """Walking pages by cursor returns the same trades as offset pagination."""
+        from src.api.routes.trading_data import SortByField, SortDirection
+
+        sort = {
+            "sort_by": getattr(SortByField, sort_field),
+            "sort_direction": getattr(SortDirection, direction),
+        }
+        full = await repository.get_trades_page(account.id, limit=100, **sort)
+        assert full.next_cursor is None
+
+        walked = []
+        cursor = None
+        while True:
+            page = await repository.get_trades_page(account.id, limit=5, cursor=cursor, **sort)
+            assert page.total == len(history)
+            walked.extend(page.trades)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert [t.id for t in walked] == [t.id for t in full.trades]
+
+        offset_page = await repository.get_trades_page(account.id, limit=5, offset=5, **sort)
+        assert [t.id for t in offset_page.trades] == [t.id for t in full.trades[5:10]]
+
+    @pytest.mark.asyncio
+    async def test_cursor_for_other_sort_is_rejected(self, repository, account, history):
+        from src.api.routes.trading_data import SortByField
+        from src.database.repositories.trade_repository import InvalidCursorError
+
+        page = await repository.get_trades_page(account.id, limit=5)
+        with pytest.raises(InvalidCursorError):
+            await repository.get_trades_page(
+                account.id, cursor=page.next_cursor, sort_by=SortByField.PNL
+            )
+        with pytest.raises(InvalidCursorError):
+            await repository.get_trades_page(account.id, cursor="not-a-cursor")
+
+
+class TestAnalyticsCacheInvalidation:
+    """Trade writes invalidate the account's cached analytics responses."""
+
+    @pytest.mark.asyncio
+    async def test_writes_bump_account_version(self, repository: TradeRepository, account: Account):
+        from src.utils.response_cache import analytics_cache
+
+        versions = [analytics_cache.version(account.id)]
+        trade_id = await repository.save_trade(
+            {
+                "account_id": account.id,
+                "entry_price": Decimal("50000"),
+                "quantity": Decimal("0.001"),
+            }
+        )
+        versions.append(analytics_cache.version(account.id))
+        await repository.update_tp(trade_id, Decimal("50500"), "TP-1")
+        versions.append(analytics_cache.version(account.id))
+        await repository.update_trade_exit(trade_id, Decimal("50500"), Decimal("0.5"))
+        versions.append(analytics_cache.version(account.id))
+
+        assert versions == sorted(set(versions))
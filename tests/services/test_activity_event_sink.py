@@ -0,0 +1,165 @@
+"""Tests for ActivityEventSink."""
+
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from src.database.models.activity_event import EventType
+from src.services.activity_event_sink import ActivityEventSink, OverflowPolicy
+
+
+class RecordingWriter:
+    """Fake batch writer that records every batch it receives."""
+
+    def __init__(self, fail: bool = False):
+        self.batches: list[list[dict]] = []
+        self.fail = fail
+
+    async def __call__(self, events: list[dict]) -> int:
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(events)
+        return len(events)
+
+
+@pytest.fixture
+def writer() -> RecordingWriter:
+    """Create a recording writer."""
+    return RecordingWriter()
+
+
+class TestEnqueueAndFlush:
+    """Tests for queueing and batched flushing."""
+
+    async def test_flush_writes_in_batches(self, writer):
+        """Queued events are written in batches of at most batch_size."""
+        sink = ActivityEventSink(writer=writer, batch_size=2)
+        account_id = uuid4()
+
+        for i in range(5):
+            sink.enqueue(account_id, EventType.ORDER_FILLED, f"Event {i}")
+
+        written = await sink.flush()
+
+        assert written == 5
+        assert [len(b) for b in writer.batches] == [2, 2, 1]
+        assert [e["description"] for b in writer.batches for e in b] == [
+            f"Event {i}" for i in range(5)
+        ]
+        assert sink.pending == 0
+        assert sink.stats["queued"] == 5
+        assert sink.stats["flushed"] == 5
+        assert sink.stats["batches"] == 3
+
+    async def test_event_timestamp_captured_at_enqueue(self, writer):
+        """Each event gets a timestamp when queued, not when flushed."""
+        sink = ActivityEventSink(writer=writer)
+        sink.enqueue(uuid4(), EventType.BOT_STARTED, "Started")
+
+        await sink.flush()
+
+        assert writer.batches[0][0]["timestamp"] is not None
+
+    async def test_size_threshold_triggers_flush(self, writer):
+        """Reaching batch_size wakes the flusher before the interval elapses."""
+        sink = ActivityEventSink(writer=writer, batch_size=3, flush_interval=60)
+        await sink.start()
+        try:
+            for i in range(3):
+                sink.enqueue(uuid4(), EventType.ORDER_FILLED, f"Event {i}")
+            await asyncio.sleep(0.05)
+
+            assert len(writer.batches) == 1
+            assert len(writer.batches[0]) == 3
+        finally:
+            await sink.stop()
+
+    async def test_time_threshold_triggers_flush(self, writer):
+        """A partial batch is flushed after flush_interval."""
+        sink = ActivityEventSink(writer=writer, batch_size=100, flush_interval=0.05)
+        await sink.start()
+        try:
+            sink.enqueue(uuid4(), EventType.ORDER_FILLED, "Lonely event")
+            await asyncio.sleep(0.2)
+
+            assert sink.stats["flushed"] == 1
+        finally:
+            await sink.stop()
+
+    async def test_stop_flushes_remaining_events(self, writer):
+        """stop() writes whatever is still queued."""
+        sink = ActivityEventSink(writer=writer, batch_size=100, flush_interval=60)
+        await sink.start()
+        sink.enqueue(uuid4(), EventType.BOT_STOPPED, "Stopping")
+
+        await sink.stop()
+
+        assert sink.is_running is False
+        assert sink.stats["flushed"] == 1
+
+    async def test_write_failure_is_counted_not_raised(self):
+        """Failed batches are counted and do not raise."""
+        sink = ActivityEventSink(writer=RecordingWriter(fail=True))
+        sink.enqueue(uuid4(), EventType.ERROR_OCCURRED, "Boom")
+
+        written = await sink.flush()
+
+        assert written == 0
+        assert sink.stats["failed"] == 1
+        assert sink.pending == 0
+
+
+class TestBackpressure:
+    """Tests for overflow policies."""
+
+    async def test_drop_oldest_evicts_oldest_event(self, writer):
+        """DROP_OLDEST keeps the newest events when the queue is full."""
+        sink = ActivityEventSink(
+            writer=writer, max_queue_size=2, overflow_policy=OverflowPolicy.DROP_OLDEST
+        )
+        account_id = uuid4()
+
+        for i in range(3):
+            assert sink.enqueue(account_id, EventType.ORDER_FILLED, f"Event {i}") is True
+
+        await sink.flush()
+
+        assert [e["description"] for e in writer.batches[0]] == ["Event 1", "Event 2"]
+        assert sink.stats["dropped"] == 1
+
+    async def test_block_policy_rejects_sync_enqueue_when_full(self, writer):
+        """BLOCK rejects new events from enqueue() when the queue is full."""
+        sink = ActivityEventSink(writer=writer, max_queue_size=1, overflow_policy="block")
+        account_id = uuid4()
+
+        assert sink.enqueue(account_id, EventType.ORDER_FILLED, "First") is True
+        assert sink.enqueue(account_id, EventType.ORDER_FILLED, "Second") is False
+
+        assert sink.pending == 1
+        assert sink.stats["dropped"] == 1
+
+    async def test_block_policy_put_waits_for_flush(self, writer):
+        """BLOCK makes put() wait until a flush frees space."""
+        sink = ActivityEventSink(
+            writer=writer,
+            max_queue_size=1,
+            flush_interval=60,
+            overflow_policy=OverflowPolicy.BLOCK,
+        )
+        await sink.start()
+        account_id = uuid4()
+        try:
+            await sink.put(account_id, EventType.ORDER_FILLED, "First")
+            await asyncio.wait_for(sink.put(account_id, EventType.ORDER_FILLED, "Second"), 1)
+        finally:
+            await sink.stop()
+
+        descriptions = [e["description"] for b in writer.batches for e in b]
+        assert descriptions == ["First", "Second"]
+        assert sink.stats["dropped"] == 0
+
+    def test_invalid_sizes_rejected(self):
+        """Non-positive queue or batch sizes raise ValueError."""
+        with pytest.raises(ValueError):
+            ActivityEventSink(max_queue_size=0)
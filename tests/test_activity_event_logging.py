@@ -37,6 +37,7 @@ class TestLogActivityEventMethod:
         # Create a partial mock - just test the method logic
         gm = MagicMock(spec=GridManager)
         gm._activity_event_repository = None
+        gm._activity_event_sink = None
         gm._account_id = uuid4()
 
         # Call the actual method - it should return early
@@ -55,6 +56,26 @@ class TestLogActivityEventMethod:
         # Verify create_event was never called
         gm._activity_event_repository.create_event.assert_not_called()
 
+    def test_log_activity_event_enqueues_on_sink(self):
+        """Test that events go to the sink instead of a per-event task."""
+        from src.grid.grid_manager import GridManager
+
+        gm = MagicMock(spec=GridManager)
+        gm._account_id = uuid4()
+        gm._activity_event_repository = MagicMock()
+        gm._activity_event_sink = MagicMock()
+        gm._connection_manager = None
+
+        GridManager._log_activity_event(gm, EventType.BOT_STARTED, "Test", {"a": 1})
+
+        gm._activity_event_sink.enqueue.assert_called_once_with(
+            account_id=gm._account_id,
+            event_type=EventType.BOT_STARTED,
+            description="Test",
+            event_data={"a": 1},
+        )
+        gm._activity_event_repository.create_event.assert_not_called()
+
 
 class TestPauseStateRestoration:
     """Tests for PAUSE state restoration fix in MACDStrategy."""
@@ -0,0 +1,232 @@
+"""
+Tests for the backtesting engine.
+
+Tests:
+1. Klines load from CSV and resample into complete buckets
+2. SimulatedExchange fills on the low and exits on the high of later candles
+3. BacktestEngine drives the grid logic and reports P&L, drawdown and fills
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import GridConfig, MACDConfig, SpacingType
+from src.backtest import (
+    BacktestConfig,
+    BacktestEngine,
+    SimulatedExchange,
+    load_klines,
+    resample,
+)
+from src.client.klines import Klines
+
+MINUTE_MS = 60_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def make_klines(closes: np.ndarray, wick: float = 0.0005) -> Klines:
+    """1m candles that open at the previous close, with small wicks."""
+    closes = np.asarray(closes, dtype=float)
+    opens = np.r_[closes[0], closes[:-1]]
+    return Klines(
+        START_MS + np.arange(len(closes)) * MINUTE_MS,
+        opens,
+        np.maximum(opens, closes) * (1 + wick),
+        np.minimum(opens, closes) * (1 - wick),
+        closes,
+        np.ones(len(closes)),
+    )
+
+
+def random_walk(n: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 60_000 * np.exp(np.cumsum(rng.normal(0, 0.0008, n)))
+
+
+def make_config(**overrides) -> BacktestConfig:
+    values = {
+        "grid": GridConfig(
+            spacing_type=SpacingType.PERCENT,
+            spacing_value=0.3,
+            range_percent=5.0,
+            take_profit_percent=0.5,
+            max_total_orders=10,
+        ),
+        "macd": MACDConfig(fast=12, slow=26, signal=9, timeframe="1h"),
+        "macd_enabled": False,
+    }
+    values.update(overrides)
+    return BacktestConfig(**values)
+
+
+class TestData:
+    """Loading and resampling stored candles."""
+
+    def test_resample_aggregates_and_drops_forming_bucket(self):
+        klines = make_klines(np.arange(1, 151, dtype=float), wick=0)
+
+        hourly, ends = resample(klines, "1h")
+
+        assert len(hourly) == 2  # 150 minutes: the third hour is incomplete
+        assert list(ends) == [59, 119]
+        assert list(hourly.timestamp) == [START_MS, START_MS + 60 * MINUTE_MS]
+        assert list(hourly.open) == [1.0, 60.0]
+        assert list(hourly.close) == [60.0, 120.0]
+        assert list(hourly.high) == [60.0, 120.0]
+        assert list(hourly.low) == [1.0, 60.0]
+        assert list(hourly.volume) == [60.0, 60.0]
+
+    def test_resample_keeps_complete_last_bucket(self):
+        _, ends = resample(make_klines(np.ones(120)), "1h")
+
+        assert list(ends) == [59, 119]
+
+    def test_load_klines_from_csv(self, tmp_path):
+        path = tmp_path / "klines.csv"
+        pd.DataFrame(
+            {
+                "time": [START_MS + MINUTE_MS, START_MS, START_MS],
+                "open": [2.0, 1.0, 1.0],
+                "high": [3.0, 2.0, 2.0],
+                "low": [1.0, 0.5, 0.5],
+                "close": [2.5, 1.5, 1.5],
+                "volume": [10.0, 5.0, 5.0],
+            }
+        ).to_csv(path, index=False)
+
+        klines = load_klines(path)
+
+        assert list(klines.timestamp) == [START_MS, START_MS + MINUTE_MS]
+        assert list(klines.close) == [1.5, 2.5]
+
+    def test_load_klines_missing_columns(self, tmp_path):
+        path = tmp_path / "klines.csv"
+        pd.DataFrame({"timestamp": [START_MS], "close": [1.0]}).to_csv(path, index=False)
+
+        with pytest.raises(ValueError, match="open"):
+            load_klines(path)
+
+
+class TestSimulatedExchange:
+    """Order matching against candle high/low."""
+
+    def test_fill_then_take_profit_in_later_candle(self):
+        # Candle 1 dips to the order and rallies past the TP: only the entry fills
+        klines = Klines(
+            np.arange(3) * MINUTE_MS,
+            np.array([100.0, 100.0, 100.5]),
+            np.array([100.2, 101.5, 101.5]),
+            np.array([99.8, 98.5, 100.2]),
+            np.array([100.0, 100.5, 101.2]),
+            np.ones(3),
+        )
+        exchange = SimulatedExchange(klines, fee_rate=0.001)
+        order_id = exchange.place_order(99.0, 1.0, 101.0)
+
+        assert exchange.next_event(0, 3, ref_price=100.0) == 1
+        opened, closed = exchange.match(1)
+        assert [p.order_id for p in opened] == [order_id]
+        assert closed == []
+
+        opened, closed = exchange.match(2)
+        trade = closed[0]
+        assert trade.entry_price == 99.0
+        assert trade.exit_price == 101.0
+        assert trade.fees == pytest.approx(0.099 + 0.101)
+        assert trade.pnl == pytest.approx(2.0 - 0.2)
+        assert exchange.realized_pnl == pytest.approx(1.8)
+        assert exchange.positions == {}
+
+    def test_gaps_fill_at_open(self):
+        klines = Klines(
+            np.arange(2) * MINUTE_MS,
+            np.array([97.0, 104.0]),
+            np.array([98.0, 105.0]),
+            np.array([96.0, 103.0]),
+            np.array([97.5, 104.5]),
+            np.ones(2),
+        )
+        exchange = SimulatedExchange(klines, fee_rate=0.0)
+        exchange.place_order(99.0, 1.0, 101.0)
+
+        opened, _ = exchange.match(0)
+        _, closed = exchange.match(1)
+
+        assert opened[0].entry_price == 97.0
+        assert closed[0].exit_price == 104.0
+
+    def test_open_orders_shaped_like_bingx(self):
+        exchange = SimulatedExchange(make_klines(np.full(2, 100.0), wick=0.02))
+        filled = exchange.place_order(99.0, 1.0, 101.0)
+        exchange.match(0)
+        pending = exchange.place_order(97.0, 1.0, 99.0)
+
+        orders = {o["orderId"]: o for o in exchange.open_orders()}
+
+        assert orders[pending]["type"] == "LIMIT"
+        assert orders[pending]["price"] == 97.0
+        assert orders[filled]["type"] == "TAKE_PROFIT_MARKET"
+        assert orders[filled]["stopPrice"] == 101.0
+
+    def test_reprice_event(self):
+        exchange = SimulatedExchange(make_klines(np.array([100.0, 100.2, 100.6, 101.0])))
+
+        assert exchange.next_event(0, 4, ref_price=100.0, reprice_step=0.5) == 2
+        assert exchange.next_event(0, 4, ref_price=100.0) is None
+
+
+class TestBacktestEngine:
+    """End-to-end replays through the grid logic."""
+
+    @pytest.mark.asyncio
+    async def test_replay_reports_pnl_and_drawdown(self):
+        klines = make_klines(random_walk(3 * 24 * 60))
+
+        result = await BacktestEngine(make_config()).run(klines)
+
+        assert result.orders_created > 0
+        assert result.fills > 0
+        assert len(result.trades) > 0
+        assert len(result.equity) == len(klines)
+        assert result.equity[0] == pytest.approx(1000.0, abs=1)
+        assert result.realized_pnl == pytest.approx(sum(t.pnl for t in result.trades))
+        assert result.total_pnl == pytest.approx(result.realized_pnl + result.unrealized_pnl)
+        assert result.max_drawdown >= 0
+        assert result.fees > 0
+        assert result.summary()["trades"] == len(result.trades)
+
+    @pytest.mark.asyncio
+    async def test_respects_max_total_orders(self):
+        engine = BacktestEngine(make_config())
+        klines = make_klines(np.linspace(60_000, 50_000, 24 * 60))  # Steady decline
+
+        result = await engine.run(klines)
+
+        exchange = engine.exchange
+        assert len(exchange.pending) + len(exchange.positions) <= 10
+        assert result.open_positions == len(exchange.positions)
+        assert result.unrealized_pnl < 0
+
+    @pytest.mark.asyncio
+    async def test_macd_warmup_creates_no_orders(self):
+        # 20 hours of data never reach MACD's 26 + 9 candle warm-up
+        klines = make_klines(random_walk(20 * 60))
+
+        result = await BacktestEngine(make_config(macd_enabled=True)).run(klines)
+
+        assert result.orders_created == 0
+        assert result.total_pnl == 0
+
+    @pytest.mark.asyncio
+    async def test_month_of_minutes_replays_quickly(self):
+        klines = make_klines(random_walk(30 * 24 * 60))
+
+        started = time.perf_counter()
+        result = await BacktestEngine(make_config(macd_enabled=True)).run(klines)
+        elapsed = time.perf_counter() - started
+
+        assert result.events < len(klines) / 2  # Quiet candles are skipped
+        assert elapsed < 5.0
@@ -0,0 +1,201 @@
+"""
+Tests for parallel backtest parameter sweeps.
+
+Tests:
+1. Parameter combinations expand and map onto the backtest config
+2. Workers memory-map the shared kline dataset
+3. Results are stored incrementally and interrupted sweeps resume
+"""
+
+import numpy as np
+import pytest
+
+from config import GridConfig, MACDConfig, SpacingType
+from src.backtest import BacktestConfig, ResultStore, expand_grid, run_sweep
+from src.backtest.sweep import (
+    apply_parameters,
+    dataset_fingerprint,
+    open_shared_klines,
+    run_id,
+    share_klines,
+)
+from src.client.klines import Klines
+
+MINUTE_MS = 60_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+@pytest.fixture
+def klines():
+    rng = np.random.default_rng(3)
+    closes = 60_000 * np.exp(np.cumsum(rng.normal(0, 0.0008, 24 * 60)))
+    opens = np.r_[closes[0], closes[:-1]]
+    return Klines(
+        START_MS + np.arange(len(closes)) * MINUTE_MS,
+        opens,
+        np.maximum(opens, closes) * 1.0005,
+        np.minimum(opens, closes) * 0.9995,
+        closes,
+        np.ones(len(closes)),
+    )
+
+
+@pytest.fixture
+def base():
+    return BacktestConfig(
+        grid=GridConfig(
+            spacing_type=SpacingType.PERCENT,
+            spacing_value=0.3,
+            range_percent=5.0,
+            take_profit_percent=0.5,
+        ),
+        macd=MACDConfig(fast=12, slow=26, signal=9, timeframe="1h"),
+        macd_enabled=False,
+    )
+
+
+class TestParameters:
+    """Combination expansion and config mapping."""
+
+    def test_expand_grid(self):
+        combos = expand_grid({"spacing_value": [0.2, 0.3], "take_profit_percent": [0.5, 1.0]})
+
+        assert len(combos) == 4
+        assert {"spacing_value": 0.3, "take_profit_percent": 1.0} in combos
+
+    def test_expand_grid_skips_inverted_macd(self):
+        combos = expand_grid({"macd_fast": [12, 26], "macd_slow": [26]})
+
+        assert combos == [{"macd_fast": 12, "macd_slow": 26}]
+
+    def test_unknown_parameter(self):
+        with pytest.raises(ValueError, match="leverage"):
+            expand_grid({"leverage": [5, 10]})
+
+    def test_apply_parameters(self, base):
+        config = apply_parameters(
+            base,
+            {"spacing_type": "fixed", "spacing_value": 150, "macd_fast": 8, "ema_period": 21},
+        )
+
+        assert config.grid.spacing_type == SpacingType.FIXED
+        assert config.grid.spacing_value == 150
+        assert config.grid.take_profit_percent == 0.5
+        assert config.macd.fast == 8
+        assert config.macd.slow == 26
+        assert config.ema_period == 21
+        assert base.grid.spacing_value == 0.3
+
+    def test_run_id_depends_on_base_config(self, base):
+        params = {"spacing_value": 0.2}
+
+        assert run_id(base, params, "d") == run_id(base, dict(params), "d")
+        assert run_id(base, params, "d") != run_id(base, {"spacing_value": 0.25}, "d")
+        assert run_id(base, params, "d") != run_id(
+            apply_parameters(base, {"range_percent": 3.0}), params, "d"
+        )
+        assert run_id(base, params, "d") != run_id(base, params, "other")
+
+    def test_dataset_fingerprint(self, klines):
+        assert dataset_fingerprint(klines) == dataset_fingerprint(klines[:])
+        assert dataset_fingerprint(klines) != dataset_fingerprint(klines[:-1])
+        assert dataset_fingerprint(klines) != dataset_fingerprint(klines[1:])
+
+        closes = klines.close.copy()
+        closes[len(closes) // 2] += 1.0
+        changed = Klines(
+            klines.timestamp, klines.open, klines.high, klines.low, closes, klines.volume
+        )
+        assert dataset_fingerprint(klines) != dataset_fingerprint(changed)
+
+
+class TestSharedKlines:
+    """Memory-mapped dataset handed to the workers."""
+
+    def test_round_trip_is_memory_mapped(self, klines, tmp_path):
+        shared = open_shared_klines(share_klines(klines, tmp_path / "klines"))
+
+        np.testing.assert_array_equal(shared.timestamp, klines.timestamp)
+        np.testing.assert_array_equal(shared.close, klines.close)
+        assert isinstance(shared.close.base, np.memmap)
+        assert not shared.close.flags.writeable
+
+
+class TestResultStore:
+    """Incremental columnar result files."""
+
+    def test_write_and_load(self, tmp_path):
+        store = ResultStore(tmp_path, format="csv")
+        store.write([{"run_id": "a", "total_pnl": 1.5}])
+        store.write([{"run_id": "b", "total_pnl": -2.0}, {"run_id": "c", "total_pnl": 0.0}])
+
+        assert [p.name for p in store.parts()] == ["part-00000.csv", "part-00001.csv"]
+        assert store.completed() == {"a", "b", "c"}
+        assert list(store.load()["total_pnl"]) == [1.5, -2.0, 0.0]
+
+    def test_empty(self, tmp_path):
+        store = ResultStore(tmp_path, format="csv")
+
+        assert store.write([]) is None
+        assert store.completed() == set()
+        assert store.load().empty
+
+    def test_ignores_unfinished_temporary_parts(self, tmp_path):
+        store = ResultStore(tmp_path, format="csv")
+        (tmp_path / ".part-00000.csv.tmp").write_text("run_id\nx\n")
+
+        assert store.completed() == set()
+
+
+class TestRunSweep:
+    """Parallel sweeps end to end."""
+
+    SPACE = {"spacing_value": [0.2, 0.3, 0.5], "take_profit_percent": [0.3, 0.5]}
+
+    def test_runs_every_combination(self, klines, base, tmp_path):
+        results = run_sweep(
+            klines, self.SPACE, base, tmp_path, workers=2, batch_size=2, format="csv"
+        )
+
+        assert len(results) == 6
+        assert results["run_id"].is_unique
+        assert "error" not in results.columns
+        assert (results["orders_created"] > 0).all()
+        assert len(ResultStore(tmp_path / "results").parts()) == 3
+
+    def test_resumes_after_interruption(self, klines, base, tmp_path):
+        first = run_sweep(klines, self.SPACE, base, tmp_path, workers=2, batch_size=2, format="csv")
+        store = ResultStore(tmp_path / "results")
+        store.parts()[0].unlink()  # Batch lost to the interruption
+
+        resumed = run_sweep(
+            klines, self.SPACE, base, tmp_path, workers=2, batch_size=2, format="csv"
+        )
+
+        assert len(resumed) == 6
+        assert len(store.parts()) == 3  # Only the missing batch ran again
+        by_id = first.set_index("run_id")["total_pnl"]
+        assert resumed.set_index("run_id")["total_pnl"].to_dict() == pytest.approx(by_id.to_dict())
+
+    def test_completed_sweep_runs_nothing(self, klines, base, tmp_path):
+        run_sweep(klines, self.SPACE, base, tmp_path, workers=2, format="csv")
+        parts = ResultStore(tmp_path / "results").parts()
+
+        results = run_sweep(klines, self.SPACE, base, tmp_path, workers=2, format="csv")
+
+        assert len(results) == 6
+        assert ResultStore(tmp_path / "results").parts() == parts
+
+    def test_other_dataset_does_not_reuse_results(self, klines, base, tmp_path):
+        first = run_sweep(klines, self.SPACE, base, tmp_path, workers=2, format="csv")
+
+        later = klines[: len(klines) // 2]
+        results = run_sweep(later, self.SPACE, base, tmp_path, workers=2, format="csv")
+
+        assert len(results) == 6
+        assert set(results["run_id"]).isdisjoint(first["run_id"])
+        assert (results["dataset"] == dataset_fingerprint(later)).all()
+        assert len(ResultStore(tmp_path / "results").completed()) == 12
+        # The first dataset is still intact for resuming its own sweep
+        shared = open_shared_klines(tmp_path / "klines" / dataset_fingerprint(klines))
+        np.testing.assert_array_equal(shared.close, klines.close)
@@ -0,0 +1,271 @@
+"""
+Tests for batch order placement and cancellation.
+
+Tests:
+1. create_orders_batch chunks orders and returns per-order results
+2. cancel_orders_batch reports success/failure per order ID
+3. GridManager creates and cancels grid orders through the batch endpoints
+"""
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from config import BingXConfig
+from src.client.bingx_client import BingXClient
+from src.client.order_book import ExchangeOrderBook
+from src.client.rate_limiter import RateLimitError
+from src.grid.grid_calculator import GridLevel
+from src.grid.order_tracker import OrderTracker
+
+
+@pytest.fixture
+def client():
+    return BingXClient(
+        BingXConfig(
+            api_key="test_api_key",  # pragma: allowlist secret
+            secret_key="test_secret_key",  # pragma: allowlist secret
+            is_demo=False,
+        ),
+        http_client=httpx.AsyncClient(),
+    )
+
+
+def _spec(price):
+    return BingXClient.limit_order_with_tp_spec("BUY", "BOTH", price, 0.001, price + 500)
+
+
+def _echo_created(fail_index=None):
+    """Fake _request for batch create that echoes each order back with an ID."""
+
+    async def request(method, endpoint, params):
+        orders = json.loads(params["batchOrders"])
+        created = []
+        for i, order in enumerate(orders):
+            if i == fail_index:
+                created.append({"code": 101204, "msg": "Insufficient margin"})
+                continue
+            created.append(
+                {
+                    "orderId": f"id-{order['price']}",
+                    "clientOrderID": order["clientOrderID"],
+                    "takeProfit": {"orderId": f"tp-{order['price']}"},
+                }
+            )
+        return {"orders": list(reversed(created))}
+
+    return request
+
+
+class TestCreateOrdersBatch:
+    """Tests for BingXClient.create_orders_batch."""
+
+    async def test_results_follow_input_order(self, client):
+        """Results are matched back to inputs by clientOrderID."""
+        client._request = AsyncMock(side_effect=_echo_created())
+
+        results = await client.create_orders_batch("BTC-USDT", [_spec(100), _spec(200)])
+
+        assert [r["entry_order_id"] for r in results] == ["id-100", "id-200"]
+        assert [r["tp_order_id"] for r in results] == ["tp-100", "tp-200"]
+        assert all(r["success"] for r in results)
+
+    async def test_orders_are_chunked(self, client):
+        """More than BATCH_CREATE_LIMIT orders are split over several requests."""
+        client._request = AsyncMock(side_effect=_echo_created())
+
+        results = await client.create_orders_batch("BTC-USDT", [_spec(p) for p in range(7)])
+
+        assert client._request.await_count == 2
+        sizes = sorted(
+            len(json.loads(c.args[2]["batchOrders"])) for c in client._request.await_args_list
+        )
+        assert sizes == [2, 5]
+        assert len(results) == 7
+
+    async def test_partial_failure(self, client):
+        """A rejected order fails alone; the others succeed."""
+        results_by_request = _echo_created(fail_index=1)
+
+        async def request(method, endpoint, params):
+            data = await results_by_request(method, endpoint, params)
+            for order in data["orders"]:
+                order.pop("clientOrderID", None)
+            data["orders"].reverse()  # Position matching when IDs are missing
+            return data
+
+        client._request = AsyncMock(side_effect=request)
+
+        results = await client.create_orders_batch("BTC-USDT", [_spec(100), _spec(200)])
+
+        assert results[0]["success"]
+        assert not results[1]["success"]
+        assert results[1]["error"] == "Insufficient margin"
+
+    async def test_failed_chunk_keeps_exception(self, client):
+        """A failed request fails its chunk only and keeps the exception."""
+        error = RateLimitError("BingX API Error: rate limit", "order", 1.0)
+        calls = 0
+
+        async def request(method, endpoint, params):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise error
+            return await _echo_created()(method, endpoint, params)
+
+        client._request = AsyncMock(side_effect=request)
+
+        results = await client.create_orders_batch("BTC-USDT", [_spec(p) for p in range(6)])
+
+        assert [r["success"] for r in results] == [False] * 5 + [True]
+        assert results[0]["exception"] is error
+
+
+class TestCancelOrdersBatch:
+    """Tests for BingXClient.cancel_orders_batch."""
+
+    async def test_partial_failure(self, client):
+        """Each ID reports success or the exchange error."""
+        client._request = AsyncMock(
+            return_value={
+                "success": [{"orderId": 1}],
+                "failed": [{"orderId": 2, "errorMessage": "order not exist"}],
+            }
+        )
+
+        results = await client.cancel_orders_batch("BTC-USDT", ["1", "2", "3"])
+
+        assert results == [
+            {"orderId": "1", "success": True, "error": None},
+            {"orderId": "2", "success": False, "error": "order not exist"},
+            {"orderId": "3", "success": False, "error": "Order missing from batch response"},
+        ]
+        method, endpoint, params = client._request.await_args.args
+        assert method == "DELETE"
+        assert params["orderIdList"] == "[1,2,3]"
+
+    async def test_order_id_list_is_signed_and_encoded(self, client):
+        """The orderIdList JSON array survives signing and URL encoding."""
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = {"code": 0, "data": {"success": [], "failed": []}}
+        client.client.delete = AsyncMock(return_value=response)
+
+        await client.cancel_orders_batch("BTC-USDT", ["11", "12"])
+
+        url = client.client.delete.await_args.args[0]
+        assert parse_qs(urlparse(url).query)["orderIdList"] == ["[11,12]"]
+
+
+class TestGridManagerBatching:
+    """GridManager uses the batch endpoints."""
+
+    @pytest.fixture
+    def manager(self):
+        from src.grid.grid_manager import GridManager
+
+        with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
+            gm = GridManager.__new__(GridManager)
+        gm.client = MagicMock()
+        gm._db_strategy = None
+        gm.symbol = "BTC-USDT"
+        gm.tracker = OrderTracker()
+        gm._order_book = ExchangeOrderBook(gm.client, "BTC-USDT")
+        gm._current_price = 100000.0
+        gm.order_size = 100.0
+        gm._on_order_created = None
+        gm._consecutive_errors = 0
+        gm._margin_error = False
+        gm._rate_limited_until = 0.0
+        gm._error_pause_until = 0.0
+        gm._broadcast_order_update = MagicMock()
+        gm._log_activity_event = MagicMock()
+        return gm
+
+    @staticmethod
+    def _batch(manager, *prices):
+        levels = [
+            GridLevel(entry_price=p, tp_price=p + 500, level_index=i) for i, p in enumerate(prices)
+        ]
+        return [(level, manager._order_spec(level, None)) for level in levels]
+
+    async def test_cancel_orders_single_request(self, manager):
+        """Cancelling several orders is one batch call; failures are not counted."""
+        manager._order_book.add_order({"orderId": "1", "type": "LIMIT", "price": "99000"})
+        manager.client.cancel_orders_batch = AsyncMock(
+            return_value=[
+                {"orderId": "1", "success": True, "error": None},
+                {"orderId": "2", "success": False, "error": "order not exist"},
+            ]
+        )
+
+        cancelled = await manager._cancel_orders(
+            [{"orderId": 1, "price": "99000"}, {"orderId": 2, "price": "98000"}], "test"
+        )
+
+        assert cancelled == 1
+        manager.client.cancel_orders_batch.assert_awaited_once_with("BTC-USDT", ["1", "2"])
+        assert manager._order_book.get("1") is None
+
+    async def test_cancel_nothing_skips_request(self, manager):
+        manager.client.cancel_orders_batch = AsyncMock()
+        assert await manager._cancel_orders([], "test") == 0
+        manager.client.cancel_orders_batch.assert_not_called()
+
+    async def test_created_orders_are_tracked(self, manager):
+        """Successful batch results are tracked and mirrored in the order book."""
+        level = GridLevel(entry_price=99000.0, tp_price=99500.0, level_index=0)
+        spec = manager._order_spec(level, None)
+
+        manager._track_created_order(level, spec, {"entry_order_id": "e1", "tp_order_id": "t1"})
+
+        assert spec == {
+            "symbol": "BTC-USDT",
+            "price": 99000.0,
+            "quantity": 0.001,
+            "tp_price": 99500.0,
+        }
+        assert manager.tracker.pending_orders[0].exchange_tp_order_id == "t1"
+        assert manager._order_book.get("e1")["price"] == 99000.0
+
+    async def test_success_after_failure_is_tracked(self, manager):
+        """Orders placed after a failed one in the same batch are still tracked."""
+        batch = self._batch(manager, 99000.0, 98500.0)
+        results = [
+            {"success": False, "error": "Insufficient margin"},
+            {"success": True, "entry_order_id": "e2", "tp_order_id": "t2"},
+        ]
+
+        manager._handle_batch_results(batch, results)
+
+        assert manager._margin_error
+        assert [o.order_id for o in manager.tracker.pending_orders] == ["e2"]
+        assert manager._order_book.get("e2") is not None
+
+    async def test_rate_limit_pauses_creation(self, manager):
+        batch = self._batch(manager, 99000.0, 98500.0)
+        results = [
+            {"success": True, "entry_order_id": "e1", "tp_order_id": "t1"},
+            {"success": False, "error": "429", "exception": RateLimitError("429", "order", 10)},
+        ]
+
+        manager._handle_batch_results(batch, results)
+
+        assert manager._rate_limited_until > 0
+        assert len(manager.tracker.pending_orders) == 1
+
+    async def test_consecutive_errors_pause_without_blocking(self, manager):
+        """Three failures set a short cool-down instead of sleeping in the cycle."""
+        batch = self._batch(manager, 99000.0, 98500.0, 98000.0)
+        results = [{"success": False, "error": "boom"}] * 3
+
+        with patch("src.grid.grid_manager.asyncio.sleep") as sleep:
+            manager._handle_batch_results(batch, results)
+
+        sleep.assert_not_called()
+        assert manager._consecutive_errors == 3
+        assert manager._error_pause_until > 0
+        assert not manager._margin_error
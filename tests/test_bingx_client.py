@@ -2,9 +2,11 @@
 Tests for BingXClient.modify_tp_order method (BE-042).
 
 Tests the modify_tp_order functionality which cancels an existing TP order
-and creates a new one with an updated price.
+and creates a new one with an updated price, and how order mutations update
+the cached open orders.
 """
 
+import json
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -120,8 +122,8 @@ class TestModifyTPOrder:
         client.create_order.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_modify_tp_order_cache_invalidation(self, client):
-        """Test that cache is invalidated after TP order modification."""
+    async def test_modify_tp_order_keeps_caches(self, client):
+        """modify_tp_order leaves cache updates to cancel_order/create_order."""
         # Mock cancel_order
         client.cancel_order = AsyncMock(return_value={"code": 0, "msg": "Success", "data": {}})
 
@@ -144,8 +146,8 @@ class TestModifyTPOrder:
             new_tp_price=105000.0,
         )
 
-        # Verify cache invalidation was called with correct prefixes
-        client._invalidate_cache.assert_called_once_with("open_orders", "positions")
+        # No blanket invalidation: the cancel and create write through themselves
+        client._invalidate_cache.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_modify_tp_order_different_prices(self, client):
@@ -202,3 +204,122 @@ class TestModifyTPOrder:
             # Verify create_order was called with the correct quantity
             _, kwargs = client.create_order.call_args
             assert kwargs["quantity"] == qty
+
+
+class TestOpenOrdersWriteThrough:
+    """Order mutations update the cached open orders instead of flushing them."""
+
+    @pytest.fixture
+    def cached_client(self, client):
+        """Client whose open orders for two symbols are cached."""
+        books = {
+            "BTC-USDT": [{"orderId": 1, "type": "LIMIT", "price": "90000"}],
+            "ETH-USDT": [{"orderId": 2, "type": "LIMIT", "price": "3000"}],
+        }
+        client.open_order_requests = 0
+
+        async def fake_request(method, endpoint, params=None, signed=True):
+            if endpoint.endswith("/openOrders"):
+                client.open_order_requests += 1
+                return {"orders": list(books[params["symbol"]])}
+            if method == "POST" and endpoint.endswith("/batchOrders"):
+                sent = json.loads(params["batchOrders"])
+                return {
+                    "orders": [
+                        {"orderId": 100 + i, "clientOrderID": o["clientOrderID"]}
+                        for i, o in enumerate(sent)
+                    ]
+                }
+            if method == "POST":
+                return {"order": {"orderId": 99}}
+            if method == "DELETE" and endpoint.endswith("/batchOrders"):
+                ids = params["orderIdList"].strip("[]").split(",")
+                return {"success": [{"orderId": oid} for oid in ids], "failed": []}
+            return {}
+
+        client._request = fake_request
+        return client
+
+    async def _warm(self, client):
+        await client.get_open_orders("BTC-USDT")
+        await client.get_open_orders("ETH-USDT")
+        assert client.open_order_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_created_limit_order_is_added(self, cached_client):
+        await self._warm(cached_client)
+
+        await cached_client.create_limit_order_with_tp(
+            "BTC-USDT", "BUY", "BOTH", price=89000, quantity=0.001, tp_price=89500
+        )
+        orders = await cached_client.get_open_orders("BTC-USDT")
+
+        assert cached_client.open_order_requests == 2
+        assert [(str(o["orderId"]), o["type"]) for o in orders] == [("1", "LIMIT"), ("99", "LIMIT")]
+        assert orders[1]["price"] == 89000
+
+    @pytest.mark.asyncio
+    async def test_standalone_tp_order_is_added(self, cached_client):
+        await self._warm(cached_client)
+
+        await cached_client.create_order(
+            "BTC-USDT", "SELL", "BOTH", "TAKE_PROFIT_MARKET", 0.001, stop_price=91000
+        )
+        orders = await cached_client.get_open_orders("BTC-USDT")
+
+        assert orders[-1]["type"] == "TAKE_PROFIT_MARKET"
+        assert orders[-1]["stopPrice"] == 91000
+        assert cached_client.open_order_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_removes_only_that_symbols_order(self, cached_client):
+        await self._warm(cached_client)
+
+        await cached_client.cancel_order("BTC-USDT", "1")
+
+        assert await cached_client.get_open_orders("BTC-USDT") == []
+        assert len(await cached_client.get_open_orders("ETH-USDT")) == 1
+        assert cached_client.open_order_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_create_and_cancel(self, cached_client):
+        await self._warm(cached_client)
+        specs = [
+            BingXClient.limit_order_with_tp_spec("BUY", "BOTH", price, 0.001, price + 500)
+            for price in (88000, 87000)
+        ]
+
+        await cached_client.create_orders_batch("BTC-USDT", specs)
+        await cached_client.cancel_orders_batch("BTC-USDT", ["1", "100"])
+        orders = await cached_client.get_open_orders("BTC-USDT")
+
+        assert [str(o["orderId"]) for o in orders] == ["101"]
+        assert cached_client.open_order_requests == 2
+
+    @pytest.mark.asyncio
+    async def test_market_order_drops_symbol_caches(self, cached_client):
+        await self._warm(cached_client)
+
+        await cached_client.create_order("BTC-USDT", "BUY", "BOTH", "MARKET", 0.001)
+        await cached_client.get_open_orders("BTC-USDT")
+        await cached_client.get_open_orders("ETH-USDT")
+
+        assert cached_client.open_order_requests == 3  # Only BTC-USDT was refetched
+
+    @pytest.mark.asyncio
+    async def test_failed_cancel_drops_symbol_cache(self, cached_client):
+        await self._warm(cached_client)
+        request = cached_client._request
+
+        async def failing_delete(method, endpoint, params=None, signed=True):
+            if method == "DELETE":
+                raise Exception("Order does not exist")
+            return await request(method, endpoint, params, signed)
+
+        cached_client._request = failing_delete
+
+        with pytest.raises(Exception, match="does not exist"):
+            await cached_client.cancel_order("BTC-USDT", "1")
+        await cached_client.get_open_orders("BTC-USDT")
+
+        assert cached_client.open_order_requests == 3
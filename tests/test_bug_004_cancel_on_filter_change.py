@@ -13,9 +13,9 @@ IMPORTANT: Orders are NOT cancelled when:
 import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
-import pandas as pd
 import pytest
 
+from src.client.klines import Klines
 from src.grid.grid_manager import GridManager
 from src.strategy.macd_strategy import GridState
 
@@ -46,8 +46,28 @@ def mock_client():
     client.get_positions = AsyncMock(return_value=[])
     client.get_open_orders = AsyncMock(return_value=[])
     client.cancel_order = AsyncMock()
+
+    async def cancel_orders_batch(symbol, order_ids):
+        # Record batch cancels as one cancel_order call per order ID
+        for order_id in order_ids:
+            await client.cancel_order(symbol, order_id)
+        return [{"orderId": str(i), "success": True, "error": None} for i in order_ids]
+
+    client.cancel_orders_batch = AsyncMock(side_effect=cancel_orders_batch)
     client.get_price = AsyncMock(return_value=50000.0)
-    client.get_klines = AsyncMock(return_value=pd.DataFrame({"close": [50000] * 100}))
+    client.get_klines = AsyncMock(
+        return_value=Klines.from_records(
+            {
+                "time": 1704067200000 + i * 3600000,
+                "open": 50000,
+                "high": 50000,
+                "low": 50000,
+                "close": 50000,
+                "volume": 1,
+            }
+            for i in range(100)
+        )
+    )
     return client
 
 
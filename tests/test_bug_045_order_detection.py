@@ -10,6 +10,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from src.client.order_book import ExchangeOrderBook
 from src.grid.order_tracker import OrderTracker, TrackedOrder
 
 
@@ -70,6 +71,7 @@ class TestOrderDetection:
         with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
             gm = GridManager.__new__(GridManager)
             gm.client = mock_client
+            gm._order_book = ExchangeOrderBook(mock_client, "BTC-USDT")
             gm.tracker = tracker
             gm.symbol = "BTC-USDT"
             gm._current_price = 100000.0
@@ -120,6 +122,7 @@ class TestOrderDetection:
         with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
             gm = GridManager.__new__(GridManager)
             gm.client = mock_client
+            gm._order_book = ExchangeOrderBook(mock_client, "BTC-USDT")
             gm.tracker = tracker
             gm.symbol = "BTC-USDT"
             gm._current_price = 100000.0
@@ -166,6 +169,7 @@ class TestOrderDetection:
         with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
             gm = GridManager.__new__(GridManager)
             gm.client = mock_client
+            gm._order_book = ExchangeOrderBook(mock_client, "BTC-USDT")
             gm.tracker = tracker
             gm.symbol = "BTC-USDT"
             gm._current_price = 100000.0
@@ -205,6 +209,7 @@ class TestOrderDetection:
         with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
             gm = GridManager.__new__(GridManager)
             gm.client = mock_client
+            gm._order_book = ExchangeOrderBook(mock_client, "BTC-USDT")
             gm.tracker = tracker
             gm.symbol = "BTC-USDT"
             gm._current_price = 100000.0
@@ -252,6 +257,7 @@ class TestOrderDetection:
         with patch.object(GridManager, "__init__", lambda x, *args, **kwargs: None):
             gm = GridManager.__new__(GridManager)
             gm.client = mock_client
+            gm._order_book = ExchangeOrderBook(mock_client, "BTC-USDT")
             gm.tracker = tracker
             gm.symbol = "BTC-USDT"
             gm._current_price = 100000.0
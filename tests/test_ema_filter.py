@@ -5,6 +5,10 @@ Tests the EMA direction filter functionality including EMA calculation,
 direction detection, and trade filtering logic.
 """
 
+import numpy as np
+import pytest
+
+from src.client.klines import Klines
 from src.filters.base import FilterState
 from src.filters.ema_filter import EMADirection, EMAFilter
 
@@ -391,3 +395,105 @@ class TestPropertySetters:
         ema_filter = EMAFilter()
         ema_filter.allow_on_falling = True
         assert ema_filter.allow_on_falling is True
+
+
+def make_klines(n: int, start: int = 0, seed: int = 5) -> Klines:
+    """Build hourly Klines with a random-walk close."""
+    rng = np.random.default_rng(seed)
+    closes = 100_000 + np.cumsum(rng.normal(0, 100, start + n))[start:]
+    timestamps = (np.arange(start, start + n) + 1) * 3_600_000
+    return Klines(timestamps, closes, closes, closes, closes, np.ones(n))
+
+
+def loop_ema(closes, period: int) -> float:
+    """Reference EMA (SMA seed, then recursive update)."""
+    multiplier = 2 / (period + 1)
+    ema = sum(closes[:period]) / period
+    for close in closes[period:]:
+        ema = close * multiplier + ema * (1 - multiplier)
+    return ema
+
+
+class TestIncrementalEMA:
+    """Test running EMA state fed by Klines."""
+
+    def test_vectorized_matches_loop(self):
+        """Vectorized cold start equals the recursive formula."""
+        ema_filter = EMAFilter(period=13)
+        closes = make_klines(300).close
+
+        assert ema_filter._calculate_ema(closes) == pytest.approx(
+            loop_ema(list(closes), 13), rel=1e-12
+        )
+
+    def test_matches_full_recompute_on_first_window(self):
+        """Seeding from Klines gives the same values as update_closes()."""
+        klines = make_klines(100)
+        incremental = EMAFilter(period=13)
+        full = EMAFilter(period=13)
+
+        incremental.update(klines)
+        full.update_closes(klines.close)
+
+        assert incremental.current_ema == pytest.approx(full.current_ema, rel=1e-12)
+        assert incremental._previous_ema == pytest.approx(full._previous_ema, rel=1e-12)
+
+    def test_sliding_window_tracks_full_history(self, monkeypatch):
+        """Sliding windows advance the state without recomputing."""
+        ema_filter = EMAFilter(period=13)
+        ema_filter.update(make_klines(100))
+
+        def fail(*args, **kwargs):
+            raise AssertionError("EMA should not be recomputed")
+
+        monkeypatch.setattr(ema_filter, "_calculate_ema", fail)
+        for start in range(1, 50):
+            ema_filter.update(make_klines(100, start=start))
+
+        history = make_klines(149).close
+        assert ema_filter._previous_ema == pytest.approx(loop_ema(list(history[:-1]), 13))
+        assert ema_filter.current_ema == pytest.approx(loop_ema(list(history), 13))
+
+    def test_forming_candle_does_not_advance_state(self):
+        """Updates to the forming candle only change the current EMA."""
+        ema_filter = EMAFilter(period=13)
+        klines = make_klines(100)
+        ema_filter.update(klines)
+        closed_ema = ema_filter._closed_ema
+
+        closes = klines.close.copy()
+        closes[-1] *= 1.05
+        ema_filter.update(Klines(klines.timestamp, closes, closes, closes, closes, klines.volume))
+
+        assert ema_filter._closed_ema == closed_ema
+        assert ema_filter.direction == EMADirection.RISING
+
+    def test_sync_config_triggers_single_recompute(self):
+        """Changing the period re-seeds once, then advances incrementally."""
+        ema_filter = EMAFilter(period=13)
+        ema_filter.update(make_klines(100))
+        calls = []
+        original = ema_filter._calculate_ema
+        ema_filter._calculate_ema = lambda closes: calls.append(1) or original(closes)
+
+        ema_filter.sync_config(
+            enabled=True, period=21, timeframe="1h", allow_on_rising=True, allow_on_falling=False
+        )
+        ema_filter.update(make_klines(100))
+        ema_filter.update(make_klines(100, start=1))
+
+        assert len(calls) == 1
+        expected = loop_ema(list(make_klines(101).close), 21)
+        assert ema_filter.current_ema == pytest.approx(expected)
+
+    def test_gap_reseeds(self):
+        """Klines that no longer contain the last seen candle re-seed the state."""
+        ema_filter = EMAFilter(period=13)
+        ema_filter.update(make_klines(100))
+
+        gapped = make_klines(100, start=500)
+        ema_filter.update(gapped)
+
+        full = EMAFilter(period=13)
+        full.update_closes(gapped.close)
+        assert ema_filter.current_ema == pytest.approx(full.current_ema, rel=1e-12)
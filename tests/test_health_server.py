@@ -229,6 +229,29 @@ class TestHealthServerComponents:
         assert result["status"] == "unknown"
         assert result["connected"] is False
 
+    def test_http_pool_check_reports_reuse(self):
+        """Test HTTP pool check includes connection reuse stats."""
+        server = HealthServer(port=18092)
+        stats = {"initialized": True, "requests": 10, "reuse_ratio": 0.8}
+
+        with patch("src.health.health_server.get_http_pool_stats", return_value=stats):
+            result = server._check_http_pool()
+
+        assert result["status"] == "healthy"
+        assert result["pool"]["reuse_ratio"] == 0.8
+
+    def test_http_pool_check_not_initialized(self):
+        """Test HTTP pool check before the shared client exists."""
+        server = HealthServer(port=18093)
+
+        with patch(
+            "src.health.health_server.get_http_pool_stats",
+            return_value={"initialized": False},
+        ):
+            result = server._check_http_pool()
+
+        assert result["status"] == "unknown"
+
 
 class TestHealthServerGridStatus:
     """Test grid status reporting."""
@@ -0,0 +1,143 @@
+"""Tests for the shared BingX HTTP connection pool."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from config import BingXConfig
+from src.client import http_pool
+from src.client.bingx_client import BingXClient
+from src.client.http_pool import (
+    HttpPoolConfig,
+    close_http_client,
+    create_http_client,
+    get_http_client,
+    get_http_pool_config,
+    get_http_pool_stats,
+)
+
+
+def _config():
+    return BingXConfig(
+        api_key="test_api_key",  # pragma: allowlist secret
+        secret_key="test_secret_key",  # pragma: allowlist secret
+        is_demo=True,
+    )
+
+
+@pytest.fixture
+async def shared_client():
+    client = get_http_client()
+    yield client
+    await close_http_client()
+
+
+class TestPoolConfig:
+    """Pool settings from environment."""
+
+    def test_defaults(self, monkeypatch):
+        for name in ("BINGX_HTTP2", "BINGX_MAX_CONNECTIONS", "BINGX_ORDER_TIMEOUT"):
+            monkeypatch.delenv(name, raising=False)
+
+        assert get_http_pool_config() == HttpPoolConfig()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("BINGX_HTTP2", "false")
+        monkeypatch.setenv("BINGX_MAX_CONNECTIONS", "40")
+        monkeypatch.setenv("BINGX_ORDER_TIMEOUT", "2.5")
+
+        config = get_http_pool_config()
+
+        assert config.http2 is False
+        assert config.max_connections == 40
+        assert config.order_timeouts().read == 2.5
+        assert config.timeout().read == config.read_timeout
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_http11_without_h2(self):
+        with (
+            patch("src.client.http_pool.http2_available", return_value=False),
+            patch("src.client.http_pool.main_logger") as logger,
+        ):
+            client = create_http_client(HttpPoolConfig(http2=True))
+
+        logger.warning.assert_called_once()
+        await client.aclose()
+
+
+class TestSharedClient:
+    """Process-wide client lifecycle."""
+
+    @pytest.mark.asyncio
+    async def test_bingx_clients_share_one_pool(self, shared_client):
+        first, second = BingXClient(_config()), BingXClient(_config())
+
+        assert first.client is second.client is shared_client
+
+    @pytest.mark.asyncio
+    async def test_close_keeps_shared_client_open(self, shared_client):
+        await BingXClient(_config()).close()
+
+        assert not shared_client.is_closed
+
+    @pytest.mark.asyncio
+    async def test_close_closes_private_client(self):
+        private = httpx.AsyncClient()
+        await BingXClient(_config(), http_client=private).close()
+
+        assert private.is_closed
+
+    @pytest.mark.asyncio
+    async def test_closed_client_is_recreated(self):
+        client = get_http_client()
+        await close_http_client()
+
+        replacement = get_http_client()
+        assert replacement is not client and not replacement.is_closed
+        await close_http_client()
+
+
+class TestPoolStats:
+    """Request and connection reuse counters."""
+
+    @pytest.mark.asyncio
+    async def test_not_initialized(self):
+        await close_http_client()
+
+        assert get_http_pool_stats() == {"initialized": False}
+
+    @pytest.mark.asyncio
+    async def test_reuse_counted_from_trace_events(self, shared_client):
+        trace = http_pool._CountingTransport._trace
+        for _ in range(4):
+            http_pool._metrics.requests += 1
+        await trace("connection.connect_tcp.complete", {})
+
+        stats = get_http_pool_stats()
+
+        assert stats["requests"] == 4
+        assert stats["connections_opened"] == 1
+        assert stats["reused_requests"] == 3
+        assert stats["reuse_ratio"] == 0.75
+
+
+class TestOrderTimeout:
+    """Order endpoints use the shorter timeout budget."""
+
+    @pytest.mark.asyncio
+    async def test_order_requests_use_order_timeout(self):
+        http = httpx.AsyncClient()
+        client = BingXClient(_config(), http_client=http)
+        response = httpx.Response(
+            200, json={"code": 0, "data": {}}, request=httpx.Request("GET", "https://bingx")
+        )
+        http.post = AsyncMock(return_value=response)
+        http.get = AsyncMock(return_value=response)
+
+        await client._request("POST", "/openApi/swap/v2/trade/order", {"symbol": "BTC-USDT"})
+        await client._request("GET", "/openApi/swap/v2/user/balance")
+
+        assert http.post.call_args.kwargs["timeout"] == client._order_timeout
+        assert http.get.call_args.kwargs["timeout"] is httpx.USE_CLIENT_DEFAULT
+        await http.aclose()
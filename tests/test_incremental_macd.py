@@ -0,0 +1,148 @@
+"""
+Tests for the incremental MACD engine.
+
+Tests:
+1. Parity with pandas_ta.macd (seeded once, advanced per closed candle)
+2. MACDStrategy.update_macd only advances on newly closed candles
+"""
+
+import numpy as np
+import pandas as pd
+import pandas_ta as ta
+import pytest
+
+from config import MACDConfig
+from src.strategy.incremental_macd import IncrementalMACD
+from src.strategy.macd_strategy import MACDStrategy
+
+
+def make_klines(n: int, seed: int = 42, start: str = "2024-01-01") -> pd.DataFrame:
+    """Build deterministic BTC-like hourly klines (random walk around 100k)."""
+    rng = np.random.default_rng(seed)
+    close = 100_000 * np.exp(np.cumsum(rng.normal(0, 0.004, n)))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start=start, periods=n, freq="1h"),
+            "open": close * (1 + rng.normal(0, 0.001, n)),
+            "high": close * 1.002,
+            "low": close * 0.998,
+            "close": close,
+            "volume": rng.uniform(1, 10, n),
+        }
+    )
+
+
+class TestIncrementalMACDParity:
+    """The incremental engine must match pandas_ta on the same history."""
+
+    @pytest.mark.parametrize("fast,slow,signal", [(12, 26, 9), (5, 35, 5), (26, 12, 9)])
+    def test_matches_pandas_ta_over_series(self, fast, slow, signal):
+        """Seed on a prefix, advance candle by candle, compare every step."""
+        closes = make_klines(300)["close"]
+        expected = ta.macd(closes, fast=fast, slow=slow, signal=signal)
+        f, s = sorted((fast, slow))
+        macd_col, signal_col, hist_col = (
+            f"MACD_{f}_{s}_{signal}",
+            f"MACDs_{f}_{s}_{signal}",
+            f"MACDh_{f}_{s}_{signal}",
+        )
+
+        state = IncrementalMACD(fast, slow, signal)
+        seed_len = 100
+        state.seed(closes.iloc[:seed_len])
+
+        for i in range(seed_len, len(closes)):
+            state.update(float(closes.iloc[i]))
+            assert state.macd_line == pytest.approx(expected[macd_col].iloc[i], rel=1e-9)
+            assert state.signal_line == pytest.approx(expected[signal_col].iloc[i], rel=1e-9)
+            assert state.histogram == pytest.approx(expected[hist_col].iloc[i], abs=1e-6)
+            assert state.prev_histogram == pytest.approx(expected[hist_col].iloc[i - 1], abs=1e-6)
+
+    def test_not_ready_during_warmup(self):
+        """Histogram values appear only after slow + signal candles."""
+        state = IncrementalMACD(12, 26, 9)
+        closes = make_klines(40)["close"].tolist()
+
+        state.seed(closes[: state.min_periods - 1])
+        assert state.is_ready is False
+
+        state.update(closes[state.min_periods - 1])
+        assert state.is_ready is True
+
+
+class TestMACDStrategyUpdateMACD:
+    """MACDStrategy.update_macd uses the incremental state."""
+
+    @pytest.fixture
+    def strategy(self):
+        """Create MACDStrategy instance."""
+        return MACDStrategy(MACDConfig(fast=12, slow=26, signal=9, timeframe="1h"))
+
+    def test_matches_calculate_macd_on_first_window(self, strategy):
+        """Seeding from a window gives the same values as the pandas_ta path."""
+        klines = make_klines(100)
+
+        incremental = strategy.update_macd(klines)
+        full = strategy.calculate_macd(klines)
+
+        assert incremental is not None and full is not None
+        assert incremental.macd_line == pytest.approx(full.macd_line, rel=1e-9)
+        assert incremental.signal_line == pytest.approx(full.signal_line, rel=1e-9)
+        assert incremental.histogram == pytest.approx(full.histogram, abs=1e-6)
+        assert incremental.prev_histogram == pytest.approx(full.prev_histogram, abs=1e-6)
+
+    def test_sliding_window_matches_full_history(self, strategy):
+        """Advancing over sliding 100-candle windows tracks the full-history MACD."""
+        history = make_klines(200)
+        expected = ta.macd(history["close"].iloc[:-1], fast=12, slow=26, signal=9)
+
+        for end in range(100, 201):
+            values = strategy.update_macd(history.iloc[end - 100 : end])
+
+        assert values is not None
+        assert values.histogram == pytest.approx(expected["MACDh_12_26_9"].iloc[-1], abs=1e-6)
+        assert values.macd_line == pytest.approx(expected["MACD_12_26_9"].iloc[-1], rel=1e-9)
+
+    def test_no_recompute_while_candle_is_forming(self, strategy, monkeypatch):
+        """Repeated calls with the same closed candles return cached values."""
+        klines = make_klines(100)
+        first = strategy.update_macd(klines)
+
+        # Forming candle price changes, but no new candle closed
+        forming = klines.copy()
+        forming.loc[forming.index[-1], "close"] *= 1.05
+
+        def fail(*args, **kwargs):
+            raise AssertionError("MACD state should not be advanced")
+
+        monkeypatch.setattr(strategy._macd_state, "update", fail)
+        monkeypatch.setattr(strategy._macd_state, "seed", fail)
+
+        assert strategy.update_macd(forming) is first
+
+    def test_reseeds_on_parameter_change(self, strategy):
+        """Changing MACD periods rebuilds the state."""
+        klines = make_klines(100)
+        strategy.update_macd(klines)
+        old_state = strategy._macd_state
+
+        strategy.fast = 5
+        values = strategy.update_macd(klines)
+
+        assert strategy._macd_state is not old_state
+        full = strategy.calculate_macd(klines)
+        assert values.histogram == pytest.approx(full.histogram, abs=1e-6)
+
+    def test_reseeds_after_gap(self, strategy):
+        """A window that no longer overlaps the last candle re-seeds the state."""
+        strategy.update_macd(make_klines(100))
+        gapped = make_klines(100, seed=7, start="2024-03-01")
+
+        values = strategy.update_macd(gapped)
+        full = strategy.calculate_macd(gapped)
+
+        assert values.histogram == pytest.approx(full.histogram, abs=1e-6)
+
+    def test_not_enough_data(self, strategy):
+        """Short klines return None."""
+        assert strategy.update_macd(make_klines(20)) is None
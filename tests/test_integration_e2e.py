@@ -32,6 +32,7 @@ from src.api.dependencies import (
     get_password_hash,
 )
 from src.api.main import app
+from src.client.klines import Klines
 from src.database.base import Base
 from src.database.models.user import User
 from src.grid.order_tracker import OrderStatus, TrackedOrder
@@ -177,10 +178,16 @@ def mock_bingx_client():
     )
 
     # Klines data for MACD calculation
+    closes = [98000 + i * 50 for i in range(100)]
     mock.get_klines = AsyncMock(
-        return_value=[
-            {"close": 98000 + i * 50, "timestamp": 1704067200000 + i * 3600000} for i in range(100)
-        ]
+        return_value=Klines(
+            timestamp=[1704067200000 + i * 3600000 for i in range(100)],
+            open=closes,
+            high=closes,
+            low=closes,
+            close=closes,
+            volume=[1.0] * 100,
+        )
     )
 
     return mock
@@ -0,0 +1,297 @@
+"""Tests for the streaming KlineStore."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import BingXConfig
+from src.client.kline_store import KlineStore, get_kline_store
+from src.client.klines import Klines
+from src.client.websocket_client import BingXWebSocket
+from src.grid.update_scheduler import UpdateTrigger
+
+HOUR_MS = 3_600_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def make_rest_klines(n: int, start_ms: int = START_MS, closes: np.ndarray | None = None) -> Klines:
+    """Build Klines like BingXClient.get_klines()."""
+    if closes is None:
+        closes = 100_000.0 + np.arange(n, dtype=float)
+    return Klines(
+        start_ms + np.arange(n) * HOUR_MS,
+        closes - 1,
+        closes + 5,
+        closes - 5,
+        closes,
+        np.ones(n),
+    )
+
+
+def kline_msg(open_time: int, close: float) -> list[dict]:
+    """Build a BingX kline stream payload."""
+    return [
+        {
+            "T": open_time,
+            "o": str(close - 1),
+            "h": str(close + 5),
+            "l": str(close - 5),
+            "c": str(close),
+            "v": "2.5",
+        }
+    ]
+
+
+@pytest.fixture
+def ws():
+    """Unconnected market WebSocket (subscriptions are only recorded)."""
+    return BingXWebSocket(
+        BingXConfig(
+            api_key="test_api_key",  # pragma: allowlist secret
+            secret_key="test_secret_key",  # pragma: allowlist secret
+            is_demo=False,
+        )
+    )
+
+
+@pytest.fixture
+def client():
+    """REST client returning 10 hourly candles (last one forming)."""
+    mock = MagicMock()
+    mock.get_klines = AsyncMock(return_value=make_rest_klines(10))
+    return mock
+
+
+@pytest.fixture
+async def store(client, ws):
+    """Started KlineStore with capacity 5."""
+    kline_store = KlineStore(client, ws, "BTC-USDT", "1h", capacity=5)
+    await kline_store.start()
+    yield kline_store
+    await kline_store.stop()
+
+
+class TestBackfill:
+    """Tests for loading history via REST."""
+
+    async def test_start_backfills_and_registers(self, store, client, ws):
+        """start() subscribes, loads the newest candles and registers the store."""
+        client.get_klines.assert_awaited_once_with(
+            "BTC-USDT", interval="1h", limit=6, use_cache=False
+        )
+        assert "BTC-USDT@kline_1h" in ws._subscriptions
+        assert get_kline_store("BTC-USDT", "1h") is store
+        assert store.is_ready
+
+        # 10 REST candles, capacity 5 closed + 1 forming
+        assert len(store) == 6
+        np.testing.assert_array_equal(store.closes(), 100_000.0 + np.arange(4, 10))
+        np.testing.assert_array_equal(
+            store.closes(include_forming=False), 100_000.0 + np.arange(4, 9)
+        )
+        assert store.last_closed_time == START_MS + 8 * HOUR_MS
+
+    async def test_stop_unregisters(self, client, ws):
+        """stop() unsubscribes and removes the store from the registry."""
+        kline_store = KlineStore(client, ws, "ETH-USDT", "1h")
+        await kline_store.start()
+        await kline_store.stop()
+
+        assert get_kline_store("ETH-USDT", "1h") is None
+        assert "ETH-USDT@kline_1h" not in ws._subscriptions
+
+    async def test_to_frame_matches_rest_shape(self, store):
+        """to_frame() returns the same columns as get_klines()."""
+        frame = store.to_frame()
+
+        assert list(frame.columns) == ["open", "high", "low", "close", "volume", "timestamp"]
+        assert frame["timestamp"].iloc[-1] == pd.Timestamp(START_MS + 9 * HOUR_MS, unit="ms")
+
+
+class TestStreamUpdates:
+    """Tests for kline stream handling."""
+
+    async def test_forming_candle_updated_in_place(self, store):
+        """Updates for the forming candle do not close it."""
+        store._on_kline(kline_msg(START_MS + 9 * HOUR_MS, 123_456.0))
+
+        assert len(store) == 6
+        assert store.closes()[-1] == 123_456.0
+        assert store.last_closed_time == START_MS + 8 * HOUR_MS
+
+    async def test_new_candle_closes_previous(self, store):
+        """A newer open time closes the forming candle and evicts the oldest."""
+        store._on_kline(kline_msg(START_MS + 9 * HOUR_MS, 200_000.0))
+        store._on_kline(kline_msg(START_MS + 10 * HOUR_MS, 200_100.0))
+
+        assert store.last_closed_time == START_MS + 9 * HOUR_MS
+        np.testing.assert_array_equal(
+            store.closes(),
+            [100_005.0, 100_006.0, 100_007.0, 100_008.0, 200_000.0, 200_100.0],
+        )
+        assert store.stats["candles_closed"] == 1
+
+    async def test_wraparound_keeps_contiguous_views(self, store):
+        """Views stay contiguous and ordered after the ring wraps many times."""
+        for i in range(10, 30):
+            store._on_kline(kline_msg(START_MS + i * HOUR_MS, float(i)))
+
+        timestamps = store.timestamps()
+        assert np.all(np.diff(timestamps) == HOUR_MS)
+        np.testing.assert_array_equal(store.closes(), np.arange(24, 30, dtype=float))
+
+    async def test_klines_view_shares_buffer(self, store):
+        """klines() wraps the buffer without copying."""
+        klines = store.klines()
+
+        assert len(klines) == 6
+        assert np.shares_memory(klines.close, store._ohlcv)
+        np.testing.assert_array_equal(klines.timestamp, store.timestamps())
+
+    async def test_backfill_accepts_dataframe(self, client, ws):
+        """Backfill also loads DataFrame-shaped klines."""
+        client.get_klines.return_value = make_rest_klines(10).to_frame()
+        kline_store = KlineStore(client, ws, "BTC-USDT", "1h", capacity=5)
+        await kline_store.start()
+        try:
+            assert kline_store.last_closed_time == START_MS + 8 * HOUR_MS
+        finally:
+            await kline_store.stop()
+
+    async def test_views_are_zero_copy_and_read_only(self, store):
+        """Views share memory with the buffer and cannot be written."""
+        closes = store.closes()
+
+        assert np.shares_memory(closes, store._ohlcv)
+        with pytest.raises(ValueError):
+            closes[0] = 1.0
+
+    async def test_close_callback_on_new_candle(self, store):
+        """Close callbacks fire once per newly closed candle, not on forming updates."""
+        closed: list[int] = []
+        store.add_close_callback(closed.append)
+
+        store._on_kline(kline_msg(START_MS + 9 * HOUR_MS, 1.0))
+        store._on_kline(kline_msg(START_MS + 10 * HOUR_MS, 2.0))
+        store._on_kline(kline_msg(START_MS + 10 * HOUR_MS, 3.0))
+        store.remove_close_callback(closed.append)
+        store._on_kline(kline_msg(START_MS + 11 * HOUR_MS, 4.0))
+
+        assert closed == [START_MS + 9 * HOUR_MS]
+
+    async def test_out_of_order_update_ignored(self, store):
+        """Updates for already closed candles are ignored."""
+        before = store.closes().copy()
+        store._on_kline(kline_msg(START_MS + 2 * HOUR_MS, 1.0))
+
+        np.testing.assert_array_equal(store.closes(), before)
+
+    async def test_gap_triggers_backfill(self, store, client):
+        """Skipping candles schedules a REST backfill."""
+        client.get_klines.return_value = make_rest_klines(20)
+
+        store._on_kline(kline_msg(START_MS + 15 * HOUR_MS, 1.0))
+        await asyncio.sleep(0)
+        await store._backfill_task
+
+        assert store.stats["gaps"] == 1
+        assert store.stats["backfills"] == 2
+        assert store.last_closed_time == START_MS + 18 * HOUR_MS
+
+    async def test_reconnect_triggers_backfill(self, store, client, ws):
+        """The WebSocket connect callback backfills missed candles."""
+        for callback in ws._connect_callbacks:
+            callback()
+        await store._backfill_task
+
+        assert client.get_klines.await_count == 2
+
+    async def test_stale_when_no_updates(self, client, ws):
+        """Store is not ready once data is older than max_age_seconds."""
+        kline_store = KlineStore(client, ws, "BTC-USDT", "1h", max_age_seconds=0.0)
+        await kline_store.start()
+        try:
+            await asyncio.sleep(0.01)
+            assert kline_store.is_stale
+            assert not kline_store.is_ready
+        finally:
+            await kline_store.stop()
+
+
+class TestIndicatorViews:
+    """Tests for feeding store views to indicators."""
+
+    async def test_macd_from_views_matches_frame(self, client, ws):
+        """MACD computed from store views equals the pandas_ta path on the same candles."""
+        from config import MACDConfig
+        from src.strategy.macd_strategy import MACDStrategy
+
+        rng = np.random.default_rng(1)
+        closes = 100_000 + np.cumsum(rng.normal(0, 100, 100))
+        client.get_klines.return_value = make_rest_klines(100, closes=closes)
+
+        kline_store = KlineStore(client, ws, "BTC-USDT", "1h", capacity=99)
+        await kline_store.start()
+        try:
+            strategy = MACDStrategy(MACDConfig(fast=12, slow=26, signal=9, timeframe="1h"))
+            from_views = strategy.update_macd_from_arrays(
+                kline_store.timestamps(), kline_store.closes()
+            )
+            full = strategy.calculate_macd(kline_store.to_frame())
+        finally:
+            await kline_store.stop()
+
+        assert from_views.histogram == pytest.approx(full.histogram, abs=1e-6)
+        assert from_views.macd_line == pytest.approx(full.macd_line, rel=1e-9)
+
+
+class TestTimeframeChange:
+    """GridManager follows strategy timeframe changes with its kline store."""
+
+    @pytest.fixture
+    def grid_manager(self):
+        from src.filters.registry import FilterRegistry
+        from src.grid.grid_manager import GridManager
+
+        FilterRegistry().clear()
+        config = MagicMock()
+        config.trading.symbol = "BTC-USDT"
+        config.macd.fast = 12
+        config.macd.slow = 26
+        config.macd.signal = 9
+        config.macd.timeframe = "1h"
+        manager = GridManager(config, AsyncMock())
+        manager._scheduler = MagicMock()
+        yield manager
+        FilterRegistry().clear()
+
+    async def test_store_moves_to_new_timeframe(self, grid_manager, store, client, ws):
+        grid_manager.set_kline_store(store)
+        grid_manager.strategy.timeframe = "4h"
+
+        await grid_manager._follow_strategy_timeframe()
+
+        new_store = grid_manager.kline_store
+        assert new_store is not store
+        assert new_store.interval == "4h"
+        assert new_store.is_ready
+        assert get_kline_store("BTC-USDT", "4h") is new_store
+        assert get_kline_store("BTC-USDT", "1h") is None
+        assert "BTC-USDT@kline_4h" in ws._subscriptions
+        assert "BTC-USDT@kline_1h" not in ws._subscriptions
+        assert ws._connect_callbacks == [new_store._on_reconnect]
+
+        # Candle closes of the new interval drive indicator updates
+        new_store._on_kline(kline_msg(START_MS + 10 * HOUR_MS, 100_010.0))
+        grid_manager._scheduler.notify.assert_called_once_with(UpdateTrigger.CANDLE)
+        await new_store.stop()
+
+    async def test_same_timeframe_keeps_store(self, grid_manager, store):
+        grid_manager.set_kline_store(store)
+
+        await grid_manager._follow_strategy_timeframe()
+
+        assert grid_manager.kline_store is store
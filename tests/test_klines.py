@@ -0,0 +1,189 @@
+"""
+Tests for the columnar Klines container.
+
+Tests:
+1. Construction from BingX REST records and DataFrames
+2. Read-only arrays, slicing views and lazy to_frame()
+3. BingXClient.get_klines returns Klines
+4. MACDStrategy / EMAFilter accept Klines directly
+"""
+
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from config import BingXConfig, MACDConfig
+from src.client.bingx_client import BingXClient
+from src.client.klines import Klines
+from src.filters.ema_filter import EMAFilter
+from src.strategy.macd_strategy import MACDStrategy
+
+HOUR_MS = 3_600_000
+START_MS = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+
+
+def make_records(n: int) -> list[dict]:
+    """Build BingX REST kline payload (string values, as returned by the API)."""
+    rng = np.random.default_rng(3)
+    closes = 100_000 + np.cumsum(rng.normal(0, 100, n))
+    return [
+        {
+            "open": str(c - 10),
+            "close": str(c),
+            "high": str(c + 50),
+            "low": str(c - 50),
+            "volume": "1.5",
+            "time": START_MS + i * HOUR_MS,
+        }
+        for i, c in enumerate(closes)
+    ]
+
+
+class TestConstruction:
+    """Tests for building Klines."""
+
+    def test_from_records(self):
+        """REST records become typed contiguous columns."""
+        klines = Klines.from_records(make_records(5))
+
+        assert len(klines) == 5
+        assert klines.timestamp.dtype == np.int64
+        assert klines.close.dtype == np.float64
+        assert klines.close.flags.c_contiguous
+        assert klines.timestamp[-1] == START_MS + 4 * HOUR_MS
+        assert klines.high[0] == pytest.approx(klines.close[0] + 50)
+
+    def test_invalid_timestamps_dropped(self):
+        """Rows with missing or absurd open times are filtered out."""
+        records = make_records(4)
+        records[1]["time"] = None
+        records[2]["time"] = 1e20
+
+        klines = Klines.from_records(records)
+
+        assert len(klines) == 2
+        np.testing.assert_array_equal(klines.timestamp, [START_MS, START_MS + 3 * HOUR_MS])
+
+    def test_from_frame_roundtrip(self):
+        """from_frame(to_frame()) preserves all columns."""
+        klines = Klines.from_records(make_records(10))
+
+        restored = Klines.from_frame(klines.to_frame())
+
+        np.testing.assert_array_equal(restored.timestamp, klines.timestamp)
+        np.testing.assert_array_equal(restored.close, klines.close)
+        np.testing.assert_array_equal(restored.volume, klines.volume)
+
+
+class TestAccess:
+    """Tests for views and compatibility helpers."""
+
+    def test_arrays_are_read_only(self):
+        """Cached instances cannot be modified by consumers."""
+        klines = Klines.from_records(make_records(3))
+
+        with pytest.raises(ValueError):
+            klines.close[0] = 1.0
+
+    def test_slots(self):
+        """No per-instance __dict__."""
+        klines = Klines.from_records(make_records(3))
+
+        with pytest.raises(AttributeError):
+            klines.extra = 1
+
+    def test_slice_is_view(self):
+        """Slicing returns Klines sharing memory with the original."""
+        klines = Klines.from_records(make_records(10))
+
+        tail = klines[-3:]
+
+        assert isinstance(tail, Klines)
+        assert len(tail) == 3
+        assert np.shares_memory(tail.close, klines.close)
+
+    def test_to_frame_is_lazy_and_cached(self):
+        """to_frame() matches the legacy get_klines() DataFrame and is built once."""
+        klines = Klines.from_records(make_records(4))
+
+        frame = klines.to_frame()
+
+        assert klines.to_frame() is frame
+        assert list(frame.columns) == ["open", "high", "low", "close", "volume", "timestamp"]
+        assert frame["timestamp"].iloc[0] == pd.Timestamp(START_MS, unit="ms")
+
+
+class TestConsumers:
+    """Tests for client, strategy and filter integration."""
+
+    async def test_get_klines_returns_klines(self):
+        """BingXClient.get_klines parses the REST payload into Klines and caches it."""
+        client = BingXClient(
+            BingXConfig(
+                api_key="test_api_key",  # pragma: allowlist secret
+                secret_key="test_secret_key",  # pragma: allowlist secret
+                is_demo=False,
+            )
+        )
+        client._request = AsyncMock(return_value=make_records(50))
+
+        klines = await client.get_klines("BTC-USDT", interval="1h", limit=50)
+
+        assert isinstance(klines, Klines)
+        assert len(klines) == 50
+        assert await client.get_klines("BTC-USDT", interval="1h", limit=50) is klines
+        client._request.assert_awaited_once()
+
+    async def test_get_klines_rejects_non_list_payload(self):
+        """A dict payload from BingX raises a clear error instead of bad candles."""
+        client = BingXClient(
+            BingXConfig(
+                api_key="test_api_key",  # pragma: allowlist secret
+                secret_key="test_secret_key",  # pragma: allowlist secret
+                is_demo=False,
+            )
+        )
+        client._request = AsyncMock(return_value={"msg": "unexpected"})
+
+        with pytest.raises(ValueError, match="non-list klines response"):
+            await client.get_klines("BTC-USDT", interval="1h", limit=50)
+
+    def test_macd_from_klines_matches_frame(self):
+        """update_macd on Klines equals the pandas_ta path on the same candles."""
+        klines = Klines.from_records(make_records(100))
+        strategy = MACDStrategy(MACDConfig(fast=12, slow=26, signal=9, timeframe="1h"))
+
+        incremental = strategy.update_macd(klines)
+        full = strategy.calculate_macd(klines)
+
+        assert incremental is not None and full is not None
+        assert incremental.histogram == pytest.approx(full.histogram, abs=1e-6)
+        assert incremental.macd_line == pytest.approx(full.macd_line, rel=1e-9)
+
+    def test_ema_filter_accepts_klines(self):
+        """EMAFilter.update(Klines) matches the list-of-klines path."""
+        klines = Klines.from_records(make_records(30))
+        as_list = [
+            [t, o, h, lo, c, v]
+            for t, o, h, lo, c, v in zip(
+                klines.timestamp,
+                klines.open,
+                klines.high,
+                klines.low,
+                klines.close,
+                klines.volume,
+                strict=True,
+            )
+        ]
+
+        from_klines = EMAFilter(period=13)
+        from_klines.enable()
+        from_klines.update(klines)
+        from_list = EMAFilter(period=13)
+        from_list.enable()
+        from_list.update(as_list)
+
+        assert from_klines.current_ema == pytest.approx(from_list.current_ema)
+        assert from_klines.direction == from_list.direction
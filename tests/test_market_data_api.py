@@ -8,6 +8,7 @@ from fastapi.testclient import TestClient
 
 from src.api.dependencies import get_bingx_client, get_grid_calculator, get_macd_strategy
 from src.api.main import app
+from src.client.klines import Klines
 
 
 @pytest.fixture
@@ -36,7 +37,15 @@ def mock_bingx_client():
     mock.get_price.return_value = 99500.0
 
     # Mock get_klines response
-    mock.get_klines.return_value = [{"close": 99000 + i * 100} for i in range(100)]
+    closes = [99000 + i * 100 for i in range(100)]
+    mock.get_klines.return_value = Klines(
+        timestamp=[1704067200000 + i * 3600000 for i in range(100)],
+        open=closes,
+        high=closes,
+        low=closes,
+        close=closes,
+        volume=[1.0] * 100,
+    )
 
     return mock
 
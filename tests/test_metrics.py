@@ -0,0 +1,256 @@
+"""
+Tests for the in-process metrics registry and the /metrics endpoint.
+
+Tests:
+1. Counters, gauges and histograms render in the Prometheus text format
+2. Collectors run at scrape time; a failing collector is skipped
+3. BingX REST requests, SQL statements and grid phases are instrumented
+4. GET /metrics on the health server exports component stats
+"""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import aiohttp
+import httpx
+import pytest
+from sqlalchemy import text
+
+from config import BingXConfig
+from src.client.bingx_client import API_ERRORS, REQUEST_SECONDS, BingXClient
+from src.database import engine as db_engine
+from src.grid.grid_manager import PHASE_SECONDS, GridManager
+from src.health.health_server import HealthServer
+from src.utils.metrics import CONTENT_TYPE, MetricFamily, MetricsRegistry, metrics
+
+SERVER_TIME = "/openApi/swap/v2/server/time"
+
+
+class TestRegistry:
+    """Test metric types and text rendering."""
+
+    def test_counter_with_labels(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("endpoint",))
+
+        requests.labels("/a").inc()
+        requests.labels("/a").inc(2)
+        requests.labels("/b").inc()
+
+        output = registry.render()
+        assert "# HELP requests_total Requests\n# TYPE requests_total counter\n" in output
+        assert 'requests_total{endpoint="/a"} 3\n' in output
+        assert 'requests_total{endpoint="/b"} 1\n' in output
+
+    def test_gauge_without_labels(self):
+        registry = MetricsRegistry()
+        gauge = registry.gauge("queue_size", "Queued items")
+
+        gauge.set(7)
+        gauge.labels().dec(2)
+
+        assert "queue_size 5\n" in registry.render()
+
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            latency.observe(value)
+
+        output = registry.render()
+        assert 'latency_seconds_bucket{le="0.1"} 2\n' in output
+        assert 'latency_seconds_bucket{le="1"} 3\n' in output
+        assert 'latency_seconds_bucket{le="+Inf"} 4\n' in output
+        assert "latency_seconds_sum 3.65\n" in output
+        assert "latency_seconds_count 4\n" in output
+
+    def test_histogram_timer(self):
+        registry = MetricsRegistry()
+        phase = registry.histogram("phase_seconds", "Phase", ("phase",))
+
+        with phase.labels("sync").time():
+            pass
+
+        value = phase.labels("sync")
+        assert value.count == 1
+        assert 0 <= value.sum < 1
+
+    def test_label_values_are_escaped(self):
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ("msg",)).labels('bad "x"\\\n').inc()
+
+        assert 'errors_total{msg="bad \\"x\\"\\\\\\n"} 1' in registry.render()
+
+    def test_wrong_label_count_raises(self):
+        registry = MetricsRegistry()
+        requests = registry.counter("requests_total", "Requests", ("endpoint", "status"))
+
+        with pytest.raises(ValueError, match="expects labels"):
+            requests.labels("/a")
+
+    def test_get_or_create_returns_same_metric(self):
+        registry = MetricsRegistry()
+
+        first = registry.counter("requests_total", "Requests")
+
+        assert registry.counter("requests_total", "Requests") is first
+        with pytest.raises(ValueError, match="already registered"):
+            registry.gauge("requests_total", "Requests")
+
+    def test_unused_metric_renders_header_only(self):
+        registry = MetricsRegistry()
+        registry.histogram("idle_seconds", "Idle", ("phase",))
+
+        assert registry.render() == "# HELP idle_seconds Idle\n# TYPE idle_seconds histogram\n"
+
+
+class TestCollectors:
+    """Test scrape-time collectors."""
+
+    def test_collector_runs_at_render(self):
+        registry = MetricsRegistry()
+        calls = []
+
+        def collect():
+            calls.append(1)
+            family = MetricFamily("cache_entries", "gauge", "Entries")
+            family.add(12, cache="klines")
+            family.add(None, cache="unknown")  # Skipped
+            return [family]
+
+        registry.register_collector(collect)
+        registry.register_collector(collect)  # No-op
+        assert calls == []
+
+        output = registry.render()
+
+        assert calls == [1]
+        assert 'cache_entries{cache="klines"} 12\n' in output
+        assert "unknown" not in output
+
+    def test_failing_collector_is_skipped(self):
+        registry = MetricsRegistry()
+        registry.counter("ok_total", "Still rendered").inc()
+
+        def broken():
+            raise RuntimeError("boom")
+
+        registry.register_collector(broken)
+
+        assert "ok_total 1\n" in registry.render()
+
+    def test_unregister_collector(self):
+        registry = MetricsRegistry()
+
+        def collect():
+            return [MetricFamily("gone", "gauge", "Gone", [({}, 1.0)])]
+
+        registry.register_collector(collect)
+        registry.unregister_collector(collect)
+
+        assert "gone" not in registry.render()
+
+
+class TestInstrumentation:
+    """Test the hot-path instrumentation."""
+
+    @staticmethod
+    def make_client(handler) -> BingXClient:
+        config = BingXConfig("key", "secret")  # pragma: allowlist secret
+        return BingXClient(
+            config, http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_latency_by_endpoint_and_status(self):
+        client = self.make_client(lambda request: httpx.Response(200, json={"code": 0, "data": {}}))
+        before = REQUEST_SECONDS.labels(SERVER_TIME, "200").count
+
+        await client._request("GET", SERVER_TIME, signed=False)
+
+        assert REQUEST_SECONDS.labels(SERVER_TIME, "200").count == before + 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_request_api_error_code_is_counted(self):
+        client = self.make_client(
+            lambda request: httpx.Response(200, json={"code": 80014, "msg": "bad symbol"})
+        )
+        before = API_ERRORS.labels(SERVER_TIME, "80014").value
+
+        with pytest.raises(Exception, match="bad symbol"):
+            await client._request("GET", SERVER_TIME, signed=False)
+
+        assert API_ERRORS.labels(SERVER_TIME, "80014").value == before + 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_request_transport_error_is_recorded(self):
+        def fail(request):
+            raise httpx.ConnectError("refused")
+
+        client = self.make_client(fail)
+        before = REQUEST_SECONDS.labels(SERVER_TIME, "error").count
+
+        with pytest.raises(httpx.ConnectError):
+            await client._request("GET", SERVER_TIME, signed=False, max_retries=1)
+
+        assert REQUEST_SECONDS.labels(SERVER_TIME, "error").count == before + 1
+        await client.close()
+
+    @pytest.mark.asyncio
+    async def test_query_duration_by_operation(self, monkeypatch):
+        monkeypatch.setenv("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
+        engine = db_engine.create_engine()
+        before = db_engine.QUERY_SECONDS.labels("SELECT").count
+
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+        assert db_engine.QUERY_SECONDS.labels("SELECT").count == before + 1
+        await engine.dispose()
+
+    @pytest.mark.asyncio
+    async def test_update_cycle_phases_are_timed(self):
+        manager = MagicMock()
+        manager._running = True
+        manager._sync_with_exchange = AsyncMock()
+        manager._broadcast_pnl_updates = AsyncMock()
+        before = PHASE_SECONDS.labels("sync").count, PHASE_SECONDS.labels("pnl").count
+
+        await GridManager._run_cycle(
+            manager, refresh_indicators=False, grid=False, sync=True, pnl=True
+        )
+
+        after = PHASE_SECONDS.labels("sync").count, PHASE_SECONDS.labels("pnl").count
+        assert after == (before[0] + 1, before[1] + 1)
+
+
+class TestMetricsEndpoint:
+    """Test GET /metrics on the health server."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_endpoint(self):
+        bingx_client = MagicMock()
+        bingx_client.cache_stats.return_value = {
+            "klines": {"hits": 5, "stale": 1, "misses": 2, "coalesced": 1},
+            "open_orders": {"hits": 0, "stale": 0, "misses": 4, "coalesced": 0},
+        }
+        server = HealthServer(port=18096, bingx_client=bingx_client)
+
+        await server.start()
+        try:
+            async with aiohttp.ClientSession() as session:
+                async with session.get("http://localhost:18096/metrics") as resp:
+                    assert resp.status == 200
+                    assert resp.headers["Content-Type"] == CONTENT_TYPE
+                    body = await resp.text()
+        finally:
+            await server.stop()
+
+        assert "# TYPE bingx_request_duration_seconds histogram" in body
+        assert 'bingx_cache_requests_total{kind="klines",result="hits"} 5\n' in body
+        assert 'bingx_cache_requests_total{kind="open_orders",result="misses"} 4\n' in body
+        assert 'analytics_cache_requests_total{result="hit"}' in body
+        # Component collectors only run while the server is up
+        assert "bingx_cache_requests_total" not in metrics.render()
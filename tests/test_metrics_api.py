@@ -2,15 +2,15 @@
 
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal
-from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.api.dependencies import get_account_id, get_trade_repository
+from src.api.dependencies import get_account_id, get_trade_analytics_repository
 from src.api.main import app
 from src.database.models.trade import Trade
+from tests.trade_analytics_fakes import FakeTradeAnalyticsRepository
 
 
 @pytest.fixture
@@ -98,16 +98,13 @@ def test_get_performance_metrics_today(sample_trades, test_account_id):
     today_start = datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
     today_trades = [t for t in sample_trades if t.opened_at >= today_start]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = today_trades
-        mock_repo.get_trades_by_account.return_value = sample_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(sample_trades, period_trades=today_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -160,16 +157,13 @@ def test_get_performance_metrics_7days(sample_trades, test_account_id):
     seven_days_ago = today_start - timedelta(days=6)
     period_trades = [t for t in sample_trades if t.opened_at >= seven_days_ago]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = period_trades
-        mock_repo.get_trades_by_account.return_value = sample_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(sample_trades, period_trades=period_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -194,17 +188,14 @@ def test_get_performance_metrics_7days(sample_trades, test_account_id):
 def test_get_performance_metrics_30days(sample_trades, test_account_id):
     """Test GET /api/v1/metrics/performance with 30days period."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
+    async def mock_get_trade_analytics_repository():
         # All trades are within 30 days
-        mock_repo.get_trades_by_period.return_value = sample_trades
-        mock_repo.get_trades_by_account.return_value = sample_trades
-        return mock_repo
+        return FakeTradeAnalyticsRepository(sample_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -234,16 +225,13 @@ def test_get_performance_metrics_custom_period(sample_trades, test_account_id):
     # Only older trades (from 10 days ago)
     older_trades = [t for t in sample_trades if t.opened_at <= now - timedelta(days=5)]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = older_trades
-        mock_repo.get_trades_by_account.return_value = sample_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(sample_trades, period_trades=older_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -270,13 +258,13 @@ def test_get_performance_metrics_custom_period(sample_trades, test_account_id):
 def test_get_performance_metrics_custom_without_dates(test_account_id):
     """Test GET /api/v1/metrics/performance custom period without dates."""
 
-    async def mock_get_trade_repository():
-        return AsyncMock()
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -295,16 +283,13 @@ def test_get_performance_metrics_custom_without_dates(test_account_id):
 def test_get_performance_metrics_empty(test_account_id):
     """Test GET /api/v1/metrics/performance with no trades."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = []
-        mock_repo.get_trades_by_account.return_value = []
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -357,16 +342,13 @@ def test_get_performance_metrics_win_rate_calculation(test_account_id):
         )
         trades.append(trade)
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = trades
-        mock_repo.get_trades_by_account.return_value = trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -396,16 +378,13 @@ def test_get_performance_metrics_win_rate_calculation(test_account_id):
 def test_get_performance_metrics_default_period(test_account_id):
     """Test that default period is 'today'."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = []
-        mock_repo.get_trades_by_account.return_value = []
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -0,0 +1,255 @@
+"""
+Tests for the local exchange order book mirror.
+
+Tests:
+1. ORDER_TRADE_UPDATE events upsert/remove orders and keep the indexes in sync
+2. Reads fall back to REST while the account WebSocket is down
+3. Snapshots are only taken when the book is stale, and keep in-flight events
+4. TradeReconciliation reads open orders from the book when given one
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.client.order_book import ExchangeOrderBook
+
+
+def _event(order_id, status="NEW", order_type="LIMIT", price="100000", stop_price="0", qty="0.001"):
+    return {
+        "s": "BTC-USDT",
+        "i": order_id,
+        "S": "BUY",
+        "o": order_type,
+        "p": price,
+        "sp": stop_price,
+        "q": qty,
+        "X": status,
+    }
+
+
+def _rest_order(order_id, order_type="LIMIT", price="100000", stop_price="0"):
+    return {
+        "orderId": order_id,
+        "symbol": "BTC-USDT",
+        "type": order_type,
+        "price": price,
+        "stopPrice": stop_price,
+        "origQty": "0.001",
+    }
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.get_open_orders = AsyncMock(return_value=[])
+    return client
+
+
+@pytest.fixture
+def live_ws():
+    ws = MagicMock()
+    ws.is_connected = True
+    return ws
+
+
+class TestEvents:
+    """Tests for applying ORDER_TRADE_UPDATE events."""
+
+    def test_new_order_is_indexed(self, client):
+        """A NEW event adds the order in REST shape, indexed by id, type and price."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.apply_event(_event(1))
+
+        order = book.get(1)
+        assert order["orderId"] == "1"
+        assert order["type"] == "LIMIT"
+        assert order["origQty"] == "0.001"
+        assert book.by_type("LIMIT") == [order]
+        assert book.at_price(100000.0) == [order]
+
+    def test_tp_order_is_indexed_by_stop_price(self, client):
+        """TP orders are indexed by their trigger price."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.apply_event(_event(2, order_type="TAKE_PROFIT_MARKET", price="0", stop_price="100500"))
+
+        assert [o["orderId"] for o in book.at_price(100500.0)] == ["2"]
+        assert book.at_price(0.0) == []
+
+    def test_closed_status_removes_order(self, client):
+        """FILLED and CANCELED events remove the order from every index."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.apply_event(_event(1))
+        book.apply_event(_event(2))
+
+        book.apply_event(_event(1, status="FILLED"))
+        book.apply_event(_event(2, status="CANCELED"))
+
+        assert len(book) == 0
+        assert book.by_type("LIMIT") == []
+        assert book.at_price(100000.0) == []
+
+    def test_update_reindexes_price(self, client):
+        """An update with a new price moves the order to the new price index."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.apply_event(_event(1, price="100000"))
+        book.apply_event(_event(1, status="PARTIALLY_FILLED", price="99000"))
+
+        assert book.at_price(100000.0) == []
+        assert book.get(1)["status"] == "PARTIALLY_FILLED"
+        assert book.at_price(99000.0) == [book.get(1)]
+
+    def test_other_symbol_is_ignored(self, client):
+        """Events for other symbols are ignored."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.apply_event({**_event(1), "s": "ETH-USDT"})
+
+        assert len(book) == 0
+
+
+class TestReads:
+    """Tests for REST fallback and snapshot reconciliation."""
+
+    async def test_rest_fallback_without_websocket(self, client):
+        """Without a connected WebSocket every read goes to REST."""
+        client.get_open_orders.return_value = [_rest_order("1")]
+        book = ExchangeOrderBook(client, "BTC-USDT")
+
+        orders = await book.get_open_orders()
+        await book.get_open_orders()
+
+        assert orders == [_rest_order("1")]
+        assert client.get_open_orders.await_count == 2
+        assert book.is_stale
+        assert book.stats["rest_reads"] == 2
+
+    async def test_live_book_takes_one_snapshot(self, client, live_ws):
+        """When live, only the first read takes a snapshot; later reads are in-memory."""
+        client.get_open_orders.return_value = [_rest_order("1")]
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+
+        await book.get_open_orders()
+        book.apply_event(_event(2))
+        orders = await book.get_open_orders()
+
+        client.get_open_orders.assert_awaited_once_with("BTC-USDT", use_cache=False)
+        assert {o["orderId"] for o in orders} == {"1", "2"}
+        assert not book.is_stale
+        assert book.stats["book_reads"] == 2
+
+    async def test_reconnect_forces_snapshot(self, client, live_ws):
+        """A WebSocket reconnect marks the book stale until the next snapshot."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+        reconnect = live_ws.add_connect_callback.call_args.args[0]
+
+        await book.get_open_orders()
+        assert not book.is_stale
+
+        reconnect()
+        assert book.is_stale
+        await book.get_open_orders()
+        assert client.get_open_orders.await_count == 2
+
+    async def test_snapshot_keeps_events_received_meanwhile(self, client, live_ws):
+        """Events that arrive while a snapshot is in flight are replayed on top of it."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+
+        async def slow_snapshot(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return [_rest_order("1"), _rest_order("2")]
+
+        client.get_open_orders.side_effect = slow_snapshot
+        refresh = asyncio.create_task(book.refresh())
+        await asyncio.sleep(0)
+        book.apply_event(_event(2, status="FILLED"))
+        book.apply_event(_event(3))
+        await refresh
+
+        assert {o["orderId"] for o in book.orders()} == {"1", "3"}
+
+    async def test_failed_snapshot_keeps_book_stale(self, client, live_ws):
+        """A failed snapshot leaves the book stale and is counted."""
+        client.get_open_orders.side_effect = RuntimeError("boom")
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+
+        await book.refresh()
+
+        assert book.is_stale
+        assert book.stats["snapshot_errors"] == 1
+
+    async def test_failed_snapshot_reads_rest_instead_of_stale_book(self, client, live_ws):
+        """A live but stale book is not served when its snapshot fails."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+        book.apply_event(_event(1))  # Book before the reconnect
+        book.clear()
+
+        async def snapshot_fails(symbol, use_cache=True):
+            if not use_cache:
+                raise RuntimeError("boom")
+            return [_rest_order("2")]
+
+        client.get_open_orders.side_effect = snapshot_fails
+        orders = await book.get_open_orders()
+
+        assert [o["orderId"] for o in orders] == ["2"]
+        assert book.stats["snapshot_errors"] == 1
+        assert book.stats["rest_reads"] == 1
+        assert book.stats["book_reads"] == 0
+
+    async def test_failed_snapshot_and_rest_read_raise(self, client, live_ws):
+        """If REST is down too, the error reaches the caller instead of an empty book."""
+        client.get_open_orders.side_effect = RuntimeError("boom")
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+
+        with pytest.raises(RuntimeError, match="boom"):
+            await book.get_open_orders()
+
+    async def test_local_add_and_discard(self, client, live_ws):
+        """Local create/cancel results are visible immediately."""
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+        await book.refresh()
+
+        book.add_order(_rest_order("7"))
+        assert [o["orderId"] for o in await book.get_open_orders()] == ["7"]
+
+        assert book.discard("7") is not None
+        assert await book.get_open_orders() == []
+
+
+class TestReconciliationUsesBook:
+    """TradeReconciliation reads open orders from the book."""
+
+    async def test_reconcile_reads_book(self, client, live_ws, monkeypatch):
+        """With an order book, reconcile() does not call client.get_open_orders."""
+        from uuid import uuid4
+
+        from src.grid import reconciliation as reconciliation_module
+        from src.grid.reconciliation import TradeReconciliation
+
+        book = ExchangeOrderBook(client, "BTC-USDT")
+        book.attach(live_ws)
+        await book.refresh()
+        client.get_open_orders.reset_mock()
+
+        async def fake_session():
+            yield MagicMock()
+
+        monkeypatch.setattr(reconciliation_module, "get_session", fake_session)
+        repo = MagicMock()
+        repo.get_open_trades = AsyncMock(return_value=[])
+        monkeypatch.setattr(reconciliation_module, "TradeRepository", lambda s: repo)
+        client.get_positions = AsyncMock(return_value=[])
+
+        reconciliation = TradeReconciliation(client, uuid4(), "BTC-USDT", order_book=book)
+        await reconciliation.reconcile()
+
+        client.get_open_orders.assert_not_called()
+        repo.get_open_trades.assert_awaited_once()
@@ -0,0 +1,193 @@
+"""
+Tests for the BingX request rate limiter.
+
+Tests:
+1. TokenBucket paces requests, backs off on penalties and recovers
+2. RateLimiter maps endpoints to groups and bounds order concurrency
+3. BingXClient retries rate-limited responses and raises RateLimitError
+"""
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from config import BingXConfig
+from src.client.bingx_client import BingXClient
+from src.client.rate_limiter import (
+    BucketLimit,
+    RateLimiter,
+    RateLimitError,
+    TokenBucket,
+    endpoint_group,
+    is_rate_limit_error,
+)
+
+
+def _response(status_code=200, payload=None, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.json.return_value = payload if payload is not None else {"code": 0, "data": {}}
+    return response
+
+
+@pytest.fixture
+def client():
+    config = BingXConfig(
+        api_key="test_api_key",  # pragma: allowlist secret
+        secret_key="test_secret_key",  # pragma: allowlist secret
+        is_demo=False,
+    )
+    client = BingXClient(config, http_client=httpx.AsyncClient())
+    client.rate_limiter = RateLimiter(retry_after=0.01)
+    return client
+
+
+class TestTokenBucket:
+    """Tests for token bucket pacing and adaptation."""
+
+    async def test_burst_is_immediate(self):
+        """Requests within the burst do not wait."""
+        bucket = TokenBucket(rate=10, burst=5)
+        waits = [await bucket.acquire() for _ in range(5)]
+        assert waits == [0.0] * 5
+
+    async def test_empty_bucket_waits_for_refill(self):
+        """Once the burst is used, requests are paced at the refill rate."""
+        bucket = TokenBucket(rate=100, burst=1)
+        await bucket.acquire()
+
+        start = time.monotonic()
+        await bucket.acquire()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.015
+
+    async def test_penalize_halves_rate_and_pauses(self):
+        """A penalty halves the rate and blocks for retry_after."""
+        bucket = TokenBucket(rate=100, burst=10)
+        bucket.penalize(0.05)
+        assert bucket.rate == 50
+
+        start = time.monotonic()
+        await bucket.acquire()
+        assert time.monotonic() - start >= 0.04
+
+    def test_rate_has_a_floor(self):
+        """Repeated penalties never go below the minimum rate."""
+        bucket = TokenBucket(rate=10, burst=10, min_rate_fraction=0.2)
+        for _ in range(10):
+            bucket.penalize(0)
+        assert bucket.rate == 2
+
+    def test_rate_recovers_after_quiet_period(self):
+        """Successes after the recovery period step the rate back up."""
+        bucket = TokenBucket(rate=10, burst=10, recovery_seconds=0)
+        bucket.penalize(0)
+        bucket.record_success()
+        assert bucket.rate == 6.25
+        for _ in range(10):
+            bucket.record_success()
+        assert bucket.rate == 10
+
+    def test_no_recovery_during_quiet_period(self):
+        """The rate stays reduced while penalties are recent."""
+        bucket = TokenBucket(rate=10, burst=10, recovery_seconds=60)
+        bucket.penalize(0)
+        bucket.record_success()
+        assert bucket.rate == 5
+
+
+class TestRateLimiter:
+    """Tests for endpoint groups and concurrency limits."""
+
+    @pytest.mark.parametrize(
+        "method,endpoint,group",
+        [
+            ("GET", "/openApi/swap/v2/quote/price", "market"),
+            ("GET", "/openApi/swap/v3/quote/klines", "market"),
+            ("POST", "/openApi/swap/v2/trade/order", "order"),
+            ("DELETE", "/openApi/swap/v2/trade/order", "order"),
+            ("GET", "/openApi/swap/v2/trade/openOrders", "account"),
+            ("GET", "/openApi/swap/v2/user/positions", "account"),
+        ],
+    )
+    def test_endpoint_group(self, method, endpoint, group):
+        assert endpoint_group(method, endpoint) == group
+
+    def test_rate_limit_detection(self):
+        assert is_rate_limit_error(100410, "")
+        assert is_rate_limit_error(80001, "over 20 error in 8 minutes")
+        assert is_rate_limit_error(1, "Rate limit exceeded")
+        assert not is_rate_limit_error(80001, "Insufficient margin")
+
+    async def test_order_concurrency_is_bounded(self):
+        """No more than max_concurrency order requests run at once."""
+        limiter = RateLimiter({"order": BucketLimit(rate=1000, burst=100, max_concurrency=3)})
+        running = 0
+        peak = 0
+
+        async def request():
+            nonlocal running, peak
+            async with limiter.slot("order"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(request() for _ in range(10)))
+        assert peak == 3
+        assert limiter.stats["order"]["requests"] == 10
+
+    def test_record_rate_limited_uses_default_cooldown(self):
+        limiter = RateLimiter(retry_after=2.0)
+        assert limiter.record_rate_limited("order") == 2.0
+        assert limiter.record_rate_limited("order", 0.5) == 0.5
+        assert limiter.stats["order"]["rate_limited"] == 2
+
+
+class TestClientRateLimiting:
+    """Tests for rate-limit handling in BingXClient._request."""
+
+    async def test_retries_after_api_rate_limit(self, client):
+        """A frequency-limit error code is retried after the cool-down."""
+        client.client.post = AsyncMock(
+            side_effect=[
+                _response(payload={"code": 100410, "msg": "rate limitation"}),
+                _response(payload={"code": 0, "data": {"orderId": "1"}}),
+            ]
+        )
+
+        data = await client._request("POST", "/openApi/swap/v2/trade/order", {"symbol": "X"})
+
+        assert data == {"orderId": "1"}
+        assert client.client.post.await_count == 2
+        assert client.rate_limiter.stats["order"]["rate_limited"] == 1
+        assert client.rate_limiter.stats["order"]["rate"] < 9.0
+
+    async def test_http_429_uses_retry_after_header(self, client):
+        """HTTP 429 raises RateLimitError with the Retry-After cool-down."""
+        client.client.get = AsyncMock(
+            return_value=_response(status_code=429, headers={"Retry-After": "0"})
+        )
+
+        with pytest.raises(RateLimitError) as exc_info:
+            await client._request("GET", "/openApi/swap/v2/user/positions", max_retries=2)
+
+        assert exc_info.value.group == "account"
+        assert exc_info.value.retry_after == 0
+        assert client.client.get.await_count == 2
+
+    async def test_other_errors_are_not_rate_limits(self, client):
+        """Regular API errors are raised as before, without penalizing the group."""
+        client.client.post = AsyncMock(
+            return_value=_response(payload={"code": 80001, "msg": "Insufficient margin"})
+        )
+
+        with pytest.raises(Exception, match="Insufficient margin") as exc_info:
+            await client._request("POST", "/openApi/swap/v2/trade/order", {"symbol": "X"})
+
+        assert not isinstance(exc_info.value, RateLimitError)
+        assert client.rate_limiter.stats["order"]["rate_limited"] == 0
@@ -0,0 +1,211 @@
+"""Tests for the BingX request cache (single-flight, stale-while-revalidate, LRU)."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from config import BingXConfig
+from src.client.bingx_client import BingXClient
+from src.client.request_cache import CachePolicy, RequestCache
+
+
+class Loader:
+    """Async loader that counts calls and can be held until released."""
+
+    def __init__(self):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.calls
+
+
+class Clock:
+    """Controllable replacement for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("src.client.request_cache.time.monotonic", clock):
+        yield clock
+
+
+class TestSingleFlight:
+    """Concurrent misses share one request."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_coalesce(self):
+        cache = RequestCache()
+        loader = Loader()
+        loader.release.clear()
+
+        tasks = [asyncio.create_task(cache.fetch("open_orders:BTC-USDT", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+
+        assert await asyncio.gather(*tasks) == [1] * 5
+        assert loader.calls == 1
+        stats = cache.snapshot()["open_orders"]
+        assert (stats["misses"], stats["coalesced"]) == (1, 4)
+
+    @pytest.mark.asyncio
+    async def test_failure_is_shared_and_not_cached(self):
+        cache = RequestCache()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0)
+            raise RuntimeError("boom")
+
+        results = await asyncio.gather(
+            cache.fetch("positions:all", failing),
+            cache.fetch("positions:all", failing),
+            return_exceptions=True,
+        )
+
+        assert calls == 1
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert cache.get("positions:all") is None
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_request(self):
+        cache = RequestCache()
+        loader = Loader()
+        loader.release.clear()
+
+        first = asyncio.create_task(cache.fetch("balance", loader))
+        second = asyncio.create_task(cache.fetch("balance", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+
+        assert await second == 1
+        assert cache.get("balance") == 1
+
+    @pytest.mark.asyncio
+    async def test_invalidated_load_is_not_cached(self):
+        cache = RequestCache()
+        loader = Loader()
+        loader.release.clear()
+
+        pending = asyncio.create_task(cache.fetch("open_orders:BTC-USDT", loader))
+        await asyncio.sleep(0)
+        cache.invalidate("open_orders")  # Order placed while the read was in flight
+        loader.release.set()
+
+        assert await pending == 1
+        assert cache.get("open_orders:BTC-USDT") is None
+        assert await cache.fetch("open_orders:BTC-USDT", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_always_requests(self):
+        cache = RequestCache()
+        loader = Loader()
+
+        await cache.fetch("klines:BTC-USDT:1h", loader)
+        assert await cache.fetch("klines:BTC-USDT:1h", loader, use_cache=False) == 2
+        assert cache.get("klines:BTC-USDT:1h") == 2
+
+
+class TestExpiry:
+    """TTL, stale-while-revalidate and LRU bound."""
+
+    @pytest.mark.asyncio
+    async def test_policy_by_key_kind(self, clock):
+        cache = RequestCache({"positions": CachePolicy(ttl=15)})
+        loader = Loader()
+
+        await cache.fetch("positions:BTC-USDT", loader)
+        clock.now += 14
+        assert await cache.fetch("positions:BTC-USDT", loader) == 1
+        clock.now += 2
+        assert await cache.fetch("positions:BTC-USDT", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_value_served_while_refreshing(self, clock):
+        cache = RequestCache({"funding_rate": CachePolicy(ttl=10, stale=10)})
+        loader = Loader()
+        await cache.fetch("funding_rate:BTC-USDT", loader)
+        loader.release.clear()
+
+        clock.now += 15
+        assert await cache.fetch("funding_rate:BTC-USDT", loader) == 1
+        assert await cache.fetch("funding_rate:BTC-USDT", loader) == 1  # One refresh only
+        loader.release.set()
+        await asyncio.sleep(0)
+
+        assert loader.calls == 2
+        assert cache.get("funding_rate:BTC-USDT") == 2
+        assert cache.snapshot()["funding_rate"]["stale"] == 2
+
+    @pytest.mark.asyncio
+    async def test_past_stale_window_waits_for_fresh_value(self, clock):
+        cache = RequestCache({"funding_rate": CachePolicy(ttl=10, stale=10)})
+        loader = Loader()
+        await cache.fetch("funding_rate:BTC-USDT", loader)
+
+        clock.now += 25
+        assert await cache.fetch("funding_rate:BTC-USDT", loader) == 2
+
+    @pytest.mark.asyncio
+    async def test_lru_bound(self):
+        cache = RequestCache(max_entries=2)
+        for key in ("a", "b"):
+            await cache.fetch(key, Loader())
+        await cache.fetch("a", Loader())  # Hit: "a" becomes most recently used
+
+        await cache.fetch("c", Loader())
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    @pytest.mark.asyncio
+    async def test_stats_are_bounded_per_kind(self):
+        cache = RequestCache(max_entries=2)
+        for limit in range(10):
+            await cache.fetch(f"klines:BTC-USDT:1h:{limit}", Loader())
+        await cache.fetch("klines:BTC-USDT:1h:9", Loader())
+
+        assert cache.snapshot() == {"klines": {"hits": 1, "stale": 0, "misses": 10, "coalesced": 0}}
+
+
+class TestBingXClientCoalescing:
+    """BingXClient getters share in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_open_orders_share_one_request(self):
+        client = BingXClient(
+            BingXConfig(
+                api_key="test_api_key",  # pragma: allowlist secret
+                secret_key="test_secret_key",  # pragma: allowlist secret
+                is_demo=True,
+            )
+        )
+        calls = 0
+
+        async def fake_request(method, endpoint, params=None, signed=True):
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"orders": [{"orderId": "1"}]}
+
+        client._request = fake_request
+
+        results = await asyncio.gather(*(client.get_open_orders("BTC-USDT") for _ in range(4)))
+
+        assert calls == 1
+        assert all(r == [{"orderId": "1"}] for r in results)
+        assert client.cache_stats()["open_orders"]["coalesced"] == 3
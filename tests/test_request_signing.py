@@ -0,0 +1,88 @@
+"""
+Tests for BingX request signing.
+
+Tests:
+1. Signatures match a plain HMAC-SHA256 of the sorted raw query string
+2. The URL query is encoded only when a value needs quoting
+
+The per-order signing overhead is benchmarked in benchmarks/test_signing.py.
+"""
+
+import hashlib
+import hmac
+import json
+from urllib.parse import parse_qs, urlencode, urlparse
+
+import httpx
+import pytest
+
+from config import BingXConfig
+from src.client.bingx_client import BingXClient, _canonical_query
+
+SECRET = "test_secret_key"  # pragma: allowlist secret
+
+ORDER_PARAMS = {
+    "symbol": "BTC-USDT",
+    "side": "BUY",
+    "positionSide": "LONG",
+    "type": "LIMIT",
+    "quantity": 0.001,
+    "price": 97250.5,
+    "clientOrderId": "grid-3f2a9c1e",
+    "timestamp": 1760000000000,
+}
+
+
+@pytest.fixture
+def client():
+    return BingXClient(
+        BingXConfig(
+            api_key="test_api_key",  # pragma: allowlist secret
+            secret_key=SECRET,
+            is_demo=False,
+        ),
+        http_client=httpx.AsyncClient(),
+    )
+
+
+def _reference_url(client, endpoint, params):
+    """Signed URL as built before signing was precomputed."""
+    sorted_params = sorted(params.items())
+    query_string = "&".join([f"{k}={v}" for k, v in sorted_params])
+    signature = hmac.new(SECRET.encode(), query_string.encode(), hashlib.sha256).hexdigest()
+    return f"{client.base_url}{endpoint}?{urlencode(sorted_params)}&signature={signature}"
+
+
+class TestSigning:
+    """Signature and URL construction."""
+
+    def test_signature_matches_plain_hmac(self, client):
+        expected = hmac.new(SECRET.encode(), b"a=1&b=2", hashlib.sha256).hexdigest()
+
+        assert client._generate_signature("a=1&b=2") == expected
+        assert client._generate_signature("a=1&b=2") == expected  # Prototype is not consumed
+
+    def test_plain_values_skip_encoding(self):
+        raw, encoded = _canonical_query({"symbol": "BTC-USDT", "price": 97250.5})
+
+        assert raw == "price=97250.5&symbol=BTC-USDT"
+        assert encoded is raw
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            ORDER_PARAMS,
+            {"symbol": "BTC-USDT", "orderIdList": "[11,12]", "timestamp": 1},
+            {"batchOrders": json.dumps([{"symbol": "BTC-USDT", "price": "1"}]), "timestamp": 1},
+            {"note": "a=b&c d", "timestamp": 1},
+        ],
+    )
+    def test_url_matches_reference(self, client, params):
+        endpoint = "/openApi/swap/v2/trade/order"
+
+        assert client._signed_url(endpoint, params) == _reference_url(client, endpoint, params)
+
+    def test_encoded_values_round_trip(self, client):
+        url = client._signed_url("/x", {"orderIdList": "[11,12]", "timestamp": 1})
+
+        assert parse_qs(urlparse(url).query)["orderIdList"] == ["[11,12]"]
@@ -0,0 +1,158 @@
+"""Tests for the analytics response cache."""
+
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api.dependencies import get_account_id, get_trade_analytics_repository
+from src.api.main import app
+from src.utils.response_cache import BYPASS, HIT, MISS, ResponseCache, invalidate_account
+from tests.trade_analytics_fakes import FakeTradeAnalyticsRepository
+
+
+class Counter:
+    """Async compute function that counts its calls."""
+
+    def __init__(self, value="value"):
+        self.value = value
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        return self.value
+
+
+class TestResponseCache:
+    """Unit tests for ResponseCache."""
+
+    @pytest.mark.asyncio
+    async def test_hit_after_miss(self):
+        cache = ResponseCache()
+        compute = Counter()
+        key = ("route", uuid4(), "today")
+
+        assert await cache.get_or_compute(key, compute) == ("value", MISS)
+        assert await cache.get_or_compute(key, compute) == ("value", HIT)
+        assert compute.calls == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bump_invalidates_only_that_account(self):
+        cache = ResponseCache()
+        account, other = uuid4(), uuid4()
+        compute = Counter()
+        await cache.get_or_compute(("route", account), compute)
+        await cache.get_or_compute(("route", other), compute)
+
+        cache.bump(account)
+
+        assert (await cache.get_or_compute(("route", account), compute))[1] == MISS
+        assert (await cache.get_or_compute(("route", other), compute))[1] == HIT
+        assert compute.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_value_computed_across_a_bump_is_not_stored(self):
+        cache = ResponseCache()
+        account = uuid4()
+
+        async def compute():
+            cache.bump(account)  # Trade closed while the response was computed
+            return "stale"
+
+        await cache.get_or_compute(("route", account), compute)
+
+        assert cache.get(("route", account)) is None
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry(self):
+        cache = ResponseCache(ttl=10)
+        key = ("route", uuid4())
+        await cache.get_or_compute(key, Counter())
+
+        with patch("src.utils.response_cache.time.monotonic", return_value=time.monotonic() + 11):
+            assert cache.get(key) is None
+
+    @pytest.mark.asyncio
+    async def test_bypass_neither_reads_nor_writes(self):
+        cache = ResponseCache()
+        key = ("route", uuid4())
+        compute = Counter()
+
+        assert await cache.get_or_compute(key, compute, bypass=True) == ("value", BYPASS)
+        assert cache.stats()["entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_by_entry_count(self):
+        cache = ResponseCache(max_entries=2)
+        account = uuid4()
+        for route in ("a", "b"):
+            await cache.get_or_compute((route, account), Counter())
+        cache.get(("a", account))  # "a" is now the most recently used
+
+        await cache.get_or_compute(("c", account), Counter())
+
+        assert cache.get(("b", account)) is None
+        assert cache.get(("a", account)) == "value"
+        assert cache.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_memory_cap(self):
+        cache = ResponseCache(max_bytes=2000)
+        account = uuid4()
+        for route in ("a", "b", "c"):
+            await cache.get_or_compute((route, account), Counter("x" * 900))
+
+        stats = cache.stats()
+        assert stats["bytes"] <= 2000
+        assert stats["entries"] == 2
+        assert cache.get(("a", account)) is None
+
+
+class TestCachedEndpoints:
+    """Route-level caching of the analytics endpoints."""
+
+    @pytest.fixture
+    def account_id(self):
+        return uuid4()
+
+    @pytest.fixture
+    def analytics_repo(self, account_id):
+        repo = FakeTradeAnalyticsRepository([])
+        repo.calls = 0
+        summarize = repo.summarize
+
+        async def counting_summarize(*args, **kwargs):
+            repo.calls += 1
+            return await summarize(*args, **kwargs)
+
+        repo.summarize = counting_summarize
+        app.dependency_overrides[get_account_id] = lambda: account_id
+        app.dependency_overrides[get_trade_analytics_repository] = lambda: repo
+        yield repo
+        app.dependency_overrides.clear()
+
+    def test_stats_served_from_cache_until_invalidated(self, account_id, analytics_repo):
+        client = TestClient(app)
+
+        first = client.get("/api/v1/trading/stats")
+        second = client.get("/api/v1/trading/stats")
+        invalidate_account(account_id)
+        third = client.get("/api/v1/trading/stats")
+
+        assert [r.headers["X-Cache"] for r in (first, second, third)] == [MISS, HIT, MISS]
+        assert second.json() == first.json()
+        assert analytics_repo.calls == 2
+
+    @pytest.mark.parametrize("headers", [{"X-Cache-Bypass": "1"}, {"Cache-Control": "no-cache"}])
+    def test_bypass_header(self, analytics_repo, headers):
+        client = TestClient(app)
+
+        client.get("/api/v1/metrics/performance")
+        response = client.get("/api/v1/metrics/performance", headers=headers)
+
+        assert response.headers["X-Cache"] == BYPASS
+        assert analytics_repo.calls == 4  # Period and all-time summaries, twice
@@ -0,0 +1,368 @@
+"""
+Tests for the local BingX simulator.
+
+Tests:
+1. FakeExchange matches orders, nets the position and books fees and P&L
+2. BingXClient runs unchanged against the simulator's REST API
+3. Faults: rejected timestamps, rate limits and injected errors
+4. Market and account WebSocket feeds, including reconnects
+"""
+
+import asyncio
+
+import httpx
+import numpy as np
+import pytest
+
+from config import BingXConfig, load_config
+from src.client.bingx_client import BingXClient
+from src.client.klines import Klines
+from src.client.rate_limiter import RateLimitError
+from src.client.time_sync import ServerClock
+from src.client.websocket_client import BingXAccountWebSocket, BingXWebSocket
+from src.simulator import (
+    BingXSimulator,
+    ExchangeError,
+    FakeExchange,
+    SimulatorConfig,
+    candle_ticks,
+)
+
+SYMBOL = "BTC-USDT"
+API_KEY = "sim_api_key"  # pragma: allowlist secret
+SECRET_KEY = "sim_secret_key"  # pragma: allowlist secret
+
+
+def limit_with_tp(price, quantity=0.001, tp_price=None):
+    params = {
+        "symbol": SYMBOL,
+        "side": "BUY",
+        "positionSide": "LONG",
+        "type": "LIMIT",
+        "quantity": quantity,
+        "price": price,
+    }
+    if tp_price:
+        params["takeProfit"] = {"type": "TAKE_PROFIT_MARKET", "stopPrice": tp_price}
+    return params
+
+
+class TestFakeExchange:
+    """Matching engine and account state."""
+
+    @pytest.fixture
+    def exchange(self):
+        exchange = FakeExchange(price=100_000.0, balance=1_000.0, maker_fee=0.001, taker_fee=0.002)
+        exchange.events = []
+        exchange.listeners.append(exchange.events.append)
+        return exchange
+
+    def test_limit_fill_places_attached_take_profit(self, exchange):
+        entry = exchange.place_order(limit_with_tp(99_000, tp_price=100_000))
+
+        exchange.set_price(98_800)
+
+        assert entry.status == "FILLED"
+        assert entry.avg_price == 99_000  # Filled at the limit price
+        assert exchange.position_amt == pytest.approx(0.001)
+        [tp] = exchange.orders.values()
+        assert (tp.type, tp.side, tp.stop_price, tp.quantity) == (
+            "TAKE_PROFIT_MARKET",
+            "SELL",
+            100_000,
+            0.001,
+        )
+
+    def test_take_profit_closes_position_and_books_pnl(self, exchange):
+        exchange.place_order(limit_with_tp(99_000, tp_price=100_000))
+        exchange.set_price(99_000)
+        exchange.set_price(100_100)
+
+        assert exchange.position_amt == 0
+        assert exchange.orders == {}
+        assert exchange.realized_pnl == pytest.approx(1.1)  # Exits at the market (gap)
+        fees = 99_000 * 0.001 * 0.001 + 100_100 * 0.001 * 0.002
+        assert exchange.balance == pytest.approx(1_000 + 1.1 - fees)
+        assert {r["incomeType"] for r in exchange.income_history()} == {
+            "COMMISSION",
+            "REALIZED_PNL",
+        }
+
+    def test_fills_net_into_one_position(self, exchange):
+        exchange.place_order(limit_with_tp(99_000))
+        exchange.place_order(limit_with_tp(98_000))
+        exchange.set_price(97_900)
+
+        [position] = exchange.positions()
+        assert float(position["positionAmt"]) == pytest.approx(0.002)
+        assert float(position["avgPrice"]) == pytest.approx(98_500)
+        assert position["onlyOnePosition"] is True
+
+    def test_marketable_limit_fills_at_market(self, exchange):
+        order = exchange.place_order(limit_with_tp(101_000))
+
+        assert order.status == "FILLED"
+        assert order.avg_price == 100_000
+
+    def test_take_profit_expires_without_position(self, exchange):
+        tp = exchange.place_order(
+            {
+                "symbol": SYMBOL,
+                "side": "SELL",
+                "positionSide": "LONG",
+                "type": "TAKE_PROFIT_MARKET",
+                "quantity": 0.001,
+                "stopPrice": 100_500,
+            }
+        )
+
+        exchange.set_price(100_600)
+
+        assert tp.status == "EXPIRED"
+        assert exchange.balance == 1_000
+
+    def test_events_follow_order_lifecycle(self, exchange):
+        entry = exchange.place_order(limit_with_tp(99_000, tp_price=100_000))
+        exchange.set_price(99_000)
+
+        order_events = [
+            (e["o"]["i"], e["o"]["X"]) for e in exchange.events if e["e"] == "ORDER_TRADE_UPDATE"
+        ]
+        tp_id = next(iter(exchange.orders))
+        assert order_events == [
+            (entry.order_id, "NEW"),
+            (entry.order_id, "FILLED"),
+            (tp_id, "NEW"),
+        ]
+        [account] = [e for e in exchange.events if e["e"] == "ACCOUNT_UPDATE"]
+        assert account["a"]["P"][0]["pa"] == "0.001"
+
+    def test_rejects_invalid_orders(self, exchange):
+        with pytest.raises(ExchangeError):
+            exchange.place_order({**limit_with_tp(99_000), "price": 0})
+        with pytest.raises(ExchangeError):
+            exchange.place_order({**limit_with_tp(99_000), "symbol": "ETH-USDT"})
+        with pytest.raises(ExchangeError):
+            exchange.cancel_order("42")
+
+    def test_seeded_history_aggregates_to_intervals(self):
+        exchange = FakeExchange(clock=lambda: 1_704_074_400.0)  # 2024-01-01 02:00 UTC
+        n = 120
+        closes = 100.0 + np.arange(n)
+        exchange.seed_klines(
+            Klines(np.arange(n) * 60_000, closes, closes + 1, closes - 1, closes, np.ones(n))
+        )
+
+        hourly = exchange.klines("1h", limit=10)
+
+        assert [k["time"] for k in hourly] == [1_704_067_200_000, 1_704_070_800_000]
+        assert hourly[0]["open"] == "100" and hourly[0]["close"] == "159"
+        assert hourly[1]["high"] == "220" and hourly[1]["volume"] == "60"
+        assert exchange.price == 219
+
+    def test_candle_ticks(self):
+        klines = Klines(
+            np.array([0, 60_000]),
+            np.array([10.0, 12.0]),
+            np.array([13.0, 12.5]),
+            np.array([9.0, 8.0]),
+            np.array([12.0, 9.0]),
+            np.ones(2),
+        )
+
+        assert list(candle_ticks(klines)) == [10, 9, 13, 12, 12, 12.5, 8, 9]
+
+
+@pytest.fixture
+async def simulator():
+    config = SimulatorConfig(api_key=API_KEY, secret_key=SECRET_KEY, ping_interval=0)
+    async with BingXSimulator(config, FakeExchange(price=100_000.0)) as simulator:
+        yield simulator
+
+
+@pytest.fixture
+async def client(simulator):
+    client = BingXClient(
+        BingXConfig(API_KEY, SECRET_KEY, rest_url=simulator.rest_url, stream_url=simulator.ws_url),
+        http_client=httpx.AsyncClient(),
+    )
+    client.clock = ServerClock()
+    yield client
+    await client.close()
+
+
+class TestRestApi:
+    """BingXClient against the simulator."""
+
+    async def test_market_data(self, simulator, client):
+        simulator.set_price(100_250.5)
+
+        assert await client.get_price(SYMBOL) == 100_250.5
+        klines = await client.get_klines(SYMBOL, "1m")
+        assert klines.close[-1] == 100_250.5
+        assert (await client.get_funding_rate(SYMBOL))["markPrice"] == 100_250.5
+
+    async def test_order_lifecycle(self, simulator, client):
+        spec = client.limit_order_with_tp_spec("BUY", "LONG", 99_000, 0.001, 99_500)
+        created = await client.create_limit_order_with_tp(
+            SYMBOL, "BUY", "LONG", 99_000, 0.001, 99_500
+        )
+        batch = await client.create_orders_batch(SYMBOL, [spec, spec])
+
+        assert created["entry_order_id"] in simulator.exchange.orders
+        assert all(r["success"] for r in batch)
+
+        simulator.set_price(98_900)
+        orders = await client.get_open_orders(SYMBOL, use_cache=False)
+        tps = [o for o in orders if o["type"] == "TAKE_PROFIT_MARKET"]
+        assert [float(o["stopPrice"]) for o in tps] == [99_500] * 3
+        positions = await client.get_positions(SYMBOL)
+        assert float(positions[0]["positionAmt"]) == pytest.approx(0.003)
+
+        results = await client.cancel_orders_batch(SYMBOL, [tps[0]["orderId"], "123"])
+        assert [r["success"] for r in results] == [True, False]
+
+    async def test_rejects_bad_signature(self, simulator):
+        client = BingXClient(
+            BingXConfig(API_KEY, "wrong", rest_url=simulator.rest_url),
+            http_client=httpx.AsyncClient(),
+        )
+        try:
+            with pytest.raises(Exception, match="Signature verification failed"):
+                await client.get_balance()
+        finally:
+            await client.close()
+
+    async def test_listen_key(self, simulator, client):
+        listen_key = await client.generate_listen_key()
+
+        assert listen_key in simulator.listen_keys
+        assert await client.keep_alive_listen_key(listen_key)
+        assert await client.close_listen_key(listen_key)
+        assert not await client.keep_alive_listen_key(listen_key)
+
+
+class TestFaults:
+    """Network and API faults."""
+
+    async def test_clock_skew_triggers_resync(self, simulator, client):
+        simulator.config.clock_offset_ms = 30_000
+
+        balance = await client.get_balance()
+
+        assert balance["balance"]["asset"] == "USDT"
+        assert client.clock.offset_ms == pytest.approx(30_000, abs=1_000)
+        assert simulator.requests["/openApi/swap/v2/user/balance"] == 2
+
+    async def test_rate_limit(self, simulator, client):
+        simulator.config.rate_limits = {"market": 2}
+
+        await client.get_price(SYMBOL)
+        await client.get_price(SYMBOL)
+        with pytest.raises(RateLimitError):
+            await client._request(
+                "GET",
+                "/openApi/swap/v2/quote/price",
+                {"symbol": SYMBOL},
+                signed=False,
+                max_retries=1,
+            )
+
+    async def test_injected_error(self, simulator, client):
+        simulator.inject_error(
+            "/openApi/swap/v2/trade/order", code=101204, msg="Insufficient margin"
+        )
+
+        with pytest.raises(Exception, match="Insufficient margin"):
+            await client.create_order(SYMBOL, "BUY", "LONG", "MARKET", 0.001)
+        await client.create_order(SYMBOL, "BUY", "LONG", "MARKET", 0.001)  # Next one passes
+
+        assert simulator.exchange.position_amt == pytest.approx(0.001)
+
+    async def test_latency(self, simulator, client):
+        simulator.config.latency_ms = 50
+        loop = asyncio.get_running_loop()
+
+        started = loop.time()
+        await client.get_price(SYMBOL)
+
+        assert loop.time() - started >= 0.05
+
+
+async def wait_for(condition, timeout=3.0):
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not condition():
+        assert loop.time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+class TestWebSockets:
+    """Market and account streams."""
+
+    async def test_market_feed(self, simulator, client):
+        ws = BingXWebSocket(client.config)
+        prices, candles = [], []
+        await ws.subscribe_price(SYMBOL, prices.append)
+        await ws.subscribe_kline(SYMBOL, "1m", candles.append)
+        task = asyncio.create_task(ws.connect())
+        try:
+            await wait_for(lambda: simulator.connections["market"] == 1)
+            await asyncio.sleep(0.05)  # Subscriptions in flight
+            simulator.set_price(100_100)
+            simulator.set_price(100_200)
+
+            await wait_for(lambda: len(prices) == 2 and len(candles) == 2)
+            assert prices == [100_100, 100_200]
+            assert candles[-1][0]["c"] == "100200"
+        finally:
+            await ws.disconnect()
+            task.cancel()
+
+    async def test_account_feed_and_reconnect(self, simulator, client):
+        listen_key = await client.generate_listen_key()
+        ws = BingXAccountWebSocket(listen_key, base_url=client.config.ws_url)
+        updates, positions = [], []
+        ws.set_order_callback(lambda o: updates.append((o["o"], o["X"])))
+        ws.set_position_callback(lambda p: positions.append(p["pa"]))
+        task = asyncio.create_task(ws.connect())
+        try:
+            await wait_for(lambda: simulator.connections["account"] == 1)
+            await client.create_limit_order_with_tp(SYMBOL, "BUY", "LONG", 99_000, 0.001, 99_500)
+            simulator.set_price(99_000)
+
+            await wait_for(lambda: len(updates) == 3)
+            assert updates == [
+                ("LIMIT", "NEW"),
+                ("LIMIT", "FILLED"),
+                ("TAKE_PROFIT_MARKET", "NEW"),
+            ]
+            assert positions == ["0.001"]
+
+            await simulator.drop_connections()
+            await wait_for(lambda: not ws.is_connected)
+            await wait_for(lambda: ws.is_connected, timeout=5)
+            simulator.set_price(99_600)
+            await wait_for(lambda: positions[-1] == "0")
+        finally:
+            await ws.disconnect()
+            task.cancel()
+
+
+class TestConfigOverrides:
+    """Pointing the bot at the simulator."""
+
+    def test_urls_default_to_bingx(self):
+        config = BingXConfig("key", "secret", is_demo=True)
+
+        assert config.base_url == "https://open-api-vst.bingx.com"
+        assert config.ws_url == "wss://open-api-ws.bingx.com/market"
+
+    def test_urls_from_environment(self, monkeypatch):
+        monkeypatch.setenv("BINGX_REST_URL", "http://127.0.0.1:8090")
+        monkeypatch.setenv("BINGX_WS_URL", "ws://127.0.0.1:8090/market")
+
+        config = load_config().bingx
+
+        assert config.base_url == "http://127.0.0.1:8090"
+        assert config.ws_url == "ws://127.0.0.1:8090/market"
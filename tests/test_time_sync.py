@@ -0,0 +1,200 @@
+"""
+Tests for BingX server clock synchronization.
+
+Tests:
+1. ServerClock estimates and smooths the offset from server time samples
+2. BingXClient signs with the corrected timestamp
+3. A rejected timestamp triggers an unsmoothed resync instead of a backoff sleep
+4. /health reports the measured skew
+"""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+
+from config import BingXConfig
+from src.client.bingx_client import BingXClient
+from src.client.time_sync import ServerClock
+from src.health.health_server import HealthServer
+
+
+class FakeServer:
+    """Server time fetcher with a fixed clock offset and scripted round trips."""
+
+    def __init__(self, offset_ms, rtts_ms=(20,)):
+        self.offset_ms = offset_ms
+        self.rtts_ms = list(rtts_ms)
+        self.now = 1_760_000_000.0  # Local clock, seconds
+        self.calls = 0
+
+    def time(self):
+        return self.now
+
+    async def __call__(self):
+        rtt = self.rtts_ms[self.calls % len(self.rtts_ms)] / 1000
+        self.calls += 1
+        self.now += rtt / 2
+        server_ms = self.now * 1000 + self.offset_ms
+        self.now += rtt / 2
+        return int(server_ms)
+
+
+class TestServerClock:
+    """Offset and RTT estimation."""
+
+    @pytest.mark.asyncio
+    async def test_offset_from_request_midpoint(self):
+        clock = ServerClock()
+        server = FakeServer(offset_ms=1500)
+
+        with patch("src.client.time_sync.time.time", server.time):
+            assert await clock.sync(server)
+            assert clock.now_ms() == pytest.approx(server.now * 1000 + 1500, abs=1)
+
+        assert clock.offset_ms == pytest.approx(1500, abs=1)
+        assert clock.rtt_ms == pytest.approx(20, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_fastest_sample_wins(self):
+        clock = ServerClock(samples=3)
+        server = FakeServer(offset_ms=-800, rtts_ms=(400, 10, 250))
+
+        with patch("src.client.time_sync.time.time", server.time):
+            await clock.sync(server)
+
+        assert server.calls == 3
+        assert clock.rtt_ms == pytest.approx(10, abs=1)
+
+    def test_later_samples_are_smoothed(self):
+        clock = ServerClock(alpha=0.5)
+        clock.add_sample(0, 1000 + 10, 20)  # Offset 1000
+        clock.add_sample(0, 2000 + 10, 20)  # Offset 2000
+
+        assert clock.offset_ms == pytest.approx(1500)
+        assert clock.syncs == 2
+
+    def test_unsmoothed_sample_replaces_offset(self):
+        clock = ServerClock(alpha=0.3)
+        clock.add_sample(0, 1000 + 10, 20)  # Offset 1000
+        clock.add_sample(0, 9000 + 10, 20, smooth=False)  # Offset 9000
+
+        assert clock.offset_ms == pytest.approx(9000)
+
+    def test_slow_sample_discarded(self):
+        clock = ServerClock(max_rtt_ms=500)
+
+        assert not clock.add_sample(0, 5000, 900)
+        assert not clock.is_synced
+        assert clock.offset_ms == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_sync_keeps_previous_offset(self):
+        clock = ServerClock()
+        clock.add_sample(0, 310, 20)
+
+        assert not await clock.sync(AsyncMock(side_effect=httpx.ConnectError("down")))
+        assert clock.offset_ms == pytest.approx(300)
+        assert clock.failures == 1
+
+
+class TestClientTimestamps:
+    """BingXClient uses the server clock for signed requests."""
+
+    @pytest.fixture
+    def client(self):
+        client = BingXClient(
+            BingXConfig(
+                api_key="test_api_key",  # pragma: allowlist secret
+                secret_key="test_secret_key",  # pragma: allowlist secret
+                is_demo=False,
+            ),
+            http_client=httpx.AsyncClient(),
+        )
+        client.clock = ServerClock()
+        return client
+
+    @staticmethod
+    def _response(payload):
+        response = MagicMock(status_code=200, headers={})
+        response.json.return_value = payload
+        return response
+
+    @pytest.mark.asyncio
+    async def test_signed_timestamp_includes_offset(self, client):
+        client.clock.offset_ms = 2000.0
+        client.client.get = AsyncMock(return_value=self._response({"code": 0, "data": {}}))
+
+        with patch("src.client.time_sync.time.time", return_value=1000.0):
+            await client._request("GET", "/openApi/swap/v2/user/balance")
+
+        url = client.client.get.await_args.args[0]
+        assert parse_qs(urlparse(url).query)["timestamp"] == ["1002000"]
+
+    @pytest.mark.asyncio
+    async def test_rejected_timestamp_resyncs_without_sleeping(self, client):
+        rejected = self._response({"code": 100421, "msg": "timestamp is invalid"})
+        accepted = self._response({"code": 0, "data": {"orderId": "1"}})
+        client.client.post = AsyncMock(side_effect=[rejected, accepted])
+        client.get_server_time = AsyncMock(return_value=1)
+
+        with patch("src.client.bingx_client.asyncio.sleep") as sleep:
+            result = await client._request("POST", "/openApi/swap/v2/trade/order", {})
+
+        assert result == {"orderId": "1"}
+        assert client.get_server_time.await_count == client.clock.samples
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_skew_corrected_in_one_retry(self, client):
+        """After a clock step, the first resync is enough for the retry to pass."""
+        server = FakeServer(offset_ms=5000)
+        client.clock.add_sample(0, 10, 20)  # Synced before the step (offset ~0)
+        client.get_server_time = server
+
+        def post(url, **kwargs):
+            timestamp = int(parse_qs(urlparse(url).query)["timestamp"][0])
+            if abs(timestamp - (server.now * 1000 + server.offset_ms)) > 1000:
+                return self._response({"code": 100421, "msg": "timestamp is invalid"})
+            return self._response({"code": 0, "data": {"orderId": "1"}})
+
+        client.client.post = AsyncMock(side_effect=post)
+
+        with patch("src.client.time_sync.time.time", server.time):
+            result = await client._request(
+                "POST", "/openApi/swap/v2/trade/order", {}, max_retries=2
+            )
+
+        assert result == {"orderId": "1"}
+        assert client.client.post.await_count == 2
+        assert client.clock.offset_ms == pytest.approx(5000, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_get_server_time(self, client):
+        server_time = {"code": 0, "data": {"serverTime": 1760000000123}}
+        client.client.get = AsyncMock(return_value=self._response(server_time))
+
+        assert await client.get_server_time() == 1760000000123
+        assert "signature" not in client.client.get.await_args.args[0]
+
+
+class TestHealthClock:
+    """Clock component of /health."""
+
+    def test_reports_skew(self):
+        clock = ServerClock()
+        clock.add_sample(0, 1250 + 15, 30)
+
+        with patch("src.health.health_server.server_clock", clock):
+            result = HealthServer(port=18094)._check_clock()
+
+        assert result["status"] == "healthy"
+        assert result["skew_ms"] == 1250.0
+        assert result["rtt_ms"] == 30.0
+
+    def test_not_synced(self):
+        with patch("src.health.health_server.server_clock", ServerClock()):
+            result = HealthServer(port=18095)._check_clock()
+
+        assert result["status"] == "unknown"
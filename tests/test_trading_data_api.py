@@ -10,12 +10,16 @@ from fastapi.testclient import TestClient
 
 from src.api.dependencies import (
     get_account_id,
+    get_daily_pnl_repository,
     get_tp_adjustment_repository,
+    get_trade_analytics_repository,
     get_trade_repository,
 )
 from src.api.main import app
 from src.database.models.tp_adjustment import TPAdjustment
 from src.database.models.trade import Trade
+from src.database.repositories.trade_repository import InvalidCursorError, TradePage
+from tests.trade_analytics_fakes import FakeDailyPnlRepository, FakeTradeAnalyticsRepository
 
 
 @pytest.fixture
@@ -92,24 +96,35 @@ def sample_trades(test_account_id):
     return trades
 
 
+def _duration_seconds(trade: Trade) -> int | None:
+    if trade.closed_at and trade.opened_at:
+        return int((trade.closed_at - trade.opened_at).total_seconds())
+    return None
+
+
 def _create_mock_repository(trades: list[Trade]):
-    """Create a mock repository with get_trades_with_filters method."""
+    """Create a mock repository with get_trades_page method (simulating SQL behavior)."""
 
     async def mock_get_trade_repository():
         mock_repo = AsyncMock()
 
-        async def mock_get_trades_with_filters(
+        async def mock_get_trades_page(
             account_id,
             *,
             start_date=None,
             end_date=None,
             status=None,
+            profit_filter=None,
             min_entry_price=None,
             max_entry_price=None,
+            min_duration=None,
+            max_duration=None,
             min_quantity=None,
             max_quantity=None,
+            search_query=None,
             limit=100,
             offset=0,
+            cursor=None,
             sort_by=None,
             sort_direction=None,
         ):
@@ -118,14 +133,34 @@ def _create_mock_repository(trades: list[Trade]):
             # Apply SQL-level filters
             if status:
                 result = [t for t in result if t.status == status]
+            profit_value = profit_filter.value if profit_filter else None
+            if profit_value == "profitable":
+                result = [t for t in result if t.pnl is not None and t.pnl > 0]
+            elif profit_value == "losses":
+                result = [t for t in result if t.pnl is not None and t.pnl < 0]
             if min_entry_price is not None:
                 result = [t for t in result if t.entry_price >= min_entry_price]
             if max_entry_price is not None:
                 result = [t for t in result if t.entry_price <= max_entry_price]
+            if min_duration is not None or max_duration is not None:
+                result = [
+                    t
+                    for t in result
+                    if _duration_seconds(t) is not None
+                    and (min_duration is None or _duration_seconds(t) >= min_duration)
+                    and (max_duration is None or _duration_seconds(t) <= max_duration)
+                ]
             if min_quantity is not None:
                 result = [t for t in result if t.quantity >= min_quantity]
             if max_quantity is not None:
                 result = [t for t in result if t.quantity <= max_quantity]
+            if search_query:
+                result = [
+                    t
+                    for t in result
+                    if search_query in (t.exchange_order_id or "")
+                    or search_query in (t.exchange_tp_order_id or "")
+                ]
 
             # Apply SQL-level sorting (simulating database behavior)
             if sort_by is not None:
@@ -147,16 +182,18 @@ def _create_mock_repository(trades: list[Trade]):
                     "quantity": lambda t: t.quantity,
                     "pnl": lambda t: (t.pnl is None, t.pnl or Decimal(0)),
                     "pnlPercent": lambda t: (t.pnl_percent is None, t.pnl_percent or Decimal(0)),
+                    "duration": lambda t: (_duration_seconds(t) is None, _duration_seconds(t) or 0),
                 }
 
                 if sort_value in sort_key_map:
                     result = sorted(result, key=sort_key_map[sort_value], reverse=is_desc)
 
             total = len(result)
-            result = result[offset : offset + limit]
-            return result, total
+            page = result[offset : offset + limit]
+            next_cursor = "next-page" if offset + limit < total else None
+            return TradePage(trades=page, total=total, next_cursor=next_cursor)
 
-        mock_repo.get_trades_with_filters = mock_get_trades_with_filters
+        mock_repo.get_trades_page = mock_get_trades_page
         mock_repo.get_open_trades.return_value = [t for t in trades if t.status == "OPEN"]
         return mock_repo
 
@@ -178,6 +215,11 @@ def _create_mock_tp_adjustment_repository(adjustments_by_trade_id: dict | None =
         mock_repo.get_by_trade.side_effect = lambda trade_id: adjustments_by_trade_id.get(
             trade_id, []
         )
+        mock_repo.get_by_trades.side_effect = lambda trade_ids: {
+            trade_id: adjustments_by_trade_id[trade_id]
+            for trade_id in trade_ids
+            if trade_id in adjustments_by_trade_id
+        }
         return mock_repo
 
     return mock_get_tp_adjustment_repository
@@ -273,6 +315,45 @@ def test_get_trades_with_pagination(sample_trades, test_account_id):
         app.dependency_overrides.clear()
 
 
+def test_get_trades_returns_next_cursor(sample_trades, test_account_id):
+    """Test GET /trading/trades returns a cursor while more pages exist."""
+    app.dependency_overrides[get_trade_repository] = _create_mock_repository(sample_trades)
+    app.dependency_overrides[get_account_id] = lambda: test_account_id
+    app.dependency_overrides[get_tp_adjustment_repository] = _create_mock_tp_adjustment_repository()
+
+    try:
+        client = TestClient(app)
+        first = client.get("/api/v1/trading/trades", params={"limit": 5}).json()
+        last = client.get("/api/v1/trading/trades", params={"limit": 5, "offset": 5}).json()
+
+        assert first["next_cursor"] == "next-page"
+        assert last["next_cursor"] is None
+    finally:
+        app.dependency_overrides.clear()
+
+
+def test_get_trades_invalid_cursor(test_account_id):
+    """Test GET /trading/trades with an invalid cursor returns 400."""
+
+    async def mock_get_trade_repository():
+        mock_repo = AsyncMock()
+        mock_repo.get_trades_page.side_effect = InvalidCursorError("Invalid cursor")
+        return mock_repo
+
+    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_account_id] = lambda: test_account_id
+    app.dependency_overrides[get_tp_adjustment_repository] = _create_mock_tp_adjustment_repository()
+
+    try:
+        client = TestClient(app)
+        response = client.get("/api/v1/trading/trades", params={"cursor": "garbage"})
+
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Invalid cursor"
+    finally:
+        app.dependency_overrides.clear()
+
+
 def test_get_trades_invalid_status(test_account_id):
     """Test GET /trading/trades with invalid status."""
     app.dependency_overrides[get_trade_repository] = _create_mock_repository([])
@@ -292,12 +373,10 @@ def test_get_trades_invalid_status(test_account_id):
 def test_get_trade_stats(sample_trades, test_account_id):
     """Test GET /api/v1/trading/stats endpoint."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_account.return_value = sample_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(sample_trades)
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = lambda: test_account_id
 
     try:
@@ -352,12 +431,10 @@ def test_get_positions_empty(test_account_id):
 def test_get_stats_empty(test_account_id):
     """Test GET /api/v1/trading/stats with no trades."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_account.return_value = []
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = lambda: test_account_id
 
     try:
@@ -845,15 +922,13 @@ def test_get_performance_metrics_default_period(sample_trades, test_account_id):
     """Test GET /api/v1/trading/performance-metrics with default period (today)."""
     closed_trades = [t for t in sample_trades if t.status == "CLOSED"]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = closed_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(closed_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -899,15 +974,13 @@ def test_get_performance_metrics_7days_period(sample_trades, test_account_id):
     """Test GET /api/v1/trading/performance-metrics with 7days period."""
     closed_trades = [t for t in sample_trades if t.status == "CLOSED"]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = closed_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(closed_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -928,15 +1001,13 @@ def test_get_performance_metrics_custom_period(sample_trades, test_account_id):
     """Test GET /api/v1/trading/performance-metrics with custom period."""
     closed_trades = [t for t in sample_trades if t.status == "CLOSED"]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = closed_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(closed_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -962,13 +1033,13 @@ def test_get_performance_metrics_custom_period(sample_trades, test_account_id):
 def test_get_performance_metrics_custom_period_missing_dates(test_account_id):
     """Test GET /api/v1/trading/performance-metrics with custom period but missing dates."""
 
-    async def mock_get_trade_repository():
-        return AsyncMock()
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -987,15 +1058,13 @@ def test_get_performance_metrics_custom_period_missing_dates(test_account_id):
 def test_get_performance_metrics_empty_trades(test_account_id):
     """Test GET /api/v1/trading/performance-metrics with no trades."""
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = []
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository([])
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -1071,15 +1140,13 @@ def test_get_performance_metrics_roi_calculation(test_account_id):
         ),
     ]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -1107,15 +1174,13 @@ def test_get_performance_metrics_best_worst_trade_with_id(sample_trades, test_ac
     best = max(closed_trades, key=lambda t: t.pnl if t.pnl else Decimal(0))
     worst = min(closed_trades, key=lambda t: t.pnl if t.pnl else Decimal(0))
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = closed_trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(closed_trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -1170,15 +1235,13 @@ def test_get_performance_metrics_single_positive_trade(test_account_id):
         ),
     ]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -1226,15 +1289,13 @@ def test_get_performance_metrics_single_negative_trade(test_account_id):
         ),
     ]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -1282,15 +1343,13 @@ def test_get_performance_metrics_single_breakeven_trade(test_account_id):
         ),
     ]
 
-    async def mock_get_trade_repository():
-        mock_repo = AsyncMock()
-        mock_repo.get_trades_by_period.return_value = trades
-        return mock_repo
+    async def mock_get_trade_analytics_repository():
+        return FakeTradeAnalyticsRepository(trades)
 
     async def mock_get_account_id():
         return test_account_id
 
-    app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+    app.dependency_overrides[get_trade_analytics_repository] = mock_get_trade_analytics_repository
     app.dependency_overrides[get_account_id] = mock_get_account_id
 
     try:
@@ -2091,12 +2150,10 @@ class TestCumulativePnl:
     def test_cumulative_pnl_basic(self, cumulative_pnl_trades, test_account_id):
         """Test basic cumulative P&L calculation across multiple days."""
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = cumulative_pnl_trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(cumulative_pnl_trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2131,12 +2188,10 @@ class TestCumulativePnl:
     def test_cumulative_pnl_empty_period(self, test_account_id):
         """Test cumulative P&L returns empty array when no trades in period."""
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = []
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository([])
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2154,12 +2209,10 @@ class TestCumulativePnl:
     def test_cumulative_pnl_with_period_filter(self, cumulative_pnl_trades, test_account_id):
         """Test cumulative P&L with period filter."""
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = cumulative_pnl_trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(cumulative_pnl_trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2181,12 +2234,10 @@ class TestCumulativePnl:
     def test_cumulative_pnl_custom_period(self, cumulative_pnl_trades, test_account_id):
         """Test cumulative P&L with custom date range."""
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = cumulative_pnl_trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(cumulative_pnl_trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2210,10 +2261,10 @@ class TestCumulativePnl:
     def test_cumulative_pnl_custom_period_missing_dates(self, test_account_id):
         """Test cumulative P&L with custom period but missing dates returns 400."""
 
-        async def mock_get_trade_repository():
-            return AsyncMock()
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository([])
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2274,12 +2325,10 @@ class TestCumulativePnl:
             ),
         ]
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2341,12 +2390,10 @@ class TestCumulativePnl:
             ),
         ]
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2407,12 +2454,10 @@ class TestCumulativePnl:
             ),
         ]
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
@@ -2496,12 +2541,10 @@ class TestCumulativePnl:
             ),
         ]
 
-        async def mock_get_trade_repository():
-            mock_repo = AsyncMock()
-            mock_repo.get_trades_by_period.return_value = trades
-            return mock_repo
+        async def mock_get_daily_pnl_repository():
+            return FakeDailyPnlRepository(trades)
 
-        app.dependency_overrides[get_trade_repository] = mock_get_trade_repository
+        app.dependency_overrides[get_daily_pnl_repository] = mock_get_daily_pnl_repository
         app.dependency_overrides[get_account_id] = lambda: test_account_id
 
         try:
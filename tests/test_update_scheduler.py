@@ -0,0 +1,239 @@
+"""
+Tests for the event-driven GridManager update scheduler.
+
+Tests:
+1. UpdateScheduler coalesces bursts, runs the safety-net poll and survives errors
+2. GridManager.run_triggers only runs the phases affected by each trigger
+3. Price ticks, account events and candle closes notify the scheduler
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.grid.grid_manager import GridManager
+from src.grid.update_scheduler import UpdateScheduler, UpdateTrigger
+
+
+class TestUpdateScheduler:
+    """Tests for trigger coalescing and polling."""
+
+    async def test_burst_is_coalesced_into_one_run(self):
+        """Triggers within the debounce window produce a single handler call."""
+        handler = AsyncMock()
+        scheduler = UpdateScheduler(handler, poll_interval=60, debounce=0.02)
+        scheduler.start()
+        try:
+            for _ in range(5):
+                scheduler.notify(UpdateTrigger.PRICE)
+            scheduler.notify(UpdateTrigger.ORDER)
+            await asyncio.sleep(0.1)
+        finally:
+            await scheduler.stop()
+
+        handler.assert_awaited_once_with(frozenset({UpdateTrigger.PRICE, UpdateTrigger.ORDER}))
+        assert scheduler.stats["runs"] == 1
+        assert scheduler.stats["coalesced"] == 5
+        assert scheduler.stats["triggers"]["price"] == 5
+
+    async def test_events_during_run_are_batched_next(self):
+        """Triggers arriving while the handler runs are processed in the next run."""
+        calls: list[frozenset[UpdateTrigger]] = []
+        release = asyncio.Event()
+
+        async def handler(triggers):
+            calls.append(triggers)
+            if len(calls) == 1:
+                await release.wait()
+
+        scheduler = UpdateScheduler(handler, poll_interval=60, debounce=0)
+        scheduler.start()
+        try:
+            scheduler.notify(UpdateTrigger.CANDLE)
+            await asyncio.sleep(0.01)
+            scheduler.notify(UpdateTrigger.PRICE)
+            scheduler.notify(UpdateTrigger.POSITION)
+            release.set()
+            await asyncio.sleep(0.05)
+        finally:
+            await scheduler.stop()
+
+        assert calls == [
+            frozenset({UpdateTrigger.CANDLE}),
+            frozenset({UpdateTrigger.PRICE, UpdateTrigger.POSITION}),
+        ]
+
+    async def test_poll_when_idle(self):
+        """With no events, the safety-net poll fires after poll_interval."""
+        handler = AsyncMock()
+        scheduler = UpdateScheduler(handler, poll_interval=0.05, debounce=0)
+        scheduler.start()
+        try:
+            await asyncio.sleep(0.08)
+        finally:
+            await scheduler.stop()
+
+        handler.assert_awaited_with(frozenset({UpdateTrigger.POLL}))
+
+    async def test_poll_not_starved_by_events(self):
+        """Continuous events do not postpone the safety-net poll."""
+        handler = AsyncMock()
+        scheduler = UpdateScheduler(handler, poll_interval=0.05, debounce=0)
+        scheduler.start()
+        try:
+            for _ in range(10):
+                scheduler.notify(UpdateTrigger.PRICE)
+                await asyncio.sleep(0.01)
+        finally:
+            await scheduler.stop()
+
+        assert any(UpdateTrigger.POLL in call.args[0] for call in handler.await_args_list)
+
+    async def test_handler_error_does_not_stop_scheduler(self):
+        """Errors are counted and later triggers still run."""
+        handler = AsyncMock(side_effect=[RuntimeError("boom"), None])
+        scheduler = UpdateScheduler(handler, poll_interval=60, debounce=0)
+        scheduler.start()
+        try:
+            scheduler.notify(UpdateTrigger.PRICE)
+            await asyncio.sleep(0.01)
+            scheduler.notify(UpdateTrigger.PRICE)
+            await asyncio.sleep(0.01)
+        finally:
+            await scheduler.stop()
+
+        assert handler.await_count == 2
+        assert scheduler.stats["errors"] == 1
+        assert scheduler.is_running is False
+
+
+@pytest.fixture
+def grid_manager():
+    """GridManager with mocked dependencies and phases (not started)."""
+    from src.filters.registry import FilterRegistry
+
+    FilterRegistry().clear()
+    config = MagicMock()
+    config.trading.symbol = "BTC-USDT"
+    config.macd.fast = 12
+    config.macd.slow = 26
+    config.macd.signal = 9
+    config.macd.timeframe = "1h"
+
+    manager = GridManager(config, AsyncMock())
+    manager._running = True
+    manager._refresh_indicators = AsyncMock()
+    manager._execute_state_actions = AsyncMock()
+    manager._sync_with_exchange = AsyncMock()
+    manager._broadcast_pnl_updates = AsyncMock()
+    manager.calculator.calculate_spacing = MagicMock(return_value=100.0)
+    yield manager
+    FilterRegistry().clear()
+
+
+class TestRunTriggers:
+    """Tests for routing triggers to update phases."""
+
+    @pytest.mark.parametrize(
+        "triggers,expected",
+        [
+            ({UpdateTrigger.PRICE}, {"grid", "pnl"}),
+            ({UpdateTrigger.PNL}, {"pnl"}),
+            ({UpdateTrigger.CANDLE}, {"indicators", "grid"}),
+            ({UpdateTrigger.ORDER}, {"grid", "sync", "pnl"}),
+            ({UpdateTrigger.POSITION, UpdateTrigger.PRICE}, {"grid", "sync", "pnl"}),
+            ({UpdateTrigger.POLL, UpdateTrigger.PRICE}, {"indicators", "grid", "sync", "pnl"}),
+        ],
+    )
+    async def test_phases_per_trigger(self, grid_manager, triggers, expected):
+        """Each trigger runs only the work it affects."""
+        await grid_manager.run_triggers(frozenset(triggers))
+
+        phases = {
+            "indicators": grid_manager._refresh_indicators,
+            "grid": grid_manager._execute_state_actions,
+            "sync": grid_manager._sync_with_exchange,
+            "pnl": grid_manager._broadcast_pnl_updates,
+        }
+        ran = {name for name, phase in phases.items() if phase.await_count}
+        assert ran == expected
+
+    async def test_not_running_does_nothing(self, grid_manager):
+        """Triggers are ignored once the manager is stopped."""
+        grid_manager._running = False
+
+        await grid_manager.run_triggers(frozenset({UpdateTrigger.POLL}))
+
+        grid_manager._refresh_indicators.assert_not_awaited()
+
+
+class TestEventSources:
+    """Tests for producers notifying the scheduler."""
+
+    @pytest.fixture
+    def scheduler(self, grid_manager):
+        scheduler = MagicMock()
+        grid_manager._scheduler = scheduler
+        return scheduler
+
+    def test_small_price_move_does_not_reposition(self, grid_manager, scheduler):
+        """Ticks within half the grid spacing do not trigger repositioning."""
+        grid_manager._last_grid_price = 100_000.0
+
+        grid_manager.update_price_from_websocket(100_040.0)
+
+        scheduler.notify.assert_not_called()
+
+    def test_large_price_move_triggers_reposition(self, grid_manager, scheduler):
+        """Ticks beyond half the grid spacing trigger PRICE."""
+        grid_manager._last_grid_price = 100_000.0
+
+        grid_manager.update_price_from_websocket(100_060.0)
+
+        scheduler.notify.assert_called_once_with(UpdateTrigger.PRICE)
+
+    def test_tick_with_open_positions_requests_pnl(self, grid_manager, scheduler):
+        """Small ticks still refresh P&L for open positions (throttled)."""
+        grid_manager._last_grid_price = 100_000.0
+        grid_manager.tracker = MagicMock(filled_orders=[MagicMock()])
+
+        grid_manager.update_price_from_websocket(100_010.0)
+        grid_manager._last_pnl_broadcast = float("inf")
+        grid_manager.update_price_from_websocket(100_020.0)
+
+        scheduler.notify.assert_called_once_with(UpdateTrigger.PNL)
+
+    def test_order_cancel_event_triggers_order(self, grid_manager, scheduler):
+        """Account WebSocket cancellations notify ORDER."""
+        grid_manager._on_ws_order_update({"i": "123", "X": "CANCELED", "o": "LIMIT"})
+
+        scheduler.notify.assert_called_once_with(UpdateTrigger.ORDER)
+
+    def test_position_change_triggers_position(self, grid_manager, scheduler):
+        """Position changes that do not close the position notify POSITION."""
+        grid_manager._on_ws_position_update({"s": "BTC-USDT", "pa": "0.002"})
+
+        scheduler.notify.assert_called_once_with(UpdateTrigger.POSITION)
+
+    def test_candle_close_triggers_candle(self, grid_manager, scheduler):
+        """Candle closes from the KlineStore notify CANDLE."""
+        store = MagicMock()
+        grid_manager.set_kline_store(store)
+        callback = store.add_close_callback.call_args.args[0]
+
+        callback(1_704_067_200_000)
+
+        scheduler.notify.assert_called_once_with(UpdateTrigger.CANDLE)
+
+    async def test_start_scheduler_runs_initial_full_update(self, grid_manager):
+        """start_scheduler() performs a full cycle right away."""
+        grid_manager._scheduler = None
+        grid_manager.start_scheduler(poll_interval=60, debounce=0)
+        try:
+            await asyncio.sleep(0.02)
+        finally:
+            await grid_manager.stop_scheduler()
+
+        grid_manager._refresh_indicators.assert_awaited_once()
+        grid_manager._sync_with_exchange.assert_awaited_once()
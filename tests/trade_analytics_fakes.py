@@ -0,0 +1,110 @@
+"""In-memory analytics repositories for API tests.
+
+summarize_trades() is the Python implementation the analytics endpoints
+used before aggregating in SQL; it is the reference for the parity tests.
+"""
+
+from decimal import Decimal
+
+from src.database.models.daily_pnl import DailyPnl
+from src.database.models.trade import Trade
+from src.database.repositories.daily_pnl_repository import utc_date
+from src.database.repositories.trade_analytics_repository import TradeSummary
+
+
+def _realized(trades: list[Trade]) -> list[Trade]:
+    return [t for t in trades if t.status == "CLOSED" and t.pnl is not None]
+
+
+def summarize_trades(trades: list[Trade]) -> TradeSummary:
+    """Aggregate a list of trades in Python."""
+    realized = _realized(trades)
+    pnls = [t.pnl for t in realized]
+    wins = [p for p in pnls if p > 0]
+    losses = [p for p in pnls if p < 0]
+    return TradeSummary(
+        total_trades=len(trades),
+        open_trades=sum(1 for t in trades if t.status == "OPEN"),
+        closed_trades=sum(1 for t in trades if t.status == "CLOSED"),
+        total_fees=sum((t.trading_fee + t.funding_fee for t in trades), Decimal("0")),
+        realized_trades=len(realized),
+        winning_trades=len(wins),
+        losing_trades=len(losses),
+        realized_pnl=sum(pnls, Decimal("0")),
+        realized_fees=sum((t.trading_fee + t.funding_fee for t in realized), Decimal("0")),
+        capital_employed=sum((t.entry_price * t.quantity for t in realized), Decimal("0")),
+        gross_profit=sum(wins, Decimal("0")),
+        gross_loss=sum(losses, Decimal("0")),
+        best_pnl=max(pnls, default=Decimal("0")),
+        worst_pnl=min(pnls, default=Decimal("0")),
+        largest_win=max(wins, default=Decimal("0")),
+        largest_loss=min(losses, default=Decimal("0")),
+    )
+
+
+def best_worst_trades(trades: list[Trade]) -> tuple[Trade | None, Trade | None]:
+    """Highest and lowest P&L realized trades, in Python."""
+    realized = _realized(trades)
+    if not realized:
+        return None, None
+    return max(realized, key=lambda t: t.pnl), min(realized, key=lambda t: t.pnl)
+
+
+class FakeTradeAnalyticsRepository:
+    """Serves analytics from in-memory trade lists.
+
+    Args:
+        trades: All of the account's trades (used when no period is given).
+        period_trades: Trades returned for any period (defaults to trades).
+    """
+
+    def __init__(self, trades: list[Trade], period_trades: list[Trade] | None = None):
+        self.trades = trades
+        self.period_trades = trades if period_trades is None else period_trades
+
+    def _scope(self, start, end) -> list[Trade]:
+        return self.period_trades if start is not None and end is not None else self.trades
+
+    async def summarize(self, account_id, start=None, end=None) -> TradeSummary:
+        return summarize_trades(self._scope(start, end))
+
+    async def get_best_worst_trades(self, account_id, start=None, end=None):
+        return best_worst_trades(self._scope(start, end))
+
+
+def rollup_trades(trades: list[Trade]) -> list[DailyPnl]:
+    """Build daily_pnl rows from trades, in Python."""
+    rows: dict[tuple, DailyPnl] = {}
+    for t in _realized(trades):
+        if t.closed_at is None:
+            continue
+        key = (t.account_id, t.symbol, utc_date(t.closed_at))
+        row = rows.setdefault(
+            key,
+            DailyPnl(
+                account_id=key[0],
+                symbol=key[1],
+                date=key[2],
+                realized_pnl=Decimal("0"),
+                fees=Decimal("0"),
+                trade_count=0,
+                wins=0,
+                losses=0,
+            ),
+        )
+        row.realized_pnl += t.pnl
+        row.fees += t.trading_fee + t.funding_fee
+        row.trade_count += 1
+        row.wins += t.pnl > 0
+        row.losses += t.pnl < 0
+    return sorted(rows.values(), key=lambda r: (r.date, r.symbol))
+
+
+class FakeDailyPnlRepository:
+    """Serves the daily rollup of an in-memory trade list, for any period."""
+
+    def __init__(self, trades: list[Trade]):
+        self.rows = rollup_trades(trades)
+
+    async def get_by_period(self, account_id, start, end) -> list[DailyPnl]:
+        return self.rows